@@ -71,11 +71,21 @@ def _analyse(repo_root: Path) -> list[TypedDictDarkMatterPair]:
     """Build matrix, import graph, and run dark matter filter."""
     from omnibase_core.analysis.co_change_dark_matter import find_dark_matter
     from omnibase_core.analysis.co_change_matrix import build_cochange_matrix
+    from omnibase_core.analysis.co_change_sparse import (
+        build_sparse_cochange_matrix,
+        has_sparse_backend,
+    )
     from omnibase_core.analysis.import_graph import build_import_graph
 
     commits = _git_commits(repo_root)
-    matrix = build_cochange_matrix(commits)
-    import_graph = build_import_graph(repo_root)
+    matrix = (
+        build_sparse_cochange_matrix(commits)
+        if has_sparse_backend()
+        else build_cochange_matrix(commits)
+    )
+    import_graph = build_import_graph(
+        repo_root, cache_path=repo_root / ".onex_state" / "import-graph-cache.json"
+    )
     return find_dark_matter(matrix, import_graph)
 
 
@@ -1,18 +1,59 @@
 # SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
 # SPDX-License-Identifier: MIT
 
-import json
+"""JSONL-backed agent trajectory store.
+
+Entries are appended to ``<state_dir>/trajectory/<session_id>.jsonl`` through a
+file handle kept open for the store's lifetime. By default each append is
+flushed before append() returns; with ``batch_size`` > 1 appends are group
+committed once ``batch_size`` entries are pending or ``flush_interval_s`` has
+passed. ``fsync_policy`` decides when commits are forced to stable storage.
+
+A sidecar ``<session_id>.idx`` holds the byte offset of every line as
+native-endian uint64s, so read_recent() can page past the in-memory cache by
+seeking straight to the requested lines. On open the index is reconciled with
+the JSONL (lines written after the last index update are indexed) and the cache
+is refilled with the newest entries by reading backwards from the end of the
+JSONL through mmap. A partial trailing line is never truncated, since another
+writer may still be appending it; it is left unindexed and skipped on read.
+
+Several stores may append to one session. Each group commit holds an exclusive
+``flock`` on the JSONL (POSIX only) while it writes its lines and their index
+entries, and takes the offsets from the real end of the file, so the index
+stays in file order whichever store wrote a line.
+"""
+
+import mmap
+import os
 import re
 import threading
+import weakref
+from array import array
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO, Self
 
+from pydantic import ValidationError
+
+from omnibase_core.enums.enum_fsync_policy import EnumFsyncPolicy
 from omnibase_core.models.agents.model_trajectory_entry import ModelTrajectoryEntry
 
+try:
+    import fcntl
+except ImportError:  # fallback-ok: non-POSIX; the per-store lock still applies
+    fcntl = None  # type: ignore[assignment]
+
 _CACHE_CAP = 1000
 _EVICT_COUNT = 500
 _SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
 
+# One unsigned 64-bit line offset per entry
+_OFFSET_TYPECODE = "Q"
+_OFFSET_SIZE = array(_OFFSET_TYPECODE).itemsize
+
 
 def _validate_session_id(session_id: str) -> str:
     if not isinstance(session_id, str):
@@ -34,36 +75,292 @@ def _validate_session_id(session_id: str) -> str:
     return normalized
 
 
+def _parse_lines(lines: list[bytes]) -> list[ModelTrajectoryEntry]:
+    entries = []
+    for line in lines:
+        try:
+            entries.append(ModelTrajectoryEntry.model_validate_json(line))
+        except ValidationError:  # fallback-ok: skip a corrupt line, keep history
+            continue
+    return entries
+
+
+def _read_tail_lines(path: Path, end: int, count: int) -> list[bytes]:
+    """Return up to ``count`` lines ending at byte ``end``, oldest first."""
+    if end == 0 or count == 0:
+        return []
+    lines: list[bytes] = []
+    with (
+        path.open("rb") as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        # end is just past a newline; step back over it to the line before
+        line_end = end - 1
+        while line_end > 0 and len(lines) < count:
+            line_start = mm.rfind(b"\n", 0, line_end) + 1
+            lines.append(mm[line_start:line_end])
+            line_end = line_start - 1
+    lines.reverse()
+    return lines
+
+
+@contextmanager
+def _locked_file(fh: BinaryIO) -> Iterator[None]:
+    """Hold an exclusive flock on ``fh`` so writers of one session serialize."""
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _close_handles(
+    data_fh: BinaryIO, index_fh: BinaryIO, fsync_policy: EnumFsyncPolicy
+) -> None:
+    for fh in (data_fh, index_fh):
+        if fh.closed:
+            continue
+        fh.flush()
+        if fsync_policy is not EnumFsyncPolicy.NEVER:
+            os.fsync(fh.fileno())
+        fh.close()
+
+
 class TrajectoryStore:
     """JSONL-backed trajectory store with a bounded in-memory cache."""
 
-    def __init__(self, session_id: str, state_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        session_id: str,
+        state_dir: Path | None = None,
+        *,
+        batch_size: int = 1,
+        flush_interval_s: float = 0.05,
+        fsync_policy: EnumFsyncPolicy = EnumFsyncPolicy.NEVER,
+    ) -> None:
+        """
+        Args:
+            session_id: Path-safe session identifier naming the JSONL file.
+            state_dir: Root state directory; defaults to ``.onex_state``.
+            batch_size: Pending entries that trigger a group commit; 1 commits
+                every append before it returns.
+            flush_interval_s: Longest time an entry waits for its batch.
+            fsync_policy: When commits are forced to stable storage.
+        """
         self._session_id = _validate_session_id(session_id)
+        if batch_size < 1:
+            # error-ok: local validation rejects an empty group commit
+            raise ValueError("batch_size must be at least 1")
         root = state_dir if state_dir is not None else Path(".onex_state")
         self._jsonl_path = root / "trajectory" / f"{self._session_id}.jsonl"
+        self._index_path = self._jsonl_path.with_suffix(".idx")
         self._jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._fsync_policy = fsync_policy
         self._cache: deque[ModelTrajectoryEntry] = deque()
         self._lock = threading.Lock()
+        self._pending: list[bytes] = []
+        self._flush_timer: threading.Timer | None = None
+        # Start offset of every complete line in the file, and the byte length
+        # they span; a partial trailing line is not counted
+        self._offsets: array[int] = array(_OFFSET_TYPECODE)
+        self._size = 0
+        # False once another writer's lines sit among ours, so the cache no
+        # longer mirrors the tail of the file
+        self._cache_is_tail = True
+        self._fh: BinaryIO = self._jsonl_path.open("a+b")
+        self._index_fh: BinaryIO = self._index_path.open("ab")
+        self._closed = False
+        self._finalizer = weakref.finalize(
+            self, _close_handles, self._fh, self._index_fh, fsync_policy
+        )
+        with _locked_file(self._fh):
+            self._reconcile_locked()
+        tail = _read_tail_lines(self._jsonl_path, self._size, _CACHE_CAP - _EVICT_COUNT)
+        self._cache.extend(_parse_lines(tail))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def append(self, entry: ModelTrajectoryEntry) -> None:
         """Append one entry to JSONL and the bounded in-memory cache under a lock."""
+        line = entry.model_dump_json().encode() + b"\n"
         with self._lock:
-            line = json.dumps(entry.model_dump(mode="json")) + "\n"
-            with self._jsonl_path.open("a", encoding="utf-8") as fh:
-                fh.write(line)
+            if self._closed:
+                # error-ok: appending to a closed store is a caller bug
+                raise ValueError("TrajectoryStore is closed")
+            self._pending.append(line)
             self._cache.append(entry)
             if len(self._cache) > _CACHE_CAP:
                 for _ in range(_EVICT_COUNT):
                     self._cache.popleft()
+            if len(self._pending) >= self._batch_size:
+                self._commit_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval_s, self.flush)
+                self._flush_timer.start()
 
-    def read_recent(self, n: int) -> list[ModelTrajectoryEntry]:
-        """Return the newest cached entries; zero returns empty and negative counts fail."""
+    def read_recent(
+        self, n: int, *, offset: int | None = None
+    ) -> list[ModelTrajectoryEntry]:
+        """Return the newest cached entries; zero returns empty and negative counts fail.
+
+        With ``offset``, pages through the whole session history instead:
+        returns up to ``n`` entries ending ``offset`` entries before the
+        newest, read through the offset index when they precede the cache.
+        """
         if n < 0:
             # error-ok: CodeRabbit review requires ValueError for negative n
             raise ValueError("n must be greater than or equal to 0")
+        if offset is not None and offset < 0:
+            # error-ok: mirrors the validation of n
+            raise ValueError("offset must be greater than or equal to 0")
         if n == 0:
             return []
 
         with self._lock:
-            items = list(self._cache)
-        return items[-n:] if n < len(items) else items
+            if offset is None:
+                items = list(self._cache)
+                return items[-n:] if n < len(items) else items
+
+            if not self._closed:
+                if os.fstat(self._fh.fileno()).st_size != self._size:
+                    # Another writer appended to this session
+                    with _locked_file(self._fh):
+                        self._reconcile_locked()
+                    self._cache_is_tail = False
+                if not self._cache_is_tail:
+                    self._commit_locked()
+            total = len(self._offsets) + len(self._pending)
+            end = total - offset
+            if end <= 0:
+                return []
+            start = max(end - n, 0)
+            cached: list[ModelTrajectoryEntry] = []
+            disk_end = end
+            if self._cache_is_tail:
+                first_cached = total - len(self._cache)
+                cached = list(
+                    islice(
+                        self._cache,
+                        max(start - first_cached, 0),
+                        max(end - first_cached, 0),
+                    )
+                )
+                if start >= first_cached:
+                    return cached
+                # Older entries come from disk, which must hold everything
+                # before the cache
+                self._commit_locked()
+                disk_end = min(end, first_cached)
+            byte_start = self._offsets[start]
+            byte_end = (
+                self._offsets[disk_end] if disk_end < len(self._offsets) else self._size
+            )
+
+        with self._jsonl_path.open("rb") as fh:
+            fh.seek(byte_start)
+            lines = fh.read(byte_end - byte_start).splitlines()
+        return _parse_lines(lines) + cached
+
+    def flush(self) -> None:
+        """Commit pending entries now."""
+        with self._lock:
+            if not self._closed:
+                self._commit_locked()
+
+    def close(self) -> None:
+        """Commit pending entries and close the JSONL and index files."""
+        with self._lock:
+            if self._closed:
+                return
+            self._commit_locked()
+            self._closed = True
+        self._finalizer()
+
+    # =========================================================================
+    # Internal Methods
+    # =========================================================================
+
+    def _commit_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        with _locked_file(self._fh):
+            # Offsets come from the real end of the file, not from what this
+            # store last wrote
+            size = os.fstat(self._fh.fileno()).st_size
+            if size != self._size:
+                # Another store appended, or a write was torn
+                self._reconcile_locked(size)
+                self._cache_is_tail = False
+            new_offsets = array(_OFFSET_TYPECODE)
+            position = size
+            if size != self._size:
+                # Nothing else holds the lock, so a partial trailing line was
+                # abandoned; terminate it rather than glue our first line on
+                new_offsets.append(self._size)
+                data = b"\n" + data
+                position += 1
+            for line in self._pending:
+                new_offsets.append(position)
+                position += len(line)
+            # Data before index: a crash in between leaves lines the next open
+            # re-indexes, never an index entry without its line
+            self._fh.write(data)
+            self._fh.flush()
+            self._index_fh.write(new_offsets.tobytes())
+            self._index_fh.flush()
+            if self._fsync_policy is EnumFsyncPolicy.EVERY_BATCH:
+                os.fsync(self._fh.fileno())
+                os.fsync(self._index_fh.fileno())
+        self._offsets.extend(new_offsets)
+        self._size = position
+        self._pending.clear()
+
+    def _reconcile_locked(self, size: int | None = None) -> None:
+        """Reload the index and index complete lines written after it.
+
+        Runs under the file lock. A partial trailing line is left in place
+        and unindexed.
+        """
+        if size is None:
+            size = os.fstat(self._fh.fileno()).st_size
+        index_size = os.fstat(self._index_fh.fileno()).st_size
+        offsets = self._offsets
+        if index_size != len(offsets) * _OFFSET_SIZE:
+            raw = self._index_path.read_bytes()
+            offsets = array(_OFFSET_TYPECODE)
+            offsets.frombytes(raw[: len(raw) - len(raw) % _OFFSET_SIZE])
+            index_size = len(raw)
+            if offsets and offsets[0] != 0:
+                # Not an index of this file; rebuild it
+                offsets = array(_OFFSET_TYPECODE)
+        while offsets and offsets[-1] >= size:
+            offsets.pop()
+
+        end = 0
+        if size:
+            with mmap.mmap(self._fh.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                # Re-check the last indexed line, then index any lines after it
+                position = offsets.pop() if offsets else 0
+                while (newline := mm.find(b"\n", position)) != -1:
+                    offsets.append(position)
+                    position = newline + 1
+                end = position
+        if len(offsets) * _OFFSET_SIZE != index_size:
+            self._index_fh.truncate(0)
+            self._index_fh.write(offsets.tobytes())
+            self._index_fh.flush()
+
+        self._offsets = offsets
+        self._size = end
@@ -13,6 +13,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from omnibase_core.analysis.co_change_matrix import CoChangeMatrix, compute_npmi
+from omnibase_core.analysis.co_change_sparse import SparseCoChangeMatrix
 from omnibase_core.analysis.import_graph import ImportGraph
 from omnibase_core.types.typed_dict_dark_matter_pair import TypedDictDarkMatterPair
 
@@ -23,17 +24,34 @@ _MIN_COMMITS = 3
 
 
 def find_dark_matter(
-    matrix: CoChangeMatrix,
+    matrix: CoChangeMatrix | SparseCoChangeMatrix,
     import_graph: ImportGraph,
 ) -> list[TypedDictDarkMatterPair]:
     """Return the top 20 co-change pairs not explained by the import graph.
 
     Returns an empty list when the matrix has fewer than _MIN_COMMITS commits
     (insufficient statistical signal).
+
+    A SparseCoChangeMatrix is scored and thresholded in the array domain and
+    its candidates are consumed in NPMI order, stopping once the top 20 are
+    found; ties are then broken by path order rather than commit order.
     """
     if matrix.total_commits < _MIN_COMMITS:
         return []
 
+    if isinstance(matrix, SparseCoChangeMatrix):
+        results: list[TypedDictDarkMatterPair] = []
+        for a, b, npmi, co_count in matrix.scored_pairs(
+            min_co_changes=_MIN_CO_CHANGES, min_npmi=_MIN_NPMI
+        ):
+            if _is_dark_matter(a, b, import_graph):
+                results.append(
+                    TypedDictDarkMatterPair(a=a, b=b, npmi=npmi, co_changes=co_count)
+                )
+                if len(results) == _TOP_K:
+                    break
+        return results
+
     total = matrix.total_commits
     candidates: list[TypedDictDarkMatterPair] = []
 
@@ -54,13 +72,7 @@ def find_dark_matter(
         if npmi < _MIN_NPMI:
             continue
 
-        if _has_static_edge(a, b, import_graph):
-            continue
-
-        if _is_test_impl_pair(a, b):
-            continue
-
-        if _same_prefix(a, b):
+        if not _is_dark_matter(a, b, import_graph):
             continue
 
         candidates.append(
@@ -71,6 +83,13 @@ def find_dark_matter(
     return candidates[:_TOP_K]
 
 
+def _is_dark_matter(a: str, b: str, graph: ImportGraph) -> bool:
+    """True if the pair survives the static-edge, test/impl and prefix filters."""
+    return not (
+        _has_static_edge(a, b, graph) or _is_test_impl_pair(a, b) or _same_prefix(a, b)
+    )
+
+
 def _has_static_edge(a: str, b: str, graph: ImportGraph) -> bool:
     """True if there is a static import edge in either direction."""
     a_edges = graph.edges_out.get(a, set())
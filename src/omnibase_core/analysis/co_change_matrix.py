@@ -4,6 +4,7 @@ import math
 from collections import Counter
 from collections.abc import Mapping
 from dataclasses import dataclass
+from itertools import combinations
 from types import MappingProxyType
 
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
@@ -34,16 +35,16 @@ def build_cochange_matrix(commits: list[list[str]]) -> CoChangeMatrix:
     Files within each commit are deduplicated before counting; pairs are stored
     as sorted (a, b) tuples with a < b. Returns a frozen CoChangeMatrix whose
     mapping fields are wrapped in MappingProxyType.
+
+    For large histories, see co_change_sparse.build_sparse_cochange_matrix.
     """
     pair_count: Counter[tuple[str, str]] = Counter()
     file_count: Counter[str] = Counter()
     for files in commits:
         unique = sorted(set(files))
-        for f in unique:
-            file_count[f] += 1
-        for i in range(len(unique)):
-            for j in range(i + 1, len(unique)):
-                pair_count[(unique[i], unique[j])] += 1
+        file_count.update(unique)
+        # combinations() of a sorted list yields (a, b) with a < b
+        pair_count.update(combinations(unique, 2))
     return CoChangeMatrix(
         MappingProxyType(dict(pair_count)),
         MappingProxyType(dict(file_count)),
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Sparse NumPy/SciPy backend for co-change matrices.
+
+File paths are interned to integer IDs (in sorted path order) and each commit
+becomes a row of a sparse commit x file incidence matrix X. The file x file
+co-occurrence counts are then X^T X: its diagonal holds the per-file commit
+counts and its strict upper triangle the pair counts, with the same (a < b)
+orientation as CoChangeMatrix.pair_count. Scoring (NPMI, lift) and threshold
+filtering run over the whole pair array at once, and candidates are ordered in
+the array domain, so only the pairs a caller consumes become Python objects.
+
+Requires the optional ``analysis`` extra (numpy and scipy). Both are loaded
+lazily; use has_sparse_backend() to check availability.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING
+
+from omnibase_core.analysis.co_change_matrix import CoChangeMatrix
+from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.models.errors.model_onex_error import ModelOnexError
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    _IntArray = npt.NDArray[np.int64]
+
+# Lazy-loaded numpy / scipy.sparse module references
+_np: ModuleType | None = None
+_sparse: ModuleType | None = None
+_HAS_BACKEND: bool | None = None
+
+
+def has_sparse_backend() -> bool:
+    """Lazy-load numpy and scipy.sparse and cache their availability.
+
+    Returns:
+        True if both are importable, False otherwise.
+    """
+    global _np, _sparse, _HAS_BACKEND
+    if _HAS_BACKEND is None:
+        try:
+            import numpy as np
+            import scipy.sparse  # type: ignore[import-untyped]
+
+            _np = np
+            _sparse = scipy.sparse
+            _HAS_BACKEND = True
+        except ImportError:
+            _HAS_BACKEND = False
+    return _HAS_BACKEND
+
+
+def _require_backend() -> tuple[ModuleType, ModuleType]:
+    if not has_sparse_backend() or _np is None or _sparse is None:
+        raise ModelOnexError(
+            "The sparse co-change backend requires numpy and scipy. "
+            "Install with: uv sync --extra analysis",
+            error_code=EnumCoreErrorCode.DEPENDENCY_UNAVAILABLE,
+        )
+    return _np, _sparse
+
+
+@dataclass(frozen=True)
+class SparseCoChangeMatrix:
+    """Immutable co-change statistics held as arrays.
+
+    files: interned file paths, sorted; a file's ID is its index.
+    file_count: per-file commit count, indexed by file ID.
+    pair_a, pair_b: file IDs of every co-changed pair, with pair_a < pair_b,
+      ordered by (pair_a, pair_b).
+    pair_count: co-occurrence count of each pair.
+    total_commits: total number of commits included in the analysis.
+
+    Arrays are marked read-only.
+    """
+
+    files: tuple[str, ...]
+    file_count: _IntArray
+    pair_a: _IntArray
+    pair_b: _IntArray
+    pair_count: _IntArray
+    total_commits: int
+
+    def scored_pairs(
+        self,
+        min_co_changes: int = 1,
+        min_npmi: float = -1.0,
+        min_lift: float = 0.0,
+    ) -> Iterator[tuple[str, str, float, int]]:
+        """Yield ``(a, b, npmi, co_changes)`` for pairs passing all thresholds.
+
+        Pairs come in descending NPMI order, ties in (a, b) path order.
+        NPMI and lift follow compute_npmi and compute_lift; pairs present in
+        every commit score an NPMI of 1.0.
+        """
+        np, _ = _require_backend()
+        if self.total_commits == 0 or len(self.pair_count) == 0:
+            return
+        total = float(self.total_commits)
+        p_ab = self.pair_count / total
+        p_a = self.file_count[self.pair_a] / total
+        p_b = self.file_count[self.pair_b] / total
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            npmi = (np.log(p_ab) - np.log(p_a * p_b)) / -np.log(p_ab)
+        npmi = np.where(p_ab >= 1.0, 1.0, np.clip(npmi, -1.0, 1.0))
+        lift = p_ab / (p_a * p_b)
+
+        mask = (
+            (self.pair_count >= min_co_changes)
+            & (npmi >= min_npmi)
+            & (lift >= min_lift)
+        )
+        selected = np.flatnonzero(mask)
+        # lexsort sorts by the last key first; pairs are already in (a, b) order
+        order = selected[np.lexsort((selected, -npmi[selected]))]
+        for index in order:
+            yield (
+                self.files[self.pair_a[index]],
+                self.files[self.pair_b[index]],
+                float(npmi[index]),
+                int(self.pair_count[index]),
+            )
+
+    def to_cochange_matrix(self) -> CoChangeMatrix:
+        """Return the equivalent mapping-based CoChangeMatrix."""
+        files = self.files
+        return CoChangeMatrix(
+            MappingProxyType(
+                {
+                    (files[a], files[b]): int(count)
+                    for a, b, count in zip(
+                        self.pair_a.tolist(),
+                        self.pair_b.tolist(),
+                        self.pair_count.tolist(),
+                        strict=True,
+                    )
+                }
+            ),
+            MappingProxyType(dict(zip(files, self.file_count.tolist(), strict=True))),
+            self.total_commits,
+        )
+
+
+def build_sparse_cochange_matrix(commits: list[list[str]]) -> SparseCoChangeMatrix:
+    """Build a SparseCoChangeMatrix from a list of per-commit file lists.
+
+    Counts match build_cochange_matrix(): files are deduplicated within each
+    commit and pairs are oriented (a < b).
+
+    Raises:
+        ModelOnexError: numpy or scipy is not installed.
+    """
+    np, sparse = _require_backend()
+    # Intern in first-seen order, then renumber so IDs follow path order
+    file_id: dict[str, int] = {}
+    intern = file_id.setdefault
+    seen_ids = [intern(f, len(file_id)) for commit in commits for f in commit]
+    names = list(file_id)
+    by_path = sorted(range(len(names)), key=names.__getitem__)
+    files = tuple(names[i] for i in by_path)
+    rank = np.empty(len(names), dtype=np.int64)
+    rank[by_path] = np.arange(len(names), dtype=np.int64)
+
+    indptr = np.zeros(len(commits) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter(map(len, commits), dtype=np.int64, count=len(commits)),
+        out=indptr[1:],
+    )
+    indices = rank[np.asarray(seen_ids, dtype=np.int64)]
+    incidence = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int64), indices, indptr),
+        shape=(len(commits), len(files)),
+    )
+    # A file listed twice in one commit counts once
+    incidence.sum_duplicates()
+    incidence.data[:] = 1
+
+    cooccurrence = (incidence.T @ incidence).tocoo()
+    file_count = np.zeros(len(files), dtype=np.int64)
+    diagonal = cooccurrence.row == cooccurrence.col
+    file_count[cooccurrence.row[diagonal]] = cooccurrence.data[diagonal]
+
+    upper = cooccurrence.row < cooccurrence.col
+    pair_a = cooccurrence.row[upper].astype(np.int64)
+    pair_b = cooccurrence.col[upper].astype(np.int64)
+    pair_count = cooccurrence.data[upper].astype(np.int64)
+    order = np.lexsort((pair_b, pair_a))
+
+    arrays = (file_count, pair_a[order], pair_b[order], pair_count[order])
+    for array in arrays:
+        array.flags.writeable = False
+    return SparseCoChangeMatrix(files, *arrays, total_commits=len(commits))
+
+
+__all__ = [
+    "SparseCoChangeMatrix",
+    "build_sparse_cochange_matrix",
+    "has_sparse_backend",
+]
@@ -1,47 +1,89 @@
 # SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
 # SPDX-License-Identifier: MIT
 
-"""Consumer graph builder: counts how many files import each module."""
+"""Consumer graph builder: counts how many files import each module.
+
+The import edges behind the counts are stored with them, so a rebuild after
+a HEAD change only adjusts the counts of targets whose importers changed
+(see _apply_edge_deltas); parsing itself is incremental through the import
+graph's content-hash cache.
+"""
 
 import json
 import subprocess
 from pathlib import Path
 
-from omnibase_core.analysis.import_graph import build_import_graph
+from omnibase_core.analysis.import_graph import ImportGraph, build_import_graph
+
+# Key in consumer-graph.json holding the import edges behind the counts
+_EDGES_KEY = "edges"
 
 
 def build_consumer_graph(repo_root: Path) -> dict[str, int]:
     """Return a mapping of repo-relative file path -> number of files that import it.
 
     Results are cached in .onex_state/consumer-graph.json keyed by the current
-    git HEAD SHA. A SHA mismatch triggers a full recompute and cache overwrite.
+    git HEAD SHA. On a SHA mismatch the import graph is rebuilt (reparsing
+    only files whose content changed) and the cached counts are updated by
+    the edges that changed; without usable cached edges the counts are
+    recomputed in full.
     """
     repo_root = repo_root.resolve()
     cache_path = repo_root / ".onex_state" / "consumer-graph.json"
     head_sha = _git_head_sha(repo_root)
 
-    if head_sha and cache_path.is_file():
+    cached: object = None
+    if cache_path.is_file():
         try:
             cached = json.loads(cache_path.read_text(encoding="utf-8"))
-            if isinstance(cached, dict) and cached.get("sha") == head_sha:
-                return {
-                    k: v
-                    for k, v in cached.items()
-                    if k != "sha" and isinstance(k, str) and isinstance(v, int)
-                }
         except (json.JSONDecodeError, OSError):
             # Cache reads are best-effort; invalid or unreadable cache forces recompute.
-            counts = _compute(repo_root)
-            _write_cache(cache_path, head_sha, counts)
-            return counts
+            cached = None
 
-    counts = _compute(repo_root)
-    _write_cache(cache_path, head_sha, counts)
+    counts = _cached_counts(cached)
+    if head_sha and isinstance(cached, dict) and cached.get("sha") == head_sha:
+        return counts
+
+    graph = build_import_graph(
+        repo_root, cache_path=repo_root / ".onex_state" / "import-graph-cache.json"
+    )
+    previous_edges = _cached_edges(cached)
+    if previous_edges is None:
+        counts = _count_consumers(graph)
+    else:
+        _apply_edge_deltas(counts, previous_edges, graph)
+    _write_cache(cache_path, head_sha, counts, graph)
     return counts
 
 
-def _compute(repo_root: Path) -> dict[str, int]:
-    graph = build_import_graph(repo_root)
+def _cached_counts(cached: object) -> dict[str, int]:
+    if not isinstance(cached, dict):
+        return {}
+    return {
+        k: v
+        for k, v in cached.items()
+        if k != "sha" and isinstance(k, str) and isinstance(v, int)
+    }
+
+
+def _cached_edges(cached: object) -> dict[str, set[str]] | None:
+    """Return the edges stored with the cached counts, if well-formed."""
+    if not isinstance(cached, dict):
+        return None
+    edges = cached.get(_EDGES_KEY)
+    if not isinstance(edges, dict):
+        return None
+    result: dict[str, set[str]] = {}
+    for src, targets in edges.items():
+        if not isinstance(targets, list) or not all(
+            isinstance(t, str) for t in targets
+        ):
+            return None
+        result[src] = set(targets)
+    return result
+
+
+def _count_consumers(graph: ImportGraph) -> dict[str, int]:
     counts: dict[str, int] = {}
     for _src, targets in graph.edges_out.items():
         for target in targets:
@@ -49,6 +91,30 @@ def _compute(repo_root: Path) -> dict[str, int]:
     return counts
 
 
+def _apply_edge_deltas(
+    counts: dict[str, int], previous: dict[str, set[str]], graph: ImportGraph
+) -> None:
+    """Update counts in place from the previous edges to graph's edges.
+
+    Only sources whose edge sets differ touch the counts; targets that drop
+    to zero are removed.
+    """
+    current = graph.edges_out
+    for src in previous.keys() | current.keys():
+        old = previous.get(src, set())
+        new = current.get(src, set())
+        if old == new:
+            continue
+        for target in old - new:
+            remaining = counts.get(target, 0) - 1
+            if remaining > 0:
+                counts[target] = remaining
+            else:
+                counts.pop(target, None)
+        for target in new - old:
+            counts[target] = counts.get(target, 0) + 1
+
+
 def _git_head_sha(repo_root: Path) -> str | None:
     try:
         result = subprocess.run(
@@ -63,10 +129,15 @@ def _git_head_sha(repo_root: Path) -> str | None:
         return None
 
 
-def _write_cache(cache_path: Path, sha: str | None, counts: dict[str, int]) -> None:
+def _write_cache(
+    cache_path: Path, sha: str | None, counts: dict[str, int], graph: ImportGraph
+) -> None:
     try:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         payload: dict[str, object] = {"sha": sha, **counts}
+        payload[_EDGES_KEY] = {
+            src: sorted(targets) for src, targets in sorted(graph.edges_out.items())
+        }
         cache_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     except OSError:
         # Cache writes are best-effort; callers already have the computed graph.
@@ -1,15 +1,56 @@
 # SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
 # SPDX-License-Identifier: MIT
 
-"""Static import graph builder for Python and JavaScript/TypeScript files."""
+"""Static import graph builder for Python and JavaScript/TypeScript files.
+
+Building happens in two steps. Each file is first parsed into raw import
+records (dotted module names and relative-import levels for Python, relative
+specifiers for JS/TS), which depend only on the file's content. The records
+are then resolved against the files present in the repo.
+
+Raw records can be kept in a JSON cache keyed by content hash, so a rebuild
+only reparses files whose content changed; resolution always reruns, so
+edges appear and disappear as import targets are added and removed. Cache
+misses are parsed in a process pool once there are enough of them.
+"""
 
 import ast
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
 
 _JS_EXTS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
 _PY_EXTS = (".py",)
 
+# Bump when the raw record format or the parsers change
+_CACHE_VERSION = 2
+# Fewest cache misses worth starting a process pool for
+_PARALLEL_MIN_FILES = 64
+
+
+class _PyImport(NamedTuple):
+    """One Python import record.
+
+    level 0 is absolute, and no names with level 0 is a plain
+    ``import module``.
+    """
+
+    level: int
+    module: str | None
+    names: tuple[str, ...]
+
+
+class _FileRecords(NamedTuple):
+    """Raw import records of one file; only the field of its kind is set."""
+
+    python: tuple[_PyImport, ...] = ()
+    js: tuple[str, ...] = ()
+
 
 @dataclass
 class ImportGraph:
@@ -22,69 +63,234 @@ def _to_repo_rel(path: Path, repo_root: Path) -> str:
     return path.relative_to(repo_root).as_posix()
 
 
-def build_import_graph(repo_root: Path) -> ImportGraph:
-    """Build a static import graph for Python and JS/TS files under repo_root."""
+def build_import_graph(
+    repo_root: Path,
+    cache_path: Path | None = None,
+    max_workers: int | None = None,
+) -> ImportGraph:
+    """Build a static import graph for Python and JS/TS files under repo_root.
+
+    Args:
+        repo_root: Repository root; edges are relative to it.
+        cache_path: Optional JSON file of raw import records keyed by content
+            hash. Files whose content is cached are not reparsed; the cache
+            is rewritten with the records of the current files.
+        max_workers: Process pool size for parsing cache misses; defaults to
+            the CPU count. 1 parses in this process.
+    """
     graph = ImportGraph()
     repo_root = repo_root.resolve()
     python_search_roots = _python_search_roots(repo_root)
 
-    py_files: list[Path] = []
-    js_files: list[Path] = []
-
+    files: list[tuple[Path, str, str]] = []
+    sources: dict[str, tuple[str, str]] = {}
     for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
         if path.suffix in _PY_EXTS:
-            py_files.append(path)
+            kind = "py"
         elif path.suffix in _JS_EXTS:
-            js_files.append(path)
-
-    for path in py_files:
-        rel = _to_repo_rel(path, repo_root)
-        edges = _parse_python_imports(path, repo_root, python_search_roots)
-        if edges:
-            graph.edges_out[rel] = edges
-
-    for path in js_files:
-        rel = _to_repo_rel(path, repo_root)
-        edges = _parse_js_imports(path, repo_root)
+            kind = "js"
+        else:
+            continue
+        if not path.is_file():
+            continue
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue  # unreadable files contribute no edges
+        key = f"{kind}:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+        files.append((path, kind, key))
+        if key not in sources:
+            sources[key] = (kind, _decode_source(data))
+
+    cached = _load_records(cache_path) if cache_path is not None else {}
+    records = {key: cached[key] for key in sources if key in cached}
+    misses = [key for key in sources if key not in records]
+    records.update(
+        zip(
+            misses,
+            _extract_all([sources[key] for key in misses], max_workers),
+            strict=True,
+        )
+    )
+    if cache_path is not None and (misses or len(records) != len(cached)):
+        _save_records(cache_path, records)
+
+    python_modules: dict[str, str | None] = {}
+    for path, kind, key in files:
+        if kind == "py":
+            edges = _resolve_python_records(
+                records[key].python,
+                path,
+                repo_root,
+                python_search_roots,
+                python_modules,
+            )
+        else:
+            edges = _resolve_js_records(records[key].js, path, repo_root)
         if edges:
-            graph.edges_out[rel] = edges
+            graph.edges_out[_to_repo_rel(path, repo_root)] = edges
 
     return graph
 
 
-def _parse_python_imports(
-    path: Path, repo_root: Path, search_roots: list[Path]
-) -> set[str]:
-    """Extract imported module paths from a Python file, resolved to repo-relative paths."""
+def _decode_source(data: bytes) -> str:
+    """Decode as Path.read_text(encoding="utf-8", errors="ignore") would."""
+    source = data.decode("utf-8", errors="ignore")
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+
+def _extract_records(kind: str, source: str) -> _FileRecords:
+    """Return the raw import records of one file's source."""
+    if kind == "py":
+        return _FileRecords(python=_extract_python_records(source))
+    return _FileRecords(js=_extract_js_records(source))
+
+
+def _extract_records_args(args: tuple[str, str]) -> _FileRecords:
+    return _extract_records(*args)
+
+
+def _extract_all(
+    sources: list[tuple[str, str]], max_workers: int | None
+) -> list[_FileRecords]:
+    """Extract records for every source, in a process pool when worthwhile."""
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if workers > 1 and len(sources) >= _PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(
+                    pool.map(
+                        _extract_records_args,
+                        sources,
+                        chunksize=max(1, len(sources) // (workers * 4)),
+                    )
+                )
+        except (BrokenProcessPool, OSError):
+            # fallback-ok: no usable process pool here, parse in this process
+            pass
+    return [_extract_records(kind, source) for kind, source in sources]
+
+
+def _load_records(cache_path: Path) -> dict[str, _FileRecords]:
+    """Return cached raw records, or nothing if the cache is unusable."""
     try:
-        source = path.read_text(encoding="utf-8", errors="ignore")
-        tree = ast.parse(source, filename=str(path))
-    except (OSError, SyntaxError):
-        return set()
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # Cache reads are best-effort; a missing or invalid cache reparses all.
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        return {}
+    records = payload.get("records")
+    if not isinstance(records, dict):
+        return {}
+    loaded: dict[str, _FileRecords] = {}
+    for key, value in records.items():
+        file_records = _decode_records(value)
+        if isinstance(key, str) and file_records is not None:
+            loaded[key] = file_records
+    return loaded
+
+
+def _decode_records(value: object) -> _FileRecords | None:
+    """Rebuild one file's records from their JSON form, or None if malformed."""
+    if not isinstance(value, list) or len(value) != 2:
+        return None
+    python, js = value
+    if not isinstance(python, list) or not _is_str_list(js):
+        return None
+    imports: list[_PyImport] = []
+    for record in python:
+        if not isinstance(record, list) or len(record) != 3:
+            return None
+        level, module, names = record
+        if (
+            not isinstance(level, int)
+            or not (module is None or isinstance(module, str))
+            or not _is_str_list(names)
+        ):
+            return None
+        imports.append(_PyImport(level, module, tuple(names)))
+    return _FileRecords(tuple(imports), tuple(js))
 
-    imports: list[str] = []
+
+def _is_str_list(value: object) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _save_records(cache_path: Path, records: dict[str, _FileRecords]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": _CACHE_VERSION, "records": records}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(cache_path)
+    except OSError:
+        # Cache writes are best-effort; callers already have the graph.
+        return
+
+
+def _extract_python_records(source: str) -> tuple[_PyImport, ...]:
+    """Return a record for every import in a Python source."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return ()
+
+    records: list[_PyImport] = []
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name)
+            records.extend(_PyImport(0, alias.name, ()) for alias in node.names)
         elif isinstance(node, ast.ImportFrom):
-            if node.level > 0:
-                imports.extend(_relative_import_names(node, path, search_roots))
-            elif node.module:
-                imports.append(node.module)
-                imports.extend(
-                    f"{node.module}.{alias.name}"
-                    for alias in node.names
-                    if alias.name != "*"
+            if node.level > 0 or node.module:
+                records.append(
+                    _PyImport(
+                        node.level,
+                        node.module,
+                        tuple(alias.name for alias in node.names),
+                    )
                 )
+    return tuple(records)
+
+
+def _resolve_python_records(
+    records: tuple[_PyImport, ...],
+    path: Path,
+    repo_root: Path,
+    search_roots: list[Path],
+    resolved_modules: dict[str, str | None],
+) -> set[str]:
+    """Resolve a Python file's raw records to repo-relative import targets.
+
+    ``resolved_modules`` memoizes module resolution across the files of one
+    build.
+    """
+    imports: list[str] = []
+    for record in records:
+        module = record.module
+        if record.level > 0:
+            imports.extend(_relative_import_names(record, path, search_roots))
+        elif module is None:
+            continue  # absolute imports always name a module
+        elif not record.names:
+            imports.append(module)
+        else:
+            imports.append(module)
+            imports.extend(f"{module}.{name}" for name in record.names if name != "*")
 
     edges: set[str] = set()
     src_rel = _to_repo_rel(path, repo_root)
 
     for module_name in imports:
-        resolved = _resolve_python_module(module_name, repo_root, search_roots)
+        if module_name in resolved_modules:
+            resolved = resolved_modules[module_name]
+        else:
+            resolved = resolved_modules[module_name] = _resolve_python_module(
+                module_name, repo_root, search_roots
+            )
         if resolved and resolved != src_rel:
             edges.add(resolved)
 
@@ -99,9 +305,9 @@ def _python_search_roots(repo_root: Path) -> list[Path]:
 
 
 def _relative_import_names(
-    node: ast.ImportFrom, importing_file: Path, search_roots: list[Path]
+    record: _PyImport, importing_file: Path, search_roots: list[Path]
 ) -> list[str]:
-    """Convert an ast.ImportFrom relative import into candidate dotted modules."""
+    """Convert a relative ``from`` import into candidate dotted modules."""
     root = _nearest_search_root(importing_file, search_roots)
     if root is None:
         return []
@@ -110,22 +316,17 @@ def _relative_import_names(
     except ValueError:
         return []
 
-    if node.level > len(package_parts):
+    if record.level > len(package_parts):
         return []
 
-    base_parts = package_parts[: len(package_parts) - node.level + 1]
-    if node.module:
-        base_parts.extend(node.module.split("."))
-        names = [".".join(base_parts)]
-        names.extend(
-            ".".join([*base_parts, alias.name])
-            for alias in node.names
-            if alias.name != "*"
-        )
-        return names
-    return [
-        ".".join([*base_parts, alias.name]) for alias in node.names if alias.name != "*"
-    ]
+    base_parts = package_parts[: len(package_parts) - record.level + 1]
+    names = [name for name in record.names if name != "*"]
+    if record.module:
+        base_parts.extend(record.module.split("."))
+        candidates = [".".join(base_parts)]
+        candidates.extend(".".join([*base_parts, name]) for name in names)
+        return candidates
+    return [".".join([*base_parts, name]) for name in names]
 
 
 def _nearest_search_root(path: Path, search_roots: list[Path]) -> Path | None:
@@ -162,25 +363,25 @@ def _resolve_python_module(
     return None
 
 
-def _parse_js_imports(path: Path, repo_root: Path) -> set[str]:
-    """Extract imported module paths from a JS/TS file, resolved to repo-relative paths."""
-    try:
-        source = path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return set()
-
-    src_rel = _to_repo_rel(path, repo_root)
-    edges: set[str] = set()
-
+def _extract_js_records(source: str) -> tuple[str, ...]:
+    """Return the relative import specifiers of a JS/TS source."""
     source = _strip_js_comments(source)
     specifiers = [
         *_iter_js_require_specifiers(source),
         *_iter_js_import_specifiers(source),
     ]
+    # skip bare module specifiers (node_modules etc.)
+    return tuple(spec for spec in specifiers if spec.startswith("."))
+
+
+def _resolve_js_records(
+    records: tuple[str, ...], path: Path, repo_root: Path
+) -> set[str]:
+    """Resolve a JS/TS file's specifiers to repo-relative import targets."""
+    src_rel = _to_repo_rel(path, repo_root)
+    edges: set[str] = set()
 
-    for spec in specifiers:
-        if not spec.startswith("."):
-            continue  # skip bare module specifiers (node_modules etc.)
+    for spec in records:
         resolved = _resolve_js_specifier(spec, path, repo_root)
         if resolved and resolved != src_rel:
             edges.add(resolved)
@@ -25,6 +25,16 @@ Phase 1 hardening (OMN-13152) added in place:
   restricted-topic auth gate, exposes the redaction state, supports chunked
   streaming, and raises explicitly on a missing artifact.
 
+Scope ledger: per-scope byte totals are kept in ``<root>/.scope_ledger.json``
+and updated under an exclusive lock on every write and delete, so quota checks
+never scan the sidecars. A missing or unreadable ledger is rebuilt from the
+sidecars on first use; :meth:`ArtifactStore.rebuild_scope_ledger` does the same
+after blobs are removed by anything other than
+:meth:`ArtifactStore.delete_blob`.
+
+Streaming writes: :meth:`ArtifactStore.write_stream` hashes, secret-scans and
+writes a payload chunk by chunk, so large artifacts never sit in memory whole.
+
 Design constraints (unchanged from the minimal slice):
 
 - stdlib + Pydantic only — no infra deps — so omniclaude hooks import this
@@ -46,9 +56,18 @@ import json
 import os
 import re
 import tempfile
-from collections.abc import Callable, Iterator
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO
+
+try:
+    import fcntl
+except ImportError:  # fallback-ok: non-POSIX; the in-process lock still applies
+    fcntl = None  # type: ignore[assignment]
 
 from omnibase_core.enums.artifacts.enum_artifact_redaction_state import (
     EnumArtifactRedactionState,
@@ -88,6 +107,21 @@ _BYTES_PER_TOKEN_ESTIMATE = 4
 
 _META_SUFFIX = ".meta.json"
 
+# Per-scope size ledger and the lock file serializing its read-modify-write.
+# Both live at the root, beside the shard directories, so sidecar scans skip
+# them.
+_LEDGER_NAME = ".scope_ledger.json"
+_LEDGER_LOCK_NAME = ".scope_ledger.lock"
+_LEDGER_VERSION = 1
+
+# Serializes ledger updates between threads where fcntl is unavailable.
+_LEDGER_THREAD_LOCK = threading.Lock()
+
+# Bytes of each streamed chunk held back and rescanned with the next chunk, so
+# a secret split across a chunk boundary is still detected before any of it
+# reaches disk.
+_SECRET_SCAN_OVERLAP_BYTES = 4096
+
 # Default chunk size for streaming reads.
 DEFAULT_READ_CHUNK_BYTES = 64 * 1024
 
@@ -248,7 +282,7 @@ class ArtifactStore:
 
         # Quota: per-write cap is checked first so an oversize single write is
         # rejected even when the scope is otherwise empty.
-        self._enforce_per_write_quota(stored_bytes)
+        self._enforce_per_write_quota(len(stored_bytes))
 
         # Secret detection runs on the bytes that would be persisted.
         if self._secret_detector.contains_secret(stored_bytes):
@@ -268,45 +302,135 @@ class ArtifactStore:
             raise ArtifactSecretDetectedError(secret_ref)
 
         ref = ModelArtifactRef.from_bytes(stored_bytes)
-        blob_path = self._blob_path(ref)
-        if blob_path.exists():
+        if self._blob_path(ref).exists():
             return ref
 
-        # Per-scope quota is checked against the live on-disk size, immediately
-        # before the write, so concurrent growth is accounted for.
-        self._enforce_scope_quota(scope_ref, len(stored_bytes))
-
-        shard_dir = blob_path.parent
-        shard_dir.mkdir(parents=True, exist_ok=True)
-
-        effective_ttl = (
-            retention_ttl_seconds
-            if retention_ttl_seconds is not None
-            else retention_class.default_ttl_seconds
-        )
-
-        meta = ModelArtifactMetadata(
-            artifact_hash=ref.hex_digest,
-            artifact_size_bytes=len(stored_bytes),
-            artifact_media_type=media_type,
+        meta = self._new_meta(
+            ref,
+            size_bytes=len(stored_bytes),
+            media_type=media_type,
             artifact_kind=artifact_kind,
             source_system=source_system,
             scope_ref=scope_ref,
             correlation_id=correlation_id,
             retention_class=retention_class,
-            retention_ttl_seconds=effective_ttl,
+            retention_ttl_seconds=retention_ttl_seconds,
             redaction_state=redaction_state,
             redaction_transform=transform_name,
             restricted=is_restricted,
-            token_estimate=len(stored_bytes) // _BYTES_PER_TOKEN_ESTIMATE,
-            created_at_utc=datetime.now(UTC).isoformat(),
-            writer_version=WRITER_VERSION,
         )
+        self._commit_blob(
+            ref, meta, lambda blob_path: self._atomic_write(blob_path, stored_bytes)
+        )
+        return ref
+
+    def write_stream(
+        self,
+        source: Iterable[bytes] | BinaryIO,
+        *,
+        media_type: str,
+        artifact_kind: str,
+        source_system: str,
+        scope_ref: str | None,
+        correlation_id: str | None,
+        retention_class: EnumArtifactRetentionClass = EnumArtifactRetentionClass.SESSION,
+        retention_ttl_seconds: int | None = None,
+        restricted: bool | None = None,
+        chunk_size: int = DEFAULT_READ_CHUNK_BYTES,
+    ) -> ModelArtifactRef:
+        """Store a chunked payload content-addressed and return its ref.
+
+        Equivalent to :meth:`write_blob` on the concatenated chunks, without
+        holding the payload in memory: each chunk is hashed, secret-scanned and
+        appended to a temp file in the store root, which is renamed into place
+        once the digest is known. ``source`` is an iterable of byte chunks or a
+        binary file object, read ``chunk_size`` bytes at a time.
+
+        The per-write quota is checked as bytes arrive, so an oversize stream
+        is abandoned early. On secret detection nothing more is written; the
+        rest of the stream is still hashed so the ``secret_detected`` sidecar
+        carries the same ref :meth:`write_blob` would record. Redaction
+        transforms need the whole payload and are not supported here.
 
-        # Sidecar first, blob last: blob presence is the idempotency signal, so
-        # a crash between the two writes never yields a blob without meta.
-        self._atomic_write(self._meta_path(ref), self._serialize_meta(meta))
-        self._atomic_write(blob_path, stored_bytes)
+        Raises:
+            ArtifactQuotaExceededError: a quota would be exceeded.
+            ArtifactSecretDetectedError: a secret was detected in the bytes.
+            ValueError: ``chunk_size`` <= 0.
+        """
+        if chunk_size <= 0:
+            msg = f"chunk_size must be > 0, got {chunk_size}"
+            raise ValueError(msg)
+        chunks: Iterable[bytes] = (
+            iter(partial(source.read, chunk_size), b"")
+            if hasattr(source, "read")
+            else source
+        )
+        is_restricted = (
+            restricted
+            if restricted is not None
+            else artifact_kind in RESTRICTED_ARTIFACT_KINDS
+        )
+
+        self._root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._root, prefix=".stream.tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            hasher = hashlib.sha256()
+            size = 0
+            secret_detected = False
+            # Scanned but not yet written; rescanned with the next chunk
+            held = b""
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in chunks:
+                    size += len(chunk)
+                    self._enforce_per_write_quota(size)
+                    hasher.update(chunk)
+                    if secret_detected:
+                        continue
+                    window = held + chunk
+                    if self._secret_detector.contains_secret(window):
+                        secret_detected = True
+                        continue
+                    handle.write(window[:-_SECRET_SCAN_OVERLAP_BYTES])
+                    held = window[-_SECRET_SCAN_OVERLAP_BYTES:]
+                if not secret_detected:
+                    handle.write(held)
+
+            ref = ModelArtifactRef(ref=f"sha256:{hasher.hexdigest()}")
+            if secret_detected:
+                self._record_secret_detected(
+                    ref,
+                    media_type=media_type,
+                    artifact_kind=artifact_kind,
+                    source_system=source_system,
+                    scope_ref=scope_ref,
+                    correlation_id=correlation_id,
+                    retention_class=retention_class,
+                    retention_ttl_seconds=retention_ttl_seconds,
+                    restricted=is_restricted,
+                    size_bytes=size,
+                )
+                raise ArtifactSecretDetectedError(ref)
+            if self._blob_path(ref).exists():
+                return ref
+
+            meta = self._new_meta(
+                ref,
+                size_bytes=size,
+                media_type=media_type,
+                artifact_kind=artifact_kind,
+                source_system=source_system,
+                scope_ref=scope_ref,
+                correlation_id=correlation_id,
+                retention_class=retention_class,
+                retention_ttl_seconds=retention_ttl_seconds,
+                redaction_state=EnumArtifactRedactionState.RAW,
+                redaction_transform=None,
+                restricted=is_restricted,
+            )
+            self._commit_blob(ref, meta, tmp_path.replace)
+        finally:
+            tmp_path.unlink(missing_ok=True)  # cleanup-resilience-ok: remove temp file
         return ref
 
     def read(
@@ -428,42 +552,74 @@ class ArtifactStore:
         """Total on-disk blob bytes currently attributed to ``scope_ref``.
 
         ``secret_detected`` sidecars (which have no blob) are excluded.
+        Answered from the scope ledger, which is rebuilt from the sidecars if
+        it is missing.
         """
-        total = 0
-        for meta_path in self._iter_meta_paths():
-            try:
-                loaded = json.loads(meta_path.read_bytes())
-            except (OSError, json.JSONDecodeError):  # fallback-ok: skip unreadable
-                continue
-            if not isinstance(loaded, dict):
-                continue
-            if loaded.get("scope_ref") != scope_ref:
-                continue
-            if (
-                loaded.get("redaction_state")
-                == EnumArtifactRedactionState.SECRET_DETECTED.value
-            ):
-                continue
-            size = loaded.get("artifact_size_bytes")
-            if isinstance(size, int):
-                total += size
-        return total
+        if not self._root.is_dir():
+            return 0
+        ledger = self._load_ledger()
+        if ledger is None:
+            with self._ledger_lock():
+                ledger = self._read_ledger_locked()
+        return ledger.get(scope_ref, 0)
+
+    def rebuild_scope_ledger(self) -> None:
+        """Recompute the scope ledger from the sidecars.
+
+        Needed only after blobs or sidecars were removed or restored by
+        something other than this store.
+        """
+        if not self._root.is_dir():
+            return
+        with self._ledger_lock():
+            self._save_ledger(self._scan_scope_sizes())
 
-    def _enforce_per_write_quota(self, stored_bytes: bytes) -> None:
+    def delete_blob(self, ref: ModelArtifactRef) -> bool:
+        """Remove the blob and sidecar for ``ref`` and release its scope bytes.
+
+        Returns:
+            True if anything was removed, False if ``ref`` was not stored.
+        """
+        blob_path = self._blob_path(ref)
+        meta_path = self._meta_path(ref)
+        if not self._root.is_dir():
+            return False
+        with self._ledger_lock():
+            try:
+                meta: ModelArtifactMetadata | None = self.read_meta(ref)
+            except (OSError, ValueError):  # fallback-ok: delete what exists
+                meta = None
+            had_blob = blob_path.is_file()
+            if not had_blob and not meta_path.exists():
+                return False
+            ledger = self._read_ledger_locked()
+            blob_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+            if had_blob and meta is not None:
+                remaining = ledger.get(meta.scope_ref, 0) - meta.artifact_size_bytes
+                ledger[meta.scope_ref] = max(remaining, 0)
+                self._save_ledger(ledger)
+            elif had_blob:
+                # The sidecar was unreadable, so its scope is unknown
+                self._save_ledger(self._scan_scope_sizes())
+        return True
+
+    def _enforce_per_write_quota(self, size_bytes: int) -> None:
         if (
             self._max_artifact_bytes is not None
-            and len(stored_bytes) > self._max_artifact_bytes
+            and size_bytes > self._max_artifact_bytes
         ):
             msg = (
-                f"artifact size {len(stored_bytes)} exceeds per-write quota "
+                f"artifact size {size_bytes} exceeds per-write quota "
                 f"{self._max_artifact_bytes}"
             )
             raise ArtifactQuotaExceededError(msg)
 
-    def _enforce_scope_quota(self, scope_ref: str | None, incoming: int) -> None:
+    def _enforce_scope_quota(
+        self, scope_ref: str | None, incoming: int, current: int
+    ) -> None:
         if self._max_scope_bytes is None:
             return
-        current = self.scope_size_bytes(scope_ref)
         if current + incoming > self._max_scope_bytes:
             msg = (
                 f"scope {scope_ref!r} total {current + incoming} would exceed "
@@ -508,12 +664,46 @@ class ArtifactStore:
         if meta_path.exists():
             return
         meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = self._new_meta(
+            ref,
+            size_bytes=size_bytes,
+            media_type=media_type,
+            artifact_kind=artifact_kind,
+            source_system=source_system,
+            scope_ref=scope_ref,
+            correlation_id=correlation_id,
+            retention_class=retention_class,
+            retention_ttl_seconds=retention_ttl_seconds,
+            redaction_state=EnumArtifactRedactionState.SECRET_DETECTED,
+            redaction_transform=None,
+            restricted=restricted,
+            token_estimate=0,
+        )
+        self._atomic_write(meta_path, self._serialize_meta(meta))
+
+    @staticmethod
+    def _new_meta(
+        ref: ModelArtifactRef,
+        *,
+        size_bytes: int,
+        media_type: str,
+        artifact_kind: str,
+        source_system: str,
+        scope_ref: str | None,
+        correlation_id: str | None,
+        retention_class: EnumArtifactRetentionClass,
+        retention_ttl_seconds: int | None,
+        redaction_state: EnumArtifactRedactionState,
+        redaction_transform: str | None,
+        restricted: bool,
+        token_estimate: int | None = None,
+    ) -> ModelArtifactMetadata:
         effective_ttl = (
             retention_ttl_seconds
             if retention_ttl_seconds is not None
             else retention_class.default_ttl_seconds
         )
-        meta = ModelArtifactMetadata(
+        return ModelArtifactMetadata(
             artifact_hash=ref.hex_digest,
             artifact_size_bytes=size_bytes,
             artifact_media_type=media_type,
@@ -523,14 +713,129 @@ class ArtifactStore:
             correlation_id=correlation_id,
             retention_class=retention_class,
             retention_ttl_seconds=effective_ttl,
-            redaction_state=EnumArtifactRedactionState.SECRET_DETECTED,
-            redaction_transform=None,
+            redaction_state=redaction_state,
+            redaction_transform=redaction_transform,
             restricted=restricted,
-            token_estimate=0,
+            token_estimate=(
+                token_estimate
+                if token_estimate is not None
+                else size_bytes // _BYTES_PER_TOKEN_ESTIMATE
+            ),
             created_at_utc=datetime.now(UTC).isoformat(),
             writer_version=WRITER_VERSION,
         )
-        self._atomic_write(meta_path, self._serialize_meta(meta))
+
+    def _commit_blob(
+        self,
+        ref: ModelArtifactRef,
+        meta: ModelArtifactMetadata,
+        place_blob: Callable[[Path], object],
+    ) -> None:
+        """Quota-check, persist and account for a new blob under the ledger lock.
+
+        ``place_blob`` atomically creates the blob at the path it is given.
+        """
+        blob_path = self._blob_path(ref)
+        with self._ledger_lock():
+            # Re-checked under the lock: a concurrent writer may have stored it
+            if blob_path.exists():
+                return
+            ledger = self._read_ledger_locked()
+            # Checked against the ledger immediately before the write, under
+            # the same lock as every other write, so concurrent growth is
+            # accounted for.
+            self._enforce_scope_quota(
+                meta.scope_ref,
+                meta.artifact_size_bytes,
+                ledger.get(meta.scope_ref, 0),
+            )
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # Sidecar first, blob last: blob presence is the idempotency
+            # signal, so a crash between the two writes never yields a blob
+            # without meta.
+            self._atomic_write(self._meta_path(ref), self._serialize_meta(meta))
+            place_blob(blob_path)
+            ledger[meta.scope_ref] = (
+                ledger.get(meta.scope_ref, 0) + meta.artifact_size_bytes
+            )
+            self._save_ledger(ledger)
+
+    @contextmanager
+    def _ledger_lock(self) -> Iterator[None]:
+        """Hold the ledger lock across threads and, on POSIX, processes."""
+        self._root.mkdir(parents=True, exist_ok=True)
+        with _LEDGER_THREAD_LOCK:
+            fd = os.open(self._root / _LEDGER_LOCK_NAME, os.O_RDWR | os.O_CREAT)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)  # closing releases the flock
+
+    def _load_ledger(self) -> dict[str | None, int] | None:
+        """Return the persisted ledger, or None if it is missing or unreadable."""
+        try:
+            loaded: object = json.loads((self._root / _LEDGER_NAME).read_bytes())
+        except (OSError, ValueError):  # fallback-ok: caller rebuilds the ledger
+            return None
+        if not isinstance(loaded, dict) or loaded.get("version") != _LEDGER_VERSION:
+            return None
+        ledger: dict[str | None, int] = {}
+        for entry in loaded.get("scopes", []):
+            if not isinstance(entry, dict):
+                return None
+            scope_ref = entry.get("scope_ref")
+            size = entry.get("size_bytes")
+            if not isinstance(size, int) or not (
+                scope_ref is None or isinstance(scope_ref, str)
+            ):
+                return None
+            ledger[scope_ref] = size
+        return ledger
+
+    def _read_ledger_locked(self) -> dict[str | None, int]:
+        """Return the ledger, rebuilding it first if needed. Caller holds the lock."""
+        ledger = self._load_ledger()
+        if ledger is None:
+            ledger = self._scan_scope_sizes()
+            self._save_ledger(ledger)
+        return ledger
+
+    def _save_ledger(self, ledger: dict[str | None, int]) -> None:
+        # A list of entries rather than a mapping: None is a valid scope
+        payload = {
+            "version": _LEDGER_VERSION,
+            "scopes": [
+                {"scope_ref": scope_ref, "size_bytes": size}
+                for scope_ref, size in ledger.items()
+                if size
+            ],
+        }
+        self._atomic_write(self._root / _LEDGER_NAME, json.dumps(payload).encode())
+
+    def _scan_scope_sizes(self) -> dict[str | None, int]:
+        """Sum blob sizes per scope from every sidecar (the slow path)."""
+        totals: dict[str | None, int] = {}
+        for meta_path in self._iter_meta_paths():
+            try:
+                loaded = json.loads(meta_path.read_bytes())
+            except (OSError, json.JSONDecodeError):  # fallback-ok: skip unreadable
+                continue
+            if not isinstance(loaded, dict):
+                continue
+            if (
+                loaded.get("redaction_state")
+                == EnumArtifactRedactionState.SECRET_DETECTED.value
+            ):
+                continue
+            size = loaded.get("artifact_size_bytes")
+            scope_ref = loaded.get("scope_ref")
+            if isinstance(size, int) and (
+                scope_ref is None or isinstance(scope_ref, str)
+            ):
+                totals[scope_ref] = totals.get(scope_ref, 0) + size
+        return totals
 
     @staticmethod
     def _verify_hash(ref: ModelArtifactRef, data: bytes) -> None:
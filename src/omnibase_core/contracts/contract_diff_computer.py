@@ -51,14 +51,31 @@ Performance Considerations:
         - Define identity keys for all list fields to enable O(n) diffing
         - Use field exclusions to skip volatile/large fields
         - Consider chunking very large contracts (>10000 fields)
+        - Enable ``use_merkle_hashing`` when most subtrees are unchanged
+
+    Merkle Hashing:
+        With ``ModelDiffConfiguration.use_merkle_hashing`` every dict and list
+        of both dumps is hashed bottom-up first. Subtrees with equal hashes are
+        skipped in O(1), so the walk only descends where the contracts differ.
+        Hashes are cached per contract class and digest of the exact dump, so
+        a contract diffed again is dumped but not hashed again. The cache is
+        not keyed on the fingerprint, which ignores nulls and empty dicts.
 
 .. versionadded:: 0.4.0
 """
 
 from __future__ import annotations
 
+import datetime
+import hashlib
 import logging
+import math
+import pickle
+import threading
+from collections import OrderedDict
+from enum import Enum
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from pydantic import ValidationError
 
@@ -69,6 +86,23 @@ logger = logging.getLogger(__name__)
 # Maximum recursion depth for _items_equal to prevent stack overflow
 _MAX_RECURSION_DEPTH = 100
 
+# Maximum number of contract dumps kept with their subtree hashes
+_MERKLE_CACHE_SIZE = 1024
+
+# Scalar types whose repr() identifies the value exactly
+_EXACT_REPR_TYPES: tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bytes,
+    type(None),
+    Enum,
+    UUID,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
@@ -112,6 +146,129 @@ DEFAULT_IDENTITY_KEYS: dict[str, str] = {
 }
 
 
+def _digest(tag: bytes, parts: list[bytes]) -> bytes:
+    hasher = hashlib.blake2b(tag, digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _hash_subtree(value: object, hashes: dict[int, bytes]) -> bytes | None:
+    """Hash ``value`` bottom-up, recording the hash of every dict and list.
+
+    Returns None for values that cannot be hashed exactly (unknown types,
+    NaN); their ancestors get no hash either and are always walked.
+    """
+    if isinstance(value, dict):
+        entries: list[bytes] = []
+        complete = True
+        for key, item in value.items():
+            key_hash = _hash_subtree(key, hashes)
+            item_hash = _hash_subtree(item, hashes)
+            if key_hash is None or item_hash is None:
+                complete = False
+            else:
+                entries.append(key_hash + item_hash)
+        if not complete:
+            return None
+        # Sorted entry hashes make the hash independent of key order
+        digest = _digest(b"dict", sorted(entries))
+    elif isinstance(value, (list, tuple)):
+        children = [_hash_subtree(item, hashes) for item in value]
+        if any(child is None for child in children):
+            return None
+        digest = _digest(
+            b"list" if isinstance(value, list) else b"tuple",
+            [child for child in children if child is not None],
+        )
+    elif isinstance(value, _EXACT_REPR_TYPES):
+        if isinstance(value, float) and math.isnan(value):
+            return None  # NaN never equals itself
+        value_type = type(value)
+        return _digest(
+            f"{value_type.__module__}.{value_type.__qualname__}".encode(),
+            [repr(value).encode()],
+        )
+    else:
+        return None
+    hashes[id(value)] = digest
+    return digest
+
+
+class _SubtreeHashes:
+    """A contract dump with the Merkle hash of each of its dicts and lists.
+
+    Hashes are keyed by ``id()`` of the container, which stays valid because
+    the dump is kept alive with them. The dump is shared; do not mutate it.
+    """
+
+    __slots__ = ("data", "hashes")
+
+    def __init__(self, data: dict[str, object]) -> None:
+        self.data = data
+        self.hashes: dict[int, bytes] = {}
+        try:
+            _hash_subtree(data, self.hashes)
+        except RecursionError:
+            # fallback-ok: too deep to hash, every subtree is walked instead
+            self.hashes.clear()
+
+
+class _SubtreeHashCache:
+    """Thread-safe LRU of contract dumps and hashes, keyed by dump digest."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[type, bytes], _SubtreeHashes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, contract: BaseModel) -> _SubtreeHashes:
+        """Return the dump and hashes of ``contract``, hashing each dump once.
+
+        Pickled bytes keep the types that hashing tells apart (list vs tuple,
+        int vs float, enum vs str), so equal digests mean equal dumps.
+        """
+        data = contract.model_dump()
+        try:
+            digest = hashlib.blake2b(
+                pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16
+            ).digest()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # fallback-ok: unpicklable values are hashed without caching
+            return _SubtreeHashes(data)
+        key = (type(contract), digest)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        built = _SubtreeHashes(data)
+        with self._lock:
+            self._entries[key] = built
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return built
+
+
+_SUBTREE_HASH_CACHE = _SubtreeHashCache(_MERKLE_CACHE_SIZE)
+
+
+def _same_subtree(
+    hashes: tuple[_SubtreeHashes, _SubtreeHashes] | None,
+    before: object,
+    after: object,
+) -> bool:
+    """Return True if ``before`` and ``after`` are provably identical subtrees.
+
+    False means "unknown": the subtrees may still be equal.
+    """
+    if hashes is None:
+        return False
+    before_hash = hashes[0].hashes.get(id(before))
+    return before_hash is not None and before_hash == hashes[1].hashes.get(id(after))
+
+
 # naming-ok: utility class in contracts module, not a Node/Protocol/Service
 class ContractDiffComputer:
     """Computes semantic diffs between contract versions.
@@ -199,21 +356,34 @@ class ContractDiffComputer:
         after_name = self._get_contract_name(after)
 
         # Convert to dicts for comparison
-        before_dict = before.model_dump()
-        after_dict = after.model_dump()
+        hashes: tuple[_SubtreeHashes, _SubtreeHashes] | None = None
+        if self.config.use_merkle_hashing:
+            hashes = (
+                _SUBTREE_HASH_CACHE.get(before),
+                _SUBTREE_HASH_CACHE.get(after),
+            )
+            before_dict = hashes[0].data
+            after_dict = hashes[1].data
+        else:
+            before_dict = before.model_dump()
+            after_dict = after.model_dump()
 
         # Accumulate diffs
         field_diffs: list[ModelContractFieldDiff] = []
         list_diffs: list[ModelContractListDiff] = []
 
-        # Recursively diff the objects
-        self._diff_objects(
-            before=before_dict,
-            after=after_dict,
-            path="",
-            field_diffs=field_diffs,
-            list_diffs=list_diffs,
-        )
+        # Recursively diff the objects, unless they are identical throughout
+        if self.config.include_unchanged or not _same_subtree(
+            hashes, before_dict, after_dict
+        ):
+            self._diff_objects(
+                before=before_dict,
+                after=after_dict,
+                path="",
+                field_diffs=field_diffs,
+                list_diffs=list_diffs,
+                hashes=hashes,
+            )
 
         return ModelContractDiff(
             before_contract_name=before_name,
@@ -249,6 +419,7 @@ class ContractDiffComputer:
         path: str,
         field_diffs: list[ModelContractFieldDiff],
         list_diffs: list[ModelContractListDiff],
+        hashes: tuple[_SubtreeHashes, _SubtreeHashes] | None = None,
     ) -> None:
         """Recursively diff two dictionary objects.
 
@@ -261,6 +432,7 @@ class ContractDiffComputer:
             path: Current dot-separated path for field identification.
             field_diffs: Accumulator for scalar field differences.
             list_diffs: Accumulator for list field differences.
+            hashes: Subtree hashes of both dumps, in Merkle hashing mode.
         """
         # Get all keys from both dicts (sorted for deterministic output)
         all_keys = sorted(set(before.keys()) | set(after.keys()))
@@ -298,6 +470,11 @@ class ContractDiffComputer:
                 before_val = before[key]
                 after_val = after[key]
 
+                if not self.config.include_unchanged and _same_subtree(
+                    hashes, before_val, after_val
+                ):
+                    # Identical subtree: nothing to report
+                    continue
                 if isinstance(before_val, dict) and isinstance(after_val, dict):
                     # Recurse into nested dicts
                     self._diff_objects(
@@ -306,6 +483,7 @@ class ContractDiffComputer:
                         path=field_path,
                         field_diffs=field_diffs,
                         list_diffs=list_diffs,
+                        hashes=hashes,
                     )
                 elif isinstance(before_val, list) and isinstance(after_val, list):
                     # Handle list comparison
@@ -317,6 +495,7 @@ class ContractDiffComputer:
                             after=after_val,
                             field_path=field_path,
                             identity_key=identity_key,
+                            hashes=hashes,
                         )
                         if list_diff.has_changes or self.config.include_unchanged:
                             list_diffs.append(list_diff)
@@ -328,6 +507,7 @@ class ContractDiffComputer:
                             field_path=field_path,
                             field_diffs=field_diffs,
                             list_diffs=list_diffs,
+                            hashes=hashes,
                         )
                 # Scalar comparison
                 elif before_val != after_val:
@@ -353,6 +533,7 @@ class ContractDiffComputer:
         after: list[object],
         field_path: str,
         identity_key: str,
+        hashes: tuple[_SubtreeHashes, _SubtreeHashes] | None = None,
     ) -> ModelContractListDiff:
         """Diff list using identity-based matching.
 
@@ -366,6 +547,7 @@ class ContractDiffComputer:
             field_path: Dot-separated path to the list field.
             identity_key: The field name used to identify elements.
                 Use "__value__" for primitive value lists.
+            hashes: Subtree hashes of both dumps, in Merkle hashing mode.
 
         Returns:
             ModelContractListDiff with categorized changes.
@@ -406,7 +588,9 @@ class ContractDiffComputer:
                 after_idx, after_item = after_map[identity]
 
                 # Check content equality
-                content_equal = self._items_equal(before_item, after_item)
+                content_equal = _same_subtree(
+                    hashes, before_item, after_item
+                ) or self._items_equal(before_item, after_item)
                 position_equal = before_idx == after_idx
 
                 if not content_equal:
@@ -685,6 +869,7 @@ class ContractDiffComputer:
         field_path: str,
         field_diffs: list[ModelContractFieldDiff],
         list_diffs: list[ModelContractListDiff],
+        hashes: tuple[_SubtreeHashes, _SubtreeHashes] | None = None,
     ) -> None:
         """Diff list using positional comparison (fallback).
 
@@ -697,6 +882,7 @@ class ContractDiffComputer:
             field_path: Dot-separated path to the list field.
             field_diffs: Accumulator for field differences.
             list_diffs: Accumulator for list differences (propagated to nested diffs).
+            hashes: Subtree hashes of both dumps, in Merkle hashing mode.
         """
         max_len = max(len(before), len(after))
 
@@ -721,7 +907,9 @@ class ContractDiffComputer:
                     change_type=EnumContractDiffChangeType.REMOVED,
                     field_diffs=field_diffs,
                 )
-            elif before[i] != after[i]:
+            elif not _same_subtree(hashes, before[i], after[i]) and (
+                before[i] != after[i]
+            ):
                 # Modified at position
                 before_item = before[i]
                 after_item = after[i]
@@ -734,6 +922,7 @@ class ContractDiffComputer:
                         path=item_path,
                         field_diffs=field_diffs,
                         list_diffs=list_diffs,
+                        hashes=hashes,
                     )
                 else:
                     self._add_field_diff(
@@ -769,6 +958,13 @@ class ContractDiffComputer:
             change_type: The type of change.
             field_diffs: Accumulator list to append to.
         """
+        # A value replacing None, or replaced by None, is an addition or removal
+        if change_type == EnumContractDiffChangeType.MODIFIED:
+            if old_value is None:
+                change_type = EnumContractDiffChangeType.ADDED
+            elif new_value is None:
+                change_type = EnumContractDiffChangeType.REMOVED
+
         # Determine value type
         if old_value is not None:
             value_type = type(old_value).__name__
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Fsync policy enumeration for append-only JSONL writers.
+
+Defines when buffered appends are forced to stable storage.
+"""
+
+from enum import Enum, unique
+
+from omnibase_core.utils.util_str_enum_base import UtilStrValueHelper
+
+
+@unique
+class EnumFsyncPolicy(UtilStrValueHelper, str, Enum):
+    """
+    When an append-only writer calls fsync().
+
+    Every policy flushes to the OS on each group commit; the policy only
+    controls whether the OS is made to persist the data.
+    """
+
+    NEVER = "never"  # Rely on the OS to write back dirty pages
+    ON_CLOSE = "on_close"  # fsync once when the writer is closed
+    EVERY_BATCH = "every_batch"  # fsync after every group commit
+
+
+__all__ = ["EnumFsyncPolicy"]
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Backpressure policy enumeration for the buffered logging pipeline.
+
+Defines what happens to a log record when the pipeline queue is full.
+"""
+
+from enum import Enum, unique
+
+from omnibase_core.utils.util_str_enum_base import UtilStrValueHelper
+
+
+@unique
+class EnumLogBackpressurePolicy(UtilStrValueHelper, str, Enum):
+    """
+    Backpressure policy for the buffered logging pipeline.
+
+    Every record that is not enqueued is counted as dropped.
+    """
+
+    DROP_NEWEST = "drop_newest"  # Discard the incoming record
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued record
+    BLOCK = "block"  # Wait up to a timeout for space, then discard
+
+
+__all__ = ["EnumLogBackpressurePolicy"]
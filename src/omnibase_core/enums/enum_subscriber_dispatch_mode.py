@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Enum for in-memory event bus subscriber dispatch modes.
+
+Defines how :class:`~omnibase_core.event_bus.event_bus_inmemory.EventBusInmemory`
+fans a published message out to the subscribers of its topic.
+"""
+
+from enum import Enum, unique
+
+from omnibase_core.utils.util_str_enum_base import UtilStrValueHelper
+
+
+@unique
+class EnumSubscriberDispatchMode(UtilStrValueHelper, str, Enum):
+    """
+    Enumeration of subscriber dispatch modes for the in-memory event bus.
+
+    Attributes:
+        SEQUENTIAL: Subscriber callbacks are awaited one after another in
+            subscription order (historical behaviour).
+        CONCURRENT: Subscriber callbacks run at the same time, bounded by the
+            bus-wide and per-group concurrency limits. Delivery order is still
+            preserved within each (topic, group) lane.
+    """
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+
+
+__all__ = ["EnumSubscriberDispatchMode"]
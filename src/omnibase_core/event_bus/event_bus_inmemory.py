@@ -19,17 +19,23 @@ Protocol Compatibility:
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
+import itertools
 import json
 import logging
 import re
 from collections import defaultdict, deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from omnibase_core.enums.enum_consumer_group_purpose import EnumConsumerGroupPurpose
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.enums.enum_subscriber_dispatch_mode import (
+    EnumSubscriberDispatchMode,
+)
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.event_bus.model_event_bus_readiness import (
     ModelEventBusReadiness,
@@ -47,6 +53,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# (bus id, (topic, group), lane task) of the CONCURRENT lane delivery running
+# in this context. Tasks started by a callback inherit a copy, so the lane task
+# is compared with the current task before the entry is trusted.
+_CURRENT_LANE: ContextVar[
+    tuple[int, tuple[str, str], asyncio.Task[object] | None] | None
+] = ContextVar("_CURRENT_LANE", default=None)
+
 # ---------------------------------------------------------------------------
 # Consumer group ID helpers (inlined from omnibase_infra to avoid dep)
 # ---------------------------------------------------------------------------
@@ -102,6 +115,16 @@ def _compute_consumer_group_id(
     return group_id
 
 
+def _group_callbacks(
+    subscribers: list[tuple[str, Callable[[ModelEventMessage], Awaitable[None]]]],
+) -> dict[str, list[Callable[[ModelEventMessage], Awaitable[None]]]]:
+    """Group subscriber callbacks by consumer group, in subscription order."""
+    lanes: dict[str, list[Callable[[ModelEventMessage], Awaitable[None]]]] = {}
+    for group_id, callback in subscribers:
+        lanes.setdefault(group_id, []).append(callback)
+    return lanes
+
+
 # ---------------------------------------------------------------------------
 # EventBusInmemory
 # ---------------------------------------------------------------------------
@@ -113,6 +136,17 @@ class EventBusInmemory:
     Implements ProtocolEventBus interface using deque-based event history
     with direct subscriber callback invocation. Async-safe operations are
     ensured via asyncio.Lock.
+
+    By default subscriber callbacks are awaited one after another
+    (``EnumSubscriberDispatchMode.SEQUENTIAL``). With
+    ``EnumSubscriberDispatchMode.CONCURRENT`` each (topic, group) lane is
+    delivered as its own task, bounded by ``max_concurrent_deliveries`` across
+    the bus and by ``group_concurrency_limits`` per consumer group. Delivery
+    order within a lane always matches publish order. A publish made from
+    inside a lane callback does not wait for delivery, because the lane holds
+    the semaphores the delivery may need: it is enqueued onto every other
+    lane, and delivered inline to the publishing lane itself when nothing is
+    queued behind it there.
     """
 
     def __init__(
@@ -121,6 +155,12 @@ class EventBusInmemory:
         group: str = "default",
         max_history: int = 1000,
         circuit_breaker_threshold: int = 5,
+        dispatch_mode: EnumSubscriberDispatchMode = (
+            EnumSubscriberDispatchMode.SEQUENTIAL
+        ),
+        max_concurrent_deliveries: int = 64,
+        group_concurrency_limits: Mapping[str, int] | None = None,
+        max_topic_history: int | None = None,
     ) -> None:
         if circuit_breaker_threshold < 1:
             raise ModelOnexError(
@@ -128,15 +168,40 @@ class EventBusInmemory:
                 f"got {circuit_breaker_threshold}",
                 error_code=EnumCoreErrorCode.VALIDATION_ERROR,
             )
+        if max_concurrent_deliveries < 1:
+            raise ModelOnexError(
+                f"max_concurrent_deliveries must be a positive integer, "
+                f"got {max_concurrent_deliveries}",
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
+        if max_topic_history is not None and max_topic_history < 1:
+            raise ModelOnexError(
+                f"max_topic_history must be a positive integer, "
+                f"got {max_topic_history}",
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
         self._environment = environment
         self._group = group
         self._max_history = max_history
+        self._topic_history_configured = max_topic_history is not None
+        self._max_topic_history = (
+            max_topic_history if max_topic_history is not None else max(max_history, 1)
+        )
 
         self._subscribers: dict[
             str, list[tuple[str, Callable[[ModelEventMessage], Awaitable[None]]]]
         ] = defaultdict(list)
 
         self._event_history: deque[ModelEventMessage] = deque(maxlen=max_history)
+        # Per-topic ring buffers with their own retention, so topic-filtered
+        # history reads never scan the global history. Entries leave with
+        # their message's eviction from the global history, so the total is
+        # bounded by max_history and idle topics are dropped.
+        self._topic_history: dict[str, deque[ModelEventMessage]] = {}
+        # Running counters kept in step with _subscribers so health checks
+        # and subscriber counts never sum over every topic.
+        self._subscriber_total = 0
+        self._active_topic_count = 0
         self._topic_offsets: dict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
         self._started = False
@@ -145,6 +210,16 @@ class EventBusInmemory:
         self._subscriber_failures: dict[tuple[str, str], int] = {}
         self._max_consecutive_failures: int = circuit_breaker_threshold
 
+        self._dispatch_mode = EnumSubscriberDispatchMode(dispatch_mode)
+        self._delivery_semaphore = asyncio.Semaphore(max_concurrent_deliveries)
+        self._group_semaphores: dict[str, asyncio.Semaphore] = {}
+        for limit_group_id, limit in (group_concurrency_limits or {}).items():
+            self.set_group_concurrency_limit(limit_group_id, limit)
+        # Last in-flight delivery per (topic, group) lane (CONCURRENT mode).
+        self._lane_tails: dict[tuple[str, str], asyncio.Future[None]] = {}
+        # Lane deliveries enqueued by publishes nobody waits on.
+        self._detached_deliveries: set[asyncio.Future[None]] = set()
+
     @property
     def adapter(self) -> EventBusInmemory:
         """No adapter for in-memory -- returns self."""
@@ -160,6 +235,25 @@ class EventBusInmemory:
         """Get the consumer group identifier."""
         return self._group
 
+    @property
+    def dispatch_mode(self) -> EnumSubscriberDispatchMode:
+        """Get the subscriber dispatch mode."""
+        return self._dispatch_mode
+
+    def set_group_concurrency_limit(self, group_id: str, limit: int) -> None:
+        """Bound concurrent deliveries for one consumer group.
+
+        Only applies in ``EnumSubscriberDispatchMode.CONCURRENT``. Deliveries
+        already holding the previous limit finish under it.
+        """
+        if limit < 1:
+            raise ModelOnexError(
+                f"Group concurrency limit must be a positive integer, "
+                f"got {limit} for group {group_id!r}",
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
+        self._group_semaphores[group_id] = asyncio.Semaphore(limit)
+
     async def start(self) -> None:
         """Start the event bus."""
         async with self._lock:
@@ -184,6 +278,12 @@ class EventBusInmemory:
                 self._event_history = deque(
                     self._event_history, maxlen=self._max_history
                 )
+                if not self._topic_history_configured:
+                    self._max_topic_history = max(self._max_history, 1)
+            if "max_topic_history" in config:
+                self._max_topic_history = int(str(config["max_topic_history"]))
+                self._topic_history_configured = True
+            self._rebuild_topic_history()
         await self.start()
 
     async def shutdown(self) -> None:
@@ -223,48 +323,222 @@ class EventBusInmemory:
                 offset=str(offset),
                 partition=0,
             )
-            self._event_history.append(message)
+            self._append_history(message)
             subscribers = list(self._subscribers.get(topic, []))
 
+        if not subscribers:
+            return
+
+        correlation_id = str(headers.correlation_id)
+        if self._dispatch_mode is EnumSubscriberDispatchMode.CONCURRENT:
+            current = _CURRENT_LANE.get()
+            if (
+                current is not None
+                and current[0] == id(self)
+                and current[2] is asyncio.current_task()
+            ):
+                await self._dispatch_nested(
+                    topic, message, subscribers, correlation_id, current[1]
+                )
+            else:
+                await self._dispatch_concurrent(
+                    topic, message, subscribers, correlation_id
+                )
+            return
+
         for group_id, callback in subscribers:
-            failure_key = (topic, group_id)
+            await self._invoke_subscriber(
+                topic, group_id, callback, message, correlation_id
+            )
 
-            async with self._lock:
-                failure_count = self._subscriber_failures.get(failure_key, 0)
-
-            if failure_count >= self._max_consecutive_failures:
-                logger.warning(
-                    "Subscriber circuit breaker open - skipping callback",
-                    extra={
-                        "topic": topic,
-                        "group_id": group_id,
-                        "consecutive_failures": failure_count,
-                        "correlation_id": str(headers.correlation_id),
-                    },
-                )
+    def _append_history(self, message: ModelEventMessage) -> None:
+        """Append to the global and per-topic histories. Caller holds the lock."""
+        history = self._event_history
+        if len(history) == history.maxlen:
+            if not history:
+                return  # max_history=0 retains nothing
+            self._drop_topic_entry(history[0])
+        history.append(message)
+        self._append_topic_entry(message)
+
+    def _append_topic_entry(self, message: ModelEventMessage) -> None:
+        topic_history = self._topic_history.get(message.topic)
+        if topic_history is None:
+            topic_history = deque(maxlen=self._max_topic_history)
+            self._topic_history[message.topic] = topic_history
+        topic_history.append(message)
+
+    def _drop_topic_entry(self, message: ModelEventMessage) -> None:
+        """Drop ``message``, leaving the global history, from its topic history."""
+        topic_history = self._topic_history.get(message.topic)
+        # Still retained only if it is the oldest entry of its topic
+        if topic_history and topic_history[0] is message:
+            topic_history.popleft()
+            if not topic_history:
+                del self._topic_history[message.topic]
+
+    def _rebuild_topic_history(self) -> None:
+        """Rebuild per-topic histories from the global history."""
+        self._topic_history = {}
+        for message in self._event_history:
+            self._append_topic_entry(message)
+
+    async def _dispatch_concurrent(
+        self,
+        topic: str,
+        message: ModelEventMessage,
+        subscribers: list[tuple[str, Callable[[ModelEventMessage], Awaitable[None]]]],
+        correlation_id: str,
+    ) -> None:
+        """Fan a message out to every (topic, group) lane concurrently.
+
+        Subscribers are grouped by consumer group; each group becomes one lane
+        task that awaits the previous delivery on the same lane before running,
+        so per-(topic, group) ordering matches publish order. Lane tasks are
+        chained synchronously (no await between reading and replacing the lane
+        tail), which is what makes the ordering guarantee hold across
+        concurrent publishers.
+        """
+        tasks = [
+            self._enqueue_lane(topic, group_id, callbacks, message, correlation_id)
+            for group_id, callbacks in _group_callbacks(subscribers).items()
+        ]
+        await asyncio.gather(*tasks)
+
+    async def _dispatch_nested(
+        self,
+        topic: str,
+        message: ModelEventMessage,
+        subscribers: list[tuple[str, Callable[[ModelEventMessage], Awaitable[None]]]],
+        correlation_id: str,
+        current_lane: tuple[str, str],
+    ) -> None:
+        """Dispatch a message published from inside the ``current_lane`` callback.
+
+        The publishing lane holds the bus-wide semaphore and possibly its
+        group's, so waiting for any delivery here could deadlock. Other lanes
+        get the message enqueued in publish order without waiting. The
+        publishing lane delivers it inline, unless deliveries are already
+        queued behind it; then it is enqueued there too, after them.
+        """
+        current_task = asyncio.current_task()
+        for group_id, callbacks in _group_callbacks(subscribers).items():
+            lane = (topic, group_id)
+            if lane == current_lane and self._lane_tails.get(lane) is current_task:
+                for callback in callbacks:
+                    await self._invoke_subscriber(
+                        topic, group_id, callback, message, correlation_id
+                    )
                 continue
+            task = self._enqueue_lane(
+                topic, group_id, callbacks, message, correlation_id
+            )
+            self._detached_deliveries.add(task)
+            task.add_done_callback(self._detached_deliveries.discard)
 
-            try:
-                await callback(message)
-                async with self._lock:
-                    if failure_key in self._subscriber_failures:
-                        del self._subscriber_failures[failure_key]
-            except Exception as e:
-                async with self._lock:
-                    self._subscriber_failures[failure_key] = (
-                        self._subscriber_failures.get(failure_key, 0) + 1
+    def _enqueue_lane(
+        self,
+        topic: str,
+        group_id: str,
+        callbacks: list[Callable[[ModelEventMessage], Awaitable[None]]],
+        message: ModelEventMessage,
+        correlation_id: str,
+    ) -> asyncio.Task[None]:
+        """Chain one delivery onto the tail of its (topic, group) lane."""
+        lane = (topic, group_id)
+        previous = self._lane_tails.get(lane)
+        task = asyncio.ensure_future(
+            self._deliver_lane(
+                topic, group_id, callbacks, message, correlation_id, previous
+            )
+        )
+        self._lane_tails[lane] = task
+        task.add_done_callback(functools.partial(self._release_lane, lane))
+        return task
+
+    async def _deliver_lane(
+        self,
+        topic: str,
+        group_id: str,
+        callbacks: list[Callable[[ModelEventMessage], Awaitable[None]]],
+        message: ModelEventMessage,
+        correlation_id: str,
+        previous: asyncio.Future[None] | None,
+    ) -> None:
+        """Deliver one message to one (topic, group) lane, in lane order."""
+        if previous is not None and not previous.done():
+            # asyncio.wait never raises the awaited task's exception or
+            # cancellation, so a failed predecessor cannot stall the lane.
+            await asyncio.wait((previous,))
+        # Each lane task runs in its own context copy; no reset needed
+        _CURRENT_LANE.set((id(self), (topic, group_id), asyncio.current_task()))
+
+        group_semaphore = self._group_semaphores.get(group_id)
+        async with self._delivery_semaphore:
+            if group_semaphore is None:
+                for callback in callbacks:
+                    await self._invoke_subscriber(
+                        topic, group_id, callback, message, correlation_id
                     )
-                    current_failure_count = self._subscriber_failures[failure_key]
-                logger.exception(
-                    "Subscriber callback failed",
-                    extra={
-                        "topic": topic,
-                        "group_id": group_id,
-                        "error": str(e),
-                        "consecutive_failures": current_failure_count,
-                        "correlation_id": str(headers.correlation_id),
-                    },
-                )
+                return
+            async with group_semaphore:
+                for callback in callbacks:
+                    await self._invoke_subscriber(
+                        topic, group_id, callback, message, correlation_id
+                    )
+
+    def _release_lane(self, lane: tuple[str, str], task: asyncio.Future[None]) -> None:
+        """Drop a finished lane tail so idle lanes do not accumulate."""
+        if self._lane_tails.get(lane) is task:
+            del self._lane_tails[lane]
+
+    async def _invoke_subscriber(
+        self,
+        topic: str,
+        group_id: str,
+        callback: Callable[[ModelEventMessage], Awaitable[None]],
+        message: ModelEventMessage,
+        correlation_id: str,
+    ) -> None:
+        """Invoke one subscriber callback behind its circuit breaker.
+
+        Circuit-breaker counters are read and written without ``self._lock``:
+        each update is a single dict operation with no ``await`` in between, so
+        it is atomic with respect to other coroutines on the loop.
+        """
+        failure_key = (topic, group_id)
+        failure_count = self._subscriber_failures.get(failure_key, 0)
+
+        if failure_count >= self._max_consecutive_failures:
+            logger.warning(
+                "Subscriber circuit breaker open - skipping callback",
+                extra={
+                    "topic": topic,
+                    "group_id": group_id,
+                    "consecutive_failures": failure_count,
+                    "correlation_id": correlation_id,
+                },
+            )
+            return
+
+        try:
+            await callback(message)
+        except Exception as e:
+            current_failure_count = self._subscriber_failures.get(failure_key, 0) + 1
+            self._subscriber_failures[failure_key] = current_failure_count
+            logger.exception(
+                "Subscriber callback failed",
+                extra={
+                    "topic": topic,
+                    "group_id": group_id,
+                    "error": str(e),
+                    "consecutive_failures": current_failure_count,
+                    "correlation_id": correlation_id,
+                },
+            )
+            return
+
+        self._subscriber_failures.pop(failure_key, None)
 
     async def publish_envelope(
         self,
@@ -332,7 +606,11 @@ class EventBusInmemory:
             )
 
         async with self._lock:
-            self._subscribers[topic].append((effective_group_id, on_message))
+            topic_subscribers = self._subscribers[topic]
+            if not topic_subscribers:
+                self._active_topic_count += 1
+            topic_subscribers.append((effective_group_id, on_message))
+            self._subscriber_total += 1
             logger.debug(
                 "Subscriber added",
                 extra={"topic": topic, "group_id": effective_group_id},
@@ -340,10 +618,16 @@ class EventBusInmemory:
 
         async def unsubscribe() -> None:
             async with self._lock:
+                topic_subscribers = self._subscribers.get(topic)
+                if topic_subscribers is None:
+                    return
                 try:
-                    self._subscribers[topic].remove((effective_group_id, on_message))
+                    topic_subscribers.remove((effective_group_id, on_message))
                 except ValueError:
-                    pass
+                    return
+                self._subscriber_total -= 1
+                if not topic_subscribers:
+                    self._active_topic_count -= 1
 
         return unsubscribe
 
@@ -397,7 +681,10 @@ class EventBusInmemory:
         """Close the event bus and release resources."""
         async with self._lock:
             self._subscribers.clear()
+            self._subscriber_total = 0
+            self._active_topic_count = 0
             self._subscriber_failures.clear()
+            self._lane_tails.clear()
             self._started = False
             self._shutdown = True
         logger.info(
@@ -408,8 +695,8 @@ class EventBusInmemory:
     async def health_check(self) -> TypedDictEventBusHealth:
         """Check event bus health."""
         async with self._lock:
-            subscriber_count = sum(len(subs) for subs in self._subscribers.values())
-            topic_count = len(self._subscribers)
+            subscriber_count = self._subscriber_total
+            topic_count = self._active_topic_count
             history_size = len(self._event_history)
 
         return TypedDictEventBusHealth(
@@ -435,27 +722,40 @@ class EventBusInmemory:
         limit: int = 100,
         topic: str | None = None,
     ) -> list[ModelEventMessage]:
-        """Get recent events for debugging."""
+        """Get recent events for debugging.
+
+        Topic-filtered reads come from the per-topic ring buffer and cost
+        O(limit) rather than O(max_history). They return the topic's last
+        ``max_topic_history`` messages (default ``max_history``) that are still
+        in the global history.
+        """
         async with self._lock:
-            history_list = list(self._event_history)
             if topic:
-                history_list = [msg for msg in history_list if msg.topic == topic]
-            history = (
-                history_list[-limit:] if limit < len(history_list) else history_list
-            )
-            return list(history)
+                source = self._topic_history.get(topic)
+                if source is None:
+                    return []
+            else:
+                source = self._event_history
+            if limit < 1:
+                return list(source)[-limit:]
+            if limit >= len(source):
+                return list(source)
+            recent = list(itertools.islice(reversed(source), limit))
+            recent.reverse()
+            return recent
 
     async def clear_event_history(self) -> None:
         """Clear event history."""
         async with self._lock:
             self._event_history.clear()
+            self._topic_history.clear()
 
     async def get_subscriber_count(self, topic: str | None = None) -> int:
         """Get subscriber count, optionally filtered by topic."""
         async with self._lock:
             if topic:
                 return len(self._subscribers.get(topic, []))
-            return sum(len(subs) for subs in self._subscribers.values())
+            return self._subscriber_total
 
     async def get_topics(self) -> list[str]:
         """Get list of topics with active subscribers."""
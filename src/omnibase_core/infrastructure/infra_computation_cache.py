@@ -4,25 +4,38 @@
 """
 Computation Cache - Caching layer for expensive computations.
 
-Provides TTL-based caching with LRU eviction and memory management.
+Provides TTL-based caching with O(1) LRU/LFU/FIFO eviction and memory management.
 """
 
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from omnibase_core.enums.enum_cache_eviction_policy import EnumCacheEvictionPolicy
+from omnibase_core.utils.util_eviction_index import UtilEvictionIndex
+
 
 class ComputationCache:
     """
     Caching layer for expensive computations with TTL and memory management.
+
+    Eviction order and expiry are tracked by a UtilEvictionIndex, so puts at
+    capacity and get_stats() never scan the cache.
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl_minutes: int = 30):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl_minutes: int = 30,
+        eviction_policy: EnumCacheEvictionPolicy | str = EnumCacheEvictionPolicy.LRU,
+    ):
         self.max_size = max_size
         self.default_ttl_minutes = default_ttl_minutes
+        self.eviction_policy = EnumCacheEvictionPolicy(eviction_policy)
         self._cache: dict[
             str,
             tuple[Any, datetime, int],
         ] = {}  # key -> (value, expiry, access_count)
+        self._index = UtilEvictionIndex(self.eviction_policy)
 
     def get(self, cache_key: str) -> Any | None:
         """Get cached value if valid and not expired."""
@@ -34,10 +47,12 @@ class ComputationCache:
         # Check expiry (use UTC for consistent timezone-aware comparison)
         if datetime.now(UTC) > expiry:
             del self._cache[cache_key]
+            self._index.remove(cache_key)
             return None
 
         # Update access count
         self._cache[cache_key] = (value, expiry, access_count + 1)
+        self._index.touch(cache_key)
         return value
 
     def put(
@@ -47,36 +62,44 @@ class ComputationCache:
         ttl_minutes: int | None = None,
     ) -> None:
         """Cache value with TTL."""
-        # Evict if at capacity
-        if len(self._cache) >= self.max_size:
-            self._evict_lru()
+        # Use UTC for consistent timezone-aware expiry times
+        now = datetime.now(UTC)
+        # Evict if at capacity (expired entries first; overwrites need no room)
+        if cache_key not in self._cache and len(self._cache) >= self.max_size:
+            self._purge_expired(now)
+            if len(self._cache) >= self.max_size:
+                self._evict_lru()
 
         ttl = ttl_minutes or self.default_ttl_minutes
-        # Use UTC for consistent timezone-aware expiry times
-        expiry = datetime.now(UTC) + timedelta(minutes=ttl)
+        expiry = now + timedelta(minutes=ttl)
         self._cache[cache_key] = (value, expiry, 1)
+        self._index.insert(cache_key, expiry)
 
     def _evict_lru(self) -> None:
-        """Evict least recently used item."""
-        if not self._cache:
-            return
-
-        # Find item with lowest access count (simple LRU approximation)
-        lru_key = min(self._cache.keys(), key=lambda k: self._cache[k][2])
-        del self._cache[lru_key]
+        """Evict the next item chosen by the eviction policy (LRU by default)."""
+        evict_key = self._index.pop_victim()
+        if evict_key is not None:
+            del self._cache[evict_key]
+
+    def _purge_expired(self, now: datetime) -> int:
+        """Drop every entry expired at ``now``; returns how many were dropped."""
+        expired = self._index.pop_expired(now)
+        for key in expired:
+            del self._cache[key]
+        return len(expired)
 
     def clear(self) -> None:
         """Clear all cached values."""
         self._cache.clear()
+        self._index.clear()
 
     def get_stats(self) -> dict[str, int]:
-        """Get cache statistics."""
-        now = datetime.now(UTC)
-        expired_count = sum(1 for _, expiry, _ in self._cache.values() if expiry <= now)
+        """Get cache statistics (expired entries are purged as they are counted)."""
+        expired_count = self._purge_expired(datetime.now(UTC))
 
         return {
-            "total_entries": len(self._cache),
+            "total_entries": len(self._cache) + expired_count,
             "expired_entries": expired_count,
-            "valid_entries": len(self._cache) - expired_count,
+            "valid_entries": len(self._cache),
             "max_size": self.max_size,
         }
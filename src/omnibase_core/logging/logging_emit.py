@@ -5,17 +5,41 @@
 
 Provides the main entry point for all ONEX logging, routing events through
 the logger node with smart formatting and correlation tracking.
+
+emit_log_event() checks the level threshold first and returns immediately for
+disabled levels. The threshold defaults to TRACE, so every event is processed
+unless set_log_level_threshold() raises it.
+
+Events are written on the calling thread by default. configure_log_pipeline()
+with ``asynchronous=True`` opts into a background writer (see LogPipeline):
+enabled events then capture only the caller's frame location, node ID and a
+copy of ``data`` on the calling thread, and sanitization, context building
+and output run in batches on the writer. ERROR and more severe events are
+always written on the calling thread, so backpressure never drops them and a
+hard exit cannot lose them in the queue.
 """
 
+import atexit
+import copy
 import inspect
 import os
+import sys
+import threading
 from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from types import CodeType
+from typing import Any, NamedTuple
 from uuid import UUID, uuid4
 
+from omnibase_core.enums.enum_log_backpressure_policy import (
+    EnumLogBackpressurePolicy,
+)
 from omnibase_core.enums.enum_log_level import EnumLogLevel as LogLevel
+from omnibase_core.logging.logging_pipeline import LogPipeline
 from omnibase_core.models.core.model_log_context import ModelLogContext
+from omnibase_core.types.typed_dict_log_pipeline_stats import (
+    TypedDictLogPipelineStats,
+)
 
 # Type aliases for logging infrastructure (BOUNDARY_LAYER_EXCEPTION)
 # These types support logging resilience by allowing flexible identifiers
@@ -25,6 +49,43 @@ LogNodeIdentifier = UUID | str
 # needs to accept various types while sanitization ensures JSON compatibility
 LogDataValue = Any
 
+# Severity ranks used by the level gate; unranked levels are treated as INFO
+_LEVEL_RANKS: dict[LogLevel, int] = {
+    LogLevel.TRACE: 5,
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.SUCCESS: 20,
+    LogLevel.UNKNOWN: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+    LogLevel.FATAL: 50,
+}
+
+
+# Events at or above this rank bypass the asynchronous pipeline
+_SYNCHRONOUS_RANK = _LEVEL_RANKS[LogLevel.ERROR]
+
+# Use list to hold the mutable threshold without global statement
+_log_level_threshold: list[LogLevel] = [LogLevel.TRACE]
+_log_level_rank: list[int] = [_LEVEL_RANKS[_log_level_threshold[0]]]
+
+
+def set_log_level_threshold(level: LogLevel) -> None:
+    """Set the minimum level emit_log_event() processes."""
+    _log_level_threshold[0] = level
+    _log_level_rank[0] = _LEVEL_RANKS.get(level, 20)
+
+
+def get_log_level_threshold() -> LogLevel:
+    """Return the minimum level emit_log_event() processes."""
+    return _log_level_threshold[0]
+
+
+def is_log_level_enabled(level: LogLevel) -> bool:
+    """Whether events at ``level`` pass the threshold."""
+    return _LEVEL_RANKS.get(level, 20) >= _log_level_rank[0]
+
 
 def _validate_node_id(node_id: LogNodeIdentifier | None) -> UUID | None:
     """
@@ -47,6 +108,10 @@ def _validate_node_id(node_id: LogNodeIdentifier | None) -> UUID | None:
     if isinstance(node_id, UUID):
         return node_id
     if isinstance(node_id, str):
+        # Every UUID spelling has at least 32 hex digits; this skips the
+        # exception for the usual module-name fallbacks
+        if len(node_id) < 32:
+            return None
         try:
             return UUID(node_id)
         except ValueError:
@@ -84,32 +149,35 @@ def emit_log_event(
         data: Additional structured data
         event_bus: Event bus for routing (uses default if not provided)
     """
-    # Auto-detect node ID from calling context if not provided
+    rank = _LEVEL_RANKS.get(level, 20)
+    if rank < _log_level_rank[0]:
+        return
+
+    # Only the caller's location and node ID need the live stack; everything
+    # else is done by the writer
+    asynchronous = _pipeline_asynchronous[0] and rank < _SYNCHRONOUS_RANK
+    frame = sys._getframe(1)
     if node_id is None:
         node_id = _detect_node_id_from_context()
-
-    # Create log context from calling frame
-    context = _create_log_context_from_frame()
-
-    # Get or create event bus
-    if event_bus is None:
-        event_bus = _get_default_event_bus()
-
-    # Sanitize sensitive data before routing
-    sanitized_message = _sanitize_sensitive_data(message)
-    sanitized_data = _sanitize_data_dict(data or {})
-
-    # Route through logger node
-    _route_to_logger_node(
+    event = _PendingLogEvent(
         level=level,
         event_type=event_type,
-        message=sanitized_message,
-        _node_id=_validate_node_id(node_id),
+        message=message,
         correlation_id=correlation_id,
-        context=context,
-        data=sanitized_data,
-        _event_bus=event_bus,
+        node_id=_validate_node_id(node_id),
+        data=_snapshot_log_data(data) if asynchronous and data else data,
+        calling_function=frame.f_code.co_name,
+        calling_module=frame.f_globals.get("__name__", "unknown"),
+        calling_line=frame.f_lineno,
+        created_at=datetime.now(UTC),
+        event_bus=event_bus,
     )
+    del frame
+
+    if asynchronous:
+        _get_log_pipeline().submit(event)
+    else:
+        _write_log_batch([event])
 
 
 def emit_log_event_with_new_correlation(
@@ -230,6 +298,8 @@ def trace_function_lifecycle[F: Callable[..., Any]](func: F) -> F:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not is_log_level_enabled(LogLevel.TRACE):
+            return func(*args, **kwargs)
         function_name = func.__name__
         module_name = func.__module__
         correlation_id = uuid4()
@@ -521,6 +591,17 @@ _SENSITIVE_PATTERNS = [
     ),  # Generic tokens
 ]
 
+# Matches wherever any of _SENSITIVE_PATTERNS matches, so a text it does not
+# match is returned after one scan instead of one per pattern. Texts it does
+# match still go through the sequential passes, whose later patterns see the
+# output of earlier ones.
+_SENSITIVE_PATTERN = re.compile(
+    r"\b(?:[A-Za-z0-9+/]{20,}={0,2}\b"
+    r"|(?i:password|api[_-]?key|secret|access[_-]?token|token)"
+    r"[\"']?\s*[:=]\s*[\"']?[^,}\s]+[\"}]?)"
+)
+
+
 # Sensitive key names that should trigger value redaction
 _SENSITIVE_KEY_NAMES = frozenset(
     {
@@ -565,6 +646,9 @@ def _sanitize_sensitive_data(text: str) -> str:
         # Why: Defensive branch covers runtime data even when static narrowing marks it unreachable.
         return text  # type: ignore[unreachable]
 
+    if _SENSITIVE_PATTERN.search(text) is None:
+        return text
+
     sanitized = text
     for pattern, replacement in _SENSITIVE_PATTERNS:
         sanitized = pattern.sub(replacement, sanitized)
@@ -640,6 +724,14 @@ def _get_or_generate_correlation_id() -> str:
     return str(uuid4())[:8]
 
 
+def _binds_self(code: CodeType) -> bool:
+    return (
+        "self" in code.co_varnames
+        or "self" in code.co_cellvars
+        or "self" in code.co_freevars
+    )
+
+
 def _detect_node_id_from_context() -> LogNodeIdentifier:
     """Detect node ID from calling context with limited stack depth.
 
@@ -661,7 +753,8 @@ def _detect_node_id_from_context() -> LogNodeIdentifier:
             frame = frame.f_back
             depth += 1
 
-            if frame and "self" in frame.f_locals:
+            # Consult the code object first; f_locals builds a dict per frame
+            if frame and _binds_self(frame.f_code) and "self" in frame.f_locals:
                 obj = frame.f_locals["self"]
                 # Check for node_id attribute - use try/except to avoid hasattr() deadlock with Mock
                 try:
@@ -703,67 +796,6 @@ def _detect_node_id_from_context() -> LogNodeIdentifier:
         del original_frame
 
 
-def _create_log_context_from_frame() -> ModelLogContext:
-    """Create log context from the calling frame."""
-    frame = inspect.currentframe()
-
-    # Walk up the stack to get the actual caller
-    if frame and frame.f_back and frame.f_back.f_back:
-        frame = frame.f_back.f_back
-        node_id_raw = _detect_node_id_from_context()
-
-        # Convert node_id_raw to UUID if valid, otherwise None
-        # _detect_node_id_from_context() returns UUID | str (fallback strings like module names)
-        # ModelLogContext expects UUID | None, so we must validate string conversion
-        node_id_value: UUID | None
-        if isinstance(node_id_raw, str):
-            try:
-                node_id_value = UUID(node_id_raw)
-            except ValueError:
-                # String is not a valid UUID (e.g., module name, "unknown")
-                node_id_value = None
-        else:
-            node_id_value = node_id_raw
-
-        return ModelLogContext(
-            calling_function=frame.f_code.co_name,
-            calling_module=frame.f_globals.get("__name__", "unknown"),
-            calling_line=frame.f_lineno,
-            timestamp=datetime.now(UTC).isoformat(),
-            node_id=node_id_value,
-        )
-    return ModelLogContext(
-        calling_function="unknown",
-        calling_module="unknown",
-        calling_line=0,
-        timestamp=datetime.now(UTC).isoformat(),
-        node_id=UUID("00000000-0000-0000-0000-000000000000"),
-    )
-
-
-def _get_default_event_bus() -> Any | None:
-    """Get the default event bus for logging using protocol-based discovery."""
-    try:
-        from omnibase_core.models.container.model_onex_container import (
-            ModelONEXContainer,
-        )
-        from omnibase_core.nodes.node_runtime.protocols.protocol_event_bus_factory import (
-            AnyFactory,
-        )
-
-        # Try to get container and event bus factory
-        container = ModelONEXContainer()
-        event_bus_factory = container.get_service(AnyFactory)
-
-        if event_bus_factory:
-            return event_bus_factory.get_event_bus()
-
-        return None
-    except Exception:  # noqa: BLE001  # fallback-ok: logger unavailable during bootstrap
-        # Fallback when event bus unavailable
-        return None
-
-
 def _route_to_logger_node(
     level: LogLevel,
     event_type: str,
@@ -806,3 +838,135 @@ def _route_to_logger_node(
 
     except Exception:  # noqa: BLE001  # fallback-ok: logger node routing failure is non-fatal
         pass
+
+
+class _PendingLogEvent(NamedTuple):
+    """An enabled log event captured on the calling thread, not yet written."""
+
+    level: LogLevel
+    event_type: str
+    message: str
+    correlation_id: UUID
+    node_id: UUID | None
+    data: dict[str, LogDataValue | None] | None
+    calling_function: str
+    calling_module: str
+    calling_line: int
+    created_at: datetime
+    event_bus: Any | None
+
+
+def _snapshot_log_data(
+    data: dict[str, LogDataValue | None],
+) -> dict[str, LogDataValue | None]:
+    """Deep-copy ``data`` so caller mutations after emit cannot reach the writer."""
+    try:
+        return copy.deepcopy(data)
+    except Exception:  # noqa: BLE001  # fallback-ok: uncopyable values are logged as they are when written
+        return dict(data)
+
+
+def _write_log_batch(batch: list[_PendingLogEvent]) -> None:
+    """Sanitize, contextualize and route a batch of captured events."""
+    formatter, output_handler = get_protocol_services()
+    if not (formatter and output_handler):
+        # Nothing would be output, so skip sanitization and context building
+        return
+    for event in batch:
+        _route_to_logger_node(
+            level=event.level,
+            event_type=event.event_type,
+            message=_sanitize_sensitive_data(event.message),
+            _node_id=event.node_id,
+            correlation_id=event.correlation_id,
+            context=ModelLogContext(
+                calling_function=event.calling_function,
+                calling_module=event.calling_module,
+                calling_line=event.calling_line,
+                timestamp=event.created_at.isoformat(),
+                node_id=event.node_id,
+            ),
+            data=_sanitize_data_dict(event.data or {}),
+            _event_bus=event.event_bus,
+        )
+
+
+_pipeline_lock = threading.Lock()
+_pipeline_holder: list[LogPipeline[_PendingLogEvent] | None] = [None]
+_pipeline_asynchronous: list[bool] = [False]
+
+
+def _get_log_pipeline() -> LogPipeline[_PendingLogEvent]:
+    pipeline = _pipeline_holder[0]
+    if pipeline is None:
+        with _pipeline_lock:
+            pipeline = _pipeline_holder[0]
+            if pipeline is None:
+                pipeline = LogPipeline(_write_log_batch)
+                _pipeline_holder[0] = pipeline
+    return pipeline
+
+
+def configure_log_pipeline(
+    asynchronous: bool = False,
+    max_queue_size: int = 10_000,
+    batch_size: int = 256,
+    policy: EnumLogBackpressurePolicy = EnumLogBackpressurePolicy.DROP_NEWEST,
+    block_timeout_s: float = 0.1,
+) -> None:
+    """
+    Replace the log pipeline, writing out events queued on the old one.
+
+    Args:
+        asynchronous: Hand events below ERROR to the background writer; False
+            (the default) writes each event on the calling thread
+        max_queue_size: Queue capacity before ``policy`` applies
+        batch_size: Maximum events per writer batch
+        policy: What to drop when the queue is full
+        block_timeout_s: How long BLOCK waits for space before dropping
+    """
+    with _pipeline_lock:
+        old = _pipeline_holder[0]
+        _pipeline_holder[0] = LogPipeline(
+            _write_log_batch,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            policy=policy,
+            block_timeout_s=block_timeout_s,
+        )
+        _pipeline_asynchronous[0] = asynchronous
+    if old is not None:
+        old.shutdown()
+
+
+def flush_log_pipeline(timeout: float = 5.0) -> bool:
+    """
+    Wait until every queued log event has been written.
+
+    Returns:
+        True if the queue drained within ``timeout``
+    """
+    pipeline = _pipeline_holder[0]
+    return pipeline is None or pipeline.flush(timeout)
+
+
+def get_log_pipeline_stats() -> TypedDictLogPipelineStats:
+    """Return queue depth and drop counters of the log pipeline."""
+    return _get_log_pipeline().get_stats()
+
+
+def _shutdown_log_pipeline() -> None:
+    pipeline = _pipeline_holder[0]
+    if pipeline is not None:
+        pipeline.shutdown()
+
+
+def _reset_log_pipeline_after_fork() -> None:
+    pipeline = _pipeline_holder[0]
+    if pipeline is not None:
+        pipeline._reset_after_fork()
+
+
+atexit.register(_shutdown_log_pipeline)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_pipeline_after_fork)
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Bounded, batched hand-off from log producers to a background writer.
+
+Producers call submit() with a cheap, already-captured record; a daemon
+writer thread drains the queue in batches and hands each batch to the writer
+callable, where the expensive work (sanitization, formatting, output) runs.
+
+Backpressure is explicit: when the queue is full the configured
+EnumLogBackpressurePolicy decides whether the new record, the oldest record,
+or (after waiting up to ``block_timeout_s``) the new record is dropped.
+Every drop is counted.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable
+
+from omnibase_core.enums.enum_log_backpressure_policy import (
+    EnumLogBackpressurePolicy,
+)
+from omnibase_core.types.typed_dict_log_pipeline_stats import (
+    TypedDictLogPipelineStats,
+)
+
+
+class LogPipeline[R]:
+    """
+    Bounded record queue drained in batches by a daemon writer thread.
+
+    Args:
+        writer: Called on the writer thread with each batch of records
+        max_queue_size: Queue capacity before backpressure applies
+        batch_size: Maximum records per writer call
+        policy: What to drop when the queue is full
+        block_timeout_s: How long BLOCK waits for space before dropping
+        name: Writer thread name
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[R]], None],
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+        policy: EnumLogBackpressurePolicy = EnumLogBackpressurePolicy.DROP_NEWEST,
+        block_timeout_s: float = 0.1,
+        name: str = "onex-log-writer",
+    ) -> None:
+        self._writer = writer
+        self.max_queue_size = max(max_queue_size, 1)
+        self.batch_size = max(batch_size, 1)
+        self.policy = policy
+        self.block_timeout_s = block_timeout_s
+        self.name = name
+        self._queue: deque[R] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._in_flight = 0
+        self._stopping = False
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._blocked = 0
+        self._batches = 0
+        self._writer_errors = 0
+
+    def submit(self, record: R) -> bool:
+        """
+        Queue a record for the writer thread.
+
+        Returns:
+            True if the record was queued, False if it was dropped
+        """
+        with self._cond:
+            if len(self._queue) >= self.max_queue_size:
+                if self.policy is EnumLogBackpressurePolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                elif self.policy is EnumLogBackpressurePolicy.BLOCK:
+                    self._blocked += 1
+                    self._ensure_writer()
+                    if not self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_queue_size,
+                        self.block_timeout_s,
+                    ):
+                        self._dropped += 1
+                        return False
+                else:
+                    self._dropped += 1
+                    return False
+            self._queue.append(record)
+            self._enqueued += 1
+            self._ensure_writer()
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every queued record has been written.
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        with self._cond:
+            if self._queue:
+                self._ensure_writer()
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Write the remaining records and stop the writer thread."""
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._cond:
+            self._thread = None
+            self._stopping = False
+
+    def get_stats(self) -> TypedDictLogPipelineStats:
+        """Return queue depth and throughput/drop counters."""
+        with self._cond:
+            return TypedDictLogPipelineStats(
+                queue_depth=len(self._queue),
+                max_queue_size=self.max_queue_size,
+                enqueued=self._enqueued,
+                written=self._written,
+                dropped=self._dropped,
+                blocked=self._blocked,
+                batches=self._batches,
+                writer_errors=self._writer_errors,
+            )
+
+    def _ensure_writer(self) -> None:
+        # Caller holds self._cond
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._drain, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._stopping)
+                if not self._queue:
+                    return
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+            failed = False
+            try:
+                self._writer(batch)
+            except Exception:  # noqa: BLE001  # fallback-ok: a failing log writer must not kill the pipeline
+                failed = True
+            with self._cond:
+                self._in_flight = 0
+                self._written += count
+                self._batches += 1
+                self._writer_errors += failed
+                self._cond.notify_all()
+
+    def _reset_after_fork(self) -> None:
+        # The writer thread does not survive fork(); queued records belong to
+        # the parent and are discarded in the child.
+        self._cond = threading.Condition()
+        self._queue.clear()
+        self._thread = None
+        self._in_flight = 0
+        self._stopping = False
+
+
+__all__ = ["LogPipeline"]
@@ -15,6 +15,16 @@ from typing import Any
 from omnibase_core.enums.enum_log_level import EnumLogLevel as LogLevel
 from omnibase_core.logging.logging_pydantic_encoder import PydanticJSONEncoder
 
+# Map SPI LogLevel to Python logging levels
+_LEVEL_MAPPING = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.FATAL: logging.CRITICAL,
+}
+
 
 def emit_log_event_sync(
     level: LogLevel,
@@ -33,25 +43,7 @@ def emit_log_event_sync(
     """
     logger = logging.getLogger("omnibase")
 
-    # Create structured log entry
-    log_entry = {
-        "timestamp": datetime.now(UTC).isoformat(),
-        "level": level.value.lower(),
-        "message": message,
-        "context": context or {},
-    }
-
-    # Map SPI LogLevel to Python logging levels
-    level_mapping = {
-        LogLevel.DEBUG: logging.DEBUG,
-        LogLevel.INFO: logging.INFO,
-        LogLevel.WARNING: logging.WARNING,
-        LogLevel.ERROR: logging.ERROR,
-        LogLevel.CRITICAL: logging.CRITICAL,
-        LogLevel.FATAL: logging.CRITICAL,
-    }
-
-    python_level = level_mapping.get(level)
+    python_level = _LEVEL_MAPPING.get(level)
     if python_level is None:
         # fallback-ok: use INFO for unknown log levels but warn about configuration
         logger.warning(
@@ -61,4 +53,16 @@ def emit_log_event_sync(
         )
         python_level = logging.INFO
 
+    # Skip building and serializing the entry when it would be discarded
+    if not logger.isEnabledFor(python_level):
+        return
+
+    # Create structured log entry
+    log_entry = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "level": level.value.lower(),
+        "message": message,
+        "context": context or {},
+    }
+
     logger.log(python_level, json.dumps(log_entry, cls=PydanticJSONEncoder))
@@ -10,7 +10,8 @@ in an async-compatible interface and provides contract validation utilities.
 
 Thread Safety:
     The mixin methods are stateless and operate on passed arguments only.
-    The underlying execute_compute_pipeline function is pure and thread-safe.
+    Pipelines run through per-contract compiled plans (see
+    util_compute_pipeline_plan), which are immutable and thread-safe.
     However, the mixing class (e.g., NodeCompute) may have its own thread-safety
     constraints - consult the mixing class documentation.
 
@@ -33,12 +34,14 @@ Example:
 
 See Also:
     - omnibase_core.utils.util_compute_executor: Core pipeline execution logic
+    - omnibase_core.utils.util_compute_pipeline_plan: Compiled pipeline plans
     - omnibase_core.models.contracts.subcontracts: Contract models
     - omnibase_core.nodes.node_compute: Base NodeCompute class
     - docs/guides/node-building/03_COMPUTE_NODE_TUTORIAL.md: Compute node tutorial
 """
 
 from collections import Counter
+from collections.abc import Iterable
 from uuid import UUID, uuid4
 
 from omnibase_core.models.compute.model_compute_execution_context import (
@@ -50,7 +53,9 @@ from omnibase_core.models.compute.model_compute_pipeline_result import (
 from omnibase_core.models.contracts.subcontracts.model_compute_subcontract import (
     ModelComputeSubcontract,
 )
-from omnibase_core.utils.util_compute_executor import execute_compute_pipeline
+from omnibase_core.utils.util_compute_pipeline_plan import (
+    get_compiled_compute_pipeline,
+)
 
 
 class MixinComputeExecution:
@@ -100,9 +105,10 @@ class MixinComputeExecution:
         """
         Execute a contract-driven compute pipeline asynchronously.
 
-        Wraps the synchronous execute_compute_pipeline function in an async
-        interface for use in async node processing methods. Creates an execution
-        context with operation tracking information.
+        Runs the contract's compiled plan (compiled once per contract and
+        cached) behind an async interface for use in async node processing
+        methods. Results are identical to execute_compute_pipeline. Creates an
+        execution context with operation tracking information.
 
         Thread Safety:
             This method is async but the underlying pipeline execution is synchronous.
@@ -138,8 +144,39 @@ class MixinComputeExecution:
             ... else:
             ...     raise PipelineError(result.error_message)
         """
-        # Build execution context
-        context = ModelComputeExecutionContext(
+        context = self._build_compute_context(correlation_id)
+
+        # Execute pipeline (sync plan, but wrapped for async compatibility)
+        return get_compiled_compute_pipeline(contract).execute(input_data, context)
+
+    async def execute_contract_pipeline_batch(
+        self,
+        contract: ModelComputeSubcontract,
+        inputs: Iterable[object],
+        correlation_id: UUID | None = None,
+    ) -> list[ModelComputePipelineResult]:
+        """
+        Execute a contract-driven compute pipeline over many inputs.
+
+        Each input is processed independently (abort-on-first-failure and
+        timeout apply per input) by the contract's compiled plan, sharing one
+        execution context.
+
+        Args:
+            contract: The compute subcontract defining the pipeline steps.
+            inputs: Input data items to process through the pipeline.
+            correlation_id: Optional UUID for distributed tracing.
+
+        Returns:
+            One ModelComputePipelineResult per input, in input order.
+        """
+        context = self._build_compute_context(correlation_id)
+        return get_compiled_compute_pipeline(contract).execute_batch(inputs, context)
+
+    def _build_compute_context(
+        self, correlation_id: UUID | None
+    ) -> ModelComputeExecutionContext:
+        return ModelComputeExecutionContext(
             operation_id=uuid4(),
             correlation_id=correlation_id,
             node_id=(
@@ -149,11 +186,6 @@ class MixinComputeExecution:
             ),
         )
 
-        # Execute pipeline (sync function, but wrapped for async compatibility)
-        result = execute_compute_pipeline(contract, input_data, context)
-
-        return result
-
     def validate_compute_contract(self, contract: ModelComputeSubcontract) -> list[str]:
         """
         Validate a compute contract at load time.
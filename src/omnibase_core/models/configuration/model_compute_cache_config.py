@@ -32,7 +32,8 @@ class ModelComputeCacheConfig(BaseModel):
     NodeCompute performance across different workload patterns.
 
     Thread Safety:
-        Cache operations must be synchronized by implementation.
+        Cache operations must be synchronized by implementation; set
+        ``thread_safe=True`` to have ServiceComputeCache do it.
         See docs/THREADING.md for thread-safe patterns.
 
     Memory Implications:
@@ -45,6 +46,7 @@ class ModelComputeCacheConfig(BaseModel):
         ttl_seconds: Time-to-live for cached entries (None = no expiration)
         eviction_policy: Cache eviction strategy (lru/lfu/fifo)
         enable_stats: Enable cache hit/miss statistics tracking
+        thread_safe: Use a lock-guarded cache shared safely across threads
     """
 
     model_config = ConfigDict(frozen=False, validate_assignment=True, extra="forbid")
@@ -71,6 +73,10 @@ class ModelComputeCacheConfig(BaseModel):
         default=True,
         description="Enable cache hit/miss statistics for monitoring",
     )
+    thread_safe: bool = Field(
+        default=False,
+        description="Serialize cache operations behind a lock (ModelThreadSafeComputeCache)",
+    )
 
     def get_ttl_minutes(self) -> int | None:
         """
@@ -134,6 +134,9 @@ from omnibase_core.protocols.compute import ProtocolToolCache
 
 T = TypeVar("T")
 
+# Sentinel for slot-cache misses (a resolved service may legitimately be None)
+_MISSING = object()
+
 
 # === CORE CONTAINER DEFINITION ===
 
@@ -191,6 +194,7 @@ class ModelONEXContainer:
         cache_dir: Path | None = None,
         compute_cache_config: ModelComputeCacheConfig | None = None,
         enable_service_registry: bool = True,
+        cache_hit_log_interval: int = 0,
     ) -> None:
         """Initialize enhanced container with optional performance optimizations.
 
@@ -203,6 +207,9 @@ class ModelONEXContainer:
             cache_dir: Optional cache directory (defaults to temp directory).
             compute_cache_config: Cache configuration for NodeCompute instances (uses defaults if None).
             enable_service_registry: Enable new ServiceRegistry for protocol-based DI (default: True).
+            cache_hit_log_interval: Log every Nth service cache hit (0 disables
+                cache-hit logging, the default). Cache hits are the hot path of
+                handler auto-wiring; sampling keeps them free of log overhead.
 
         Note:
             If ServiceRegistry initialization fails (import error or other exception),
@@ -223,8 +230,10 @@ class ModelONEXContainer:
             "active_services": 0,
         }
 
-        # Initialize service cache
-        self._service_cache: dict[str, object] = {}
+        # Slot cache of resolved services, keyed by (protocol type, service name)
+        self._service_cache: dict[tuple[type, str | None], object] = {}
+        self._cache_hits = 0
+        self._cache_hit_log_interval = max(cache_hit_log_interval, 0)
 
         # Optional performance enhancements
         self.enable_performance_cache = enable_performance_cache
@@ -450,7 +459,8 @@ class ModelONEXContainer:
         Async service resolution with caching and logging.
 
         Enhanced with ServiceRegistry support - tries registry first, then falls back
-        to alternative resolution if registry lookup fails.
+        to alternative resolution if registry lookup fails. Cache hits return
+        without logging unless cache_hit_log_interval is set.
 
         Args:
             protocol_type: Protocol interface to resolve
@@ -463,24 +473,16 @@ class ModelONEXContainer:
         Raises:
             ModelOnexError: If service resolution fails
         """
+        # Check cache first
+        cache_key = (protocol_type, service_name)
+        cached_service = self._service_cache.get(cache_key, _MISSING)
+        if cached_service is not _MISSING:
+            self._record_cache_hit(protocol_type, service_name, correlation_id)
+            return cast(T, cached_service)
+
         protocol_name = protocol_type.__name__
-        cache_key = f"{protocol_name}:{service_name or 'default'}"
         final_correlation_id = correlation_id or uuid4()
 
-        # Check cache first
-        if cache_key in self._service_cache:
-            emit_log_event(
-                LogLevel.INFO,
-                f"Service resolved from cache: {protocol_name}",
-                {
-                    "protocol_type": protocol_name,
-                    "service_name": service_name,
-                    "correlation_id": str(final_correlation_id),
-                },
-            )
-            cached_service = cast(T, self._service_cache[cache_key])
-            return cached_service
-
         # Use ServiceRegistry (new DI system) - fail fast if enabled
         if self._enable_service_registry and self._service_registry is not None:
             try:
@@ -561,6 +563,54 @@ class ModelONEXContainer:
             },
         )
 
+    def get_cached_service(
+        self,
+        protocol_type: type[T],
+        service_name: str | None = None,
+    ) -> T | None:
+        """
+        Return an already-resolved service without resolving it.
+
+        The synchronous fast path for hot resolution loops: a single dict
+        lookup, with no coroutine, event loop or (unless sampled) logging.
+
+        Args:
+            protocol_type: Protocol interface to look up
+            service_name: Optional service name
+
+        Returns:
+            The cached service instance, or None if it has not been resolved
+        """
+        cached_service = self._service_cache.get(
+            (protocol_type, service_name), _MISSING
+        )
+        if cached_service is _MISSING:
+            return None
+        self._record_cache_hit(protocol_type, service_name, None)
+        return cast(T, cached_service)
+
+    def _record_cache_hit(
+        self,
+        protocol_type: type,
+        service_name: str | None,
+        correlation_id: UUID | None,
+    ) -> None:
+        """Count a cache hit and log every cache_hit_log_interval-th one."""
+        self._cache_hits += 1
+        interval = self._cache_hit_log_interval
+        if interval and self._cache_hits % interval == 0:
+            emit_log_event(
+                LogLevel.INFO,
+                f"Service resolved from cache: {protocol_type.__name__}",
+                {
+                    "protocol_type": protocol_type.__name__,
+                    "service_name": service_name,
+                    "correlation_id": str(correlation_id or uuid4()),
+                    "cache_hits": self._cache_hits,
+                    "sample_interval": interval,
+                },
+            )
+
     def get_service_sync(
         self,
         protocol_type: type[T],
@@ -571,9 +621,10 @@ class ModelONEXContainer:
 
         Works from both sync and async contexts: when called from inside a
         running event loop (e.g. handler __init__ during async auto-wiring),
-        the coroutine runs in a short-lived thread with its own event loop
-        to avoid ``RuntimeError: asyncio.run() cannot be called from a
-        running event loop``.
+        the coroutine runs on the persistent background loop thread
+        (``run_coro_sync``) to avoid ``RuntimeError: asyncio.run() cannot
+        be called from a running event loop``. Cached services are returned directly, without
+        a coroutine, unless performance monitoring is enabled.
 
         Args:
             protocol_type: Protocol interface to resolve
@@ -583,6 +634,14 @@ class ModelONEXContainer:
             T: Resolved service instance
         """
         if not self.enable_performance_cache or not self.performance_monitor:
+            # Fast path: cached services need no coroutine or event loop
+            cached_service = self._service_cache.get(
+                (protocol_type, service_name), _MISSING
+            )
+            if cached_service is not _MISSING:
+                self._record_cache_hit(protocol_type, service_name, None)
+                return cast(T, cached_service)
+
             # Standard resolution without performance monitoring.
             # run_coro_sync (OMN-9237) is safe from both sync and async
             # callers — handler __init__ may run inside an active loop during
@@ -1104,7 +1163,7 @@ def get_model_onex_container_sync() -> ModelONEXContainer:
     Worker-thread fallback (OMN-9237/OMN-9241): when called from inside a
     running event loop (e.g. handler ``__init__`` during async auto-wiring),
     the underlying ``create_model_onex_container()`` coroutine is dispatched
-    to a short-lived worker thread via ``run_coro_sync``. When no loop is
+    to the persistent background loop thread via ``run_coro_sync``. When no loop is
     running, the coroutine runs in-process via ``asyncio.run()`` as before.
     Prefer ``get_model_onex_container()`` (async) in async code to avoid the
     thread-offload overhead.
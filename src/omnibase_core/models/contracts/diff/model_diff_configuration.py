@@ -34,6 +34,8 @@ class ModelDiffConfiguration(BaseModel):
             Defaults to False for more concise output.
         normalize_before_diff: If True, normalize contract values before diffing.
             Normalization includes sorting keys and canonicalizing values.
+        use_merkle_hashing: If True, hash every subtree of both contracts first
+            and skip subtrees whose hashes match instead of walking them.
 
     Example:
         >>> config = ModelDiffConfiguration(
@@ -97,6 +99,14 @@ class ModelDiffConfiguration(BaseModel):
         ),
     )
 
+    use_merkle_hashing: bool = Field(
+        default=False,
+        description=(
+            "Whether to compare subtree hashes before walking subtrees. "
+            "Identical subtrees are skipped without being compared field by field."
+        ),
+    )
+
     model_config = ConfigDict(
         frozen=True,
         extra="forbid",
@@ -101,7 +101,7 @@ class ModelFSMTransitionCondition(BaseModel):
 
     # Valid operators for expression evaluation
     # Must be kept in sync with fsm_expression_parser.SUPPORTED_OPERATORS
-    # and fsm_executor._evaluate_single_condition()
+    # and util_fsm_transition_table.compile_condition()
     VALID_OPERATORS: frozenset[str] = frozenset(
         {
             # Equality operators (symbolic and textual)
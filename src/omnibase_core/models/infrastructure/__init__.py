@@ -9,6 +9,9 @@ Models for system infrastructure, execution, and operational concerns.
 
 from omnibase_core.models.core.model_action_payload import ModelActionPayload
 from omnibase_core.models.infrastructure.model_compute_cache import ModelComputeCache
+from omnibase_core.models.infrastructure.model_thread_safe_compute_cache import (
+    ModelThreadSafeComputeCache,
+)
 
 from .model_cli_result_data import ModelCliResultData
 from .model_duration import ModelDuration
@@ -46,6 +49,7 @@ __all__ = [
     "ModelRetryPolicy",
     "ModelTestResult",
     "ModelTestResults",
+    "ModelThreadSafeComputeCache",
     "ModelTimeBased",
     "ModelTimeout",
     "ModelTimeoutData",
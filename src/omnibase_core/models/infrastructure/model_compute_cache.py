@@ -4,13 +4,13 @@
 """
 ModelComputeCache - Caching Layer for Compute Node Operations.
 
-Provides TTL-based caching with memory management and LRU eviction for expensive
-computational operations. Designed for use with NodeCompute to optimize performance
-through intelligent result caching.
+Provides TTL-based caching with memory management and LRU/LFU/FIFO eviction for
+expensive computational operations. Designed for use with NodeCompute to optimize
+performance through intelligent result caching.
 
 Key Capabilities:
-- TTL-based cache expiration
-- LRU eviction policy for memory management
+- TTL-based cache expiration (expired entries found via a min-heap, not a scan)
+- O(1) LRU / LFU / FIFO eviction via UtilEvictionIndex
 - Access count tracking
 - Cache statistics and monitoring
 
@@ -21,6 +21,7 @@ from time import monotonic
 from typing import Any
 
 from omnibase_core.enums.enum_cache_eviction_policy import EnumCacheEvictionPolicy
+from omnibase_core.utils.util_eviction_index import UtilEvictionIndex
 
 __all__ = ["ModelComputeCache"]
 
@@ -30,7 +31,8 @@ class ModelComputeCache:
     Caching layer for expensive computations with TTL and memory management.
 
     Provides intelligent caching with time-to-live (TTL) expiration and
-    least-recently-used (LRU) eviction to optimize compute-intensive operations.
+    policy-driven eviction to optimize compute-intensive operations. Gets,
+    puts and evictions are O(1) for every policy; see UtilEvictionIndex.
 
     Attributes:
         max_size: Maximum number of cache entries
@@ -43,7 +45,8 @@ class ModelComputeCache:
         ⚠️ NOT thread-safe by default
         - LRU operations are not atomic
         - Concurrent get/put operations can corrupt cache state
-        - Production use requires external synchronization (e.g., threading.Lock)
+        - Production use requires external synchronization, or use
+          ModelThreadSafeComputeCache
         - See docs/THREADING.md for thread-safe wrapper implementation
     """
 
@@ -86,6 +89,8 @@ class ModelComputeCache:
         # For LRU: last_access_time (float from monotonic())
         # For LFU/FIFO: access_count (int)
         self._cache: dict[str, tuple[Any, datetime, float | int]] = {}
+        # Eviction order + expiry heap mirroring the keys of _cache.
+        self._index = UtilEvictionIndex(self.eviction_policy)
 
         # FIFO insertion counter
         self._insert_order = 0
@@ -121,6 +126,7 @@ class ModelComputeCache:
 
         if datetime.now() > expiry:
             del self._cache[cache_key]
+            self._index.remove(cache_key)
             if self.enable_stats:
                 self._stats["misses"] += 1
                 self._stats["expirations"] += 1
@@ -134,6 +140,7 @@ class ModelComputeCache:
             # LFU: Increment access count
             self._cache[cache_key] = (value, expiry, int(access_metric) + 1)
         # FIFO doesn't update access metric
+        self._index.touch(cache_key)
 
         if self.enable_stats:
             self._stats["hits"] += 1
@@ -153,11 +160,16 @@ class ModelComputeCache:
         if self.max_size <= 0:
             return
 
-        if len(self._cache) >= self.max_size:
-            self._evict()
+        now = datetime.now()
+        # Overwriting an existing key never needs room; a new key first reclaims
+        # expired entries, then evicts by policy.
+        if cache_key not in self._cache and len(self._cache) >= self.max_size:
+            self._purge_expired(now)
+            if len(self._cache) >= self.max_size:
+                self._evict()
 
         ttl = timedelta(minutes=ttl_minutes) if ttl_minutes is not None else self.ttl
-        expiry = datetime.now() + ttl
+        expiry = now + ttl
 
         # Set initial access metric based on eviction policy
         if self.eviction_policy == EnumCacheEvictionPolicy.LRU:
@@ -169,27 +181,28 @@ class ModelComputeCache:
             access_metric = self._insert_order  # Insertion order
 
         self._cache[cache_key] = (value, expiry, access_metric)
+        self._index.insert(cache_key, expiry)
 
     def _evict(self) -> None:
         """Evict item based on configured eviction policy."""
-        if not self._cache:
+        evict_key = self._index.pop_victim()
+        if evict_key is None:
             return
 
-        if self.eviction_policy == EnumCacheEvictionPolicy.LRU:
-            # Evict least recently used (smallest timestamp = oldest access)
-            evict_key = min(self._cache.keys(), key=lambda k: self._cache[k][2])
-        elif self.eviction_policy == EnumCacheEvictionPolicy.LFU:
-            # Evict least frequently used (lowest access count)
-            evict_key = min(self._cache.keys(), key=lambda k: self._cache[k][2])
-        else:  # FIFO
-            # Evict first in (lowest insertion order)
-            evict_key = min(self._cache.keys(), key=lambda k: self._cache[k][2])
-
         del self._cache[evict_key]
 
         if self.enable_stats:
             self._stats["evictions"] += 1
 
+    def _purge_expired(self, now: datetime) -> int:
+        """Drop every entry expired at ``now``; returns how many were dropped."""
+        expired = self._index.pop_expired(now)
+        for key in expired:
+            del self._cache[key]
+        if expired and self.enable_stats:
+            self._stats["expirations"] += len(expired)
+        return len(expired)
+
     def _evict_lru(self) -> None:
         """Legacy LRU eviction method."""
         self._evict()
@@ -197,6 +210,7 @@ class ModelComputeCache:
     def clear(self) -> None:
         """Clear all cached values."""
         self._cache.clear()
+        self._index.clear()
         if self.enable_stats:
             self._stats = {
                 "hits": 0,
@@ -210,10 +224,13 @@ class ModelComputeCache:
         """
         Get cache statistics for monitoring and optimization.
 
+        Expired entries are purged as they are counted (via the expiry heap,
+        without scanning valid entries) and added to ``expirations``.
+
         Returns:
             Dictionary with cache metrics:
-            - total_entries: Total cached items
-            - expired_entries: Count of expired items
+            - total_entries: Total cached items, including those expired now
+            - expired_entries: Count of expired items (purged by this call)
             - valid_entries: Count of valid items
             - max_size: Maximum cache capacity
             - hits: Cache hit count (if stats enabled)
@@ -222,13 +239,12 @@ class ModelComputeCache:
             - evictions: Eviction count (if stats enabled)
             - expirations: Expiration count (if stats enabled)
         """
-        now = datetime.now()
-        expired_count = sum(1 for _, expiry, _ in self._cache.values() if expiry <= now)
+        expired_count = self._purge_expired(datetime.now())
 
         stats: dict[str, int | float] = {
-            "total_entries": len(self._cache),
+            "total_entries": len(self._cache) + expired_count,
             "expired_entries": expired_count,
-            "valid_entries": len(self._cache) - expired_count,
+            "valid_entries": len(self._cache),
             "max_size": self.max_size,
         }
 
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+ModelThreadSafeComputeCache - Lock-guarded ModelComputeCache.
+
+Every ModelComputeCache operation mutates shared state (the entry map, the
+eviction index and the statistics), including get(). This variant serializes
+them behind one lock so a cache can be shared by worker threads.
+"""
+
+import threading
+from typing import Any
+
+from omnibase_core.models.infrastructure.model_compute_cache import ModelComputeCache
+
+__all__ = ["ModelThreadSafeComputeCache"]
+
+
+class ModelThreadSafeComputeCache(ModelComputeCache):
+    """
+    ModelComputeCache whose public operations are atomic.
+
+    Accepts the same arguments as ModelComputeCache. Each operation holds the
+    lock only for its O(1) bookkeeping, so contention stays low.
+
+    Thread Safety:
+        Thread-safe. get/put/clear/get_stats are each atomic; a get followed by
+        a put is NOT (two threads may both miss and compute the same value).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Any | None:
+        """Get cached value if valid and not expired (atomic)."""
+        with self._lock:
+            return super().get(cache_key)
+
+    def put(self, cache_key: str, value: Any, ttl_minutes: int | None = None) -> None:
+        """Cache value with TTL (atomic)."""
+        with self._lock:
+            super().put(cache_key, value, ttl_minutes)
+
+    def clear(self) -> None:
+        """Clear all cached values (atomic)."""
+        with self._lock:
+            super().clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get cache statistics (atomic)."""
+        with self._lock:
+            return super().get_stats()
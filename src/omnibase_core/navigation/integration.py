@@ -42,7 +42,8 @@ class NavigationFacade:
     and BackwardChainingPlanner into a single object. All methods delegate
     directly to the underlying component -- no additional logic is added.
 
-    Thread-safe: all underlying components are stateless.
+    Thread-safe: the planner's caches are lock-protected and the other
+    components are stateless.
     """
 
     def __init__(self) -> None:
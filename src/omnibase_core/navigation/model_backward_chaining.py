@@ -10,15 +10,19 @@ produces a verified execution plan as a path through the contract graph.
 Design principles:
 - Pure graph search — no calls to the local model
 - Every step corresponds to a declared ContractTransition in the graph
-- Cycle detection via visited-set keyed on ContractState identity (node_id)
+- Plans are simple paths; goals reachable only from cycles are reported
 - Configurable max depth (default: 10)
 - Deterministic: same graph + goal + current_state → same plan
 - Handles disconnected graph regions gracefully (returns NoPlanFound)
-- Depth-limited backward BFS from goal to current state
+- Backward A* from the goal states to the current state, over predecessors
+  sorted once per graph, with plans cached per (graph hash, start, goal)
 """
 
+import hashlib
+import heapq
 import logging
-from collections import deque
+import threading
+from collections import OrderedDict, deque
 from enum import Enum, auto
 
 from omnibase_core.navigation.model_contract_graph import (
@@ -41,9 +45,16 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_DEPTH = 10
 
+# Graphs (by identity and by content hash) whose search index is kept
+_GRAPH_CACHE_SIZE = 8
+# Start states whose reachability closure is kept per graph
+_CLOSURE_CACHE_SIZE = 256
+# (graph hash, start, goal) plan results kept per planner
+_PLAN_CACHE_SIZE = 1024
+
 
 class _BfsSignal(Enum):
-    """Internal signals returned by _backward_bfs when no plan is found."""
+    """Internal signals returned by _search when no plan is found."""
 
     CYCLE = auto()
     DEPTH_EXCEEDED = auto()
@@ -51,6 +62,108 @@ class _BfsSignal(Enum):
 
 _BfsResult = list[PlanStep] | _BfsSignal | None
 
+# Incoming edge of a node: (total_cost, transition_id, source_state_id, output_types)
+_IncomingEdge = tuple[int, str, str, tuple[str, ...]]
+
+
+class _GraphIndex:
+    """Search structures for one graph, built once per graph hash.
+
+    Incoming transitions are sorted by (cost, transition_id) once. Forward
+    reachability closures (with hop distances) are computed per start state on
+    first use, and the set of nodes on cycles once, on the first failed search.
+    """
+
+    def __init__(self, graph: ContractGraph) -> None:
+        self.incoming: dict[str, tuple[_IncomingEdge, ...]] = {}
+        self.outgoing: dict[str, list[str]] = {}
+        for node_id in graph.predecessors:
+            edges = sorted(
+                (
+                    t.cost.total_cost,
+                    t.transition_id,
+                    t.source_state_id,
+                    t.output_types,
+                )
+                for t in graph.get_incoming_transitions(node_id)
+            )
+            if edges:
+                self.incoming[node_id] = tuple(edges)
+            for _cost, _tid, source_id, _outputs in edges:
+                self.outgoing.setdefault(source_id, []).append(node_id)
+        self._closures: OrderedDict[str, dict[str, int]] = OrderedDict()
+        self._cyclic: frozenset[str] | None = None
+
+    def hops_from(self, start_id: str) -> dict[str, int]:
+        """Return the fewest steps from start_id to every node it can reach."""
+        hops = self._closures.get(start_id)
+        if hops is not None:
+            self._closures.move_to_end(start_id)
+            return hops
+        hops = {start_id: 0}
+        queue = deque([start_id])
+        while queue:
+            node_id = queue.popleft()
+            next_hops = hops[node_id] + 1
+            for target_id in self.outgoing.get(node_id, ()):
+                if target_id not in hops:
+                    hops[target_id] = next_hops
+                    queue.append(target_id)
+        self._closures[start_id] = hops
+        while len(self._closures) > _CLOSURE_CACHE_SIZE:
+            self._closures.popitem(last=False)
+        return hops
+
+    def cyclic_nodes(self) -> frozenset[str]:
+        """Return the nodes that lie on a cycle (including self-loops)."""
+        if self._cyclic is None:
+            self._cyclic = self._find_cyclic_nodes()
+        return self._cyclic
+
+    def _find_cyclic_nodes(self) -> frozenset[str]:
+        # Iterative Tarjan over the forward edges
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        cyclic: set[str] = set()
+        for root in self.outgoing:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.outgoing.get(root, ())))]
+            while work:
+                node_id, targets = work[-1]
+                for target_id in targets:
+                    if target_id == node_id:
+                        cyclic.add(node_id)
+                    if target_id not in index:
+                        index[target_id] = lowlink[target_id] = len(index)
+                        stack.append(target_id)
+                        on_stack.add(target_id)
+                        work.append((target_id, iter(self.outgoing.get(target_id, ()))))
+                        break
+                    if target_id in on_stack:
+                        lowlink[node_id] = min(lowlink[node_id], index[target_id])
+                else:
+                    work.pop()
+                    if work:
+                        parent_id = work[-1][0]
+                        lowlink[parent_id] = min(lowlink[parent_id], lowlink[node_id])
+                    if lowlink[node_id] == index[node_id]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node_id:
+                                break
+                        if len(component) > 1:
+                            cyclic.update(component)
+        return frozenset(cyclic)
+
 
 def _satisfies_goal(state: ContractState, goal: GoalCondition) -> bool:
     """Check if a state satisfies the goal condition.
@@ -105,8 +218,11 @@ class BackwardChainingPlanner:
     state to any state that satisfies the goal condition. Returns a forward-
     ordered plan (first step first).
 
+    Plans are optimal: fewest steps first, then lowest total transition cost.
     The planner is deterministic: the same graph, goal, and current state
-    always produce the same plan (BFS explores nodes in sorted order).
+    always produce the same plan. Search structures are built once per graph
+    (keyed by a hash of its content) and results are cached per
+    (graph hash, start state, goal); caches are lock-protected.
 
     Example:
         >>> planner = BackwardChainingPlanner(max_depth=10)
@@ -127,6 +243,13 @@ class BackwardChainingPlanner:
                 f"max_depth must be >= 1, got {max_depth}"
             )
         self._max_depth = max_depth
+        self._lock = threading.Lock()
+        # id(graph) -> (graph, content hash); the graph is held so ids stay valid
+        self._graph_hashes: OrderedDict[int, tuple[ContractGraph, str]] = OrderedDict()
+        self._indexes: OrderedDict[str, _GraphIndex] = OrderedDict()
+        self._plans: OrderedDict[tuple[str, str, GoalCondition], PlanResult] = (
+            OrderedDict()
+        )
 
     @property
     def max_depth(self) -> int:
@@ -141,11 +264,12 @@ class BackwardChainingPlanner:
     ) -> PlanResult:
         """Produce a verified execution plan from current_state to a goal-satisfying state.
 
-        Implements depth-limited backward BFS:
+        Implements a backward A* search from the goal states:
         1. Check if current_state already satisfies the goal.
         2. Collect all goal-satisfying states in the graph.
-        3. For each goal state, use backward BFS to find a path from current_state.
-        4. Return the shortest plan found (fewest steps).
+        3. Search backwards from all goal states at once for current_state,
+           guided by the forward step distance from current_state.
+        4. Return the shortest plan found (fewest steps, then lowest cost).
 
         Args:
             graph: The contract graph for this navigation session.
@@ -174,6 +298,53 @@ class BackwardChainingPlanner:
             )
             return GoalAlreadySatisfied(current_state_id=current_state.node_id)
 
+        with self._lock:
+            graph_hash = self._graph_hash(graph)
+            key = (graph_hash, current_state.node_id, goal)
+            cached = self._plans.get(key)
+            if cached is not None:
+                self._plans.move_to_end(key)
+                return cached
+            result = self._plan_uncached(
+                graph, self._index(graph, graph_hash), goal, current_state.node_id
+            )
+            self._plans[key] = result
+            while len(self._plans) > _PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+            return result
+
+    def _graph_hash(self, graph: ContractGraph) -> str:
+        """Return the content hash of graph, computed once per graph object."""
+        entry = self._graph_hashes.get(id(graph))
+        if entry is not None and entry[0] is graph:
+            self._graph_hashes.move_to_end(id(graph))
+            return entry[1]
+        graph_hash = hashlib.blake2b(
+            graph.model_dump_json().encode("utf-8"), digest_size=16
+        ).hexdigest()
+        self._graph_hashes[id(graph)] = (graph, graph_hash)
+        while len(self._graph_hashes) > _GRAPH_CACHE_SIZE:
+            self._graph_hashes.popitem(last=False)
+        return graph_hash
+
+    def _index(self, graph: ContractGraph, graph_hash: str) -> _GraphIndex:
+        index = self._indexes.get(graph_hash)
+        if index is not None:
+            self._indexes.move_to_end(graph_hash)
+            return index
+        index = _GraphIndex(graph)
+        self._indexes[graph_hash] = index
+        while len(self._indexes) > _GRAPH_CACHE_SIZE:
+            self._indexes.popitem(last=False)
+        return index
+
+    def _plan_uncached(
+        self,
+        graph: ContractGraph,
+        index: _GraphIndex,
+        goal: GoalCondition,
+        start_id: str,
+    ) -> PlanResult:
         # Step 2: Collect all goal-satisfying states
         goal_state_ids: list[str] = sorted(
             node_id
@@ -192,167 +363,181 @@ class BackwardChainingPlanner:
                 )
             )
 
-        # Step 3: Backward BFS from each goal state to find shortest path to current_state
-        # We search backwards: from goal states, follow predecessors to find current_state.
-        # BFS state: (node_id, path_of_transition_ids_from_goal_backwards)
-        # We convert to forward plan at the end.
-
-        best_plan: list[PlanStep] | None = None
-        cycle_detected = False
-        depth_exceeded = False
-
-        for goal_state_id in goal_state_ids:
-            bfs_result = self._backward_bfs(
-                graph=graph,
-                start_id=current_state.node_id,
-                goal_id=goal_state_id,
-                goal=goal,
-            )
-            if bfs_result is None:
-                # No path found for this goal state — disconnected
-                continue
-            if bfs_result is _BfsSignal.CYCLE:
-                cycle_detected = True
-                continue
-            if bfs_result is _BfsSignal.DEPTH_EXCEEDED:
-                depth_exceeded = True
-                continue
-
-            # bfs_result is a list of PlanStep
-            plan_steps: list[PlanStep] = bfs_result
-            if best_plan is None or len(plan_steps) < len(best_plan):
-                best_plan = plan_steps
+        # Step 3: Backward search from the goal states to current_state
+        search_result = self._search(index, start_id, goal_state_ids, goal)
 
-        if best_plan is not None:
+        if isinstance(search_result, list):
             logger.debug(
                 "Backward chaining produced plan",
                 extra={
-                    "step_count": len(best_plan),
-                    "current_state_id": current_state.node_id,
+                    "step_count": len(search_result),
+                    "current_state_id": start_id,
                 },
             )
-            return Plan(steps=tuple(best_plan))
+            return Plan(steps=tuple(search_result))
 
         # No plan found — return most specific reason
-        if depth_exceeded:
+        if search_result is _BfsSignal.DEPTH_EXCEEDED:
             return NoPlanFound(reason=MaxDepthExceeded(max_depth=self._max_depth))
-        if cycle_detected:
+        if search_result is _BfsSignal.CYCLE:
             return NoPlanFound(reason=CycleDetected())
         return NoPlanFound(
             reason=RequiredTransitionNotInGraph(goal_node_id=goal.target_node_id)
         )
 
-    def _backward_bfs(
+    def _search(
         self,
-        graph: ContractGraph,
+        index: _GraphIndex,
         start_id: str,
-        goal_id: str,
+        goal_ids: list[str],
         goal: GoalCondition,
     ) -> _BfsResult:
-        """Depth-limited backward BFS from goal_id back to start_id.
+        """Backward A* from all goal states to start_id.
+
+        Labels are (steps, total_cost) from a node to its goal, compared
+        lexicographically; the priority adds the node's forward step distance
+        from start_id, an exact and consistent estimate of the steps still
+        needed, so nodes that cannot be reached from start_id are never
+        explored. Parent pointers (transition_id, successor) rebuild the plan.
 
         Returns:
             list[PlanStep]: A forward-ordered plan if found.
             None: No path found (disconnected).
-            _BfsSignal.CYCLE: All paths contain cycles.
-            _BfsSignal.DEPTH_EXCEEDED: Max depth exceeded before finding path.
+            _BfsSignal.CYCLE: No path found; states on cycles lead to the goal.
+            _BfsSignal.DEPTH_EXCEEDED: Any path is longer than max_depth, or
+                the states leading to the goal extend beyond max_depth.
         """
-        # BFS queue: (current_node_id, path_backwards: list of (transition_id, from_id, to_id))
-        # "path_backwards" records the transitions traversed going backward from goal.
-        # visited set: frozenset of node_ids in current path (cycle detection)
-
-        # Each queue entry: (node_id, visited_set, backward_path)
-        # backward_path: list of (transition_id, pre_id, post_id) in backward traversal order
-        initial_visited: frozenset[str] = frozenset({goal_id})
-        initial_path: list[tuple[str, str, str]] = []  # (transition_id, pre, post)
-
-        queue: deque[tuple[str, frozenset[str], list[tuple[str, str, str]]]] = deque()
-        queue.append((goal_id, initial_visited, initial_path))
-
+        hops = index.hops_from(start_id)
+        labels: dict[str, tuple[int, int]] = {}
+        parents: dict[str, tuple[str, str]] = {}
+        # The goal a node's label leads to; plans never pass through it twice
+        terminals: dict[str, str] = {}
+        heap: list[tuple[int, int, str]] = []
+
+        for goal_id in goal_ids:
+            if goal_id == start_id:
+                continue  # only a cycle could lead back to the start
+            for cost, transition_id, source_id, _outputs in self._goal_edges(
+                index, goal_id, goal
+            ):
+                if source_id == goal_id or source_id not in hops:
+                    continue
+                label = (1, cost)
+                if source_id not in labels or label < labels[source_id]:
+                    labels[source_id] = label
+                    parents[source_id] = (transition_id, goal_id)
+                    terminals[source_id] = goal_id
+                    heapq.heappush(heap, (1 + hops[source_id], cost, source_id))
+
+        while heap:
+            priority, cost, node_id = heapq.heappop(heap)
+            steps, label_cost = labels[node_id]
+            if (steps + hops[node_id], label_cost) != (priority, cost):
+                continue  # stale entry
+            if priority > self._max_depth:
+                # Every remaining plan needs at least `priority` steps
+                return _BfsSignal.DEPTH_EXCEEDED
+            if node_id == start_id:
+                return self._build_plan(start_id, steps, parents)
+
+            terminal_id = terminals[node_id]
+            for edge_cost, transition_id, source_id, _outputs in index.incoming.get(
+                node_id, ()
+            ):
+                if source_id not in hops or source_id == terminal_id:
+                    continue
+                label = (steps + 1, label_cost + edge_cost)
+                if source_id not in labels or label < labels[source_id]:
+                    labels[source_id] = label
+                    parents[source_id] = (transition_id, node_id)
+                    terminals[source_id] = terminal_id
+                    heapq.heappush(
+                        heap, (label[0] + hops[source_id], label[1], source_id)
+                    )
+
+        return self._classify_unreachable(index, start_id, goal_ids, goal)
+
+    @staticmethod
+    def _goal_edges(
+        index: _GraphIndex, goal_id: str, goal: GoalCondition
+    ) -> list[_IncomingEdge]:
+        """Incoming edges of a goal state that produce a required output type."""
+        edges = index.incoming.get(goal_id, ())
+        if not goal.required_output_types:
+            return list(edges)
+        return [
+            edge
+            for edge in edges
+            if _transition_satisfies_output_goal(edge[3], goal.required_output_types)
+        ]
+
+    def _classify_unreachable(
+        self,
+        index: _GraphIndex,
+        start_id: str,
+        goal_ids: list[str],
+        goal: GoalCondition,
+    ) -> _BfsResult:
+        """Explain why no plan reaches a goal state from start_id.
+
+        Walks backwards from the goal states through everything that can
+        reach them, tracking each node's fewest steps to its goal (paths do
+        not pass through their own goal state or start_id). Reports
+        DEPTH_EXCEEDED if that region extends to max_depth steps (a
+        depth-limited search would have been cut off), else CYCLE if a cycle
+        leads into it, else None.
+        """
+        cyclic = index.cyclic_nodes()
+        depths: dict[str, int] = {}
+        terminals: dict[str, str] = {}
+        queue: deque[str] = deque()
         found_cycle = False
-        found_depth_exceeded = False
-
+        for goal_id in goal_ids:
+            for _cost, _tid, source_id, _outputs in self._goal_edges(
+                index, goal_id, goal
+            ):
+                if source_id == goal_id:
+                    found_cycle = True
+                elif source_id not in depths:
+                    depths[source_id] = 1
+                    terminals[source_id] = goal_id
+                    queue.append(source_id)
         while queue:
-            current_id, visited, backward_path = queue.popleft()
-
-            # Check if we've reached the start state (check before depth limit
-            # so a path of exactly max_depth steps is accepted)
-            if current_id == start_id and backward_path:
-                # Convert backward path to forward plan
-                return self._backward_path_to_plan(backward_path)
-
-            # Check depth limit before expanding further
-            if len(backward_path) >= self._max_depth:
-                found_depth_exceeded = True
+            node_id = queue.popleft()
+            if depths[node_id] >= self._max_depth:
+                return _BfsSignal.DEPTH_EXCEEDED
+            if node_id == start_id:
                 continue
-
-            # Explore predecessors (transitions incoming to current_id)
-            # Sort for determinism
-            incoming = sorted(
-                graph.get_incoming_transitions(current_id),
-                key=lambda t: (t.cost.total_cost, t.transition_id),
-            )
-
-            if not incoming:
-                # Dead end (no predecessors) and not the start
-                continue
-
-            for transition in incoming:
-                predecessor_id = transition.source_state_id
-
-                # Check for output type constraint if goal requires it
-                # (only check this for the first backward step, i.e., transitions entering the goal)
-                if current_id == goal_id and goal.required_output_types:
-                    if not _transition_satisfies_output_goal(
-                        transition.output_types, goal.required_output_types
-                    ):
-                        continue
-
-                # Cycle detection (in current path)
-                if predecessor_id in visited:
-                    found_cycle = True
-                    continue
-
-                new_visited = visited | {predecessor_id}
-                new_backward_path = backward_path + [
-                    (transition.transition_id, predecessor_id, current_id)
-                ]
-                queue.append((predecessor_id, new_visited, new_backward_path))
-
-        # Check if we simply never reached start (not same as cycle)
-        if found_depth_exceeded:
-            return _BfsSignal.DEPTH_EXCEEDED
-        if found_cycle:
-            return _BfsSignal.CYCLE
-        return None
-
-    def _backward_path_to_plan(
-        self,
-        backward_path: list[tuple[str, str, str]],
+            found_cycle = found_cycle or node_id in cyclic
+            for _cost, _tid, source_id, _outputs in index.incoming.get(node_id, ()):
+                if source_id not in depths and source_id != terminals[node_id]:
+                    depths[source_id] = depths[node_id] + 1
+                    terminals[source_id] = terminals[node_id]
+                    queue.append(source_id)
+        return _BfsSignal.CYCLE if found_cycle else None
+
+    @staticmethod
+    def _build_plan(
+        start_id: str, step_count: int, parents: dict[str, tuple[str, str]]
     ) -> list[PlanStep]:
-        """Convert a backward path to a forward-ordered list of PlanStep.
+        """Follow parent pointers from start_id for step_count steps.
 
-        Args:
-            backward_path: List of (transition_id, pre_state_id, post_state_id)
-                in backward traversal order (goal-first). The path does NOT include
-                the trivial "goal reached" entry — it starts from the first predecessor.
-
-        Returns:
-            Forward-ordered list of PlanStep (first = step from start).
+        Counting steps (rather than stopping at the first goal state) keeps
+        plans that pass through another goal state intact.
         """
-        # The backward path is in reverse order: backward_path[0] is the last step
-        # (the step that leads into the goal state), backward_path[-1] is the first step.
-        forward_path = list(reversed(backward_path))
         steps = []
-        for i, (transition_id, pre_id, post_id) in enumerate(forward_path):
+        node_id = start_id
+        for i in range(step_count):
+            transition_id, next_id = parents[node_id]
             steps.append(
                 PlanStep(
                     transition_id=transition_id,
-                    pre_state_id=pre_id,
-                    post_state_id=post_id,
+                    pre_state_id=node_id,
+                    post_state_id=next_id,
                     step_index=i,
                 )
             )
+            node_id = next_id
         return steps
 
 
@@ -34,6 +34,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 from collections.abc import Callable
+from time import monotonic
 from typing import Any
 
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
@@ -56,6 +57,9 @@ from omnibase_core.protocols.compute import (
 )
 from omnibase_core.resolution.resolver_handler import HandlerCallable
 
+# Upper bound on cache keys whose stale-while-revalidate deadline is tracked.
+_MAX_TRACKED_REFRESH_DEADLINES = 10_000
+
 
 class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
     """
@@ -111,6 +115,8 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
 
         **Mutable State Components**:
         - ``_cache``: Optional compute cache (injected via ProtocolComputeCache)
+        - ``_inflight_computations``: Single-flight futures keyed by cache key
+          (shared by concurrent callers on ONE event loop)
         - ``computation_registry``: Algorithm function registry (dict[str, Callable])
         - ``computation_metrics``: Performance metrics dictionary (dict[str, dict[str, float]])
 
@@ -158,6 +164,21 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
         # Configuration (only used if infrastructure services are available)
         self.cache_ttl_minutes: int = 30
         self.performance_threshold_ms: float = 100.0
+        # Fraction of the TTL, at the end of an entry's life, during which a cache
+        # hit also triggers a background recomputation (0.0 disables).
+        self.stale_while_revalidate_fraction: float = 0.0
+
+        # Single-flight: concurrent cache misses for one key await one computation.
+        self._inflight_computations: dict[str, asyncio.Future[Any]] = {}
+        # Cache key -> monotonic time after which a hit triggers a refresh.
+        self._refresh_deadlines: dict[str, float] = {}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._cache_request_counts: dict[str, int] = {
+            "hits": 0,
+            "coalesced": 0,
+            "misses": 0,
+            "stale_refreshes": 0,
+        }
 
         # Computation registry for algorithm functions
         self.computation_registry: dict[str, Callable[..., Any]] = {}
@@ -361,31 +382,80 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
         input_data: ModelComputeInput[T_Input],
         start_time: float | None,
     ) -> ModelComputeOutput[T_Output]:
-        """Cache check → parallel/sequential execution → cache store → metrics."""
-        if input_data.cache_enabled and self._cache is not None:
-            cache_key = self._generate_cache_key(input_data)
-            cached_result = self._cache.get(cache_key)
-            if cached_result is not None:
+        """Cache check → single-flight → execution → cache store → metrics.
+
+        Concurrent callers that miss on the same cache key share ONE in-flight
+        computation (the first caller computes, the rest await its result), so an
+        expired hot key is recomputed once rather than once per caller.
+        """
+        if not input_data.cache_enabled or self._cache is None:
+            return await self._execute_uncached(input_data, start_time, None)
+
+        cache_key = self._generate_cache_key(input_data)
+        cached_result = self._cache.get(cache_key)
+        if cached_result is not None:
+            self._cache_request_counts["hits"] += 1
+            self._maybe_revalidate(cache_key, input_data)
+            return ModelComputeOutput(
+                result=cached_result,
+                operation_id=input_data.operation_id,
+                computation_type=input_data.computation_type,
+                processing_time_ms=0.0,
+                cache_hit=True,
+                parallel_execution_used=False,
+                metadata={"cache_retrieval": True},
+            )
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight_computations.get(cache_key)
+        # Futures are loop-bound: only coalesce with computations on this loop.
+        if inflight is not None and inflight.get_loop() is loop:
+            try:
+                # shield: a cancelled follower must not cancel the shared computation.
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leader was cancelled, not us: compute ourselves below.
+            else:
+                self._cache_request_counts["coalesced"] += 1
                 return ModelComputeOutput(
-                    result=cached_result,
+                    result=result,
                     operation_id=input_data.operation_id,
                     computation_type=input_data.computation_type,
                     processing_time_ms=0.0,
                     cache_hit=True,
                     parallel_execution_used=False,
-                    metadata={"cache_retrieval": True},
+                    metadata={"cache_retrieval": True, "coalesced": True},
                 )
 
-        parallel_used = False
-        if (
-            input_data.parallel_enabled
-            and self._parallel_executor is not None
-            and self._supports_parallel_execution(input_data)
-        ):
-            result = await self._execute_parallel_computation(input_data)
-            parallel_used = True
+        self._cache_request_counts["misses"] += 1
+        future: asyncio.Future[Any] = loop.create_future()
+        self._inflight_computations[cache_key] = future
+        try:
+            output = await self._execute_uncached(input_data, start_time, cache_key)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved: followers are optional
+            raise
+        except BaseException:
+            future.cancel()
+            raise
         else:
-            result = await self._execute_sequential_computation(input_data)
+            future.set_result(output.result)
+            return output
+        finally:
+            if self._inflight_computations.get(cache_key) is future:
+                del self._inflight_computations[cache_key]
+
+    async def _execute_uncached(
+        self,
+        input_data: ModelComputeInput[T_Input],
+        start_time: float | None,
+        cache_key: str | None,
+    ) -> ModelComputeOutput[T_Output]:
+        """Parallel/sequential execution → cache store (when keyed) → metrics."""
+        result, parallel_used = await self._run_computation(input_data)
 
         processing_time: float = 0.0
         if self._timing_service is not None and start_time is not None:
@@ -401,9 +471,8 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
                     },
                 )
 
-        if input_data.cache_enabled and self._cache is not None:
-            cache_key = self._generate_cache_key(input_data)
-            self._cache.put(cache_key, result, self.cache_ttl_minutes)
+        if cache_key is not None:
+            self._store_cached(cache_key, result)
 
         if self._timing_service is not None:
             self._update_specialized_metrics(
@@ -428,6 +497,82 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
             },
         )
 
+    async def _run_computation(
+        self, input_data: ModelComputeInput[T_Input]
+    ) -> tuple[Any, bool]:
+        """Execute the computation; returns ``(result, parallel_execution_used)``."""
+        if (
+            input_data.parallel_enabled
+            and self._parallel_executor is not None
+            and self._supports_parallel_execution(input_data)
+        ):
+            return await self._execute_parallel_computation(input_data), True
+        return await self._execute_sequential_computation(input_data), False
+
+    def _store_cached(self, cache_key: str, result: Any) -> None:
+        """Cache a result and, with stale-while-revalidate on, its refresh deadline."""
+        if self._cache is None:
+            return
+        self._cache.put(cache_key, result, self.cache_ttl_minutes)
+        if self.stale_while_revalidate_fraction > 0:
+            fresh_for = (
+                self.cache_ttl_minutes * 60 * (1 - self.stale_while_revalidate_fraction)
+            )
+            deadlines = self._refresh_deadlines
+            deadlines.pop(cache_key, None)
+            if len(deadlines) >= _MAX_TRACKED_REFRESH_DEADLINES:
+                del deadlines[next(iter(deadlines))]
+            deadlines[cache_key] = monotonic() + fresh_for
+
+    def _maybe_revalidate(
+        self, cache_key: str, input_data: ModelComputeInput[T_Input]
+    ) -> None:
+        """On a hit close to expiry, recompute in the background (single-flight)."""
+        deadline = self._refresh_deadlines.get(cache_key)
+        if (
+            deadline is None
+            or monotonic() < deadline
+            or cache_key in self._inflight_computations
+        ):
+            return
+        del self._refresh_deadlines[cache_key]
+        self._cache_request_counts["stale_refreshes"] += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight_computations[cache_key] = future
+        task = asyncio.create_task(self._revalidate(cache_key, input_data, future))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _revalidate(
+        self,
+        cache_key: str,
+        input_data: ModelComputeInput[T_Input],
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Background refresh; a failure keeps serving the current entry."""
+        try:
+            result, _ = await self._run_computation(input_data)
+        except Exception as e:  # noqa: BLE001  # fallback-ok: the cached value stays valid until its TTL; the failure is logged and the next hit past the deadline retries
+            future.set_exception(e)
+            future.exception()
+            emit_log_event(
+                LogLevel.WARNING,
+                f"Stale-while-revalidate refresh failed: {e!s}",
+                {
+                    "node_id": str(self.node_id),
+                    "computation_type": input_data.computation_type,
+                },
+            )
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            self._store_cached(cache_key, result)
+            future.set_result(result)
+        finally:
+            if self._inflight_computations.get(cache_key) is future:
+                del self._inflight_computations[cache_key]
+
     async def execute_compute(
         self,
         contract: ModelContractCompute,
@@ -607,6 +752,14 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
                 / max(max_size, 1),
                 "ttl_minutes": float(self.cache_ttl_minutes),
             }
+            counts = self._cache_request_counts
+            result["cache_requests"] = {
+                "hits": float(counts["hits"]),
+                "coalesced": float(counts["coalesced"]),
+                "misses": float(counts["misses"]),
+                "stale_refreshes": float(counts["stale_refreshes"]),
+                "in_flight": float(len(self._inflight_computations)),
+            }
 
         # Add execution mode info
         result["execution_mode"] = {
@@ -686,12 +839,18 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
                 "compute.performance_threshold_ms",
                 default=self.performance_threshold_ms,
             )
+            swr_value = await config.get_performance_config(
+                "compute.stale_while_revalidate_fraction",
+                default=self.stale_while_revalidate_fraction,
+            )
 
             # Update configuration values with type checking
             if isinstance(cache_ttl_value, (int, float)):
                 self.cache_ttl_minutes = int(cache_ttl_value)
             if isinstance(perf_threshold_value, (int, float)):
                 self.performance_threshold_ms = float(perf_threshold_value)
+            if isinstance(swr_value, (int, float)) and 0 <= swr_value < 1:
+                self.stale_while_revalidate_fraction = float(swr_value)
 
         emit_log_event(
             LogLevel.INFO,
@@ -727,6 +886,11 @@ class NodeCompute[T_Input, T_Output](NodeCoreBase, MixinHandlerRouting):
             )
             self._parallel_executor = None
 
+        # Stop background stale-while-revalidate refreshes
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        self._refresh_deadlines.clear()
+
         # Clear cache if available
         if self._cache is not None:
             self._cache.clear()
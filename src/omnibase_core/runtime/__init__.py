@@ -20,6 +20,7 @@ Related:
 
 from omnibase_core.runtime.mixin_node_dispatch import MixinNodeDispatch
 from omnibase_core.runtime.runtime_dispatch import DispatchRoute, RuntimeDispatch
+from omnibase_core.runtime.runtime_envelope_codec import EnvelopeCodec
 from omnibase_core.runtime.runtime_envelope_router import (
     decode_inbound_envelope,
     derive_event_type_from_topic,
@@ -36,6 +37,7 @@ from omnibase_core.runtime.runtime_local_adapter import LocalRuntimeBusAdapter
 
 __all__ = [
     "DispatchRoute",
+    "EnvelopeCodec",
     "FileRegistry",
     "LocalRuntimeBusAdapter",
     "MixinNodeDispatch",
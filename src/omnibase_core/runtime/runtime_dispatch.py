@@ -35,10 +35,19 @@ What it owns (runtime = policy; transport = mechanism, plan I6):
    prefix; the first ``REDELIVER`` stops that partition's prefix and nothing past it is
    committed this round. ONE commit per partition per poll (throughput), correctness by
    the same decision.
+7. Partition concurrency (opt-in): with ``max_concurrent_partitions > 1`` the
+   independent ``(topic, partition)`` groups of one poll batch are dispatched
+   concurrently (bounded by that limit) while each group stays strictly
+   offset-ordered, and ``pipeline_sends`` issues a message's fan-out sends together
+   instead of awaiting each in turn. Commit / nack stays per partition.
+8. Precompiled envelope codecs: each route's :class:`EnvelopeCodec` is built at wiring
+   time, so inbound bytes decode straight into the route's typed input model in one
+   validation pass and outbound envelopes serialize directly to ``bytes``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 from collections import defaultdict
@@ -54,10 +63,11 @@ from omnibase_core.enums.enum_delivery_disposition import EnumDeliveryDispositio
 from omnibase_core.enums.enum_node_kind import EnumNodeKind
 from omnibase_core.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.events.model_event_envelope import ModelEventEnvelope
-from omnibase_core.runtime.runtime_envelope_router import (
-    decode_inbound_envelope,
-    wrap_outbound_envelope,
+from omnibase_core.runtime.runtime_envelope_codec import (
+    EnvelopeCodec,
+    get_envelope_codec,
 )
+from omnibase_core.runtime.runtime_envelope_router import wrap_outbound_envelope
 from omnibase_core.runtime.runtime_fanout_resolver import (
     assert_published_events_injective,
     is_fanout_sequence,
@@ -75,6 +85,8 @@ _DEFAULT_MAX_MESSAGES = 64
 _DEFAULT_POLL_TIMEOUT_MS = 1000
 # Number of redeliveries a message gets before it is dead-lettered.
 _DEFAULT_MAX_RETRIES = 3
+# Partition groups dispatched at once per poll batch (1 == sequential).
+_DEFAULT_MAX_CONCURRENT_PARTITIONS = 1
 
 
 # --- structural transport surface (declared here on purpose) ----------------
@@ -184,7 +196,17 @@ class RuntimeDispatch:
         max_retries: int = _DEFAULT_MAX_RETRIES,
         dlq_topic_resolver: Callable[[str], str] | None = None,
         clock: Callable[[], datetime] | None = None,
+        max_concurrent_partitions: int = _DEFAULT_MAX_CONCURRENT_PARTITIONS,
+        pipeline_sends: bool = False,
     ) -> None:
+        if max_concurrent_partitions < 1:
+            raise ModelOnexError(
+                message=(
+                    "RuntimeDispatch: max_concurrent_partitions must be a positive "
+                    f"integer, got {max_concurrent_partitions}"
+                ),
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
         self._consumer = consumer
         self._producer = producer
         self._routing_map: dict[str, DispatchRoute] = dict(routing_map)
@@ -201,6 +223,8 @@ class RuntimeDispatch:
         self._max_retries = max_retries
         self._dlq_topic_resolver = dlq_topic_resolver or _default_dlq_topic
         self._clock = clock
+        self._max_concurrent_partitions = max_concurrent_partitions
+        self._pipeline_sends = pipeline_sends
         self._stopping = False
         # (topic, partition, offset) -> consecutive failure count, for retry budgeting.
         self._attempts: dict[tuple[str, int, int], int] = {}
@@ -216,6 +240,14 @@ class RuntimeDispatch:
                 self._default_route.published_events,
                 context=f"default_route::{self._default_route.name}",
             )
+        # Wiring-time codec per route (item 8): no per-message adapter construction
+        # on the hot path. The default route's codec comes from the same cache.
+        self._codecs: dict[str, EnvelopeCodec] = {
+            topic: get_envelope_codec(route.input_model_cls)
+            for topic, route in self._routing_map.items()
+        }
+        if self._default_route is not None:
+            get_envelope_codec(self._default_route.input_model_cls)
 
     def stop(self) -> None:
         """Request the :meth:`run` loop to exit after the current poll cycle."""
@@ -267,6 +299,11 @@ class RuntimeDispatch:
         process strictly in offset order, commit the contiguous
         successfully-terminalized (or DLQ'd) prefix once, and stop the prefix at the
         first ``REDELIVER`` — nothing past it is committed this round.
+
+        With ``max_concurrent_partitions > 1`` the partition groups run concurrently
+        (at most that many at once); ordering and the commit decision stay per group.
+        If one group raises, the others are cancelled and awaited before the error
+        propagates.
         """
         batch = await self._consumer.poll(
             max_messages=self._max_messages, timeout_ms=self._poll_timeout_ms
@@ -278,28 +315,59 @@ class RuntimeDispatch:
         for message in batch:
             groups[(message.topic, message.partition)].append(message)
 
+        if self._max_concurrent_partitions == 1 or len(groups) == 1:
+            processed = 0
+            for messages in groups.values():
+                processed += await self._process_partition(messages)
+            return processed
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_partitions)
+
+        async def _bounded(messages: list[_TransportMessageLike]) -> int:
+            async with semaphore:
+                return await self._process_partition(messages)
+
+        tasks = [
+            asyncio.create_task(_bounded(messages)) for messages in groups.values()
+        ]
+        try:
+            counts = await asyncio.gather(*tasks)
+        except BaseException:
+            # A commit / DLQ failure in one group must not leave its siblings
+            # running unobserved; their uncommitted offsets are redelivered.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return sum(counts)
+
+    async def _process_partition(self, messages: list[_TransportMessageLike]) -> int:
+        """Dispatch one ``(topic, partition)`` group in offset order, then commit.
+
+        Commits the contiguous terminalized prefix once and nacks the first
+        ``REDELIVER`` (HOLE 1). Returns the number of messages dispatched.
+        """
+        ordered = sorted(messages, key=lambda m: m.offset)
         processed = 0
-        for messages in groups.values():
-            ordered = sorted(messages, key=lambda m: m.offset)
-            last_committable: _TransportMessageLike | None = None
-            redeliver_from: _TransportMessageLike | None = None
-            for message in ordered:
-                disposition = await self._dispatch_one(message)
-                processed += 1
-                if disposition is EnumDeliveryDisposition.COMMIT:
-                    last_committable = message
-                elif disposition is EnumDeliveryDisposition.DLQ:
-                    await self._send_to_dlq(message)
-                    last_committable = message
-                else:  # REDELIVER — stop this partition's prefix HERE (HOLE 1)
-                    redeliver_from = message
-                    break
-            if last_committable is not None:
-                await self._consumer.commit(last_committable)
-            if redeliver_from is not None:
-                # Hold: make this message (and later same-partition offsets)
-                # redeliverable. Kafka: seek; in-memory: reset the fetch position.
-                await self._consumer.nack(redeliver_from)
+        last_committable: _TransportMessageLike | None = None
+        redeliver_from: _TransportMessageLike | None = None
+        for message in ordered:
+            disposition = await self._dispatch_one(message)
+            processed += 1
+            if disposition is EnumDeliveryDisposition.COMMIT:
+                last_committable = message
+            elif disposition is EnumDeliveryDisposition.DLQ:
+                await self._send_to_dlq(message)
+                last_committable = message
+            else:  # REDELIVER — stop this partition's prefix HERE (HOLE 1)
+                redeliver_from = message
+                break
+        if last_committable is not None:
+            await self._consumer.commit(last_committable)
+        if redeliver_from is not None:
+            # Hold: make this message (and later same-partition offsets)
+            # redeliverable. Kafka: seek; in-memory: reset the fetch position.
+            await self._consumer.nack(redeliver_from)
         return processed
 
     async def _dispatch_one(
@@ -326,7 +394,10 @@ class RuntimeDispatch:
                     ),
                     error_code=EnumCoreErrorCode.CONTRACT_VALIDATION_ERROR,
                 )
-            envelope = decode_inbound_envelope(message.value)
+            codec = self._codecs.get(message.topic) or get_envelope_codec(
+                route.input_model_cls
+            )
+            envelope = codec.decode(message.value)
             request = self._coerce_request(envelope, route)
             result = await self._invoke(route, request)
             pairs = self._resolve_outbound(result, route)
@@ -348,13 +419,26 @@ class RuntimeDispatch:
                 )
                 for idx, (topic, payload) in enumerate(pairs)
             ]
-            for topic, out_envelope in outbound:
-                await self._producer.send(
-                    topic,
-                    key=message.key,
-                    value=out_envelope.model_dump_json().encode("utf-8"),
-                    headers={},
+            encoded = [
+                (topic, EnvelopeCodec.encode(out_envelope))
+                for topic, out_envelope in outbound
+            ]
+            if self._pipeline_sends and len(encoded) > 1:
+                # Sends are issued in fan-out order; the producer keeps per-partition
+                # order for calls in issue order, so only the waits overlap.
+                await asyncio.gather(
+                    *(
+                        self._producer.send(
+                            topic, key=message.key, value=value, headers={}
+                        )
+                        for topic, value in encoded
+                    )
                 )
+            else:
+                for topic, value in encoded:
+                    await self._producer.send(
+                        topic, key=message.key, value=value, headers={}
+                    )
             self._attempts.pop(key, None)
             return EnumDeliveryDisposition.COMMIT
         except Exception as exc:  # fallback-ok: the failure is SURFACED (logged) and converted to a delivery disposition (redeliver within budget, else DLQ) — the at-least-once contract, NOT a swallow; re-raising would abort the whole poll loop. CancelledError is BaseException and stays uncaught.
@@ -383,13 +467,17 @@ class RuntimeDispatch:
     ) -> object:
         """Extract ``envelope.payload`` and prepare it for the ONE coercion.
 
-        ``payload_type_match`` (``input_model_cls`` set): pre-validate the payload dict
-        into the declared model. ``operation_match`` (``input_model_cls`` None): pass
+        ``payload_type_match`` (``input_model_cls`` set): the route's codec already
+        decoded the payload into the declared model; a raw dict (decoded elsewhere) is
+        pre-validated into it. ``operation_match`` (``input_model_cls`` None): pass
         the raw dict; ``_invoke_handle_method`` coerces it against the handler's own
         parameter annotation (the OMN-8724 core fix, the single coercion trigger).
         """
         payload = envelope.payload
         if route.input_model_cls is not None:
+            if isinstance(payload, route.input_model_cls):
+                # Already typed by the route's codec at decode time.
+                return payload
             if not isinstance(payload, dict):
                 raise ModelOnexError(
                     message=(
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Precompiled envelope codecs for the runtime dispatch loop's hot path.
+
+:mod:`omnibase_core.runtime.runtime_envelope_router` defines the envelope boundary
+contract; this module is its fast path. The generic boundary decodes every inbound
+message into ``ModelEventEnvelope[object]`` (payload left as a ``dict``) and the
+dispatch loop then validates that dict a second time into the route's def-B input
+model; outbound envelopes go through ``model_dump_json()`` (a ``str``) and are then
+``.encode()``-d into a second buffer.
+
+An :class:`EnvelopeCodec` is built once per route at wiring time
+(``RuntimeDispatch.__init__``) and holds:
+
+* a ``TypeAdapter`` over ``ModelEventEnvelope[<input model>]``, so the wire bytes
+  decode straight into the typed payload in ONE validation pass;
+* the outbound envelope's compiled serializer, which writes JSON ``bytes`` directly
+  (no intermediate ``str``).
+
+Decode failures keep the boundary's fail-closed contract: they raise
+``ModelOnexError(VALIDATION_ERROR)`` exactly like :func:`decode_inbound_envelope`.
+Codecs are cached per input model, so routes sharing a model share one codec.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import cast
+
+from pydantic import BaseModel, TypeAdapter
+
+from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.errors.model_onex_error import ModelOnexError
+from omnibase_core.models.events.model_event_envelope import ModelEventEnvelope
+
+__all__ = ["EnvelopeCodec", "get_envelope_codec"]
+
+# Outbound envelopes are built unparametrized (payload typed ``T`` == any), so their
+# compiled serializer emits the runtime payload type's fields.
+_OUTBOUND_SERIALIZER = ModelEventEnvelope.__pydantic_serializer__
+
+
+class EnvelopeCodec:
+    """Route-bound inbound decoder + outbound encoder (see module docstring).
+
+    ``input_model_cls`` is the route's def-B input model; ``None`` (an
+    ``operation_match`` route) decodes the payload as raw JSON, the same as the
+    generic boundary.
+    """
+
+    __slots__ = ("_adapter", "input_model_cls")
+
+    def __init__(self, input_model_cls: type[BaseModel] | None = None) -> None:
+        self.input_model_cls = input_model_cls
+        envelope_cls = (
+            ModelEventEnvelope[input_model_cls]  # type: ignore[valid-type]
+            if input_model_cls is not None
+            else ModelEventEnvelope[object]
+        )
+        self._adapter: TypeAdapter[ModelEventEnvelope[object]] = TypeAdapter(
+            envelope_cls
+        )
+
+    def decode(self, value: bytes) -> ModelEventEnvelope[object]:
+        """Decode wire bytes into an envelope whose payload is already typed.
+
+        Raises:
+            ModelOnexError: if the bytes are not a valid envelope, or (typed routes)
+                the payload does not validate against ``input_model_cls``.
+        """
+        try:
+            return self._adapter.validate_json(value)
+        except Exception as exc:  # boundary-ok: wire decode failure is surfaced as a typed error, never swallowed
+            model_name = (
+                self.input_model_cls.__name__
+                if self.input_model_cls is not None
+                else "object"
+            )
+            raise ModelOnexError(
+                message=(
+                    "RuntimeDispatch: failed to decode inbound wire bytes into a "
+                    f"ModelEventEnvelope[{model_name}]. The inbound boundary requires "
+                    "an enveloped message (not a bare payload) whose payload matches "
+                    "the route's input model."
+                ),
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            ) from exc
+
+    @staticmethod
+    def encode(envelope: ModelEventEnvelope[BaseModel]) -> bytes:
+        """Serialize an outbound envelope straight to JSON bytes.
+
+        Byte-identical to ``envelope.model_dump_json().encode("utf-8")``.
+        """
+        return cast(bytes, _OUTBOUND_SERIALIZER.to_json(envelope))
+
+
+@cache
+def get_envelope_codec(input_model_cls: type[BaseModel] | None = None) -> EnvelopeCodec:
+    """Return the shared :class:`EnvelopeCodec` for ``input_model_cls``."""
+    return EnvelopeCodec(input_model_cls)
@@ -9,48 +9,218 @@ OMN-14717, ticket OMN-14720; see
 (c)/(d.4)). Nothing in production wires it yet — reversible, zero behavior change.
 
 The broker is the append-only log + per-``(topic, group, partition)`` committed
-cursor that every in-memory producer/consumer sharing it sees. Records are
-append-only (never removed); a consumer group's *durability* is the committed
-offset; a consumer instance's *fetch position* is instance-local (owned by
-``InMemoryTransport``) so a restart resumes from the committed offset. This is what
-makes the in-memory transport model Kafka's monotonic per-partition offset (plan
-HOLE 2), not SQS per-message ack.
+cursor that every in-memory producer/consumer sharing it sees. A consumer group's
+*durability* is the committed offset; a consumer instance's *fetch position* is
+instance-local (owned by ``InMemoryTransport``) so a restart resumes from the
+committed offset. This is what makes the in-memory transport model Kafka's monotonic
+per-partition offset (plan HOLE 2), not SQS per-message ack.
+
+Bulk producers (replay, golden-chain runs) should use :meth:`InMemoryBroker.append_batch`:
+it assigns offsets for a whole batch with one ``extend`` per partition and hoists
+the per-record lookups out of the loop. Headers are passed straight to the model:
+Pydantic validation already snapshots the mapping, so neither path pre-copies it.
+
+Retention
+---------
+By default records are never removed. Long-running soak loops can opt into Kafka-style
+retention per partition:
+
+* ``trim_committed`` — drop records below the minimum committed offset across every
+  group that has committed on the partition (nothing is trimmed until some group
+  commits).
+* ``retention_max_records`` / ``retention_max_bytes`` — cap the retained log by
+  record count / by ``len(key) + len(value)``, dropping the oldest records first
+  regardless of commits (Kafka ``retention.bytes`` semantics).
+* ``compact_by_key`` — keep only the latest record per key (unkeyed records are kept).
+  Compaction runs whenever a partition has doubled in size since its last compaction,
+  so it is amortised O(1) per append.
+
+Offsets are never reused: a partition's next offset is monotonic no matter what is
+removed, and :meth:`InMemoryBroker.record_at` keeps working for every retained
+offset. A fetch below the log start offset resumes at the earliest retained record
+(Kafka ``auto.offset.reset=earliest``).
 """
 
 from __future__ import annotations
 
-import hashlib
-from collections.abc import Mapping, Sequence
+import bisect
+import zlib
+from collections.abc import Iterable, Mapping, Sequence
 
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.runtime.model_transport_message import ModelTransportMessage
 
-__all__ = ["InMemoryBroker"]
+__all__ = ["InMemoryBroker", "TransportRecord"]
+
+# One record of a batch append: ``(key, value, headers)``.
+type TransportRecord = tuple[bytes | None, bytes, Mapping[str, bytes]]
+
+# Smallest retained size at which automatic key compaction is considered.
+_MIN_COMPACTION_RECORDS = 64
+
+
+def _offset_of(message: ModelTransportMessage) -> int:
+    return message.offset
+
+
+def _record_bytes(message: ModelTransportMessage) -> int:
+    return len(message.value) + (len(message.key) if message.key is not None else 0)
+
+
+class _PartitionLog:
+    """Retained records of one partition plus its monotonic next offset.
+
+    The retained records are ``messages[head:]``: dropping from the head only
+    advances ``head``, and the dead prefix is deleted once it makes up half of
+    ``messages``, so head retention is amortised O(1) per dropped record instead
+    of copying the whole log on every drop.
+
+    The retained records are ascending by offset. Until a compaction removes records
+    from the middle they are also *dense* (offset == start offset + index), which
+    keeps :meth:`index_of` O(1); a compacted log falls back to a binary search.
+    """
+
+    __slots__ = (
+        "compacted_size",
+        "dense",
+        "head",
+        "messages",
+        "next_offset",
+        "size_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.messages: list[ModelTransportMessage] = []
+        self.head = 0
+        self.next_offset = 0
+        self.size_bytes = 0
+        self.dense = True
+        self.compacted_size = 0
+
+    def __len__(self) -> int:
+        return len(self.messages) - self.head
+
+    @property
+    def start_offset(self) -> int:
+        if self.head < len(self.messages):
+            return self.messages[self.head].offset
+        return self.next_offset
+
+    def retained(self) -> list[ModelTransportMessage]:
+        """The retained records, with the dropped prefix released first."""
+        if self.head:
+            del self.messages[: self.head]
+            self.head = 0
+        return self.messages
+
+    def index_of(self, offset: int) -> int:
+        """Index (into ``messages``) of the first retained ``record.offset >= offset``."""
+        messages = self.messages
+        head = self.head
+        if head >= len(messages):
+            return head
+        start = messages[head].offset
+        if offset <= start:
+            return head
+        if self.dense:
+            return min(head + offset - start, len(messages))
+        return bisect.bisect_left(messages, offset, lo=head, key=_offset_of)
+
+    def get(self, offset: int) -> ModelTransportMessage | None:
+        index = self.index_of(offset)
+        if index < len(self.messages) and self.messages[index].offset == offset:
+            return self.messages[index]
+        return None
+
+    def bytes_between(self, start: int, stop: int) -> int:
+        """Retained bytes of ``messages[start:stop]``, without slicing the log."""
+        messages = self.messages
+        return sum(_record_bytes(messages[i]) for i in range(start, stop))
+
+    def drop_head(self, count: int) -> None:
+        if count <= 0:
+            return
+        head = self.head
+        stop = min(head + count, len(self.messages))
+        self.size_bytes -= self.bytes_between(head, stop)
+        self.head = stop
+        if stop * 2 >= len(self.messages):
+            del self.messages[:stop]
+            self.head = 0
+
+    def compact(self) -> None:
+        """Keep only the latest record per key (unkeyed records are all kept)."""
+        messages = self.retained()
+        latest: dict[bytes, int] = {}
+        for message in messages:
+            if message.key is not None:
+                latest[message.key] = message.offset
+        retained = [m for m in messages if m.key is None or latest[m.key] == m.offset]
+        if len(retained) != len(messages):
+            self.messages = retained
+            self.size_bytes = sum(_record_bytes(m) for m in retained)
+            self.dense = False
+        self.compacted_size = len(retained)
 
 
 class InMemoryBroker:
     """Append-only log + per-group committed cursor shared by in-memory transports.
 
     ``num_partitions`` controls partition fan-out. Partition assignment is
-    deterministic: keyed messages hash to a stable partition; unkeyed messages
-    round-robin per topic in send order. The stored value is a canonical
-    :class:`ModelTransportMessage` whose opaque ``ack_token`` is the
-    ``(topic, partition, offset)`` coordinate (group-independent — the runtime never
-    interprets it).
+    deterministic: keyed messages hash (CRC-32, stable across processes) to a
+    stable partition; unkeyed messages round-robin per topic in send order. The
+    stored value is a canonical :class:`ModelTransportMessage` whose opaque
+    ``ack_token`` is the ``(topic, partition, offset)`` coordinate
+    (group-independent — the runtime never interprets it).
+
+    Retention is opt-in; see the module docstring for ``trim_committed``,
+    ``retention_max_records``, ``retention_max_bytes`` and ``compact_by_key``.
     """
 
-    def __init__(self, num_partitions: int = 1) -> None:
+    def __init__(
+        self,
+        num_partitions: int = 1,
+        *,
+        trim_committed: bool = False,
+        retention_max_records: int | None = None,
+        retention_max_bytes: int | None = None,
+        compact_by_key: bool = False,
+    ) -> None:
         if num_partitions < 1:
             raise ModelOnexError(
                 f"num_partitions must be a positive integer, got {num_partitions}",
                 error_code=EnumCoreErrorCode.VALIDATION_ERROR,
             )
+        if retention_max_records is not None and retention_max_records < 1:
+            raise ModelOnexError(
+                "retention_max_records must be a positive integer, "
+                f"got {retention_max_records}",
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
+        if retention_max_bytes is not None and retention_max_bytes < 1:
+            raise ModelOnexError(
+                "retention_max_bytes must be a positive integer, "
+                f"got {retention_max_bytes}",
+                error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            )
         self.num_partitions = num_partitions
-        # topic -> partition index -> append-ordered messages (offset == list index).
-        self._logs: dict[str, list[list[ModelTransportMessage]]] = {}
+        self._trim_committed = trim_committed
+        self._retention_max_records = retention_max_records
+        self._retention_max_bytes = retention_max_bytes
+        self._compact_by_key = compact_by_key
+        self._retention_enabled = (
+            trim_committed
+            or compact_by_key
+            or retention_max_records is not None
+            or retention_max_bytes is not None
+        )
+        # topic -> partition index -> retained messages (ascending offset).
+        self._logs: dict[str, list[_PartitionLog]] = {}
         # (topic, group, partition) -> highest committed offset (-1 == none committed).
         self._committed: dict[tuple[str, str, int], int] = {}
+        # (topic, partition) -> groups that have committed there (for trim_committed).
+        self._committing_groups: dict[tuple[str, int], set[str]] = {}
         # topic -> monotonic counter for round-robin assignment of unkeyed messages.
         self._round_robin: dict[str, int] = {}
 
@@ -61,8 +231,20 @@ class InMemoryBroker:
             counter = self._round_robin.get(topic, 0)
             self._round_robin[topic] = counter + 1
             return counter % self.num_partitions
-        digest = hashlib.sha256(key).digest()
-        return int.from_bytes(digest[:8], "big") % self.num_partitions
+        return zlib.crc32(key) % self.num_partitions
+
+    def _partitions(self, topic: str) -> list[_PartitionLog]:
+        partitions = self._logs.get(topic)
+        if partitions is None:
+            partitions = [_PartitionLog() for _ in range(self.num_partitions)]
+            self._logs[topic] = partitions
+        return partitions
+
+    def _partition_log(self, topic: str, partition: int) -> _PartitionLog | None:
+        partitions = self._logs.get(topic)
+        if partitions is None:
+            return None
+        return partitions[partition]
 
     def append(
         self,
@@ -73,36 +255,106 @@ class InMemoryBroker:
     ) -> ModelTransportMessage:
         """Append one message, assigning partition + offset deterministically."""
         partition = self._select_partition(topic, key)
-        partitions = self._logs.setdefault(
-            topic, [[] for _ in range(self.num_partitions)]
-        )
-        log = partitions[partition]
-        offset = len(log)
+        log = self._partitions(topic)[partition]
+        offset = log.next_offset
         message = ModelTransportMessage(
             topic=topic,
             partition=partition,
             offset=offset,
             key=key,
             value=value,
-            headers=dict(headers),
+            headers=headers,
             ack_token=(topic, partition, offset),
         )
-        log.append(message)
+        log.messages.append(message)
+        log.next_offset = offset + 1
+        log.size_bytes += _record_bytes(message)
+        if self._retention_enabled:
+            self._apply_retention(topic, partition, log)
         return message
 
+    def append_batch(
+        self, topic: str, records: Iterable[TransportRecord]
+    ) -> list[ModelTransportMessage]:
+        """Append many messages to ``topic`` in one step, in iteration order.
+
+        Partition assignment is identical to calling :meth:`append` once per record
+        in the same order (round-robin counters and key hashes advance the same
+        way), so batched and unbatched producers are interchangeable. Offsets for
+        each partition are assigned from one read of the next offset and committed
+        with one ``extend``.
+
+        Returns the appended messages in input order.
+        """
+        partitions = self._partitions(topic)
+        next_offsets = [log.next_offset for log in partitions]
+        pending: list[list[ModelTransportMessage]] = [
+            [] for _ in range(self.num_partitions)
+        ]
+        build = ModelTransportMessage
+        select = self._select_partition
+        appended: list[ModelTransportMessage] = []
+
+        for key, value, headers in records:
+            partition = select(topic, key)
+            offset = next_offsets[partition]
+            next_offsets[partition] = offset + 1
+            message = build(
+                topic=topic,
+                partition=partition,
+                offset=offset,
+                key=key,
+                value=value,
+                headers=headers,
+                ack_token=(topic, partition, offset),
+            )
+            pending[partition].append(message)
+            appended.append(message)
+
+        for partition, batch in enumerate(pending):
+            if batch:
+                log = partitions[partition]
+                log.messages.extend(batch)
+                log.next_offset = next_offsets[partition]
+                log.size_bytes += sum(_record_bytes(m) for m in batch)
+                if self._retention_enabled:
+                    self._apply_retention(topic, partition, log)
+        return appended
+
     def records(self, topic: str, partition: int) -> Sequence[ModelTransportMessage]:
-        partitions = self._logs.get(topic)
-        if partitions is None:
+        """Retained records of one partition, ascending by offset."""
+        log = self._partition_log(topic, partition)
+        if log is None:
             return ()
-        return partitions[partition]
+        return log.retained()
+
+    def read(
+        self, topic: str, partition: int, offset: int, max_messages: int
+    ) -> list[ModelTransportMessage]:
+        """Up to ``max_messages`` retained records with ``record.offset >= offset``."""
+        log = self._partition_log(topic, partition)
+        if log is None or max_messages < 1:
+            return []
+        start = log.index_of(offset)
+        return log.messages[start : start + max_messages]
 
     def record_at(
         self, topic: str, partition: int, offset: int
     ) -> ModelTransportMessage | None:
-        log = self.records(topic, partition)
-        if 0 <= offset < len(log):
-            return log[offset]
-        return None
+        log = self._partition_log(topic, partition)
+        if log is None:
+            return None
+        return log.get(offset)
+
+    def log_start_offset(self, topic: str, partition: int) -> int:
+        """Offset of the earliest retained record (== end offset when empty)."""
+        log = self._partition_log(topic, partition)
+        return 0 if log is None else log.start_offset
+
+    def log_end_offset(self, topic: str, partition: int) -> int:
+        """Offset the next appended record on this partition will receive."""
+        log = self._partition_log(topic, partition)
+        return 0 if log is None else log.next_offset
 
     def committed_offset(self, topic: str, group: str, partition: int) -> int:
         return self._committed.get((topic, group, partition), -1)
@@ -120,3 +372,47 @@ class InMemoryBroker:
         key = (topic, group, partition)
         if offset > self._committed.get(key, -1):
             self._committed[key] = offset
+            if self._trim_committed:
+                self._committing_groups.setdefault((topic, partition), set()).add(group)
+                log = self._partition_log(topic, partition)
+                if log is not None:
+                    self._apply_retention(topic, partition, log)
+
+    def enforce_retention(self) -> None:
+        """Apply every configured retention rule to every partition now."""
+        for topic, partitions in self._logs.items():
+            for partition, log in enumerate(partitions):
+                if self._compact_by_key:
+                    log.compact()
+                self._apply_retention(topic, partition, log)
+
+    def _apply_retention(self, topic: str, partition: int, log: _PartitionLog) -> None:
+        if self._compact_by_key and len(log) >= max(
+            _MIN_COMPACTION_RECORDS, 2 * log.compacted_size
+        ):
+            log.compact()
+
+        drop = 0
+        if self._trim_committed:
+            groups = self._committing_groups.get((topic, partition))
+            if groups:
+                low_water = min(
+                    self._committed[(topic, group, partition)] for group in groups
+                )
+                drop = log.index_of(low_water + 1) - log.head
+        if self._retention_max_records is not None:
+            drop = max(drop, len(log) - self._retention_max_records)
+        if self._retention_max_bytes is not None:
+            messages = log.messages
+            index = log.head + drop
+            # Bytes already released by the commit/count trims above.
+            excess = (
+                log.size_bytes
+                - self._retention_max_bytes
+                - log.bytes_between(log.head, index)
+            )
+            while excess > 0 and index < len(messages):
+                excess -= _record_bytes(messages[index])
+                index += 1
+            drop = index - log.head
+        log.drop_head(drop)
@@ -52,13 +52,16 @@ observable Kafka semantics against ANY transport, which is what licenses
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import cast
 
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.runtime.model_transport_message import ModelTransportMessage
-from omnibase_core.runtime.transport.runtime_in_memory_broker import InMemoryBroker
+from omnibase_core.runtime.transport.runtime_in_memory_broker import (
+    InMemoryBroker,
+    TransportRecord,
+)
 
 __all__ = ["InMemoryTransport"]
 
@@ -126,7 +129,9 @@ class InMemoryTransport:
         them) but are NOT removed from the log — a ``nack`` or a restart re-exposes
         any that stay uncommitted. ``timeout_ms`` is ignored: the in-memory log
         never blocks, it returns whatever is currently available (possibly empty).
-        Chaos-mode duplicates of already-committed offsets are drained first.
+        Chaos-mode duplicates of already-committed offsets are drained first. A
+        position the broker's retention has already trimmed resumes at the earliest
+        retained offset.
         """
         self._require_started()
         if max_messages < 1:
@@ -147,12 +152,13 @@ class InMemoryTransport:
             for partition in range(self._broker.num_partitions):
                 if len(batch) >= max_messages:
                     break
-                log = self._broker.records(topic, partition)
                 position = self._position(topic, partition)
-                while position < len(log) and len(batch) < max_messages:
-                    batch.append(log[position])
-                    position += 1
-                self._positions[(topic, partition)] = position
+                fetched = self._broker.read(
+                    topic, partition, position, max_messages - len(batch)
+                )
+                if fetched:
+                    batch.extend(fetched)
+                    self._positions[(topic, partition)] = fetched[-1].offset + 1
         return batch
 
     async def commit(self, message: object) -> None:
@@ -197,3 +203,16 @@ class InMemoryTransport:
     ) -> None:
         """Append one event to the shared log, awaiting the (synchronous) ack."""
         self._broker.append(topic, key, value, headers)
+
+    async def send_batch(
+        self,
+        topic: str,
+        records: Iterable[TransportRecord],
+    ) -> None:
+        """Append many ``(key, value, headers)`` events to ``topic`` in one step.
+
+        Equivalent to awaiting :meth:`send` once per record in order, but offsets
+        are assigned for the whole batch at once (see
+        :meth:`InMemoryBroker.append_batch`).
+        """
+        self._broker.append_batch(topic, records)
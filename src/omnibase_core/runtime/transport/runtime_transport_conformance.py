@@ -193,7 +193,7 @@ class TransportConformanceSuite:
         strand), which is exactly why this multi-partition case exists.
 
         Determinism / transport-agnosticism: distinct keys fan the messages across
-        >=2 partitions on any reasonable partitioner (sha256 in-memory, murmur2
+        >=2 partitions on any reasonable partitioner (crc32 in-memory, murmur2
         Kafka) given a >=2-partition environment (the subclass provides one). A
         throwaway-group probe establishes the true partition layout INDEPENDENTLY of
         the consumer under test, so the strand assertion is unambiguous: a value the
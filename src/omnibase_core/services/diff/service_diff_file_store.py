@@ -60,8 +60,17 @@ See Also:
     Added as part of Diff Storage Infrastructure (OMN-1149)
 """
 
+import asyncio
 import json
+import os
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from heapq import merge
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 from uuid import UUID
 
 from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
@@ -73,32 +82,70 @@ from omnibase_core.models.diff.model_diff_storage_configuration import (
 )
 from omnibase_core.protocols.storage.protocol_diff_store import ProtocolDiffStore
 
+# Key of a tombstone record: {"tombstone": "<diff_id>"}
+_TOMBSTONE_KEY = "tombstone"
+
+# Version of the index file layout; other versions trigger a rebuild
+_INDEX_VERSION = 1
+
+# Appended records between index checkpoints, bounding the tail to rescan
+_INDEX_CHECKPOINT_INTERVAL = 10_000
+
+_SEALED_SEGMENT_PATTERN = re.compile(r"diffs\.(\d{6})\.jsonl")
+
+_by_computed_at = attrgetter("computed_at")
+
+
+class _DiffLocation(NamedTuple):
+    """Where a live diff record is stored, plus the fields queries index."""
+
+    segment: int
+    offset: int
+    length: int
+    before_contract_name: str
+    after_contract_name: str
+    computed_at: datetime
+
 
 class ServiceDiffFileStore:
     """
-    File-based diff storage using JSONL format.
+    File-based diff storage using append-only JSONL segments.
 
-    Stores diffs in a JSONL file (one JSON object per line) with buffered
-    writes for efficiency. Implements all ProtocolDiffStore methods for
-    filtering, pagination, and counting.
+    Diffs are buffered, then appended to the active segment. Every live diff
+    is tracked in an in-memory index of diff_id to segment offset, with
+    secondary indexes on contract name and computed_at, so lookups read one
+    record and queries read only the records they return. Upserts append a
+    newer record and deletes append a tombstone; superseded records become
+    garbage that compaction removes.
 
     Storage structure:
         {base_path}/
-            diffs.jsonl          # Main storage file
+            diffs.jsonl          # Active segment (appends go here)
+            diffs.000000.jsonl   # Sealed segments, oldest first
+            diffs.index.json     # Index checkpoint loaded at startup
+
+    The active segment is sealed once it reaches ``segment_max_bytes``. When
+    more than ``compaction_threshold`` of the sealed bytes are garbage, a
+    background task rewrites the sealed segments into one, off the event
+    loop. At startup the index checkpoint is loaded and only records appended
+    after it are scanned; a missing or stale checkpoint triggers a full scan.
 
     Attributes:
         _base_path: Directory for storing diff files.
         _config: Storage configuration.
         _buffer_size: Number of diffs to buffer before auto-flush.
         _buffer: Internal buffer for pending writes.
+        _index: Live diff_id to record location.
 
     Thread Safety:
         NOT thread-safe. See module docstring for details.
 
     Performance Considerations:
-        - Uses load-then-filter for queries (simple but not optimal for large files)
-        - Buffered writes reduce I/O overhead
-        - Consider ServiceDiffInMemoryStore or PostgreSQL backend for high-volume usage
+        - put(): O(1) until the buffer flushes; flush appends only new records
+        - get()/exists()/delete(): O(1) index lookup plus at most one read
+        - query(): reads only candidates from the contract-name or time index
+          until ``offset + limit`` matches are found
+        - count(): no file reads unless change_types or has_changes is set
 
     Example:
         >>> store = ServiceDiffFileStore(base_path=Path("/tmp/diffs"))
@@ -110,14 +157,19 @@ class ServiceDiffFileStore:
         Added as part of Diff Storage Infrastructure (OMN-1149)
     """
 
-    # Default filename for the JSONL storage file
+    # Default filename for the active JSONL segment
     STORAGE_FILENAME = "diffs.jsonl"
 
+    # Filename of the index checkpoint
+    INDEX_FILENAME = "diffs.index.json"
+
     def __init__(
         self,
         base_path: Path,
         config: ModelDiffStorageConfiguration | None = None,
         buffer_size: int = 10,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        compaction_threshold: float = 0.5,
     ) -> None:
         """
         Initialize file-based storage.
@@ -129,18 +181,35 @@ class ServiceDiffFileStore:
                 default configuration.
             buffer_size: Number of diffs to buffer before auto-flush.
                 Defaults to 10. Set to 1 for immediate writes.
+            segment_max_bytes: Size at which the active segment is sealed.
+            compaction_threshold: Fraction of garbage in sealed segments that
+                triggers background compaction.
         """
         self._base_path = base_path
         self._config = config or ModelDiffStorageConfiguration()
         self._buffer_size = buffer_size
         self._buffer: list[ModelContractDiff] = []
         self._ready = True
+        self._segment_max_bytes = segment_max_bytes
+        self._compaction_threshold = compaction_threshold
+        self._compaction_task: asyncio.Task[None] | None = None
+        # Serializes background and manual compactions, which share the
+        # ``.compacting`` temp file and swap the same segments
+        self._compaction_lock = asyncio.Lock()
+        # Index state is loaded lazily on first use
+        self._loaded = False
+        self._reset_index()
 
     @property
     def file_path(self) -> Path:
-        """Get the path to the JSONL storage file."""
+        """Get the path to the active JSONL segment."""
         return self._base_path / self.STORAGE_FILENAME
 
+    @property
+    def index_path(self) -> Path:
+        """Get the path to the index checkpoint file."""
+        return self._base_path / self.INDEX_FILENAME
+
     @property
     def config(self) -> ModelDiffStorageConfiguration:
         """Get the storage configuration."""
@@ -161,8 +230,8 @@ class ServiceDiffFileStore:
         Store a contract diff.
 
         Buffers the diff and flushes when buffer is full. Uses upsert
-        semantics - if a diff with the same diff_id exists, the file
-        will be rewritten with the new version.
+        semantics - a buffered diff with the same diff_id is replaced, and a
+        stored one is superseded when the buffer is flushed.
 
         Args:
             diff: The contract diff to store.
@@ -177,14 +246,12 @@ class ServiceDiffFileStore:
                 context={"path": str(self._base_path)},
             )
 
-        # Check if diff with same ID exists (upsert semantics)
-        existing = await self.get(diff.diff_id)
-        if existing is not None:
-            # Remove from existing file by rewriting without this ID
-            await self._rewrite_without(diff.diff_id)
-
-        # Add to buffer
-        self._buffer.append(diff)
+        for i, buffered in enumerate(self._buffer):
+            if buffered.diff_id == diff.diff_id:
+                self._buffer[i] = diff
+                break
+        else:
+            self._buffer.append(diff)
 
         # Auto-flush if buffer is full
         if len(self._buffer) >= self._buffer_size:
@@ -194,7 +261,7 @@ class ServiceDiffFileStore:
         """
         Retrieve a diff by its unique identifier.
 
-        Checks buffer first, then loads from file.
+        Checks buffer first, then reads the indexed record.
 
         Args:
             diff_id: The UUID of the diff to retrieve.
@@ -202,18 +269,15 @@ class ServiceDiffFileStore:
         Returns:
             The diff if found, None otherwise.
         """
-        # Check buffer first
         for diff in self._buffer:
             if diff.diff_id == diff_id:
                 return diff
 
-        # Load from file
-        all_diffs = await self._load_all()
-        for diff in all_diffs:
-            if diff.diff_id == diff_id:
-                return diff
-
-        return None
+        self._ensure_loaded()
+        location = self._index.get(diff_id)
+        if location is None:
+            return None
+        return next(self._read_diffs([location]), None)
 
     async def query(self, filters: ModelDiffQuery) -> list[ModelContractDiff]:
         """
@@ -229,42 +293,20 @@ class ServiceDiffFileStore:
         Returns:
             List of matching diffs, ordered by computed_at descending.
         """
-        # Combine buffer and file diffs
-        all_diffs = await self._load_all()
-        all_diffs.extend(self._buffer)
-
-        # Deduplicate by diff_id (buffer takes precedence)
-        seen_ids: set[UUID] = set()
-        unique_diffs: list[ModelContractDiff] = []
-
-        # Process buffer first (more recent)
-        for diff in self._buffer:
-            if diff.diff_id not in seen_ids:
-                seen_ids.add(diff.diff_id)
-                unique_diffs.append(diff)
-
-        # Then file diffs
-        for diff in await self._load_all():
-            if diff.diff_id not in seen_ids:
-                seen_ids.add(diff.diff_id)
-                unique_diffs.append(diff)
-
-        # Apply filters
-        matching_diffs = [diff for diff in unique_diffs if filters.matches_diff(diff)]
-
-        # Sort by computed_at descending (newest first)
-        matching_diffs.sort(key=lambda d: d.computed_at, reverse=True)
-
-        # Apply pagination
-        start_idx = filters.offset
-        end_idx = start_idx + filters.limit
-        return matching_diffs[start_idx:end_idx]
+        wanted = filters.offset + filters.limit
+        results: list[ModelContractDiff] = []
+        for diff in self._iter_matching(filters):
+            results.append(diff)
+            if len(results) >= wanted:
+                break
+        return results[filters.offset :]
 
     async def delete(self, diff_id: UUID) -> bool:
         """
         Delete a diff by its unique identifier.
 
-        Removes from buffer if present, then rewrites file without the diff.
+        Removes it from the buffer and, if it was flushed, appends a
+        tombstone record.
 
         Args:
             diff_id: The UUID of the diff to delete.
@@ -272,18 +314,16 @@ class ServiceDiffFileStore:
         Returns:
             True if the diff was deleted, False if it was not found.
         """
-        found = False
-
-        # Check buffer
-        for i, diff in enumerate(self._buffer):
-            if diff.diff_id == diff_id:
-                del self._buffer[i]
-                found = True
-                break
-
-        # Check file and rewrite if needed
-        if await self._exists_in_file(diff_id):
-            await self._rewrite_without(diff_id)
+        remaining = [diff for diff in self._buffer if diff.diff_id != diff_id]
+        found = len(remaining) != len(self._buffer)
+        self._buffer[:] = remaining
+
+        self._ensure_loaded()
+        if diff_id in self._index:
+            tombstone = json.dumps({_TOMBSTONE_KEY: str(diff_id)}) + "\n"
+            self._append_records([tombstone.encode("utf-8")])
+            self._unindex(diff_id)
+            self._after_append()
             found = True
 
         return found
@@ -298,13 +338,12 @@ class ServiceDiffFileStore:
         Returns:
             True if the diff exists, False otherwise.
         """
-        # Check buffer
         for diff in self._buffer:
             if diff.diff_id == diff_id:
                 return True
 
-        # Check file
-        return await self._exists_in_file(diff_id)
+        self._ensure_loaded()
+        return diff_id in self._index
 
     async def count(self, filters: ModelDiffQuery | None = None) -> int:
         """
@@ -318,33 +357,28 @@ class ServiceDiffFileStore:
             Number of diffs matching the filter criteria.
         """
         if filters is None:
-            # Count all unique diffs
-            all_diffs = await self._load_all()
-            all_ids = {diff.diff_id for diff in all_diffs}
-            buffer_ids = {diff.diff_id for diff in self._buffer}
-            return len(all_ids | buffer_ids)
-
-        # Apply filters (ignore pagination)
-        all_diffs = await self._load_all()
-        all_diffs.extend(self._buffer)
-
-        # Deduplicate
-        seen_ids: set[UUID] = set()
-        count = 0
-        for diff in all_diffs:
-            if diff.diff_id not in seen_ids:
-                seen_ids.add(diff.diff_id)
-                if filters.matches_diff(diff):
-                    count += 1
-
-        return count
+            self._ensure_loaded()
+            buffered_ids = {diff.diff_id for diff in self._buffer}
+            return len(self._index) + len(buffered_ids - self._index.keys())
+
+        if filters.change_types is not None or filters.has_changes is not None:
+            return sum(1 for _ in self._iter_matching(filters))
+
+        # Every remaining filter is answered by the index alone
+        self._ensure_loaded()
+        buffered = self._buffered_by_id()
+        return sum(1 for diff in buffered.values() if filters.matches_diff(diff)) + sum(
+            1
+            for diff_id, location in self._candidates(filters)
+            if diff_id not in buffered and _location_matches(filters, location)
+        )
 
     async def flush(self) -> None:
         """
-        Flush buffered diffs to file.
+        Flush buffered diffs to the active segment.
 
-        Writes all buffered diffs to the JSONL file and clears the buffer.
-        Creates the storage directory if it doesn't exist.
+        Appends all buffered diffs and clears the buffer. Creates the storage
+        directory if it doesn't exist.
 
         Raises:
             ModelOnexError: If writing to file fails.
@@ -352,18 +386,12 @@ class ServiceDiffFileStore:
         if not self._buffer:
             return
 
+        self._ensure_loaded()
+        records = [
+            (self._serialize_diff(diff) + "\n").encode("utf-8") for diff in self._buffer
+        ]
         try:
-            # Ensure parent directory exists
-            self._base_path.mkdir(parents=True, exist_ok=True)
-
-            # Append buffered diffs to file
-            with self.file_path.open("a", encoding="utf-8") as f:
-                for diff in self._buffer:
-                    json_line = self._serialize_diff(diff)
-                    f.write(json_line + "\n")
-
-            self._buffer.clear()
-
+            positions = self._append_records(records)
         except OSError as e:
             raise ModelOnexError(
                 message=f"Failed to write diffs to file: {e}",
@@ -374,17 +402,108 @@ class ServiceDiffFileStore:
                 },
             ) from e
 
+        for diff, (offset, length) in zip(self._buffer, positions, strict=True):
+            self._add_location(
+                diff.diff_id,
+                _DiffLocation(
+                    self._active_segment,
+                    offset,
+                    length,
+                    diff.before_contract_name,
+                    diff.after_contract_name,
+                    diff.computed_at,
+                ),
+            )
+        self._buffer.clear()
+        self._after_append()
+
+    async def compact(self) -> None:
+        """
+        Rewrite the sealed segments into one, keeping only live records.
+
+        Superseded records, deleted records and their tombstones, and
+        malformed lines are dropped. The rewrite runs in a worker thread;
+        records changed meanwhile stay correct because the index is only
+        switched over for records it still points at. A compaction already in
+        progress, such as the background one, is waited for first.
+
+        Raises:
+            ModelOnexError: If reading or writing segment files fails.
+        """
+        async with self._compaction_lock:
+            await self._compact_sealed()
+
+    async def _compact_sealed(self) -> None:
+        self._ensure_loaded()
+        sealed = sorted(
+            seq for seq in self._segment_sizes if seq != self._active_segment
+        )
+        if not sealed:
+            return
+        target = sealed[-1]
+        sealed_set = set(sealed)
+        live = sorted(
+            (
+                (diff_id, location)
+                for diff_id, location in self._index.items()
+                if location.segment in sealed_set
+            ),
+            key=lambda item: (item[1].segment, item[1].offset),
+        )
+        temp_path = self._segment_path(target).with_suffix(".compacting")
+        writer = asyncio.ensure_future(
+            asyncio.to_thread(
+                self._write_compacted,
+                [(self._segment_path(loc.segment), loc) for _, loc in live],
+                temp_path,
+            )
+        )
+        try:
+            new_offsets = await asyncio.shield(writer)
+            temp_path.replace(self._segment_path(target))
+        except OSError as e:
+            raise ModelOnexError(
+                message=f"Failed to compact diff segments: {e}",
+                error_code=EnumCoreErrorCode.FILE_WRITE_ERROR,
+                context={"path": str(self._base_path), "segments": len(sealed)},
+            ) from e
+        finally:
+            if not writer.done():
+                # Cancelled mid-write: let the worker thread finish first so
+                # it cannot recreate the temp file after it is removed.
+                await asyncio.wait((writer,))
+            temp_path.unlink(missing_ok=True)
+
+        live_bytes = 0
+        for (diff_id, old), new_offset in zip(live, new_offsets, strict=True):
+            # Records deleted or superseded meanwhile stay behind as garbage
+            if self._index.get(diff_id) is old:
+                self._index[diff_id] = old._replace(segment=target, offset=new_offset)
+                live_bytes += old.length
+        for seq in sealed[:-1]:
+            self._segment_path(seq).unlink(missing_ok=True)
+            self._segment_sizes.pop(seq, None)
+            self._live_bytes.pop(seq, None)
+        self._segment_sizes[target] = sum(loc.length for _, loc in live)
+        self._live_bytes[target] = live_bytes
+        self._save_index()
+
     async def close(self) -> None:
         """
         Close the store after flushing remaining buffer.
 
-        After closing, the store will reject new operations.
+        Waits for a running compaction and checkpoints the index. After
+        closing, the store will reject new operations.
 
         Raises:
             ModelOnexError: If final flush fails.
         """
         try:
             await self.flush()
+            if self._compaction_task is not None:
+                await self._compaction_task
+            if self._loaded:
+                self._save_index()
         finally:
             self._ready = False
 
@@ -392,23 +511,41 @@ class ServiceDiffFileStore:
         """
         Remove all diffs from the store.
 
-        Clears the buffer and removes the storage file if it exists.
+        Clears the buffer and removes all segment and index files.
         Useful for testing and cleanup.
 
         Raises:
             ModelOnexError: If file deletion fails.
         """
         self._buffer.clear()
-
-        if self.file_path.exists():
+        task = self._compaction_task
+        if task is not None and not task.done():
+            task.cancel()
             try:
-                self.file_path.unlink()
-            except OSError as e:
-                raise ModelOnexError(
-                    message=f"Failed to delete storage file: {e}",
-                    error_code=EnumCoreErrorCode.FILE_OPERATION_ERROR,
-                    context={"path": str(self.file_path)},
-                ) from e
+                await task
+            except (asyncio.CancelledError, ModelOnexError):
+                pass
+        self._compaction_task = None
+
+        paths = [self.file_path, self.index_path]
+        if self._base_path.is_dir():
+            paths.extend(
+                path
+                for path in self._base_path.iterdir()
+                if _SEALED_SEGMENT_PATTERN.fullmatch(path.name)
+            )
+        for path in paths:
+            if path.exists():
+                try:
+                    path.unlink()
+                except OSError as e:
+                    raise ModelOnexError(
+                        message=f"Failed to delete storage file: {e}",
+                        error_code=EnumCoreErrorCode.FILE_OPERATION_ERROR,
+                        context={"path": str(path)},
+                    ) from e
+        self._reset_index()
+        self._loaded = True
 
     async def get_all(self) -> list[ModelContractDiff]:
         """
@@ -417,135 +554,446 @@ class ServiceDiffFileStore:
         Returns:
             List of all stored diffs, ordered by computed_at descending.
         """
-        # Combine file and buffer
-        all_diffs = await self._load_all()
-
-        # Deduplicate (buffer takes precedence)
-        seen_ids: set[UUID] = set()
-        unique_diffs: list[ModelContractDiff] = []
-
-        # Buffer first (more recent)
-        for diff in self._buffer:
-            if diff.diff_id not in seen_ids:
-                seen_ids.add(diff.diff_id)
-                unique_diffs.append(diff)
-
-        # Then file
-        for diff in all_diffs:
-            if diff.diff_id not in seen_ids:
-                seen_ids.add(diff.diff_id)
-                unique_diffs.append(diff)
-
-        # Sort by computed_at descending
-        unique_diffs.sort(key=lambda d: d.computed_at, reverse=True)
-        return unique_diffs
+        return list(self._iter_matching(ModelDiffQuery()))
 
     # =========================================================================
     # Internal Methods
     # =========================================================================
 
-    async def _load_all(self) -> list[ModelContractDiff]:
+    def _reset_index(self) -> None:
+        self._index: dict[UUID, _DiffLocation] = {}
+        self._by_contract: dict[str, set[UUID]] = {}
+        self._by_time: list[tuple[datetime, UUID]] = []
+        self._active_segment = 0
+        self._segment_sizes: dict[int, int] = {}
+        self._live_bytes: dict[int, int] = {}
+        self._needs_newline = False
+        self._appended_since_checkpoint = 0
+
+    def _segment_path(self, segment: int) -> Path:
+        if segment == self._active_segment:
+            return self.file_path
+        return self._base_path / f"diffs.{segment:06d}.jsonl"
+
+    def _ensure_loaded(self) -> None:
         """
-        Load all diffs from the storage file.
-
-        Returns:
-            List of diffs from file. Empty list if file doesn't exist.
+        Load the index on first use, then pick up external appends.
 
         Raises:
-            ModelOnexError: If file reading or parsing fails.
+            ModelOnexError: If segment files cannot be read.
+        """
+        if not self._loaded:
+            self._load()
+            return
+        try:
+            size = self.file_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        known = self._segment_sizes.get(self._active_segment, 0)
+        if size > known:
+            self._scan_segment(self._active_segment, known)
+        elif size < known:
+            # Truncated or replaced behind our back
+            self._reset_index()
+            self._load()
+
+    def _load(self) -> None:
+        self._reset_index()
+        self._loaded = True
+        sealed: list[int] = []
+        if self._base_path.is_dir():
+            sealed = sorted(
+                int(match.group(1))
+                for path in self._base_path.iterdir()
+                if (match := _SEALED_SEGMENT_PATTERN.fullmatch(path.name))
+            )
+        if self._load_index_checkpoint(sealed):
+            return
+        self._reset_index()
+        self._active_segment = sealed[-1] + 1 if sealed else 0
+        for segment in [*sealed, self._active_segment]:
+            self._scan_segment(segment, 0)
+
+    def _load_index_checkpoint(self, sealed: list[int]) -> bool:
         """
-        if not self.file_path.exists():
-            return []
+        Load the index checkpoint if it matches the segment files.
 
-        diffs: list[ModelContractDiff] = []
+        Returns:
+            False if the checkpoint is missing or stale and a full scan is needed.
+        """
+        try:
+            raw = json.loads(self.index_path.read_bytes())
+            if raw.get("version") != _INDEX_VERSION:
+                return False
+            self._active_segment = int(raw["active_segment"])
+            recorded = {
+                int(seq): (int(size), int(inode))
+                for seq, (size, inode) in raw["segments"].items()
+            }
+            if set(recorded) != {*sealed, self._active_segment}:
+                return False
+            tails: list[tuple[int, int]] = []
+            for seq, (size, inode) in recorded.items():
+                try:
+                    stat = self._segment_path(seq).stat()
+                    actual = (stat.st_size, stat.st_ino)
+                except FileNotFoundError:
+                    actual = (0, 0)
+                if actual[0] < size or (size and actual[1] != inode):
+                    return False
+                self._segment_sizes[seq] = size
+                self._live_bytes[seq] = 0
+                if actual[0] > size:
+                    tails.append((seq, size))
+            for diff_id, seq, offset, length, before, after, computed_at in raw[
+                "entries"
+            ]:
+                self._add_location(
+                    UUID(diff_id),
+                    _DiffLocation(
+                        seq,
+                        offset,
+                        length,
+                        before,
+                        after,
+                        datetime.fromisoformat(computed_at),
+                    ),
+                )
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return False
+        for seq, start in tails:
+            self._scan_segment(seq, start)
+        return True
+
+    def _save_index(self) -> None:
+        """Write the index checkpoint atomically."""
+        segments: dict[str, tuple[int, int]] = {}
+        for seq, size in self._segment_sizes.items():
+            try:
+                inode = self._segment_path(seq).stat().st_ino
+            except FileNotFoundError:
+                inode = 0
+            segments[str(seq)] = (size, inode)
+        checkpoint = {
+            "version": _INDEX_VERSION,
+            "active_segment": self._active_segment,
+            "segments": segments,
+            "entries": [
+                (
+                    str(diff_id),
+                    loc.segment,
+                    loc.offset,
+                    loc.length,
+                    loc.before_contract_name,
+                    loc.after_contract_name,
+                    loc.computed_at.isoformat(),
+                )
+                for diff_id, loc in self._index.items()
+            ],
+        }
+        temp_path = self.index_path.with_suffix(".tmp")
+        try:
+            self._base_path.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(checkpoint, separators=(",", ":")))
+            temp_path.replace(self.index_path)
+        except OSError as e:
+            raise ModelOnexError(
+                message=f"Failed to write diff index: {e}",
+                error_code=EnumCoreErrorCode.FILE_WRITE_ERROR,
+                context={"path": str(self.index_path)},
+            ) from e
+        self._appended_since_checkpoint = 0
+
+    def _scan_segment(self, segment: int, start: int) -> None:
+        """
+        Index the records of a segment from byte ``start`` onwards.
 
+        Raises:
+            ModelOnexError: If the segment cannot be read.
+        """
+        self._segment_sizes.setdefault(segment, 0)
+        self._live_bytes.setdefault(segment, 0)
+        offset = start
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
+            with self._segment_path(segment).open("rb") as f:
+                f.seek(start)
                 for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        diff = ModelContractDiff.model_validate(data)
-                        diffs.append(diff)
-                    except (json.JSONDecodeError, ValueError):
-                        # fallback-ok: skip malformed lines and continue reading
-                        # In production, this might emit a warning event
-                        continue
-
+                    if not line.endswith(b"\n"):
+                        # Partial record from an interrupted write; the next
+                        # append starts on a fresh line
+                        self._needs_newline = segment == self._active_segment
+                        break
+                    self._index_record(segment, offset, line)
+                    offset += len(line)
+        except FileNotFoundError:
+            pass
         except OSError as e:
             raise ModelOnexError(
                 message=f"Failed to read diffs from file: {e}",
                 error_code=EnumCoreErrorCode.FILE_READ_ERROR,
-                context={"path": str(self.file_path)},
+                context={"path": str(self._segment_path(segment))},
             ) from e
+        self._segment_sizes[segment] = offset
 
-        return diffs
-
-    async def _exists_in_file(self, diff_id: UUID) -> bool:
+    def _index_record(self, segment: int, offset: int, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            data = json.loads(line)
+        except ValueError:
+            # fallback-ok: skip malformed lines and continue reading
+            return
+        if not isinstance(data, dict):
+            return
+        if _TOMBSTONE_KEY in data:
+            try:
+                self._unindex(UUID(str(data[_TOMBSTONE_KEY])))
+            except ValueError:
+                pass
+            return
+        try:
+            diff = ModelContractDiff.model_validate(data)
+        except ValueError:
+            # fallback-ok: skip records that no longer validate
+            return
+        self._add_location(
+            diff.diff_id,
+            _DiffLocation(
+                segment,
+                offset,
+                len(line),
+                diff.before_contract_name,
+                diff.after_contract_name,
+                diff.computed_at,
+            ),
+        )
+
+    def _add_location(self, diff_id: UUID, location: _DiffLocation) -> None:
+        self._unindex(diff_id)
+        self._index[diff_id] = location
+        self._live_bytes[location.segment] = (
+            self._live_bytes.get(location.segment, 0) + location.length
+        )
+        for name in {location.before_contract_name, location.after_contract_name}:
+            self._by_contract.setdefault(name, set()).add(diff_id)
+        insort(self._by_time, (location.computed_at, diff_id))
+
+    def _unindex(self, diff_id: UUID) -> None:
+        location = self._index.pop(diff_id, None)
+        if location is None:
+            return
+        self._live_bytes[location.segment] -= location.length
+        for name in {location.before_contract_name, location.after_contract_name}:
+            ids = self._by_contract.get(name)
+            if ids is not None:
+                ids.discard(diff_id)
+                if not ids:
+                    del self._by_contract[name]
+        key = (location.computed_at, diff_id)
+        pos = bisect_left(self._by_time, key)
+        if pos < len(self._by_time) and self._by_time[pos] == key:
+            del self._by_time[pos]
+
+    def _append_records(self, records: list[bytes]) -> list[tuple[int, int]]:
         """
-        Check if a diff with the given ID exists in the file.
-
-        Args:
-            diff_id: The UUID to check.
+        Append encoded records to the active segment.
 
         Returns:
-            True if found in file, False otherwise.
+            (offset, length) of each record.
         """
-        if not self.file_path.exists():
-            return False
-
+        self._base_path.mkdir(parents=True, exist_ok=True)
+        positions: list[tuple[int, int]] = []
+        with self.file_path.open("ab") as f:
+            if self._needs_newline:
+                f.write(b"\n")
+                self._needs_newline = False
+            offset = f.tell()
+            for record in records:
+                f.write(record)
+                positions.append((offset, len(record)))
+                offset += len(record)
+        self._segment_sizes[self._active_segment] = offset
+        self._live_bytes.setdefault(self._active_segment, 0)
+        self._appended_since_checkpoint += len(records)
+        return positions
+
+    def _after_append(self) -> None:
+        """Seal a full active segment, checkpoint and schedule compaction."""
+        if self._segment_sizes[self._active_segment] >= self._segment_max_bytes:
+            sealed = self._active_segment
+            self._active_segment += 1
+            self.file_path.replace(self._segment_path(sealed))
+            self._segment_sizes[self._active_segment] = 0
+            self._live_bytes[self._active_segment] = 0
+            self._save_index()
+            self._maybe_schedule_compaction()
+        elif self._appended_since_checkpoint >= _INDEX_CHECKPOINT_INTERVAL:
+            self._save_index()
+
+    def _maybe_schedule_compaction(self) -> None:
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        sealed_bytes = 0
+        garbage_bytes = 0
+        for seq, size in self._segment_sizes.items():
+            if seq != self._active_segment:
+                sealed_bytes += size
+                garbage_bytes += size - self._live_bytes.get(seq, 0)
+        if (
+            not sealed_bytes
+            or garbage_bytes <= sealed_bytes * self._compaction_threshold
+        ):
+            return
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        if data.get("diff_id") == str(diff_id):
-                            return True
-                    except json.JSONDecodeError:
-                        continue
-
-        except OSError:
-            return False
-
-        return False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._compaction_task = loop.create_task(self.compact())
+
+    @staticmethod
+    def _write_compacted(
+        records: list[tuple[Path, _DiffLocation]], temp_path: Path
+    ) -> list[int]:
+        """Copy live records into ``temp_path``; runs in a worker thread."""
+        offsets: list[int] = []
+        handles: dict[Path, BinaryIO] = {}
+        try:
+            with temp_path.open("wb") as out:
+                offset = 0
+                for path, location in records:
+                    handle = handles.get(path)
+                    if handle is None:
+                        handle = handles[path] = path.open("rb")
+                    handle.seek(location.offset)
+                    out.write(handle.read(location.length))
+                    offsets.append(offset)
+                    offset += location.length
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return offsets
 
-    async def _rewrite_without(self, diff_id: UUID) -> None:
+    def _read_diffs(
+        self, locations: Iterable[_DiffLocation]
+    ) -> Iterator[ModelContractDiff]:
         """
-        Rewrite the storage file excluding a specific diff.
-
-        Args:
-            diff_id: The UUID to exclude from the rewritten file.
+        Read and parse records, skipping any that no longer parse.
 
         Raises:
-            ModelOnexError: If file operations fail.
+            ModelOnexError: If a segment cannot be read.
         """
-        if not self.file_path.exists():
-            return
-
-        # Load all diffs except the one to remove
-        all_diffs = await self._load_all()
-        remaining_diffs = [d for d in all_diffs if d.diff_id != diff_id]
-
+        handles: dict[int, BinaryIO] = {}
         try:
-            # Rewrite file
-            with self.file_path.open("w", encoding="utf-8") as f:
-                for diff in remaining_diffs:
-                    json_line = self._serialize_diff(diff)
-                    f.write(json_line + "\n")
+            for location in locations:
+                try:
+                    handle = handles.get(location.segment)
+                    if handle is None:
+                        handle = self._segment_path(location.segment).open("rb")
+                        handles[location.segment] = handle
+                    handle.seek(location.offset)
+                    data = handle.read(location.length)
+                except OSError as e:
+                    raise ModelOnexError(
+                        message=f"Failed to read diffs from file: {e}",
+                        error_code=EnumCoreErrorCode.FILE_READ_ERROR,
+                        context={"path": str(self._segment_path(location.segment))},
+                    ) from e
+                try:
+                    yield ModelContractDiff.model_validate_json(data)
+                except ValueError:
+                    # fallback-ok: a corrupted record reads as missing
+                    continue
+        finally:
+            for handle in handles.values():
+                handle.close()
 
-        except OSError as e:
-            raise ModelOnexError(
-                message=f"Failed to rewrite storage file: {e}",
-                error_code=EnumCoreErrorCode.FILE_WRITE_ERROR,
-                context={"path": str(self.file_path), "excluded_id": str(diff_id)},
-            ) from e
+    def _iter_matching(self, filters: ModelDiffQuery) -> Iterator[ModelContractDiff]:
+        """
+        Yield diffs matching ``filters``, newest first.
+
+        Buffered diffs take precedence over stored ones with the same
+        diff_id. Stored candidates come from the contract-name or time index
+        and are pre-filtered on indexed fields before any record is read.
+        """
+        self._ensure_loaded()
+        buffered = self._buffered_by_id()
+        buffered_matches = sorted(
+            (diff for diff in buffered.values() if filters.matches_diff(diff)),
+            key=_by_computed_at,
+            reverse=True,
+        )
+        needs_record = (
+            filters.change_types is not None or filters.has_changes is not None
+        )
+        candidates = (
+            location
+            for diff_id, location in self._candidates(filters)
+            if diff_id not in buffered and _location_matches(filters, location)
+        )
+        if needs_record:
+            stored: Iterator[ModelContractDiff] = (
+                diff
+                for diff in self._read_diffs(candidates)
+                if filters.matches_diff(diff)
+            )
+            yield from merge(
+                buffered_matches, stored, key=_by_computed_at, reverse=True
+            )
+            return
+        entries: tuple[Iterable[ModelContractDiff | _DiffLocation], ...] = (
+            buffered_matches,
+            candidates,
+        )
+        pending: list[_DiffLocation] = []
+        for item in merge(*entries, key=_by_computed_at, reverse=True):
+            if isinstance(item, _DiffLocation):
+                pending.append(item)
+                continue
+            yield from self._read_diffs(pending)
+            pending.clear()
+            yield item
+        yield from self._read_diffs(pending)
+
+    def _buffered_by_id(self) -> dict[UUID, ModelContractDiff]:
+        """Buffered diffs by diff_id; the earliest buffered copy wins."""
+        buffered: dict[UUID, ModelContractDiff] = {}
+        for diff in self._buffer:
+            buffered.setdefault(diff.diff_id, diff)
+        return buffered
+
+    def _candidates(
+        self, filters: ModelDiffQuery
+    ) -> Iterator[tuple[UUID, _DiffLocation]]:
+        """Yield indexed diffs that may match ``filters``, newest first."""
+        names = [
+            name
+            for name in (
+                filters.contract_name,
+                filters.before_contract_name,
+                filters.after_contract_name,
+            )
+            if name is not None
+        ]
+        if names:
+            ids = min((self._by_contract.get(name, set()) for name in names), key=len)
+            yield from sorted(
+                ((diff_id, self._index[diff_id]) for diff_id in ids),
+                key=lambda item: item[1].computed_at,
+                reverse=True,
+            )
+            return
+        by_time = self._by_time
+        lo = 0
+        hi = len(by_time)
+        if filters.computed_after is not None:
+            lo = bisect_left(by_time, (filters.computed_after,))
+        if filters.computed_before is not None:
+            hi = bisect_left(by_time, (filters.computed_before,))
+        for pos in range(hi - 1, lo - 1, -1):
+            diff_id = by_time[pos][1]
+            yield diff_id, self._index[diff_id]
 
     def _serialize_diff(self, diff: ModelContractDiff) -> str:
         """
@@ -580,6 +1028,34 @@ class ServiceDiffFileStore:
             ) from e
 
 
+def _location_matches(filters: ModelDiffQuery, location: _DiffLocation) -> bool:
+    """Apply the filters that only need indexed fields."""
+    if (
+        filters.before_contract_name is not None
+        and location.before_contract_name != filters.before_contract_name
+    ):
+        return False
+    if (
+        filters.after_contract_name is not None
+        and location.after_contract_name != filters.after_contract_name
+    ):
+        return False
+    if filters.contract_name is not None and filters.contract_name not in (
+        location.before_contract_name,
+        location.after_contract_name,
+    ):
+        return False
+    if (
+        filters.computed_after is not None
+        and location.computed_at < filters.computed_after
+    ):
+        return False
+    return not (
+        filters.computed_before is not None
+        and location.computed_at >= filters.computed_before
+    )
+
+
 # Verify protocol compliance at module load time
 _store_check: ProtocolDiffStore = ServiceDiffFileStore(base_path=Path("/tmp"))
 
@@ -17,7 +17,10 @@ from omnibase_core.decorators.decorator_error_handling import standard_error_han
 from omnibase_core.models.configuration.model_compute_cache_config import (
     ModelComputeCacheConfig,
 )
-from omnibase_core.models.infrastructure import ModelComputeCache
+from omnibase_core.models.infrastructure import (
+    ModelComputeCache,
+    ModelThreadSafeComputeCache,
+)
 from omnibase_core.protocols.compute import ProtocolComputeCache
 
 __all__ = ["ServiceComputeCache"]
@@ -31,9 +34,10 @@ class ServiceComputeCache:
     providing a default implementation when no cache is injected.
 
     Thread Safety:
-        NOT thread-safe. This class wraps ModelComputeCache which uses
-        a standard Python dict internally. Concurrent access from multiple
-        threads may cause:
+        NOT thread-safe unless ``config.thread_safe`` is set, in which case it
+        wraps ModelThreadSafeComputeCache instead. By default it wraps
+        ModelComputeCache, which uses plain dicts internally. Concurrent access
+        from multiple threads may cause:
 
         - Data corruption from non-atomic read-modify-write operations
         - Race conditions during cache eviction
@@ -70,7 +74,10 @@ class ServiceComputeCache:
         Args:
             config: Cache configuration (size, TTL, eviction policy)
         """
-        self._cache = ModelComputeCache(
+        cache_cls = (
+            ModelThreadSafeComputeCache if config.thread_safe else ModelComputeCache
+        )
+        self._cache = cache_cls(
             max_size=config.max_size,
             ttl_seconds=config.ttl_seconds,
             eviction_policy=config.eviction_policy,
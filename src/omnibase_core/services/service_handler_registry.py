@@ -19,6 +19,11 @@ Design Pattern:
     - Thread-safe concurrent access after freeze
     - Clear separation between configuration and execution phases
 
+    freeze() compiles immutable per-category dispatch tables: for every
+    declared message type, a tuple of the matching handlers with the
+    accept-all handlers merged in (registration order preserved). Lookups
+    after freeze are a dict access that returns a cached tuple.
+
 Thread Safety:
     - Registration methods are protected by threading.Lock
     - After freeze(), the registry is read-only and thread-safe
@@ -107,6 +112,7 @@ class ServiceHandlerRegistry:
     Attributes:
         _handlers_by_category: Handlers organized by category -> list of entries
         _handlers_by_id: Handlers indexed by handler_id for fast lookup
+        _dispatch_tables: Per-category lookup tables compiled by freeze()
         _frozen: If True, registration is disabled
         _registration_lock: Lock protecting registration methods
 
@@ -138,6 +144,55 @@ class ServiceHandlerRegistry:
             self.message_types = message_types
             self.registration_id = registration_id
 
+    class _DispatchTable:
+        """
+        Immutable lookup table for one category, compiled by freeze().
+
+        ``by_type`` maps each declared message type to its handlers merged
+        with the accept-all handlers; undeclared types are served by
+        ``accept_all``. All tuples keep registration order. ``hits`` counts
+        lookups per message type (None for category-wide lookups,
+        ACCEPT_ALL_KEY for undeclared types).
+        """
+
+        __slots__ = ("accept_all", "all_handlers", "by_type", "hits")
+
+        ACCEPT_ALL_KEY = "*"
+
+        def __init__(self, entries: list[ServiceHandlerRegistry._HandlerEntry]) -> None:
+            self.all_handlers: tuple[ProtocolMessageHandler, ...] = tuple(
+                entry.handler for entry in entries
+            )
+            self.accept_all: tuple[ProtocolMessageHandler, ...] = tuple(
+                entry.handler for entry in entries if not entry.message_types
+            )
+            declared = {t for entry in entries for t in entry.message_types}
+            self.by_type: dict[str, tuple[ProtocolMessageHandler, ...]] = {
+                message_type: tuple(
+                    entry.handler
+                    for entry in entries
+                    if not entry.message_types or message_type in entry.message_types
+                )
+                for message_type in sorted(declared)
+            }
+            self.hits: dict[str | None, int] = dict.fromkeys(
+                [None, self.ACCEPT_ALL_KEY, *self.by_type], 0
+            )
+
+        def lookup(
+            self, message_type: str | None
+        ) -> tuple[ProtocolMessageHandler, ...]:
+            """Return the handlers for message_type and count the lookup."""
+            if message_type is None:
+                self.hits[None] += 1
+                return self.all_handlers
+            handlers = self.by_type.get(message_type)
+            if handlers is None:
+                self.hits[self.ACCEPT_ALL_KEY] += 1
+                return self.accept_all
+            self.hits[message_type] += 1
+            return handlers
+
     def __init__(self) -> None:
         """
         Initialize ServiceHandlerRegistry with empty registries.
@@ -152,6 +207,10 @@ class ServiceHandlerRegistry:
         ] = defaultdict(list)
         # Handlers indexed by handler_id for fast lookup and duplicate detection
         self._handlers_by_id: dict[str, ServiceHandlerRegistry._HandlerEntry] = {}
+        # Lookup tables, compiled once by freeze()
+        self._dispatch_tables: (
+            dict[EnumMessageCategory, ServiceHandlerRegistry._DispatchTable] | None
+        ) = None
         # Frozen flag
         self._frozen: bool = False
         # Lock protects registration methods
@@ -368,32 +427,104 @@ class ServiceHandlerRegistry:
             This method is safe for concurrent access after freeze().
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.46.8
+            Served from the dispatch tables compiled by freeze(). Use
+            lookup_handlers() to get the cached tuple without a copy.
+        """
+        return list(self._lookup("get_handlers", category, message_type))
+
+    def lookup_handlers(
+        self,
+        category: EnumMessageCategory,
+        message_type: str | None = None,
+    ) -> tuple[ProtocolMessageHandler, ...]:
+        """
+        Get handlers for the given category and message type without copying.
+
+        Same matching as ``get_handlers()``, but returns the immutable tuple
+        compiled by ``freeze()``: one dict lookup and no allocation, for use
+        on the per-message dispatch path.
+
+        Args:
+            category: The message category to look up.
+            message_type: Optional specific message type to filter by.
+
+        Returns:
+            tuple[ProtocolMessageHandler, ...]: Matching handlers in
+                registration order. Empty tuple if no handlers match.
+
+        Raises:
+            ModelOnexError: If registry is not frozen (INVALID_STATE).
+
+        Example:
+            .. code-block:: python
+
+                for handler in registry.lookup_handlers(
+                    EnumMessageCategory.EVENT, message_type="UserCreated"
+                ):
+                    await handler.handle(envelope)
+
+        Thread Safety:
+            This method is safe for concurrent access after freeze().
+
+        .. versionadded:: 0.46.8
+        """
+        return self._lookup("lookup_handlers", category, message_type)
+
+    def get_lookup_counts(self) -> dict[tuple[EnumMessageCategory, str | None], int]:
         """
+        Sample the per-lookup hit counters.
+
+        Returns a snapshot of how many lookups each (category, message_type)
+        key has served since ``freeze()``. ``None`` counts category-wide
+        lookups and ``"*"`` counts message types that no handler declares
+        (served by the accept-all handlers). Counters are never reset; diff
+        two samples to get a rate. Increments are unsynchronized, so counts
+        are approximate under concurrent dispatch.
+
+        Returns:
+            dict[tuple[EnumMessageCategory, str | None], int]: Lookup counts.
+                Empty if the registry is not frozen.
+
+        Example:
+            .. code-block:: python
+
+                before = registry.get_lookup_counts()
+                ...
+                after = registry.get_lookup_counts()
+                rate = {k: after[k] - before[k] for k in after}
+
+        .. versionadded:: 0.46.8
+        """
+        tables = self._dispatch_tables
+        if tables is None:
+            return {}
+        return {
+            (category, message_type): count
+            for category, table in tables.items()
+            for message_type, count in tuple(table.hits.items())
+        }
+
+    def _lookup(
+        self,
+        method_name: str,
+        category: EnumMessageCategory,
+        message_type: str | None,
+    ) -> tuple[ProtocolMessageHandler, ...]:
+        """Serve a lookup from the compiled tables, enforcing the freeze contract."""
+        tables = self._dispatch_tables
         # Enforce freeze contract for thread safety
-        if not self._frozen:
+        if tables is None:
             raise ModelOnexError(
-                message="get_handlers() called before freeze(). "
+                message=f"{method_name}() called before freeze(). "
                 "Registration MUST complete and freeze() MUST be called before lookup. "
                 "This is required for thread safety.",
                 error_code=EnumCoreErrorCode.INVALID_STATE,
             )
-
-        entries = self._handlers_by_category.get(category, [])
-        result: list[ProtocolMessageHandler] = []
-
-        for entry in entries:
-            # Check if handler accepts this message type
-            if message_type is None:
-                # No type filter - include all handlers for category
-                result.append(entry.handler)
-            elif not entry.message_types:
-                # Empty message_types means accept all
-                result.append(entry.handler)
-            elif message_type in entry.message_types:
-                # Specific message type matches
-                result.append(entry.handler)
-
-        return result
+        table = tables.get(category)
+        if table is None:
+            return ()
+        return table.lookup(message_type)
 
     def get_handler_by_id(self, handler_id: str) -> ProtocolMessageHandler | None:
         """
@@ -467,8 +598,20 @@ class ServiceHandlerRegistry:
             setting of the frozen flag.
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.46.8
+            Compiles the per-category dispatch tables used by lookups.
         """
         with self._registration_lock:
+            if self._frozen:
+                return
+            # Tables are published before the flag, so a frozen registry
+            # always has them
+            self._dispatch_tables = {
+                category: ServiceHandlerRegistry._DispatchTable(
+                    self._handlers_by_category.get(category, [])
+                )
+                for category in EnumMessageCategory
+            }
             self._frozen = True
 
     @property
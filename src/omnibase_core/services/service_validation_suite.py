@@ -8,6 +8,7 @@ A unified validation suite for ONEX compliance.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import cast
 
@@ -19,13 +20,32 @@ from omnibase_core.models.common.model_validation_metadata import (
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.types.typed_dict_validator_info import TypedDictValidatorInfo
 from omnibase_core.validation.validator_architecture import (
+    ArchitectureAstPass,
     validate_architecture_directory,
 )
+from omnibase_core.validation.validator_ast_engine import (
+    ValidationAstPass,
+    run_ast_passes,
+)
 from omnibase_core.validation.validator_contracts import validate_contracts_directory
-from omnibase_core.validation.validator_patterns import validate_patterns_directory
-from omnibase_core.validation.validator_types import validate_union_usage_directory
+from omnibase_core.validation.validator_patterns import (
+    PatternsAstPass,
+    validate_patterns_directory,
+)
+from omnibase_core.validation.validator_types import (
+    UnionUsageAstPass,
+    validate_union_usage_directory,
+)
 from omnibase_core.validation.validator_utils import ModelValidationResult
 
+# Engine passes equivalent to the built-in AST-based directory validators;
+# run_all_validations() runs these together, parsing each file once
+_AST_PASS_FACTORIES: dict[Callable[..., object], Callable[..., ValidationAstPass]] = {
+    validate_architecture_directory: ArchitectureAstPass,
+    validate_union_usage_directory: UnionUsageAstPass,
+    validate_patterns_directory: PatternsAstPass,
+}
+
 
 class ServiceValidationSuite:
     """
@@ -123,10 +143,20 @@ class ServiceValidationSuite:
         directory: Path,
         **kwargs: object,
     ) -> dict[str, ModelValidationResult[None]]:
-        """Run all validations on a directory."""
+        """Run all validations on a directory.
+
+        Registered validators that are built-in AST-based directory validators
+        run together through :func:`run_ast_passes`, which reads, parses and
+        walks each file once for all of them. Results are identical to running
+        each validator on its own.
+        """
+        shared = self._run_shared_ast_passes(directory, kwargs)
         results = {}
 
         for validation_type in self.validators:
+            if validation_type in shared:
+                results[validation_type] = shared[validation_type]
+                continue
             try:
                 result = self.run_validation(validation_type, directory, **kwargs)
                 results[validation_type] = result
@@ -163,6 +193,38 @@ class ServiceValidationSuite:
 
         return results
 
+    def _run_shared_ast_passes(
+        self, directory: Path, kwargs: dict[str, object]
+    ) -> dict[str, ModelValidationResult[None]]:
+        """Run the built-in AST-based validators in one pass over ``directory``.
+
+        Returns results keyed by validation type, or an empty mapping when
+        the shared run fails, so every validator is rerun on its own and
+        reports its error the usual way.
+        """
+        passes: dict[str, ValidationAstPass] = {}
+        try:
+            for validation_type, validator_info in self.validators.items():
+                factory = _AST_PASS_FACTORIES.get(validator_info["func"])
+                if factory is None:
+                    continue
+                relevant_args: list[str] = validator_info["args"]
+                ast_pass = factory(
+                    **{k: v for k, v in kwargs.items() if k in relevant_args}
+                )
+                # Pass names key the engine's results; rerun duplicates alone
+                if all(other.name != ast_pass.name for other in passes.values()):
+                    passes[validation_type] = ast_pass
+            if not passes:
+                return {}
+            by_name = run_ast_passes(directory, list(passes.values()))
+        except Exception:  # noqa: BLE001  # fallback-ok: rerun each validator to report its error
+            return {}
+        return {
+            validation_type: by_name[ast_pass.name]
+            for validation_type, ast_pass in passes.items()
+        }
+
     def get_validators(self) -> dict[str, str]:
         """Return available validators and their descriptions.
 
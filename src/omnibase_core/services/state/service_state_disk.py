@@ -3,14 +3,34 @@
 
 """File-based implementation of ProtocolStateStore.
 
-Persists node state as YAML files on disk. Each state snapshot is stored at
-``{state_root}/{node_id}/{scope_id}/state.yaml``.
+Persists node state as YAML or JSON files on disk. Each state snapshot is
+stored at ``{state_root}/{node_id}/{scope_id}/state.yaml`` (or
+``state.json`` when the store is configured for JSON, which serializes
+several times faster). Either file is read regardless of the configured
+format, so switching formats keeps existing state readable.
 
 Atomic writes: state is written to a temporary file in the target directory,
 then renamed to the final path. This prevents partial writes from corrupting
 existing state. On rename failure the temporary file is preserved so callers
 can recover.
 
+Off-loop I/O: file reads, writes and directory scans run on a single worker
+thread per store, so they never block the event loop and are applied in the
+order they were issued.
+
+Caching: the store keeps an index of existing keys, built by one directory
+scan on first use, so exists() and list_keys() never touch the filesystem.
+Recently used envelopes are kept in a write-through LRU cache. The store
+assumes it is the only writer under ``state_root``; call refresh_index()
+after changing files behind its back.
+
+Write coalescing: with ``coalesce_delay_s`` > 0, put() updates the cache and
+returns; the latest envelope per key is written once the delay expires.
+Reads see the pending envelope immediately. flush() writes pending envelopes
+now and re-raises the first error of a delayed write that failed since the
+last flush. close() flushes and shuts down the worker thread; pending writes
+are lost if the loop stops without either.
+
 Concurrency: last-write-wins. No file locking (Phase 1 local-only use).
 
 .. versionadded:: 0.35.1
@@ -19,50 +39,327 @@ Concurrency: last-write-wins. No file locking (Phase 1 local-only use).
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.enums.enum_data_format import EnumDataFormat
+from omnibase_core.errors import ModelOnexError
 from omnibase_core.errors.error_state_corruption import StateCorruptionError
 from omnibase_core.models.state.model_state_envelope import ModelStateEnvelope
 
+_STATE_FILENAMES: dict[EnumDataFormat, str] = {
+    EnumDataFormat.YAML: "state.yaml",
+    EnumDataFormat.JSON: "state.json",
+}
+
+_StateKey = tuple[str, str]
+
 
 class ServiceStateDisk:
-    """File-based state store backed by YAML files on disk."""
+    """File-based state store backed by YAML or JSON files on disk."""
+
+    def __init__(
+        self,
+        state_root: Path,
+        file_format: EnumDataFormat = EnumDataFormat.YAML,
+        cache_size: int = 256,
+        coalesce_delay_s: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            state_root: Directory holding ``{node_id}/{scope_id}`` state dirs.
+            file_format: Format of written state, YAML or JSON.
+            cache_size: Envelopes kept in the LRU cache; 0 disables it.
+            coalesce_delay_s: Delay before a put() is written; 0 writes
+                before put() returns.
 
-    def __init__(self, state_root: Path) -> None:
+        Raises:
+            ModelOnexError: If ``file_format`` is not YAML or JSON.
+        """
+        if file_format not in _STATE_FILENAMES:
+            raise ModelOnexError(
+                message=f"Unsupported state file format: {file_format}",
+                error_code=EnumCoreErrorCode.INVALID_PARAMETER,
+                context={"file_format": str(file_format)},
+            )
         self._state_root = state_root
+        self._format = file_format
+        self._cache_size = cache_size
+        self._coalesce_delay_s = coalesce_delay_s
+        self._cache: OrderedDict[_StateKey, ModelStateEnvelope] = OrderedDict()
+        self._index: dict[_StateKey, EnumDataFormat] | None = None
+        self._pending: dict[_StateKey, ModelStateEnvelope] = {}
+        # On-disk format of each pending key before its first coalesced put
+        self._pending_previous: dict[_StateKey, EnumDataFormat | None] = {}
+        self._flush_tasks: dict[_StateKey, asyncio.Task[None]] = {}
+        # Delayed writes not yet finished, and the first error one raised
+        self._background: set[asyncio.Task[None]] = set()
+        self._flush_error: BaseException | None = None
+        self._closed = False
+        # Bumped by every put/delete, so a read that raced one is not cached
+        self._mutations = 0
+        # One worker keeps file operations in issue order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="onex-state-disk"
+        )
 
-    def _state_path(self, node_id: str, scope_id: str) -> Path:
-        return self._state_root / node_id / scope_id / "state.yaml"
+    def _state_path(
+        self, node_id: str, scope_id: str, file_format: EnumDataFormat | None = None
+    ) -> Path:
+        filename = _STATE_FILENAMES[file_format or self._format]
+        return self._state_root / node_id / scope_id / filename
 
     async def get(
         self, node_id: str, scope_id: str = "default"
     ) -> ModelStateEnvelope | None:
-        path = self._state_path(node_id, scope_id)
-        if not path.exists():
+        key = (node_id, scope_id)
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        file_format = (await self._key_index()).get(key)
+        if file_format is None:
             return None
+        mutations = self._mutations
+        envelope = await self._run(self._read_file, node_id, scope_id, file_format)
+        if mutations == self._mutations:
+            if envelope is None:
+                # Removed behind our back
+                (await self._key_index()).pop(key, None)
+            else:
+                self._remember(key, envelope)
+        return envelope
+
+    async def put(self, envelope: ModelStateEnvelope) -> None:
+        self._check_open()
+        key = (envelope.node_id, envelope.scope_id)
+        index = await self._key_index()
+        self._mutations += 1
+        self._remember(key, envelope)
+        previous_format = index.get(key)
+        index[key] = self._format
+
+        if self._coalesce_delay_s > 0:
+            self._pending[key] = envelope
+            self._pending_previous.setdefault(key, previous_format)
+            if key not in self._flush_tasks:
+                task = asyncio.get_running_loop().create_task(self._flush_later(key))
+                task.add_done_callback(self._flush_task_done)
+                self._flush_tasks[key] = task
+                self._background.add(task)
+            return
+
+        await self._write(envelope, previous_format)
+
+    async def delete(self, node_id: str, scope_id: str = "default") -> bool:
+        key = (node_id, scope_id)
+        index = await self._key_index()
+        self._mutations += 1
+        self._cache.pop(key, None)
+        self._pending.pop(key, None)
+        self._pending_previous.pop(key, None)
+        task = self._flush_tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+        if index.pop(key, None) is None:
+            return False
+        await self._run(self._delete_files, node_id, scope_id)
+        return True
+
+    async def exists(self, node_id: str, scope_id: str = "default") -> bool:
+        return (node_id, scope_id) in await self._key_index()
+
+    async def list_keys(self, node_id: str | None = None) -> list[tuple[str, str]]:
+        index = await self._key_index()
+        if node_id is None:
+            return sorted(index)
+        return sorted(key for key in index if key[0] == node_id)
+
+    async def flush(self) -> None:
+        """
+        Write all coalesced envelopes now.
+
+        Also waits for delayed writes already in progress.
+
+        Raises:
+            Exception: The first error raised by a delayed write since the
+                last flush, after the pending envelopes are written.
+        """
+        pending = [
+            (envelope, self._pending_previous.get(key))
+            for key, envelope in self._pending.items()
+        ]
+        self._pending.clear()
+        self._pending_previous.clear()
+        # Tasks still in _flush_tasks are sleeping; the rest are writing
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        for envelope, previous_format in pending:
+            await self._write(envelope, previous_format)
+        if self._background:
+            await asyncio.wait(self._background)
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    async def close(self) -> None:
+        """
+        Flush coalesced writes and shut down the worker thread.
+
+        Closing twice is a no-op. After closing, the store rejects put() and
+        any call that needs the filesystem.
+
+        Raises:
+            Exception: If the final flush fails.
+        """
+        if self._closed:
+            return
         try:
-            raw = path.read_text(encoding="utf-8")
+            await self.flush()
+        finally:
+            self._closed = True
+            # Work already queued still runs; flush() has awaited all of ours
+            self._executor.shutdown(wait=False)
+
+    async def refresh_index(self) -> None:
+        """Rescan state_root and drop cached envelopes, after external changes."""
+        await self.flush()
+        self._mutations += 1
+        self._cache.clear()
+        self._index = None
+        await self._key_index()
+
+    # =========================================================================
+    # Internal Methods
+    # =========================================================================
+
+    def _remember(self, key: _StateKey, envelope: ModelStateEnvelope) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = envelope
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ModelOnexError(
+                message=f"State store at {self._state_root} is closed",
+                error_code=EnumCoreErrorCode.INVALID_STATE,
+            )
+
+    async def _run[T](self, func: Callable[..., T], *args: object) -> T:
+        self._check_open()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _key_index(self) -> dict[_StateKey, EnumDataFormat]:
+        if self._index is None:
+            scanned = await self._run(self._scan_keys)
+            # A concurrent first call may have installed (and updated) one
+            if self._index is None:
+                self._index = scanned
+        return self._index
+
+    async def _write(
+        self, envelope: ModelStateEnvelope, previous_format: EnumDataFormat | None
+    ) -> None:
+        stale_format = (
+            previous_format
+            if previous_format is not None and previous_format != self._format
+            else None
+        )
+        try:
+            await self._run(self._write_file, envelope, stale_format)
+        except BaseException:
+            # The cache and index were updated optimistically; rebuild them
+            # from disk on next use
+            self._mutations += 1
+            self._cache.pop((envelope.node_id, envelope.scope_id), None)
+            self._index = None
+            raise
+
+    async def _flush_later(self, key: _StateKey) -> None:
+        await asyncio.sleep(self._coalesce_delay_s)
+        self._flush_tasks.pop(key, None)
+        envelope = self._pending.pop(key, None)
+        previous_format = self._pending_previous.pop(key, None)
+        if envelope is not None:
+            await self._write(envelope, previous_format)
+
+    def _flush_task_done(self, task: asyncio.Task[None]) -> None:
+        # Retrieve the result so a failed write is reported by the next
+        # flush() instead of as an unretrieved task exception
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self._flush_error is None:
+            self._flush_error = error
+
+    # Worker-thread helpers; these must not touch the cache or index
+
+    def _scan_keys(self) -> dict[_StateKey, EnumDataFormat]:
+        index: dict[_StateKey, EnumDataFormat] = {}
+        if not self._state_root.is_dir():
+            return index
+        # Prefer the configured format when a scope has both files
+        formats = sorted(_STATE_FILENAMES, key=lambda f: f == self._format)
+        for node_dir in self._state_root.iterdir():
+            if not node_dir.is_dir():
+                continue
+            for scope_dir in node_dir.iterdir():
+                for file_format in formats:
+                    if (scope_dir / _STATE_FILENAMES[file_format]).is_file():
+                        index[(node_dir.name, scope_dir.name)] = file_format
+        return index
+
+    def _read_file(
+        self, node_id: str, scope_id: str, file_format: EnumDataFormat
+    ) -> ModelStateEnvelope | None:
+        path = self._state_path(node_id, scope_id, file_format)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            if file_format is EnumDataFormat.JSON:
+                return ModelStateEnvelope.model_validate_json(raw)
             data = yaml.safe_load(raw)  # yaml-ok: deserialize file then model_validate
             return ModelStateEnvelope.model_validate(data)
         except Exception as exc:
             raise StateCorruptionError(f"Corrupt state file at {path}: {exc}") from exc
 
-    async def put(self, envelope: ModelStateEnvelope) -> None:
+    def _write_file(
+        self, envelope: ModelStateEnvelope, stale_format: EnumDataFormat | None
+    ) -> None:
         path = self._state_path(envelope.node_id, envelope.scope_id)
         path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = yaml.safe_dump(
-            envelope.model_dump(mode="json"), default_flow_style=False
-        )
+        if self._format is EnumDataFormat.JSON:
+            serialized = envelope.model_dump_json().encode("utf-8")
+        else:
+            serialized = yaml.safe_dump(
+                envelope.model_dump(mode="json"), default_flow_style=False
+            ).encode("utf-8")
         fd, tmp_path = tempfile.mkstemp(
             dir=path.parent, prefix=".state_", suffix=".tmp"
         )
         closed = False
         try:
-            os.write(fd, serialized.encode("utf-8"))
+            os.write(fd, serialized)
             os.close(fd)
             closed = True
             Path(tmp_path).rename(path)
@@ -70,40 +367,18 @@ class ServiceStateDisk:
             if not closed:
                 os.close(fd)
             raise
+        if stale_format is not None:
+            self._state_path(envelope.node_id, envelope.scope_id, stale_format).unlink(
+                missing_ok=True
+            )
 
-    async def delete(self, node_id: str, scope_id: str = "default") -> bool:
-        path = self._state_path(node_id, scope_id)
-        if not path.exists():
-            return False
-        path.unlink()
+    def _delete_files(self, node_id: str, scope_id: str) -> None:
+        for file_format in _STATE_FILENAMES:
+            self._state_path(node_id, scope_id, file_format).unlink(missing_ok=True)
         # Clean up empty parent directories
-        scope_dir = path.parent
+        scope_dir = self._state_root / node_id / scope_id
         if scope_dir.exists() and not any(scope_dir.iterdir()):
             scope_dir.rmdir()
         node_dir = scope_dir.parent
         if node_dir.exists() and not any(node_dir.iterdir()):
             node_dir.rmdir()
-        return True
-
-    async def exists(self, node_id: str, scope_id: str = "default") -> bool:
-        return self._state_path(node_id, scope_id).exists()
-
-    async def list_keys(self, node_id: str | None = None) -> list[tuple[str, str]]:
-        keys: list[tuple[str, str]] = []
-        if node_id is not None:
-            node_dir = self._state_root / node_id
-            if not node_dir.is_dir():
-                return []
-            for scope_dir in sorted(node_dir.iterdir()):
-                if scope_dir.is_dir() and (scope_dir / "state.yaml").exists():
-                    keys.append((node_id, scope_dir.name))
-        else:
-            if not self._state_root.is_dir():
-                return []
-            for ndir in sorted(self._state_root.iterdir()):
-                if not ndir.is_dir():
-                    continue
-                for scope_dir in sorted(ndir.iterdir()):
-                    if scope_dir.is_dir() and (scope_dir / "state.yaml").exists():
-                        keys.append((ndir.name, scope_dir.name))
-        return keys
@@ -207,6 +207,8 @@ from .typed_dict_lifecycle_event_fields import TypedDictLifecycleEventFields
 from .typed_dict_lifecycle_event_metadata import TypedDictLifecycleEventMetadata
 from .typed_dict_load_balancer_stats import TypedDictLoadBalancerStats
 from .typed_dict_log_context import TypedDictLogContext
+from .typed_dict_log_pipeline_stats import TypedDictLogPipelineStats
+from .typed_dict_loop_runner_metrics import TypedDictLoopRunnerMetrics
 from .typed_dict_maintenance_summary import TypedDictMaintenanceSummary
 
 # YAML and path resolution TypedDict definitions
@@ -633,6 +635,8 @@ __all__ = [
     "TypedDictCustomFieldsDict",
     "TypedDictEventEnvelopeDict",
     "TypedDictLoadBalancerStats",
+    "TypedDictLogPipelineStats",
+    "TypedDictLoopRunnerMetrics",
     "TypedDictPerformanceCheckpointResult",
     "TypedDictPolicyValueData",
     "TypedDictPolicyValueInput",
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+TypedDict for logging pipeline statistics.
+
+Used by LogPipeline.get_stats().
+"""
+
+from typing import TypedDict
+
+
+class TypedDictLogPipelineStats(TypedDict):
+    """
+    Counters of a buffered logging pipeline.
+
+    Attributes:
+        queue_depth: Records waiting to be written
+        max_queue_size: Queue capacity
+        enqueued: Records accepted since creation
+        written: Records handed to the writer since creation
+        dropped: Records discarded by backpressure
+        blocked: Submissions that had to wait for queue space
+        batches: Batches written
+        writer_errors: Batches whose writer raised
+    """
+
+    queue_depth: int
+    max_queue_size: int
+    enqueued: int
+    written: int
+    dropped: int
+    blocked: int
+    batches: int
+    writer_errors: int
+
+
+__all__ = ["TypedDictLogPipelineStats"]
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+TypedDict for background loop runner metrics.
+
+Used by UtilLoopThreadRunner.get_metrics().
+"""
+
+from typing import TypedDict
+
+
+class TypedDictLoopRunnerMetrics(TypedDict):
+    """
+    Metrics snapshot of a background event-loop runner.
+
+    Attributes:
+        running: Whether the loop thread is currently alive
+        queue_depth: Coroutines submitted but not yet finished
+        submitted: Coroutines submitted since creation
+        completed: Coroutines finished (successfully or not) since creation
+        failed: Coroutines that raised or were cancelled
+        avg_wait_ms: Mean time from submission to start on the loop
+        max_wait_ms: Longest time from submission to start on the loop
+        loop_starts: Number of times the loop thread was (re)started
+    """
+
+    running: bool
+    queue_depth: int
+    submitted: int
+    completed: int
+    failed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    loop_starts: int
+
+
+__all__ = ["TypedDictLoopRunnerMetrics"]
@@ -9,6 +9,7 @@ Provides type-safe structure for workflow context passed between steps.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from typing import TypedDict
 
 
@@ -16,19 +17,21 @@ class TypedDictWorkflowContext(TypedDict):
     """
     TypedDict for workflow execution context.
 
-    Used by _build_workflow_context to provide type-safe context
-    for workflow step execution.
+    Used by the workflow executor to provide type-safe context
+    for workflow step execution. completed_steps and step_outputs are
+    read-only: the executor may hand out views shared between snapshots
+    (see UtilIncrementalWorkflowContext).
 
     Attributes:
         workflow_uuid_str: String representation of workflow UUID (for JSON serialization)
-        completed_steps: List of completed step UUIDs as strings
-        step_outputs: Dict mapping step UUID strings to their outputs
+        completed_steps: Completed step UUIDs as strings
+        step_outputs: Mapping of step UUID strings to their outputs
         step_count: Number of completed steps
     """
 
     workflow_uuid_str: str
-    completed_steps: list[str]
-    step_outputs: dict[str, object]
+    completed_steps: Sequence[str]
+    step_outputs: Mapping[str, object]
     step_count: int
 
 
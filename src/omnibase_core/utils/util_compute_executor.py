@@ -574,6 +574,57 @@ def _execute_pipeline_steps(
     )
 
 
+def _timeout_result(
+    pipeline_timeout_ms: int,
+    operation_name: str,
+    context: ModelComputeExecutionContext,
+    start_time: float,
+) -> ModelComputePipelineResult:
+    """
+    Build (and log) the failure result for a pipeline that exceeded its timeout.
+
+    Shared by execute_compute_pipeline and the compiled pipeline plans in
+    util_compute_pipeline_plan so both report timeouts identically.
+
+    Args:
+        pipeline_timeout_ms: The timeout limit that elapsed.
+        operation_name: The contract's operation name (for logging).
+        context: Execution context of the timed-out execution.
+        start_time: The time.perf_counter() value when execution started.
+
+    Returns:
+        ModelComputePipelineResult with success=False and error_type
+        TIMEOUT_EXCEEDED.
+    """
+    # Capture elapsed time immediately on timeout detection
+    total_time = (time.perf_counter() - start_time) * 1000
+
+    # Log the timeout for observability
+    logger.warning(
+        "Pipeline execution timed out after %.2fms (limit: %dms, operation_id=%s, "
+        "correlation_id=%s, pipeline=%s)",
+        total_time,
+        pipeline_timeout_ms,
+        context.operation_id,
+        context.correlation_id,
+        operation_name,
+    )
+
+    return ModelComputePipelineResult(
+        success=False,
+        output=None,
+        processing_time_ms=total_time,
+        steps_executed=[],  # Cannot reliably know which steps completed
+        step_results={},  # Cannot access partial results from timed-out thread
+        error_type=EnumCoreErrorCode.TIMEOUT_EXCEEDED.value,
+        error_message=(
+            f"Pipeline execution exceeded timeout of {pipeline_timeout_ms}ms "
+            f"(actual: {total_time:.2f}ms)"
+        ),
+        error_step=None,  # Unknown which step was running when timeout occurred
+    )
+
+
 def execute_compute_pipeline(
     contract: ModelComputeSubcontract,
     input_data: PipelineDataType,
@@ -673,33 +724,11 @@ def execute_compute_pipeline(
         return future.result(timeout=timeout_seconds)
 
     except FuturesTimeoutError:
-        # Pipeline exceeded timeout - return failure result
-        # Capture elapsed time immediately on timeout detection
-        total_time = (time.perf_counter() - start_time) * 1000
-
-        # Log the timeout for observability
-        logger.warning(
-            "Pipeline execution timed out after %.2fms (limit: %dms, operation_id=%s, "
-            "correlation_id=%s, pipeline=%s)",
-            total_time,
+        return _timeout_result(
             contract.pipeline_timeout_ms,
-            context.operation_id,
-            context.correlation_id,
             contract.operation_name,
-        )
-
-        return ModelComputePipelineResult(
-            success=False,
-            output=None,
-            processing_time_ms=total_time,
-            steps_executed=[],  # Cannot reliably know which steps completed
-            step_results={},  # Cannot access partial results from timed-out thread
-            error_type=EnumCoreErrorCode.TIMEOUT_EXCEEDED.value,
-            error_message=(
-                f"Pipeline execution exceeded timeout of {contract.pipeline_timeout_ms}ms "
-                f"(actual: {total_time:.2f}ms)"
-            ),
-            error_step=None,  # Unknown which step was running when timeout occurred
+            context,
+            start_time,
         )
 
     finally:
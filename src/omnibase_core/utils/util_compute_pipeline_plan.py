@@ -0,0 +1,568 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Compiled execution plans for contract-driven NodeCompute pipelines.
+
+execute_compute_pipeline() interprets a ModelComputeSubcontract on every call:
+it re-splits every path expression, re-checks private-attribute rules per
+segment, looks transformation handlers up in the registry and evaluates debug
+log arguments. A compute node runs the same contract for every input, so this
+module does that work once:
+
+    plan = compile_compute_pipeline(contract)
+    result = plan.execute(input_data, context)
+    results = plan.execute_batch(inputs, context)
+
+Compilation:
+    - Disabled steps are dropped.
+    - Transformation handlers and their configs are bound directly; JSON_PATH
+      paths are pre-split.
+    - Mapping paths are pre-split into ($.input) segments or ($.steps) step
+      names, with the private-attribute flag precomputed per segment.
+    - Steps whose configuration is invalid compile to the interpreted step, so
+      they fail at run time with exactly the error execute_compute_pipeline
+      reports.
+
+Equivalence:
+    A plan produces the same ModelComputePipelineResult (outputs, step results,
+    error types and messages) as execute_compute_pipeline. Compiled path
+    lookups only take the fast path when the lookup succeeds. Any miss is
+    re-resolved by the reference resolver, which raises the canonical error.
+
+Thread Safety:
+    Plans are immutable after compilation and safe for concurrent use.
+
+See Also:
+    - omnibase_core.utils.util_compute_executor: Interpreted executor (reference)
+    - omnibase_core.utils.util_compute_path_resolver: Path grammar
+    - omnibase_core.mixins.mixin_compute_execution: Uses cached plans
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from threading import Lock
+
+from omnibase_core.enums.enum_compute_step_type import EnumComputeStepType
+from omnibase_core.enums.enum_transformation_type import EnumTransformationType
+from omnibase_core.models.compute.model_compute_execution_context import (
+    ModelComputeExecutionContext,
+)
+from omnibase_core.models.compute.model_compute_pipeline_result import (
+    ModelComputePipelineResult,
+)
+from omnibase_core.models.compute.model_compute_step_metadata import (
+    ModelComputeStepMetadata,
+)
+from omnibase_core.models.compute.model_compute_step_result import (
+    ModelComputeStepResult,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_pipeline_step import (
+    ModelComputePipelineStep,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_subcontract import (
+    ModelComputeSubcontract,
+)
+from omnibase_core.models.errors.model_onex_error import ModelOnexError
+from omnibase_core.models.transformations.model_transform_json_path_config import (
+    ModelTransformJsonPathConfig,
+)
+from omnibase_core.utils.util_compute_executor import (
+    PipelineDataType,
+    _get_error_type,
+    _timeout_result,
+    execute_pipeline_step,
+    execute_validation_step,
+)
+from omnibase_core.utils.util_compute_path_resolver import (
+    _traverse_path_segments,
+    resolve_pipeline_path,
+)
+from omnibase_core.utils.util_compute_transformations import (
+    TRANSFORMATION_REGISTRY,
+    transform_json_path,
+)
+
+__all__ = [
+    "UtilComputePipelinePlan",
+    "compile_compute_pipeline",
+    "get_compiled_compute_pipeline",
+]
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# (current_data, input_data, step_results) -> step output
+type _StepRunner = Callable[
+    [PipelineDataType, PipelineDataType, dict[str, ModelComputeStepResult]], object
+]
+
+# (input_data, step_results) -> resolved mapping value
+type _PathResolver = Callable[
+    [PipelineDataType, dict[str, ModelComputeStepResult]], object
+]
+
+
+def _walk(
+    current: object, segments: tuple[tuple[str, bool], ...], check_private: bool
+) -> object:
+    """Follow pre-split segments; return _MISSING whenever the slow path must decide."""
+    for part, is_private in segments:
+        if isinstance(current, dict):
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
+                return _MISSING
+        elif check_private and is_private:
+            return _MISSING
+        else:
+            current = getattr(current, part, _MISSING)
+            if current is _MISSING:
+                return _MISSING
+    return current
+
+
+def _split_segments(path_tail: str) -> tuple[tuple[str, bool], ...]:
+    return tuple((part, part.startswith("_")) for part in path_tail.split(".") if part)
+
+
+def _compile_json_path(config: ModelTransformJsonPathConfig) -> Callable[..., object]:
+    """Bind a JSON_PATH transformation to its pre-split path."""
+    path = config.path
+    if not path or path == "$":
+        return lambda data: data
+    tail = path[2:] if path.startswith("$.") else path[1:] if path[0] == "$" else path
+    segments = _split_segments(tail)
+
+    def run(data: object) -> object:
+        value = _walk(data, segments, check_private=True)
+        if value is _MISSING:
+            # Canonical error (message and context) from the interpreted transform
+            return transform_json_path(data, config)
+        return value
+
+    return run
+
+
+def _compile_path(path: str) -> _PathResolver:
+    """Compile a mapping path expression; invalid paths defer to the resolver."""
+    if path in ("$.input", "$input"):
+        return lambda input_data, step_results: input_data
+
+    if path.startswith(("$.input.", "$input.")):
+        prefix = "$.input." if path.startswith("$.input.") else "$input."
+        tail = path[len(prefix) :]
+        segments = _split_segments(tail)
+        tail_parts = tail.split(".")
+
+        def resolve_input(
+            input_data: PipelineDataType,
+            step_results: dict[str, ModelComputeStepResult],
+        ) -> object:
+            value = _walk(input_data, segments, check_private=True)
+            if value is _MISSING:
+                return _traverse_path_segments(
+                    input_data, tail_parts, path, check_private=True
+                )
+            return value
+
+        return resolve_input
+
+    if path.startswith("$.steps."):
+        step_name, sep, sub_path = path[len("$.steps.") :].partition(".")
+        if step_name and (not sep or sub_path == "output"):
+
+            def resolve_step(
+                input_data: PipelineDataType,
+                step_results: dict[str, ModelComputeStepResult],
+            ) -> object:
+                result = step_results.get(step_name, _MISSING)
+                if result is _MISSING:
+                    return resolve_pipeline_path(path, input_data, step_results)
+                return getattr(result, "output", result)
+
+            return resolve_step
+
+    # Malformed paths: fail at run time exactly as the interpreter does
+    return lambda input_data, step_results: resolve_pipeline_path(
+        path, input_data, step_results
+    )
+
+
+def _compile_runner(step: ModelComputePipelineStep) -> _StepRunner:
+    """Bind one enabled step to a direct call; invalid configs stay interpreted."""
+    if step.step_type == EnumComputeStepType.TRANSFORMATION:
+        transformation_type = step.transformation_type
+        handler = (
+            TRANSFORMATION_REGISTRY.get(transformation_type)
+            if transformation_type is not None
+            else None
+        )
+        config = step.transformation_config
+        valid = handler is not None and (
+            transformation_type == EnumTransformationType.IDENTITY or config is not None
+        )
+        if valid and handler is not None:
+            if isinstance(config, ModelTransformJsonPathConfig):
+                json_path = _compile_json_path(config)
+                return lambda current, input_data, step_results: json_path(current)
+            return lambda current, input_data, step_results: handler(current, config)
+
+    elif step.step_type == EnumComputeStepType.MAPPING:
+        if step.mapping_config is not None:
+            fields = tuple(
+                (output_field, _compile_path(path_expr))
+                for output_field, path_expr in step.mapping_config.field_mappings.items()
+            )
+
+            def run_mapping(
+                current: PipelineDataType,
+                input_data: PipelineDataType,
+                step_results: dict[str, ModelComputeStepResult],
+            ) -> object:
+                return {
+                    output_field: resolve(input_data, step_results)
+                    for output_field, resolve in fields
+                }
+
+            return run_mapping
+
+    elif step.step_type == EnumComputeStepType.VALIDATION:
+        if step.validation_config is not None:
+            return lambda current, input_data, step_results: execute_validation_step(
+                step, current
+            )
+
+    def interpreted(
+        current: PipelineDataType,
+        input_data: PipelineDataType,
+        step_results: dict[str, ModelComputeStepResult],
+    ) -> object:
+        return execute_pipeline_step(step, current, input_data, step_results)
+
+    return interpreted
+
+
+class _CompiledStep:
+    """One enabled pipeline step with its bound runner and precomputed labels."""
+
+    __slots__ = ("name", "run", "step_type_label", "transformation_type_label")
+
+    def __init__(self, step: ModelComputePipelineStep) -> None:
+        self.name = step.step_name
+        self.run = _compile_runner(step)
+        self.step_type_label = step.step_type.value if step.step_type else "unknown"
+        self.transformation_type_label = (
+            step.transformation_type.value if step.transformation_type else None
+        )
+
+
+class UtilComputePipelinePlan:
+    """
+    A ModelComputeSubcontract compiled for repeated execution.
+
+    Create with compile_compute_pipeline() (or get_compiled_compute_pipeline()
+    for a per-contract cached plan). Results are identical to
+    execute_compute_pipeline() for the same contract and input.
+
+    The plan does not keep a reference to the contract, so caching plans per
+    contract (get_compiled_compute_pipeline) does not keep contracts alive.
+
+    Attributes:
+        operation_name: The contract's operation name.
+        pipeline_timeout_ms: The contract's timeout, or None if unbounded.
+        skipped_steps: Names of disabled steps removed at compile time.
+    """
+
+    __slots__ = ("_steps", "operation_name", "pipeline_timeout_ms", "skipped_steps")
+
+    def __init__(self, contract: ModelComputeSubcontract) -> None:
+        self.operation_name = contract.operation_name
+        self.pipeline_timeout_ms = contract.pipeline_timeout_ms
+        self.skipped_steps: tuple[str, ...] = tuple(
+            step.step_name for step in contract.pipeline if not step.enabled
+        )
+        self._steps: tuple[_CompiledStep, ...] = tuple(
+            _CompiledStep(step) for step in contract.pipeline if step.enabled
+        )
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def execute(
+        self,
+        input_data: PipelineDataType,
+        context: ModelComputeExecutionContext,
+    ) -> ModelComputePipelineResult:
+        """
+        Run the plan on one input, enforcing pipeline_timeout_ms if set.
+
+        Args:
+            input_data: Input data to process.
+            context: Execution context for logging and tracing.
+
+        Returns:
+            ModelComputePipelineResult, never raising (same contract as
+            execute_compute_pipeline).
+        """
+        start_time = time.perf_counter()
+        if self.pipeline_timeout_ms is None:
+            return self._run(input_data, context, start_time)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return self._run_with_timeout(executor, input_data, context, start_time)[0]
+        finally:
+            executor.shutdown(wait=False)
+
+    def execute_batch(
+        self,
+        inputs: Iterable[PipelineDataType],
+        context: ModelComputeExecutionContext,
+    ) -> list[ModelComputePipelineResult]:
+        """
+        Run the plan over many inputs, in order, one result per input.
+
+        Each input is an independent execution (its own abort-on-failure and
+        timeout). With a timeout configured, one worker thread is reused across
+        the batch and replaced only after an input times out.
+
+        Args:
+            inputs: Input data items to process.
+            context: Execution context shared by the batch.
+
+        Returns:
+            Results in input order.
+        """
+        if self.pipeline_timeout_ms is None:
+            run = self._run
+            return [
+                run(input_data, context, time.perf_counter()) for input_data in inputs
+            ]
+
+        results: list[ModelComputePipelineResult] = []
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            for input_data in inputs:
+                result, timed_out = self._run_with_timeout(
+                    executor, input_data, context, time.perf_counter()
+                )
+                results.append(result)
+                if timed_out:
+                    # The worker may still be busy with the timed-out input
+                    executor.shutdown(wait=False)
+                    executor = ThreadPoolExecutor(max_workers=1)
+        finally:
+            executor.shutdown(wait=False)
+        return results
+
+    def _run_with_timeout(
+        self,
+        executor: ThreadPoolExecutor,
+        input_data: PipelineDataType,
+        context: ModelComputeExecutionContext,
+        start_time: float,
+    ) -> tuple[ModelComputePipelineResult, bool]:
+        timeout_ms = self.pipeline_timeout_ms or 0
+        future = executor.submit(self._run, input_data, context, start_time)
+        try:
+            return future.result(timeout=timeout_ms / 1000.0), False
+        except FuturesTimeoutError:
+            timeout_result = _timeout_result(
+                timeout_ms, self.operation_name, context, start_time
+            )
+            return timeout_result, True
+
+    def _run(
+        self,
+        input_data: PipelineDataType,
+        context: ModelComputeExecutionContext,
+        start_time: float,
+    ) -> ModelComputePipelineResult:
+        step_results: dict[str, ModelComputeStepResult] = {}
+        steps_executed: list[str] = []
+        current_data = input_data
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            for name in self.skipped_steps:
+                logger.debug(
+                    "Skipping disabled step '%s' (operation_id=%s, correlation_id=%s)",
+                    name,
+                    context.operation_id,
+                    context.correlation_id,
+                )
+
+        for step in self._steps:
+            step_start = time.perf_counter()
+            if debug:
+                logger.debug(
+                    "Executing step '%s' (type=%s, operation_id=%s, correlation_id=%s)",
+                    step.name,
+                    step.step_type_label,
+                    context.operation_id,
+                    context.correlation_id,
+                )
+            try:
+                result_data = step.run(current_data, input_data, step_results)
+            except ModelOnexError as e:
+                error_code_str = (
+                    e.error_code.value
+                    if e.error_code is not None and hasattr(e.error_code, "value")
+                    else str(e.error_code)
+                )
+                logger.warning(
+                    "Pipeline step '%s' failed: %s (error_code=%s, operation_id=%s, "
+                    "correlation_id=%s, step_type=%s)",
+                    step.name,
+                    e.message,
+                    error_code_str,
+                    context.operation_id,
+                    context.correlation_id,
+                    step.step_type_label,
+                )
+                return self._failure(
+                    step,
+                    step_start,
+                    start_time,
+                    step_results,
+                    steps_executed,
+                    _get_error_type(e),
+                    e.message,
+                )
+            except Exception as e:  # fallback-ok: captured in the result object like execute_compute_pipeline, logged via logger.exception
+                logger.exception(
+                    "Unexpected error in pipeline step '%s': %s (type: %s, "
+                    "operation_id: %s, correlation_id: %s)",
+                    step.name,
+                    str(e),
+                    type(e).__name__,
+                    context.operation_id,
+                    context.correlation_id,
+                )
+                return self._failure(
+                    step,
+                    step_start,
+                    start_time,
+                    step_results,
+                    steps_executed,
+                    "unexpected_error",
+                    str(e),
+                )
+
+            step_duration = (time.perf_counter() - step_start) * 1000
+            step_results[step.name] = ModelComputeStepResult(
+                step_name=step.name,
+                output=result_data,
+                success=True,
+                metadata=ModelComputeStepMetadata(
+                    duration_ms=step_duration,
+                    transformation_type=step.transformation_type_label,
+                ),
+            )
+            steps_executed.append(step.name)
+            current_data = result_data
+            if debug:
+                logger.debug(
+                    "Step '%s' completed successfully (duration_ms=%.2f, operation_id=%s)",
+                    step.name,
+                    step_duration,
+                    context.operation_id,
+                )
+
+        return ModelComputePipelineResult(
+            success=True,
+            output=current_data,
+            processing_time_ms=(time.perf_counter() - start_time) * 1000,
+            steps_executed=steps_executed,
+            step_results=step_results,
+        )
+
+    @staticmethod
+    def _failure(
+        step: _CompiledStep,
+        step_start: float,
+        start_time: float,
+        step_results: dict[str, ModelComputeStepResult],
+        steps_executed: list[str],
+        error_type: str,
+        error_message: str,
+    ) -> ModelComputePipelineResult:
+        now = time.perf_counter()
+        step_results[step.name] = ModelComputeStepResult(
+            step_name=step.name,
+            output=None,
+            success=False,
+            metadata=ModelComputeStepMetadata(
+                duration_ms=(now - step_start) * 1000,
+                transformation_type=step.transformation_type_label,
+            ),
+            error_type=error_type,
+            error_message=error_message,
+        )
+        steps_executed.append(step.name)
+        return ModelComputePipelineResult(
+            success=False,
+            output=None,
+            processing_time_ms=(now - start_time) * 1000,
+            steps_executed=steps_executed,
+            step_results=step_results,
+            error_type=error_type,
+            error_message=error_message,
+            error_step=step.name,
+        )
+
+
+def compile_compute_pipeline(
+    contract: ModelComputeSubcontract,
+) -> UtilComputePipelinePlan:
+    """
+    Compile a compute subcontract into a reusable execution plan.
+
+    Args:
+        contract: The compute subcontract to compile.
+
+    Returns:
+        A new UtilComputePipelinePlan. Compilation never fails; invalid step
+        configuration surfaces as a failed result when the plan runs.
+    """
+    return UtilComputePipelinePlan(contract)
+
+
+# Keyed by id(contract): pydantic models hash and compare by value (and a
+# contract's pipeline list is unhashable). weakref.finalize evicts the entry
+# when the contract is collected, before its id can be reused.
+_plan_cache: dict[int, UtilComputePipelinePlan] = {}
+_plan_cache_lock = Lock()
+
+
+def get_compiled_compute_pipeline(
+    contract: ModelComputeSubcontract,
+) -> UtilComputePipelinePlan:
+    """
+    Return the cached plan for a contract, compiling it on first use.
+
+    Contracts are frozen, so a plan stays valid for the contract's lifetime.
+    The cache is keyed by contract identity and does not keep contracts alive.
+
+    Args:
+        contract: The compute subcontract.
+
+    Returns:
+        The contract's UtilComputePipelinePlan.
+    """
+    key = id(contract)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        with _plan_cache_lock:
+            plan = _plan_cache.get(key)
+            if plan is None:
+                plan = compile_compute_pipeline(contract)
+                _plan_cache[key] = plan
+                weakref.finalize(contract, _plan_cache.pop, key, None)
+    return plan
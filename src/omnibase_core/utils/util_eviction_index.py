@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Constant-time eviction bookkeeping for bounded in-process caches.
+
+UtilEvictionIndex tracks which key a cache should evict next, and which keys
+have expired, without scanning the cache. The owning cache keeps its own
+key -> value storage; the index only mirrors the keys.
+
+Policies (selected by EnumCacheEvictionPolicy):
+    - LRU: an ordered map; an access moves the key to the most-recent end,
+      eviction pops the least-recent end. O(1).
+    - FIFO: the same ordered map without access reordering. O(1).
+    - LFU: frequency buckets (frequency -> ordered keys) plus the current
+      minimum frequency; ties are broken least-recently-used first. O(1)
+      amortized.
+
+Expiry is a min-heap of (expiry, key) with lazy deletion: overwritten or
+removed keys leave stale heap entries that are skipped when popped, and the
+heap is rebuilt once stale entries outnumber live ones.
+
+Thread Safety:
+    UtilEvictionIndex is NOT thread-safe. It is mutated on every cache get and
+    put; callers that share a cache across threads must serialize access (see
+    ModelThreadSafeComputeCache).
+
+Example:
+    >>> from datetime import UTC, datetime, timedelta
+    >>> index = UtilEvictionIndex(EnumCacheEvictionPolicy.LRU)
+    >>> expiry = datetime.now(UTC) + timedelta(minutes=5)
+    >>> index.insert("a", expiry)
+    >>> index.insert("b", expiry)
+    >>> index.touch("a")
+    >>> index.pop_victim()
+    'b'
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from datetime import datetime
+
+from omnibase_core.enums.enum_cache_eviction_policy import EnumCacheEvictionPolicy
+
+__all__ = ["UtilEvictionIndex"]
+
+# Rebuild the expiry heap once it holds this many times more entries than keys.
+_HEAP_COMPACTION_FACTOR = 2
+
+
+class UtilEvictionIndex:
+    """
+    Eviction order and expiry tracking for a bounded cache.
+
+    Attributes:
+        policy: The eviction policy this index implements.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_expiry",
+        "_frequency",
+        "_heap",
+        "_min_frequency",
+        "_order",
+        "policy",
+    )
+
+    def __init__(self, policy: EnumCacheEvictionPolicy) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            policy: Eviction policy (LRU, LFU or FIFO).
+        """
+        self.policy = policy
+        # LRU / FIFO: key order, oldest first.
+        self._order: OrderedDict[str, None] = OrderedDict()
+        # LFU: key -> frequency, frequency -> keys (oldest first).
+        self._frequency: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_frequency = 0
+        # Expiry: key -> expiry plus a lazily-pruned min-heap over it.
+        self._expiry: dict[str, datetime] = {}
+        self._heap: list[tuple[datetime, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._expiry
+
+    def insert(self, key: str, expiry: datetime) -> None:
+        """
+        Track a newly stored key (or restart tracking of an overwritten one).
+
+        An overwritten key is treated as new: it becomes the most recent entry
+        (LRU/FIFO) or restarts at frequency 1 (LFU).
+        """
+        if key in self._expiry:
+            self.remove(key)
+        if self.policy == EnumCacheEvictionPolicy.LFU:
+            self._frequency[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_frequency = 1
+        else:
+            self._order[key] = None
+        self._expiry[key] = expiry
+        heapq.heappush(self._heap, (expiry, key))
+        if len(self._heap) > _HEAP_COMPACTION_FACTOR * len(self._expiry) + 64:
+            self._heap = [(exp, k) for k, exp in self._expiry.items()]
+            heapq.heapify(self._heap)
+
+    def touch(self, key: str) -> None:
+        """Record a cache hit on ``key``."""
+        if self.policy == EnumCacheEvictionPolicy.LRU:
+            if key in self._order:
+                self._order.move_to_end(key)
+        elif self.policy == EnumCacheEvictionPolicy.LFU:
+            frequency = self._frequency.get(key)
+            if frequency is None:
+                return
+            bucket = self._buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[frequency]
+                if self._min_frequency == frequency:
+                    self._min_frequency = frequency + 1
+            self._frequency[key] = frequency + 1
+            self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+        # FIFO: hits do not affect eviction order.
+
+    def remove(self, key: str) -> None:
+        """Stop tracking ``key`` (no-op when it is not tracked)."""
+        if self._expiry.pop(key, None) is None:
+            return
+        if self.policy == EnumCacheEvictionPolicy.LFU:
+            frequency = self._frequency.pop(key)
+            bucket = self._buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[frequency]
+                # _min_frequency is repaired lazily in pop_victim().
+        else:
+            del self._order[key]
+
+    def pop_victim(self) -> str | None:
+        """Remove and return the key to evict next, or None when empty."""
+        if not self._expiry:
+            return None
+        if self.policy == EnumCacheEvictionPolicy.LFU:
+            bucket = self._buckets.get(self._min_frequency)
+            if bucket is None:
+                self._min_frequency = min(self._buckets)
+                bucket = self._buckets[self._min_frequency]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_frequency]
+            del self._frequency[key]
+        else:
+            key, _ = self._order.popitem(last=False)
+        del self._expiry[key]
+        return key
+
+    def pop_expired(self, now: datetime) -> list[str]:
+        """
+        Remove and return every tracked key whose expiry is at or before ``now``.
+
+        Costs O(k log n) for k expired keys instead of a scan of the cache.
+        """
+        expired: list[str] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            # Skip stale heap entries left behind by overwrites and removals.
+            if self._expiry.get(key) == expiry:
+                self.remove(key)
+                expired.append(key)
+        return expired
+
+    def clear(self) -> None:
+        """Stop tracking every key."""
+        self._order.clear()
+        self._frequency.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+        self._expiry.clear()
+        self._heap.clear()
@@ -15,12 +15,10 @@ while maintaining type clarity for FSM-specific usage.
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from typing import SupportsFloat
-
     from omnibase_core.models.fsm.model_fsm_transition_result import (
         ModelFSMTransitionResult as FSMTransitionResult,
     )
@@ -40,9 +38,6 @@ from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.fsm.model_fsm_state_snapshot import (
     ModelFSMStateSnapshot as FSMState,
 )
-from omnibase_core.models.fsm.model_fsm_transition_condition import (
-    ModelFSMTransitionCondition,
-)
 from omnibase_core.models.reducer.model_intent import ModelIntent
 from omnibase_core.models.reducer.payloads import (
     ModelPayloadFSMStateAction,
@@ -52,8 +47,7 @@ from omnibase_core.models.reducer.payloads import (
     ModelPayloadPersistState,
 )
 from omnibase_core.types.type_fsm_context import FSMContextType
-from omnibase_core.utils.util_fsm_expression_parser import parse_expression
-from omnibase_core.utils.util_fsm_operators import evaluate_equals, evaluate_not_equals
+from omnibase_core.utils.util_fsm_transition_table import get_compiled_fsm
 
 
 async def execute_transition(
@@ -116,8 +110,11 @@ async def execute_transition(
 
     intents: list[ModelIntent] = []
 
+    # Compiled once per contract fingerprint and shared by every caller
+    table = get_compiled_fsm(fsm)
+
     # 1. Validate current state exists
-    state_def = _get_state_definition(fsm, current_state)
+    state_def = table.state(current_state)
     if not state_def:
         raise ModelOnexError(
             error_code=EnumCoreErrorCode.VALIDATION_ERROR,
@@ -129,7 +126,7 @@ async def execute_transition(
     #    Implements the documented ModelFSMStateTransition.priority semantics:
     #    among the transitions matching (current_state, trigger), guards are
     #    evaluated in priority order and the first eligible one is chosen.
-    selection = await _select_transition(fsm, current_state, trigger, context)
+    selection = table.select(current_state, trigger, context)
     if selection is None:
         raise ModelOnexError(
             error_code=EnumCoreErrorCode.VALIDATION_ERROR,
@@ -190,7 +187,7 @@ async def execute_transition(
         intents.extend(transition_intents)
 
         # 6. Get target state definition
-        target_state_def = _get_state_definition(fsm, transition.to_state)
+        target_state_def = table.state(transition.to_state)
         if not target_state_def:
             raise ModelOnexError(
                 error_code=EnumCoreErrorCode.VALIDATION_ERROR,
@@ -423,327 +420,6 @@ def _get_state_definition(
     return None
 
 
-class _TransitionSelection(NamedTuple):
-    """Outcome of priority-ordered guard-fallthrough transition selection.
-
-    Attributes:
-        transition: The transition chosen for the (from_state, trigger) pair —
-            either the highest-priority candidate whose guard passed, or (when
-            no candidate is eligible) the highest-priority candidate whose guard
-            failed, so the caller can emit a fail-closed guard-rejection result.
-        guard_passed: True when ``transition`` is eligible to execute (its guard
-            passed, or it is an unconditional default edge). False when no
-            candidate was eligible and the FSM must stay in its current state.
-        failed_conditions: Names of the required conditions that rejected the
-            selected candidate; empty when ``guard_passed`` is True.
-    """
-
-    transition: ModelFSMStateTransition
-    guard_passed: bool
-    failed_conditions: tuple[str, ...]
-
-
-async def _select_transition(
-    fsm: ModelFSMSubcontract,
-    from_state: str,
-    trigger: str,
-    context: FSMContextType,
-) -> _TransitionSelection | None:
-    """Select the transition to execute using priority-ordered guard fallthrough.
-
-    Implements the documented ``ModelFSMStateTransition.priority`` semantics
-    (see the model's "Priority Resolution" docstring):
-
-    1. Candidate set: transitions whose ``(from_state, trigger)`` match exactly.
-       Only when there is no exact match does the wildcard set
-       (``from_state == "*"``) apply — exact-state transitions always take
-       precedence over wildcard/global handlers (preserves prior behavior).
-    2. Candidates are evaluated in ``priority`` DESCENDING order; declaration
-       order is the stable tiebreak within equal priority.
-    3. The first candidate whose required conditions all pass is selected. A
-       transition with no required conditions is a trivially-passing "default
-       edge"; declared at the lowest priority it acts as the fallthrough once
-       every higher-priority guard has been rejected.
-    4. Fail-closed: if no candidate's guard passes (and no default edge is
-       declared), the highest-priority candidate is returned with
-       ``guard_passed=False``. The engine never silently executes a transition
-       whose guard is false; the caller emits a guard-rejection result and the
-       FSM stays in its current state.
-
-    Returns:
-        A ``_TransitionSelection``, or ``None`` when ``(from_state, trigger)``
-        matches no transition at all (the caller raises "no transition").
-    """
-    exact_candidates = [
-        transition
-        for transition in fsm.transitions
-        if transition.from_state == from_state and transition.trigger == trigger
-    ]
-    # Wildcard transitions apply only when no exact-state transition matches.
-    candidates = exact_candidates or [
-        transition
-        for transition in fsm.transitions
-        if transition.from_state == "*" and transition.trigger == trigger
-    ]
-    if not candidates:
-        return None
-
-    # Priority DESC; sorted() is stable, so equal-priority candidates keep
-    # their declaration order (the documented tiebreak).
-    ordered = sorted(
-        candidates, key=lambda transition: transition.priority, reverse=True
-    )
-
-    first_rejection: _TransitionSelection | None = None
-    for transition in ordered:
-        failed = await _evaluate_failed_conditions(transition, context)
-        if not failed:
-            # Guard passed (or unconditional default edge): the first eligible
-            # candidate in priority order wins.
-            return _TransitionSelection(transition, True, ())
-        if first_rejection is None:
-            # Remember the highest-priority guard failure for the fail-closed
-            # rejection result if no candidate turns out to be eligible.
-            first_rejection = _TransitionSelection(transition, False, failed)
-
-    # No candidate was eligible. ``first_rejection`` is guaranteed non-None here
-    # because the candidate list is non-empty and every candidate failed its
-    # guard (an eligible candidate would have returned above). Fail closed: the
-    # FSM stays in-state and no false-guard transition is silently executed.
-    return first_rejection
-
-
-async def _evaluate_conditions(
-    transition: ModelFSMStateTransition,
-    context: FSMContextType,
-) -> bool:
-    """
-    Evaluate all transition conditions.
-
-    Args:
-        transition: Transition with conditions to evaluate
-        context: Execution context for condition evaluation
-
-    Returns:
-        True if all conditions met, False otherwise
-    """
-    return not await _evaluate_failed_conditions(transition, context)
-
-
-async def _evaluate_failed_conditions(
-    transition: ModelFSMStateTransition,
-    context: FSMContextType,
-) -> tuple[str, ...]:
-    """Return names of required transition conditions that evaluated false."""
-    if not transition.conditions:
-        return ()
-
-    failed: list[str] = []
-    for condition in transition.conditions:
-        # Skip optional conditions if not required
-        if not condition.required:
-            continue
-
-        # Evaluate condition based on type and expression
-        condition_met = await _evaluate_single_condition(condition, context)
-
-        if not condition_met:
-            failed.append(condition.condition_name)
-
-    return tuple(failed)
-
-
-def _get_nested_field_value(context: FSMContextType, field_path: str) -> object:
-    """
-    Get value from nested dict using dot notation path.
-
-    Supports nested field access like "user.email" or "data.items.count".
-
-    Args:
-        context: The context dictionary
-        field_path: Dot-separated path like "user.email" or "data.items.count"
-
-    Returns:
-        The value at the path, or None if any segment is missing or
-        if any intermediate value is not a dict
-
-    Examples:
-        >>> _get_nested_field_value({"user": {"email": "test@example.com"}}, "user.email")
-        'test@example.com'
-
-        >>> _get_nested_field_value({"count": 5}, "count")
-        5
-
-        >>> _get_nested_field_value({"user": {"name": "Bob"}}, "user.email")
-        None
-
-        >>> _get_nested_field_value({"user": None}, "user.email")
-        None
-    """
-    # Fast path: no dots means simple field access
-    if "." not in field_path:
-        return context.get(field_path)
-
-    # Split and traverse for nested paths
-    segments = field_path.split(".")
-    current: object = context
-
-    for segment in segments:
-        if not isinstance(current, dict):
-            return None
-        current = current.get(segment)
-        if current is None:
-            return None
-
-    return current
-
-
-async def _evaluate_single_condition(
-    condition: ModelFSMTransitionCondition,
-    context: FSMContextType,
-) -> bool:
-    """
-    Evaluate a single transition condition.
-
-    Args:
-        condition: Condition to evaluate
-        context: Execution context
-
-    Returns:
-        True if condition met, False otherwise
-
-    Important - Type Coercion Behavior:
-        The 'equals' and 'not_equals' operators perform STRING-BASED comparison
-        by casting both sides to str before evaluation.
-
-        Why This Design?
-        - FSM conditions are typically defined in YAML/JSON where all values are strings
-        - String coercion ensures consistent behavior regardless of value source
-        - Avoids type mismatch errors when comparing config values to runtime values
-
-        Examples:
-            10 == "10"           → True  (both become "10")
-            10 != "10"           → False (both become "10")
-            True == "True"       → True  (both become "True")
-            None == "None"       → True  (both become "None")
-            [1,2] == "[1, 2]"    → True  (both become "[1, 2]")
-
-        Impact:
-            - Type information is LOST during comparison
-            - Integer 0 is treated same as string "0"
-            - Boolean True is treated same as string "True"
-
-        Workarounds:
-            - For numeric comparison: Use 'greater_than' or 'less_than' operators
-            - For type-aware checks: Preprocess context values before FSM execution
-            - For strict equality: Add custom condition evaluator
-
-        Other Operators:
-            - 'greater_than', 'less_than': Cast to float (preserves numeric comparison)
-            - 'min_length', 'max_length': Cast expected value to int
-            - 'exists', 'not_exists': No type coercion (presence check only)
-    """
-    # Expression-based evaluation using validated parser
-    # Format: "field operator value"
-    # Example: "data_sources min_length 1"
-    #
-    # Uses parse_expression for validation:
-    # - Ensures exactly 3 tokens (field, operator, value)
-    # - Validates operator is in SUPPORTED_OPERATORS
-    # - Security: Rejects underscore-prefixed field names
-
-    try:
-        field_name, operator, expected_value = parse_expression(condition.expression)
-    except ModelOnexError:
-        # Invalid expression format - fail gracefully
-        # parse_expression raises for:
-        # - Empty expression
-        # - Wrong token count (not exactly 3)
-        # - Unsupported operator
-        # - Underscore-prefixed field names (security)
-        return False
-
-    # Use nested field access to support dot notation (e.g., "user.email")
-    field_value = _get_nested_field_value(context, field_name)
-
-    # Evaluate based on operator
-    # Standard operators (validated by ModelFSMTransitionCondition)
-    if operator == "==" or operator == "equals":
-        # STRING-BASED COMPARISON via fsm_operators module
-        # Both values are cast to str before comparison (INTENTIONAL)
-        # See fsm_operators.evaluate_equals docstring for type coercion behavior
-        return evaluate_equals(field_value, expected_value)
-    elif operator == "!=" or operator == "not_equals":
-        # STRING-BASED COMPARISON via fsm_operators module
-        # Both values are cast to str before comparison (INTENTIONAL)
-        # See fsm_operators.evaluate_not_equals docstring for type coercion behavior
-        return evaluate_not_equals(field_value, expected_value)
-    elif operator == ">":
-        try:
-            # Cast to SupportsFloat - TypeError caught if not actually numeric
-            return float(cast("SupportsFloat", field_value) or 0) > float(
-                expected_value or "0"
-            )
-        except VALIDATION_ERRORS:
-            # fallback-ok: non-numeric values return False for numeric comparison
-            return False
-    elif operator == "<":
-        try:
-            # Cast to SupportsFloat - TypeError caught if not actually numeric
-            return float(cast("SupportsFloat", field_value) or 0) < float(
-                expected_value or "0"
-            )
-        except VALIDATION_ERRORS:
-            # fallback-ok: non-numeric values return False for numeric comparison
-            return False
-    elif operator == ">=":
-        try:
-            # Cast to SupportsFloat - TypeError caught if not actually numeric
-            return float(cast("SupportsFloat", field_value) or 0) >= float(
-                expected_value or "0"
-            )
-        except VALIDATION_ERRORS:
-            # fallback-ok: non-numeric values return False for numeric comparison
-            return False
-    elif operator == "<=":
-        try:
-            # Cast to SupportsFloat - TypeError caught if not actually numeric
-            return float(cast("SupportsFloat", field_value) or 0) <= float(
-                expected_value or "0"
-            )
-        except VALIDATION_ERRORS:
-            # fallback-ok: non-numeric values return False for numeric comparison
-            return False
-    elif operator == "in":
-        # Check if field_value is in expected_value (comma-separated list or iterable)
-        # Note: expected_value is always a string from parse_expression
-        expected_list = [v.strip() for v in expected_value.split(",")]
-        return str(field_value) in expected_list
-    elif operator == "not_in":
-        # Check if field_value is NOT in expected_value (comma-separated list)
-        # Note: expected_value is always a string from parse_expression
-        expected_list = [v.strip() for v in expected_value.split(",")]
-        return str(field_value) not in expected_list
-    elif operator == "contains":
-        # Check if field_value contains expected_value as substring
-        if field_value is None:
-            return False
-        return str(expected_value) in str(field_value)
-    elif operator == "matches":
-        # Regex match (basic pattern matching)
-        import re
-
-        if field_value is None:
-            return False
-        try:
-            return bool(re.match(str(expected_value), str(field_value)))
-        except re.error:
-            return False
-
-    # Unknown operator - fail safe
-    return False
-
-
 async def _execute_state_actions(
     fsm: ModelFSMSubcontract,
     state: ModelFSMStateDefinition,
@@ -30,7 +30,7 @@ from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 
 # Supported operators for FSM condition expressions
-# These correspond to operators used in fsm_executor._evaluate_single_condition()
+# These correspond to operators used in util_fsm_transition_table.compile_condition()
 SUPPORTED_OPERATORS: Final[frozenset[str]] = frozenset(
     {
         # Equality operators (textual)
@@ -0,0 +1,435 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Precompiled transition tables for declarative FSM subcontracts.
+
+Selecting a transition used to rescan ``fsm.transitions``, re-sort the
+candidates by priority and re-parse every condition expression on each
+trigger. A reducer runs the same contract for every event, so this module does
+that work once per contract:
+
+    table = get_compiled_fsm(fsm)
+    selection = table.select(current_state, trigger, context)
+
+Compilation:
+    - States are indexed by name (first declaration wins, as before).
+    - Transitions are grouped by ``(from_state, trigger)`` and sorted by
+      ``priority`` descending; declaration order is the stable tiebreak.
+      Wildcard (``from_state == "*"``) candidates are the group keyed by
+      ``("*", trigger)`` and apply only when no exact group exists.
+    - Each required condition is parsed once into a predicate closure with
+      its field path pre-split and its expected value pre-converted (float
+      threshold, ``in`` list, compiled regex). Expressions that fail to parse
+      compile to a predicate that always fails, as before.
+
+Caching:
+    Compiled tables are cached by contract fingerprint (SHA-256 of the
+    contract's JSON dump, minus its per-instance correlation_id), so every reducer instance loaded from the same
+    contract shares one table. The fingerprint itself is memoised per contract
+    instance; FSM subcontracts are frozen models.
+
+Thread Safety:
+    Tables are immutable after compilation and safe for concurrent use.
+
+See Also:
+    - omnibase_core.utils.util_fsm_executor: Uses compiled tables
+    - omnibase_core.utils.util_fsm_expression_parser: Expression grammar
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+if TYPE_CHECKING:
+    from typing import SupportsFloat
+
+from omnibase_core.errors.exception_groups import VALIDATION_ERRORS
+from omnibase_core.models.contracts.subcontracts.model_fsm_state_definition import (
+    ModelFSMStateDefinition,
+)
+from omnibase_core.models.contracts.subcontracts.model_fsm_state_transition import (
+    ModelFSMStateTransition,
+)
+from omnibase_core.models.contracts.subcontracts.model_fsm_subcontract import (
+    ModelFSMSubcontract,
+)
+from omnibase_core.models.errors.model_onex_error import ModelOnexError
+from omnibase_core.models.fsm.model_fsm_transition_condition import (
+    ModelFSMTransitionCondition,
+)
+from omnibase_core.types.type_fsm_context import FSMContextType
+from omnibase_core.utils.util_fsm_expression_parser import parse_expression
+from omnibase_core.utils.util_fsm_operators import evaluate_equals, evaluate_not_equals
+
+# Compiled condition: context -> condition met
+type FSMConditionPredicate = Callable[[FSMContextType], bool]
+
+# Maximum number of distinct contract fingerprints kept compiled
+MAX_COMPILED_FSMS = 256
+
+
+class _TransitionSelection(NamedTuple):
+    """Outcome of priority-ordered guard-fallthrough transition selection.
+
+    Attributes:
+        transition: The transition chosen for the (from_state, trigger) pair —
+            either the highest-priority candidate whose guard passed, or (when
+            no candidate is eligible) the highest-priority candidate whose guard
+            failed, so the caller can emit a fail-closed guard-rejection result.
+        guard_passed: True when ``transition`` is eligible to execute (its guard
+            passed, or it is an unconditional default edge). False when no
+            candidate was eligible and the FSM must stay in its current state.
+        failed_conditions: Names of the required conditions that rejected the
+            selected candidate; empty when ``guard_passed`` is True.
+    """
+
+    transition: ModelFSMStateTransition
+    guard_passed: bool
+    failed_conditions: tuple[str, ...]
+
+
+class _CompiledTransition(NamedTuple):
+    """A transition with its required conditions compiled to predicates."""
+
+    transition: ModelFSMStateTransition
+    guards: tuple[tuple[str, FSMConditionPredicate], ...]
+
+
+def _never(context: FSMContextType) -> bool:
+    return False
+
+
+def _field_getter(field_path: str) -> Callable[[FSMContextType], object]:
+    """
+    Compile a dot-notation field path into a context accessor.
+
+    The accessor returns None if any segment is missing or if any
+    intermediate value is not a dict, e.g. "user.email" on
+    ``{"user": None}``.
+    """
+    # Fast path: no dots means simple field access
+    if "." not in field_path:
+        return lambda context: context.get(field_path)
+
+    segments = tuple(field_path.split("."))
+
+    def get_nested(context: FSMContextType) -> object:
+        current: object = context
+        for segment in segments:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(segment)
+            if current is None:
+                return None
+        return current
+
+    return get_nested
+
+
+def _numeric_predicate(
+    get: Callable[[FSMContextType], object],
+    expected_value: str,
+    compare: Callable[[float, float], bool],
+) -> FSMConditionPredicate:
+    try:
+        threshold = float(expected_value or "0")
+    except VALIDATION_ERRORS:
+        # fallback-ok: a non-numeric threshold can never compare true
+        return _never
+
+    def predicate(context: FSMContextType) -> bool:
+        try:
+            # Cast to SupportsFloat - TypeError caught if not actually numeric
+            return compare(float(cast("SupportsFloat", get(context)) or 0), threshold)
+        except VALIDATION_ERRORS:
+            # fallback-ok: non-numeric values return False for numeric comparison
+            return False
+
+    return predicate
+
+
+def compile_condition(condition: ModelFSMTransitionCondition) -> FSMConditionPredicate:
+    """
+    Compile a transition condition into a predicate over the FSM context.
+
+    Args:
+        condition: Condition with a 3-token "field operator value" expression
+
+    Returns:
+        A callable returning True if the condition is met for a context.
+        Invalid expressions compile to a predicate that always returns False.
+
+    Important - Type Coercion Behavior:
+        The 'equals' and 'not_equals' operators perform STRING-BASED comparison
+        by casting both sides to str before evaluation.
+
+        Why This Design?
+        - FSM conditions are typically defined in YAML/JSON where all values are strings
+        - String coercion ensures consistent behavior regardless of value source
+        - Avoids type mismatch errors when comparing config values to runtime values
+
+        Examples:
+            10 == "10"           → True  (both become "10")
+            10 != "10"           → False (both become "10")
+            True == "True"       → True  (both become "True")
+            None == "None"       → True  (both become "None")
+            [1,2] == "[1, 2]"    → True  (both become "[1, 2]")
+
+        Impact:
+            - Type information is LOST during comparison
+            - Integer 0 is treated same as string "0"
+            - Boolean True is treated same as string "True"
+
+        Workarounds:
+            - For numeric comparison: Use 'greater_than' or 'less_than' operators
+            - For type-aware checks: Preprocess context values before FSM execution
+            - For strict equality: Add custom condition evaluator
+
+        Other Operators:
+            - '>', '<', '>=', '<=': Cast to float (preserves numeric comparison)
+            - 'in', 'not_in': Comma-separated list of expected strings
+            - 'contains', 'matches': Substring and regex match on str(value)
+            - Operators the parser accepts but the executor does not
+              implement compile to an always-false predicate (fail safe)
+    """
+    # Uses parse_expression for validation:
+    # - Ensures exactly 3 tokens (field, operator, value)
+    # - Validates operator is in SUPPORTED_OPERATORS
+    # - Security: Rejects underscore-prefixed field names
+    try:
+        field_name, operator, expected_value = parse_expression(condition.expression)
+    except ModelOnexError:
+        # Invalid expression format - fail gracefully
+        return _never
+
+    get = _field_getter(field_name)
+
+    if operator == "==" or operator == "equals":
+        # STRING-BASED COMPARISON (INTENTIONAL), see evaluate_equals
+        return lambda context: evaluate_equals(get(context), expected_value)
+    if operator == "!=" or operator == "not_equals":
+        # STRING-BASED COMPARISON (INTENTIONAL), see evaluate_not_equals
+        return lambda context: evaluate_not_equals(get(context), expected_value)
+    if operator == ">":
+        return _numeric_predicate(get, expected_value, float.__gt__)
+    if operator == "<":
+        return _numeric_predicate(get, expected_value, float.__lt__)
+    if operator == ">=":
+        return _numeric_predicate(get, expected_value, float.__ge__)
+    if operator == "<=":
+        return _numeric_predicate(get, expected_value, float.__le__)
+    if operator == "in" or operator == "not_in":
+        # Note: expected_value is always a string from parse_expression
+        expected = frozenset(v.strip() for v in expected_value.split(","))
+        if operator == "in":
+            return lambda context: str(get(context)) in expected
+        return lambda context: str(get(context)) not in expected
+    if operator == "contains":
+
+        def contains(context: FSMContextType) -> bool:
+            field_value = get(context)
+            return field_value is not None and expected_value in str(field_value)
+
+        return contains
+    if operator == "matches":
+        try:
+            pattern = re.compile(expected_value)
+        except re.error:
+            return _never
+
+        def matches(context: FSMContextType) -> bool:
+            field_value = get(context)
+            return field_value is not None and bool(pattern.match(str(field_value)))
+
+        return matches
+
+    # Unknown operator - fail safe
+    return _never
+
+
+class UtilFSMTransitionTable:
+    """
+    Compiled (state, trigger) → candidate table for one FSM subcontract.
+
+    Build with compile_fsm() or get_compiled_fsm(); tables never hold a
+    reference to the subcontract they were compiled from.
+    """
+
+    __slots__ = ("_candidates", "_states")
+
+    def __init__(self, fsm: ModelFSMSubcontract) -> None:
+        states: dict[str, ModelFSMStateDefinition] = {}
+        for state in fsm.states:
+            states.setdefault(state.state_name, state)
+        self._states = states
+
+        grouped: dict[tuple[str, str], list[ModelFSMStateTransition]] = {}
+        for transition in fsm.transitions:
+            key = (transition.from_state, transition.trigger)
+            grouped.setdefault(key, []).append(transition)
+
+        self._candidates: dict[tuple[str, str], tuple[_CompiledTransition, ...]] = {
+            # sorted() is stable, so equal priorities keep declaration order
+            key: tuple(
+                _CompiledTransition(
+                    transition,
+                    tuple(
+                        (condition.condition_name, compile_condition(condition))
+                        for condition in transition.conditions or ()
+                        if condition.required
+                    ),
+                )
+                for transition in sorted(
+                    transitions, key=lambda t: t.priority, reverse=True
+                )
+            )
+            for key, transitions in grouped.items()
+        }
+
+    def state(self, state_name: str) -> ModelFSMStateDefinition | None:
+        """Return the state definition for ``state_name``, or None."""
+        return self._states.get(state_name)
+
+    def candidates(
+        self, from_state: str, trigger: str
+    ) -> tuple[ModelFSMStateTransition, ...]:
+        """Return the priority-ordered candidates for ``(from_state, trigger)``."""
+        compiled = self._candidates.get((from_state, trigger)) or self._candidates.get(
+            ("*", trigger), ()
+        )
+        return tuple(candidate.transition for candidate in compiled)
+
+    def select(
+        self, from_state: str, trigger: str, context: FSMContextType
+    ) -> _TransitionSelection | None:
+        """
+        Select the transition to execute using priority-ordered guard fallthrough.
+
+        Implements the documented ``ModelFSMStateTransition.priority`` semantics
+        (see the model's "Priority Resolution" docstring):
+
+        1. Candidate set: transitions whose ``(from_state, trigger)`` match
+           exactly. Only when there is no exact match does the wildcard set
+           (``from_state == "*"``) apply.
+        2. Candidates are evaluated in ``priority`` DESCENDING order;
+           declaration order is the stable tiebreak within equal priority.
+        3. The first candidate whose required conditions all pass is selected.
+           A transition with no required conditions is a trivially-passing
+           "default edge".
+        4. Fail-closed: if no candidate's guard passes, the highest-priority
+           candidate is returned with ``guard_passed=False``.
+
+        Returns:
+            A ``_TransitionSelection``, or ``None`` when ``(from_state,
+            trigger)`` matches no transition at all.
+        """
+        compiled = self._candidates.get((from_state, trigger)) or self._candidates.get(
+            ("*", trigger)
+        )
+        if not compiled:
+            return None
+
+        first_rejection: _TransitionSelection | None = None
+        for transition, guards in compiled:
+            failed = tuple(name for name, predicate in guards if not predicate(context))
+            if not failed:
+                return _TransitionSelection(transition, True, ())
+            if first_rejection is None:
+                first_rejection = _TransitionSelection(transition, False, failed)
+
+        # Every candidate failed its guard; fail closed on the highest-priority one
+        return first_rejection
+
+
+def compile_fsm(fsm: ModelFSMSubcontract) -> UtilFSMTransitionTable:
+    """
+    Compile an FSM subcontract into a transition table (uncached).
+
+    Args:
+        fsm: FSM subcontract definition
+
+    Returns:
+        A new UtilFSMTransitionTable
+    """
+    return UtilFSMTransitionTable(fsm)
+
+
+def fsm_fingerprint(fsm: ModelFSMSubcontract) -> str:
+    """
+    Return the SHA-256 content fingerprint of an FSM subcontract.
+
+    ``correlation_id`` is excluded: it identifies an FSM instance, not its
+    definition, and is read from the subcontract at execution time.
+    """
+    payload = fsm.model_dump_json(exclude={"correlation_id"}, fallback=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Tables by contract fingerprint (LRU), plus a per-instance memo so the
+# fingerprint is computed once per contract object. weakref.finalize evicts the
+# memo entry when the contract is collected, before its id can be reused.
+_tables: OrderedDict[str, UtilFSMTransitionTable] = OrderedDict()
+_tables_by_instance: dict[int, UtilFSMTransitionTable] = {}
+_tables_lock = Lock()
+
+
+def get_compiled_fsm(fsm: ModelFSMSubcontract) -> UtilFSMTransitionTable:
+    """
+    Return the shared compiled transition table for an FSM subcontract.
+
+    Contracts with identical content share one table, whichever instance they
+    were loaded into.
+
+    Args:
+        fsm: FSM subcontract definition
+
+    Returns:
+        The cached UtilFSMTransitionTable for the contract's fingerprint
+    """
+    key = id(fsm)
+    table = _tables_by_instance.get(key)
+    if table is not None:
+        return table
+
+    fingerprint = fsm_fingerprint(fsm)
+    with _tables_lock:
+        table = _tables_by_instance.get(key)
+        if table is not None:
+            return table
+        table = _tables.get(fingerprint)
+        if table is None:
+            table = compile_fsm(fsm)
+            _tables[fingerprint] = table
+            if len(_tables) > MAX_COMPILED_FSMS:
+                _tables.popitem(last=False)
+        else:
+            _tables.move_to_end(fingerprint)
+        _tables_by_instance[key] = table
+        weakref.finalize(fsm, _tables_by_instance.pop, key, None)
+    return table
+
+
+def clear_compiled_fsm_cache() -> None:
+    """Drop all cached transition tables (for tests and contract reloads)."""
+    with _tables_lock:
+        _tables.clear()
+        _tables_by_instance.clear()
+
+
+__all__ = [
+    "MAX_COMPILED_FSMS",
+    "FSMConditionPredicate",
+    "UtilFSMTransitionTable",
+    "clear_compiled_fsm_cache",
+    "compile_condition",
+    "compile_fsm",
+    "fsm_fingerprint",
+    "get_compiled_fsm",
+]
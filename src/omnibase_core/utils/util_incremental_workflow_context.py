@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Append-only workflow context with O(1) per-wave snapshots.
+
+The declarative workflow executor hands every step (sequential mode) or wave
+(parallel mode) a TypedDictWorkflowContext holding the completed step IDs and
+their outputs. Rebuilding that context from scratch each time re-stringifies
+every UUID and copies every prior output, which is O(steps^2) over a workflow.
+
+UtilIncrementalWorkflowContext instead records each completed step once:
+the UUID is stringified on record, and the key and output are appended to
+shared lists. snapshot() returns a context whose ``completed_steps`` and
+``step_outputs`` are read-only views over the first N recorded entries.
+Later records never change an existing snapshot, so no copy is needed.
+
+Ordering:
+    Views iterate in record (completion) order, which is deterministic. The
+    previous rebuild iterated a set, so its order was arbitrary.
+
+Thread Safety:
+    Not thread-safe for concurrent record() calls. Snapshots can be read from
+    any thread while the owner keeps recording.
+
+Example:
+    >>> from uuid import uuid4
+    >>> ctx = UtilIncrementalWorkflowContext(uuid4())
+    >>> step_id = uuid4()
+    >>> ctx.record(step_id, {"rows": 3})
+    >>> before = ctx.snapshot()
+    >>> ctx.record(uuid4(), {"rows": 5})
+    >>> before["step_count"], len(ctx.snapshot()["step_outputs"])
+    (1, 2)
+    >>> before["step_outputs"][str(step_id)]
+    {'rows': 3}
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import islice
+from typing import overload
+from uuid import UUID
+
+from omnibase_core.types.typed_dict_workflow_context import TypedDictWorkflowContext
+
+__all__ = ["UtilIncrementalWorkflowContext"]
+
+# Sentinel for record() calls that satisfy a dependency without an output
+# (disabled or skip_on_failure steps).
+_NO_OUTPUT = object()
+
+
+class _PrefixSequenceView(Sequence[str]):
+    """Read-only view of the first ``length`` items of an append-only list."""
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: list[str], length: int) -> None:
+        self._items = items
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("completed_steps index out of range")
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(self._items, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == self._length and all(
+                a == b for a, b in zip(self, other, strict=False)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _PrefixMappingView(Mapping[str, object]):
+    """Read-only view of the first ``length`` entries of an append-only map."""
+
+    __slots__ = ("_keys", "_length", "_positions", "_values")
+
+    def __init__(
+        self,
+        keys: list[str],
+        values: list[object],
+        positions: dict[str, int],
+        length: int,
+    ) -> None:
+        self._keys = keys
+        self._values = values
+        self._positions = positions
+        self._length = length
+
+    def __getitem__(self, key: str) -> object:
+        position = self._positions.get(key)
+        if position is None or position >= self._length:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(self._keys, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class UtilIncrementalWorkflowContext:
+    """
+    Incrementally built workflow context for declarative workflow execution.
+
+    Attributes:
+        workflow_uuid_str: The workflow ID, stringified once.
+    """
+
+    __slots__ = (
+        "_completed",
+        "_output_keys",
+        "_output_positions",
+        "_output_values",
+        "_seen",
+        "workflow_uuid_str",
+    )
+
+    def __init__(self, workflow_id: UUID) -> None:
+        self.workflow_uuid_str = str(workflow_id)
+        self._seen: set[UUID] = set()
+        self._completed: list[str] = []
+        self._output_keys: list[str] = []
+        self._output_values: list[object] = []
+        self._output_positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def __contains__(self, step_id: object) -> bool:
+        return step_id in self._seen
+
+    def record(self, step_id: UUID, output: object = _NO_OUTPUT) -> None:
+        """
+        Record a step as completed, optionally with its output.
+
+        Recording is write-once: recording an already-recorded step is a no-op,
+        so existing snapshots can never observe a changed output.
+
+        Args:
+            step_id: The completed (or dependency-satisfying skipped) step.
+            output: The step output. Omit for steps that produce none.
+        """
+        if step_id in self._seen:
+            return
+        self._seen.add(step_id)
+        key = str(step_id)
+        self._completed.append(key)
+        if output is not _NO_OUTPUT:
+            self._output_positions[key] = len(self._output_keys)
+            self._output_keys.append(key)
+            self._output_values.append(output)
+
+    def snapshot(self) -> TypedDictWorkflowContext:
+        """
+        Return the context as of now, in O(1).
+
+        Returns:
+            TypedDictWorkflowContext whose completed_steps and step_outputs are
+            read-only views that later record() calls do not affect.
+        """
+        return TypedDictWorkflowContext(
+            workflow_uuid_str=self.workflow_uuid_str,
+            completed_steps=_PrefixSequenceView(self._completed, len(self._completed)),
+            step_outputs=_PrefixMappingView(
+                self._output_keys,
+                self._output_values,
+                self._output_positions,
+                len(self._output_keys),
+            ),
+            step_count=len(self._completed),
+        )
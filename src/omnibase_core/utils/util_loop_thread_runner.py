@@ -0,0 +1,299 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Long-lived background event loop for running coroutines from sync code.
+
+run_coro_sync() used to create a ThreadPoolExecutor and a fresh event loop
+for every call made while a loop was already running, which is the common
+case during handler ``__init__`` auto-wiring. UtilLoopThreadRunner keeps one
+daemon thread running one event loop and submits coroutines to it:
+
+    runner = get_default_loop_runner()
+    value = runner.run(fetch())
+    values = runner.run_batch([fetch(a), fetch(b)])
+
+Behavior:
+    - The loop thread starts lazily on first submission and restarts after
+      shutdown() or a fork.
+    - Coroutines run in a copy of the submitting thread's contextvars
+      context, so context-scoped state (e.g. the current container) is
+      visible to them.
+    - run() from the runner's own loop thread would deadlock; callers on that
+      thread must use run_coro_sync(), which falls back to a worker thread.
+    - The default runner is shut down at interpreter exit.
+
+Thread Safety:
+    All methods are safe to call from any thread.
+
+See Also:
+    - omnibase_core.utils.util_run_coro_sync: Uses the default runner
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Coroutine, Iterable
+from typing import Any
+
+from omnibase_core.types.typed_dict_loop_runner_metrics import (
+    TypedDictLoopRunnerMetrics,
+)
+
+
+class UtilLoopThreadRunner:
+    """
+    A daemon thread running one asyncio event loop for sync callers.
+
+    Args:
+        name: Thread name, for debugging and thread dumps
+    """
+
+    def __init__(self, name: str = "onex-loop-runner") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._loop_starts = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread is alive."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def in_runner_thread(self) -> bool:
+        """Whether the calling thread is this runner's loop thread."""
+        return self._thread is threading.current_thread()
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """
+        Schedule a coroutine on the loop and return a future for its result.
+
+        Args:
+            coro: Coroutine to run; it is awaited exactly once
+
+        Returns:
+            A concurrent.futures.Future; cancelling it cancels the coroutine
+        """
+        loop = self._ensure_started()
+        context = contextvars.copy_context()
+        with self._lock:
+            self._submitted += 1
+        future = asyncio.run_coroutine_threadsafe(
+            self._instrumented(coro, context, time.perf_counter()), loop
+        )
+        future.add_done_callback(self._record_done)
+        return future
+
+    def run[T](self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run; it is awaited exactly once
+            timeout: Seconds to wait before cancelling it (None waits forever)
+
+        Returns:
+            The coroutine's result; its exceptions propagate unchanged
+
+        Raises:
+            RuntimeError: If called from the runner's own loop thread
+            TimeoutError: If the coroutine does not finish within ``timeout``
+        """
+        if self.in_runner_thread():
+            coro.close()
+            raise RuntimeError(
+                f"{self.name}: run() called from the runner's own loop thread"
+            )
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def run_batch[T](
+        self,
+        coros: Iterable[Coroutine[Any, Any, T]],
+        timeout: float | None = None,
+    ) -> list[T]:
+        """
+        Run coroutines concurrently on the loop and return results in order.
+
+        All coroutines are submitted before any result is awaited. If one
+        raises, the others still run to completion and the first exception
+        (in submission order) is raised.
+
+        Args:
+            coros: Coroutines to run
+            timeout: Seconds to wait for the whole batch (None waits forever)
+
+        Returns:
+            Results in submission order
+        """
+        futures = [self.submit(coro) for coro in coros]
+        _done, not_done = concurrent.futures.wait(futures, timeout)
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            raise TimeoutError(
+                f"{self.name}: {len(not_done)} of {len(futures)} batch "
+                "coroutines did not finish in time"
+            )
+        return [future.result() for future in futures]
+
+    def get_metrics(self) -> TypedDictLoopRunnerMetrics:
+        """Return a snapshot of queue depth, throughput and wait times."""
+        with self._lock:
+            return TypedDictLoopRunnerMetrics(
+                running=self.is_running,
+                queue_depth=self._submitted - self._completed,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                avg_wait_ms=(
+                    self._total_wait / self._started * 1000 if self._started else 0.0
+                ),
+                max_wait_ms=self._max_wait * 1000,
+                loop_starts=self._loop_starts,
+            )
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Stop the loop thread, cancelling coroutines still running on it.
+
+        The runner can be used again afterwards; the next submission starts a
+        new loop thread.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to exit
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None and self.is_running:
+            return loop
+        with self._lock:
+            if self._loop is not None and self.is_running:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop, ready), name=self.name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            self._loop_starts += 1
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(
+                        asyncio.gather(*pending, return_exceptions=True)
+                    )
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+    async def _instrumented[T](
+        self,
+        coro: Coroutine[Any, Any, T],
+        context: contextvars.Context,
+        submitted_at: float,
+    ) -> T:
+        wait = time.perf_counter() - submitted_at
+        with self._lock:
+            self._started += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        # Cancelling this wrapper cancels the awaited task as well
+        return await asyncio.get_running_loop().create_task(coro, context=context)
+
+    def _record_done(self, future: concurrent.futures.Future[Any]) -> None:
+        with self._lock:
+            self._completed += 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+
+    def _reset_after_fork(self) -> None:
+        # The loop thread does not survive fork(); start a fresh one on demand
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+
+
+_default_runner: UtilLoopThreadRunner | None = None
+_default_runner_lock = threading.Lock()
+
+
+def get_default_loop_runner() -> UtilLoopThreadRunner:
+    """Return the process-wide runner, creating it on first use."""
+    global _default_runner
+    runner = _default_runner
+    if runner is None:
+        with _default_runner_lock:
+            runner = _default_runner
+            if runner is None:
+                runner = UtilLoopThreadRunner()
+                _default_runner = runner
+    return runner
+
+
+def shutdown_default_loop_runner(timeout: float = 5.0) -> None:
+    """Shut down the process-wide runner if it was started."""
+    runner = _default_runner
+    if runner is not None:
+        runner.shutdown(timeout)
+
+
+def _reset_default_runner_after_fork() -> None:
+    if _default_runner is not None:
+        _default_runner._reset_after_fork()
+
+
+atexit.register(shutdown_default_loop_runner)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_default_runner_after_fork)
+
+
+__all__ = [
+    "UtilLoopThreadRunner",
+    "get_default_loop_runner",
+    "shutdown_default_loop_runner",
+]
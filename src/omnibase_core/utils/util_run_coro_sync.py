@@ -25,6 +25,8 @@ import concurrent.futures
 from collections.abc import Coroutine
 from typing import Any
 
+from omnibase_core.utils.util_loop_thread_runner import get_default_loop_runner
+
 
 def run_coro_sync[T](coro: Coroutine[Any, Any, T]) -> T:
     """Run a coroutine to completion from sync code, safe inside a running loop.
@@ -34,14 +36,18 @@ def run_coro_sync[T](coro: Coroutine[Any, Any, T]) -> T:
 
     When no event loop is running in the calling thread, the coroutine is
     executed via ``asyncio.run()`` -- the cheap path. When a loop IS running,
-    the coroutine is dispatched to a short-lived worker thread with its own
-    event loop via ``concurrent.futures.ThreadPoolExecutor(max_workers=1)``,
-    and the calling thread blocks on the resulting future's ``.result()``
-    until the coroutine completes. This is O(thread-spawn); callers that can
-    await directly should prefer the async equivalent.
+    the coroutine is submitted to the process-wide background loop thread
+    (``get_default_loop_runner()``) and the calling thread blocks until it
+    completes. The loop thread is started once and reused, so repeated calls
+    do not pay for a thread and event loop each. Callers that can await
+    directly should still prefer the async equivalent.
+
+    A call made from the background loop thread itself (a coroutine running
+    there that re-enters sync code) cannot block on its own loop; it falls
+    back to a short-lived worker thread with its own event loop.
 
     Exceptions raised inside ``coro`` propagate unchanged to the caller along
-    either path.
+    every path.
 
     Args:
         coro: A coroutine object (i.e. ``some_async_fn(...)``). The coroutine
@@ -56,6 +62,11 @@ def run_coro_sync[T](coro: Coroutine[Any, Any, T]) -> T:
         # No running loop -- cheap path.
         return asyncio.run(coro)
 
-    # Running loop detected -- dispatch to a worker thread with its own loop.
+    # Running loop detected -- hand off to the persistent loop thread.
+    runner = get_default_loop_runner()
+    if not runner.in_runner_thread():
+        return runner.run(coro)
+
+    # Re-entered from the runner's own loop: blocking on it would deadlock.
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
         return executor.submit(asyncio.run, coro).result()
@@ -99,6 +99,7 @@ import heapq
 import json
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Literal, cast
 from uuid import UUID, uuid4
@@ -136,6 +137,9 @@ from omnibase_core.models.workflow.execution.model_workflow_result_metadata impo
     ModelWorkflowResultMetadata,
 )
 from omnibase_core.types.typed_dict_workflow_context import TypedDictWorkflowContext
+from omnibase_core.utils.util_incremental_workflow_context import (
+    UtilIncrementalWorkflowContext,
+)
 from omnibase_core.validation.validator_reserved_enum import validate_execution_mode
 
 # Note: MAX_WORKFLOW_STEPS, MAX_STEP_PAYLOAD_SIZE_BYTES, MAX_TOTAL_PAYLOAD_SIZE_BYTES
@@ -145,6 +149,15 @@ from omnibase_core.validation.validator_reserved_enum import validate_execution_
 # Module logger for workflow executor operations
 logger = logging.getLogger(__name__)
 
+# Opt-in hook awaited once per step (parallel mode) after its action is created,
+# e.g. to dispatch the action to an I/O-bound target. Raising fails the step.
+type WorkflowStepExecutor = Callable[
+    [ModelWorkflowStep, ModelAction, TypedDictWorkflowContext], Awaitable[None]
+]
+
+# (step, action | None, payload_size, error | None) - see _execute_parallel.execute_step
+type _StepResult = tuple[ModelWorkflowStep, ModelAction | None, int, Exception | None]
+
 
 def _log_payload_metrics(
     workflow_id: UUID,
@@ -231,6 +244,9 @@ async def execute_workflow(
     workflow_steps: list[ModelWorkflowStep],
     workflow_id: UUID,
     execution_mode: EnumExecutionMode | None = None,
+    *,
+    max_concurrent_steps: int | None = None,
+    step_executor: WorkflowStepExecutor | None = None,
 ) -> WorkflowExecutionResult:
     """
     Execute workflow declaratively from YAML contract.
@@ -250,12 +266,18 @@ async def execute_workflow(
         workflow_steps: List of workflow steps to execute (uses depends_on for ordering)
         workflow_id: Unique workflow execution ID
         execution_mode: Optional execution mode override
+        max_concurrent_steps: Parallel mode only. When set, the steps of each wave
+            run concurrently, at most this many at once (one semaphore per
+            workflow). None keeps the v1.0 one-after-another wave execution.
+        step_executor: Parallel mode only. Awaited per step with its action and
+            wave context (e.g. to dispatch I/O); raising fails the step.
 
     Returns:
         WorkflowExecutionResult with emitted actions
 
     Raises:
-        ModelOnexError: If workflow execution fails
+        ModelOnexError: If workflow execution fails, or if max_concurrent_steps /
+            step_executor are given for a non-parallel execution mode
 
     Example:
         Execute a data processing workflow::
@@ -371,6 +393,27 @@ async def execute_workflow(
     # Validate execution mode (reject reserved modes per v1.0 contract)
     validate_execution_mode(mode)
 
+    if (
+        max_concurrent_steps is not None or step_executor is not None
+    ) and mode != EnumExecutionMode.PARALLEL:
+        raise ModelOnexError(
+            error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            message=(
+                "max_concurrent_steps and step_executor apply to parallel execution "
+                f"mode only, got execution mode '{mode.value}'"
+            ),
+            context={"workflow_id": str(workflow_id), "execution_mode": mode.value},
+        )
+    if max_concurrent_steps is not None and max_concurrent_steps < 1:
+        raise ModelOnexError(
+            error_code=EnumCoreErrorCode.VALIDATION_ERROR,
+            message=(
+                "max_concurrent_steps must be a positive integer, "
+                f"got {max_concurrent_steps}"
+            ),
+            context={"workflow_id": str(workflow_id)},
+        )
+
     # Execute based on mode (pass timeout_deadline for Fix 35)
     if mode == EnumExecutionMode.SEQUENTIAL:
         result = await _execute_sequential(
@@ -378,7 +421,12 @@ async def execute_workflow(
         )
     elif mode == EnumExecutionMode.PARALLEL:
         result = await _execute_parallel(
-            workflow_definition, workflow_steps, workflow_id, timeout_deadline
+            workflow_definition,
+            workflow_steps,
+            workflow_id,
+            timeout_deadline,
+            max_concurrent_steps=max_concurrent_steps,
+            step_executor=step_executor,
         )
     elif mode == EnumExecutionMode.BATCH:
         result = await _execute_batch(
@@ -710,7 +758,8 @@ async def _execute_sequential(
     skipped_steps: list[str] = []  # v1.0.1 Fix 17: Track disabled steps
     all_actions: list[ModelAction] = []
     completed_step_ids: set[UUID] = set()
-    step_outputs: dict[UUID, object] = {}
+    # Completed steps and outputs, recorded once; snapshots are O(1) views
+    context_builder = UtilIncrementalWorkflowContext(workflow_id)
     total_payload_size = 0  # Track total payload size (OMN-670: Security hardening)
 
     # v1.0.3 Fix 35: Track timeout state
@@ -757,6 +806,7 @@ async def _execute_sequential(
         if not step.enabled:
             skipped_steps.append(str(step.step_id))
             completed_step_ids.add(step.step_id)  # v1.0.2 Fix 10: Satisfy dependencies
+            context_builder.record(step.step_id)
             continue
 
         # v1.0.1 Fix 19: Dependency Failure Semantics (Normative)
@@ -777,13 +827,12 @@ async def _execute_sequential(
         if step.skip_on_failure and failed_steps:
             skipped_steps.append(str(step.step_id))
             completed_step_ids.add(step.step_id)  # Mark as satisfied for downstream
+            context_builder.record(step.step_id)
             continue
 
         try:
-            # Build workflow context from prior step outputs for data flow
-            workflow_context = _build_workflow_context(
-                workflow_id, completed_step_ids, step_outputs
-            )
+            # Snapshot workflow context from prior step outputs for data flow
+            workflow_context = context_builder.snapshot()
 
             # Create context with workflow context for inter-step data access
             context = WorkflowStepExecutionContext(
@@ -827,7 +876,7 @@ async def _execute_sequential(
 
             # Store step output for subsequent steps (action payload serves as output)
             # v1.0.4 Fix 47: step_outputs MUST be JSON-serializable (validated in _create_action_for_step)
-            step_outputs[step.step_id] = action.payload
+            context_builder.record(step.step_id, action.payload)
 
         except ModelOnexError as e:
             # Handle expected ONEX errors
@@ -913,21 +962,26 @@ async def _execute_parallel(
     workflow_steps: list[ModelWorkflowStep],
     workflow_id: UUID,
     timeout_deadline: float,
+    *,
+    max_concurrent_steps: int | None = None,
+    step_executor: WorkflowStepExecutor | None = None,
 ) -> WorkflowExecutionResult:
     """
     Execute workflow steps in parallel mode (wave-based ordering).
 
     v1.0.5 Fix 57 - Synchronous Execution in v1.0:
-        While this function uses async signature for API compatibility, v1.0
-        execution is SYNCHRONOUS within the async context. Steps are organized
-        into waves based on dependencies, but within each wave they execute
-        SEQUENTIALLY (not concurrently). Actual parallel concurrency is deferred
-        to omnibase_infra in future versions.
-
-        The "parallel" in this function name refers to the LOGICAL wave structure
-        (steps in the same wave COULD run in parallel), not actual concurrent
-        execution. This design allows seamless upgrade to true parallelism in
-        v1.1+ without API changes.
+        By default, steps are organized into waves based on dependencies, but
+        within each wave they execute SEQUENTIALLY (not concurrently). The
+        "parallel" in this function name then refers to the LOGICAL wave
+        structure (steps in the same wave COULD run in parallel).
+
+    Concurrent Waves (opt-in, ``max_concurrent_steps``):
+        The steps of a wave run concurrently, bounded by one semaphore for the
+        whole workflow and started in YAML declaration order. Results are
+        reordered into declaration order once the wave finishes, so action
+        emission order (Fix 11), wave boundaries (Fix 18) and stop-on-error
+        (Fix 22) are exactly those of the sequential wave. Steps still running
+        when the global timeout elapses are cancelled and marked failed (Fix 35).
 
     Steps are executed in waves based on dependency order. Steps in the same wave
     cannot see each other's outputs, but can access outputs from prior waves via
@@ -938,6 +992,8 @@ async def _execute_parallel(
         workflow_steps: List of workflow steps to execute.
         workflow_id: Unique workflow execution ID.
         timeout_deadline: Unix timestamp (perf_counter) when global timeout elapses.
+        max_concurrent_steps: Concurrent-wave bound; None runs waves sequentially.
+        step_executor: Optional hook awaited per step after action creation.
 
     Returns:
         WorkflowExecutionResult with completed/failed steps and emitted actions.
@@ -960,7 +1016,8 @@ async def _execute_parallel(
     skipped_steps: list[str] = []  # v1.0.1 Fix 17: Track disabled steps
     all_actions: list[ModelAction] = []
     completed_step_ids: set[UUID] = set()
-    step_outputs: dict[UUID, object] = {}
+    # Completed steps and outputs, recorded once; snapshots are O(1) views
+    context_builder = UtilIncrementalWorkflowContext(workflow_id)
     should_stop = False
     total_payload_size = 0  # Track total payload size (OMN-670: Security hardening)
 
@@ -993,9 +1050,9 @@ async def _execute_parallel(
         exceptions, allowing the caller to process results uniformly.
 
         v1.0.5 Note:
-            Steps are executed sequentially within each wave (not concurrently).
-            The tuple return pattern is maintained for API stability and future
-            compatibility when true parallelism is introduced in v1.1+.
+            Steps are executed sequentially within each wave unless
+            max_concurrent_steps is set. The tuple return pattern lets concurrent
+            results be collected and then processed in declaration order.
 
         Args:
             step: The workflow step to execute, containing step metadata,
@@ -1034,6 +1091,8 @@ async def _execute_parallel(
             # Create action for this step (returns tuple with payload size to avoid
             # redundant JSON serialization - OMN-670: Performance optimization)
             action, payload_size = _create_action_for_step(step, workflow_id)
+            if step_executor is not None:
+                await step_executor(step, action, wave_context)
             return (step, action, payload_size, None)
         except asyncio.CancelledError:
             # Cancellation must propagate - do not convert to failed step
@@ -1043,6 +1102,13 @@ async def _execute_parallel(
             # Uses Exception (not BaseException) to allow KeyboardInterrupt/SystemExit to propagate
             return (step, None, 0, e)
 
+    # One bound for the whole workflow, shared by every concurrent wave.
+    semaphore = (
+        asyncio.Semaphore(max_concurrent_steps)
+        if max_concurrent_steps is not None
+        else None
+    )
+
     # For parallel execution, we execute in waves based on dependencies
     # v1.0.1 Fix 17: Track disabled steps in skipped_steps, not failed_steps
     remaining_steps = []
@@ -1052,6 +1118,7 @@ async def _execute_parallel(
         else:
             skipped_steps.append(str(step.step_id))
             completed_step_ids.add(step.step_id)  # v1.0.2 Fix 10: Satisfy dependencies
+            context_builder.record(step.step_id)
 
     while remaining_steps and not should_stop:
         # v1.0.3 Fix 35: Check global timeout before processing each wave
@@ -1086,6 +1153,7 @@ async def _execute_parallel(
         for step in skip_on_failure_steps:
             skipped_steps.append(str(step.step_id))
             completed_step_ids.add(step.step_id)  # Mark as satisfied for downstream
+            context_builder.record(step.step_id)
             remaining_steps.remove(step)
         if not ready_steps:
             # v1.0.1 Fix 19: Dependency Failure Semantics (Normative)
@@ -1097,31 +1165,35 @@ async def _execute_parallel(
                 failed_steps.append(str(step.step_id))
             break
 
-        # Build workflow context for this wave from prior wave outputs
-        # Steps in the same wave cannot see each other's outputs (logically parallel,
-        # executed sequentially in v1.0 per Fix 57)
-        wave_context = _build_workflow_context(
-            workflow_id, completed_step_ids, step_outputs
-        )
-
-        # v1.0.5 Fix 57: Execute steps SEQUENTIALLY within each wave
-        # Parallel waves are represented logically as metadata only.
-        # Actual concurrency is deferred to omnibase_infra in future versions.
-        # The wave structure ensures correct dependency ordering while keeping
-        # v1.0 execution simple and deterministic.
-        results: list[
-            tuple[ModelWorkflowStep, ModelAction | None, int, Exception | None]
-        ] = []
-        for step in ready_steps:
-            result = await execute_step(step, wave_context)
-            results.append(result)
+        # Snapshot workflow context for this wave from prior wave outputs
+        # Steps in the same wave cannot see each other's outputs (logically parallel);
+        # records made while processing this wave do not show through the snapshot
+        wave_context = context_builder.snapshot()
+
+        # v1.0.5 Fix 57: By default execute steps SEQUENTIALLY within each wave.
+        # With max_concurrent_steps the wave runs concurrently; either way the
+        # results list is in declaration order, so processing below is identical.
+        results: list[_StepResult]
+        if semaphore is not None and len(ready_steps) > 1:
+            results = await _run_wave_concurrently(
+                ready_steps, wave_context, execute_step, semaphore, timeout_deadline
+            )
+        else:
+            results = []
+            for step in ready_steps:
+                result = await execute_step(step, wave_context)
+                results.append(result)
+                # Fix 22: later wave members are skipped; do not execute them
+                if _stops_wave(result):
+                    break
 
         # v1.0.3 Fix 22: Partial Parallel-Wave Failure
         # Track if a "stop" was triggered within this wave. When triggered, remaining
         # steps in the wave are skipped (not added to completed/failed).
         wave_stop_triggered = False
 
-        # Process results from sequential wave execution (Fix 57)
+        # Process results in declaration order (Fix 11 / Fix 57). Results end
+        # at the first stop-on-error failure; later wave members never ran.
         for step, action, action_payload_size, error in results:
             # v1.0.3 Fix 22: Skip remaining steps in wave if "stop" was triggered
             if wave_stop_triggered:
@@ -1167,7 +1239,7 @@ async def _execute_parallel(
                 completed_step_ids.add(step.step_id)
                 # Store step output for subsequent waves (action payload serves as output)
                 # v1.0.4 Fix 47: step_outputs MUST be JSON-serializable
-                step_outputs[step.step_id] = action.payload
+                context_builder.record(step.step_id, action.payload)
             else:
                 # Step failed
                 failed_steps.append(str(step.step_id))
@@ -1239,6 +1311,86 @@ async def _execute_parallel(
     )
 
 
+async def _run_wave_concurrently(
+    ready_steps: list[ModelWorkflowStep],
+    wave_context: TypedDictWorkflowContext,
+    execute_step: Callable[
+        [ModelWorkflowStep, TypedDictWorkflowContext], Awaitable[_StepResult]
+    ],
+    semaphore: asyncio.Semaphore,
+    timeout_deadline: float,
+) -> list[_StepResult]:
+    """
+    Run one wave's steps concurrently; return results in declaration order.
+
+    Tasks are created in declaration order, so steps acquire the semaphore in
+    that order. Steps still pending at the global deadline are cancelled and
+    reported as failed with ORCHESTRATOR_EXEC_WORKFLOW_TIMEOUT (Fix 35).
+
+    Once a step fails with error_action="stop", steps declared after it that
+    have not started yet are not executed (Fix 22 skips them), and the results
+    end at the earliest such failure.
+    """
+    # Declaration index of the earliest stop-on-error failure so far
+    stop_index = len(ready_steps)
+
+    async def bounded(index: int, step: ModelWorkflowStep) -> _StepResult | None:
+        nonlocal stop_index
+        async with semaphore:
+            if index > stop_index:
+                return None
+            result = await execute_step(step, wave_context)
+        if _stops_wave(result):
+            stop_index = min(stop_index, index)
+        return result
+
+    tasks = [
+        asyncio.create_task(bounded(index, step))
+        for index, step in enumerate(ready_steps)
+    ]
+    try:
+        _, pending = await asyncio.wait(
+            tasks, timeout=max(timeout_deadline - time.perf_counter(), 0.0)
+        )
+    except BaseException:
+        # Our caller was cancelled: never leave wave tasks running behind it.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: list[_StepResult] = []
+    for index, (step, task) in enumerate(zip(ready_steps, tasks, strict=True)):
+        if index > stop_index:
+            break
+        if task in pending:
+            timeout_error = ModelOnexError(
+                error_code=EnumCoreErrorCode.ORCHESTRATOR_EXEC_WORKFLOW_TIMEOUT,
+                message=(
+                    f"Step '{step.step_name}' was still running when the workflow "
+                    "global timeout elapsed"
+                ),
+                context={"step_id": str(step.step_id)},
+            )
+            results.append((step, None, 0, timeout_error))
+        else:
+            result = task.result()
+            if result is None:  # not executed: declared after stop_index
+                break
+            results.append(result)
+    return results
+
+
+def _stops_wave(result: _StepResult) -> bool:
+    """Whether a step result is a failure that stops the wave (Fix 22)."""
+    step, action, _, error = result
+    return (error is not None or action is None) and step.error_action == "stop"
+
+
 async def _execute_batch(
     workflow_definition: ModelWorkflowDefinition,
     workflow_steps: list[ModelWorkflowStep],
@@ -1291,8 +1443,9 @@ def _build_workflow_context(
     Build workflow execution context for subsequent steps.
 
     Aggregates outputs from completed steps and provides workflow-level
-    metadata for step execution context. This context is passed to steps
-    during sequential/parallel execution to enable data flow between steps.
+    metadata for step execution context. This is a one-shot O(n) build; the
+    executors use UtilIncrementalWorkflowContext instead, which records each
+    step once and snapshots in O(1).
 
     Args:
         workflow_id: Unique workflow execution ID
@@ -100,6 +100,8 @@ class UnionUsageChecker(ast.NodeVisitor):
         self.file_path = file_path
         self.union_patterns: list[ModelUnionPattern] = []
         self._in_union_binop = False  # Track if we're inside a union BinOp chain
+        # BitOr nodes inside a counted union; skipped however the tree is walked
+        self._nested_union_binops: set[ast.BinOp] = set()
 
         # Track problematic patterns
         self.complex_unions: list[ModelUnionPattern] = []
@@ -244,12 +246,14 @@ class UnionUsageChecker(ast.NodeVisitor):
 
         Note:
             Uses _in_union_binop flag to prevent double-counting nested unions
-            like (str | int) | bool.
+            like (str | int) | bool. The BitOr nodes below a counted union are
+            also remembered, so single-pass walks that visit children after
+            this method returns (see validator_ast_engine) skip them too.
         """
         if isinstance(node.op, ast.BitOr):
             # Skip if we're already inside a union BinOp chain
             # This prevents double-counting nested unions like (str | int) | bool
-            if self._in_union_binop:
+            if self._in_union_binop or node in self._nested_union_binops:
                 return
 
             # Modern union syntax: str | int | float
@@ -266,6 +270,14 @@ class UnionUsageChecker(ast.NodeVisitor):
                 # Analyze the pattern
                 self._analyze_union_pattern(union_pattern)
 
+            self._nested_union_binops.update(
+                child
+                for child in ast.walk(node)
+                if child is not node
+                and isinstance(child, ast.BinOp)
+                and isinstance(child.op, ast.BitOr)
+            )
+
             # Mark that we're inside a union BinOp chain and visit children
             # This ensures we still visit Subscript nodes and other structures
             # but skip nested BinOp unions that are part of the same chain
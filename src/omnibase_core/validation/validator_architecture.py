@@ -61,7 +61,12 @@ from omnibase_core.models.contracts.subcontracts.model_validator_subcontract imp
     ModelValidatorSubcontract,
 )
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
+from omnibase_core.validation.validator_ast_engine import (
+    ValidationAstPass,
+    run_ast_passes,
+)
 from omnibase_core.validation.validator_base import ValidatorBase
+from omnibase_core.validation.validator_source_cache import get_validator_source_cache
 from omnibase_core.validation.validator_utils import ModelValidationResult
 
 # Configure logger for this module
@@ -601,108 +606,108 @@ class ValidatorArchitecture(ValidatorBase):
 # Legacy API functions
 
 
-def validate_one_model_per_file(file_path: Path) -> list[str]:
-    """Validate a single Python file for one-model-per-file compliance.
-
-    Note: For new code, consider using ValidatorArchitecture.validate_file() instead.
-
-    Args:
-        file_path: Path to the Python file to validate.
-
-    Returns:
-        List of error message strings (empty if valid).
-    """
+def _model_counter_errors(counter: ModelCounter) -> list[str]:
+    """Return the one-model-per-file violations recorded by ``counter``."""
     errors: list[str] = []
 
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+    # Check for multiple models
+    if len(counter.models) > 1:
+        errors.append(
+            f"{len(counter.models)} models in one file: {', '.join(counter.models)}"
+        )
 
-        tree = ast.parse(content)
-        counter = ModelCounter()
-        counter.visit(tree)
+    # Check for multiple enums
+    if len(counter.enums) > 1:
+        errors.append(
+            f"{len(counter.enums)} enums in one file: {', '.join(counter.enums)}"
+        )
 
-        # Check for multiple models
-        if len(counter.models) > 1:
-            errors.append(
-                f"{len(counter.models)} models in one file: {', '.join(counter.models)}"
-            )
+    # Check for multiple protocols
+    if len(counter.protocols) > 1:
+        errors.append(
+            f"{len(counter.protocols)} protocols in one file: {', '.join(counter.protocols)}"
+        )
 
-        # Check for multiple enums
-        if len(counter.enums) > 1:
-            errors.append(
-                f"{len(counter.enums)} enums in one file: {', '.join(counter.enums)}"
-            )
+    # Check for mixed types (models + enums + protocols)
+    type_categories = []
+    if counter.models:
+        type_categories.append("models")
+    if counter.enums:
+        type_categories.append("enums")
+    if counter.protocols:
+        type_categories.append("protocols")
 
-        # Check for multiple protocols
-        if len(counter.protocols) > 1:
-            errors.append(
-                f"{len(counter.protocols)} protocols in one file: {', '.join(counter.protocols)}"
-            )
+    if len(type_categories) > 1:
+        errors.append(f"Mixed types in one file: {', '.join(type_categories)}")
+
+    return errors
 
-        # Check for mixed types (models + enums + protocols)
-        type_categories = []
-        if counter.models:
-            type_categories.append("models")
-        if counter.enums:
-            type_categories.append("enums")
-        if counter.protocols:
-            type_categories.append("protocols")
 
-        if len(type_categories) > 1:
-            errors.append(f"Mixed types in one file: {', '.join(type_categories)}")
+def _file_error_message(file_path: Path, error: Exception) -> str:
+    """Log and describe a failure to read, parse or check ``file_path``.
 
-    except SyntaxError as e:
+    Raises:
+        Exception: ``error`` itself when it is not a file or parse failure.
+    """
+    if isinstance(error, SyntaxError):
+        # Reported as ast.parse(content) reports it, without a filename
+        error = SyntaxError(
+            error.msg,
+            (
+                "<unknown>",
+                error.lineno,
+                error.offset,
+                error.text,
+                error.end_lineno,
+                error.end_offset,
+            ),
+        )
         # Wrap in ModelOnexError for consistent error handling
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.CONFIGURATION_PARSE_ERROR,
-            message=f"Syntax error in {file_path}: {e}",
+            message=f"Syntax error in {file_path}: {error}",
             context={
                 "file_path": str(file_path),
-                "exception_type": type(e).__name__,
-                "line_number": str(e.lineno) if e.lineno else "unknown",
-                "offset": str(e.offset) if e.offset else "unknown",
+                "exception_type": type(error).__name__,
+                "line_number": str(error.lineno) if error.lineno else "unknown",
+                "offset": str(error.offset) if error.offset else "unknown",
             },
         )
-        logger.exception(f"Syntax error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-    except (UnicodeDecodeError, ValueError) as e:
+        logger.error(f"Syntax error: {wrapped_error.message}", exc_info=error)
+    elif isinstance(error, (UnicodeDecodeError, ValueError)):
         # Handle content parsing errors: invalid source content, encoding issues
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.FILE_READ_ERROR,
-            message=f"Parse error in {file_path}: {e}",
+            message=f"Parse error in {file_path}: {error}",
             context={
                 "file_path": str(file_path),
-                "exception_type": type(e).__name__,
+                "exception_type": type(error).__name__,
             },
         )
-        logger.exception(f"Parse error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-    except OSError as e:
+        logger.error(f"Parse error: {wrapped_error.message}", exc_info=error)
+    elif isinstance(error, OSError):
         # Handle file system errors: permission denied, file not found
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.FILE_READ_ERROR,
-            message=f"File read error for {file_path}: {e}",
+            message=f"File read error for {file_path}: {error}",
             context={
                 "file_path": str(file_path),
-                "exception_type": type(e).__name__,
+                "exception_type": type(error).__name__,
             },
         )
-        logger.exception(f"File read error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-    except TypeError as e:
+        logger.error(f"File read error: {wrapped_error.message}", exc_info=error)
+    elif isinstance(error, TypeError):
         # Handle malformed AST input (e.g., wrong type passed to ast.parse)
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.CONFIGURATION_PARSE_ERROR,
-            message=f"Type error parsing {file_path}: {e}",
+            message=f"Type error parsing {file_path}: {error}",
             context={
                 "file_path": str(file_path),
-                "exception_type": type(e).__name__,
+                "exception_type": type(error).__name__,
             },
         )
-        logger.exception(f"Type error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-    except RecursionError:
+        logger.error(f"Type error: {wrapped_error.message}", exc_info=error)
+    elif isinstance(error, RecursionError):
         # Handle deeply nested code that exceeds Python's recursion limit
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.CONFIGURATION_PARSE_ERROR,
@@ -712,9 +717,8 @@ def validate_one_model_per_file(file_path: Path) -> list[str]:
                 "exception_type": "RecursionError",
             },
         )
-        logger.exception(f"Recursion error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-    except MemoryError:
+        logger.error(f"Recursion error: {wrapped_error.message}", exc_info=error)
+    elif isinstance(error, MemoryError):
         # Handle extremely large files that exhaust memory during AST parsing
         wrapped_error = ModelOnexError(
             error_code=EnumCoreErrorCode.CONFIGURATION_PARSE_ERROR,
@@ -724,32 +728,56 @@ def validate_one_model_per_file(file_path: Path) -> list[str]:
                 "exception_type": "MemoryError",
             },
         )
-        logger.exception(f"Memory error: {wrapped_error.message}")
-        errors.append(wrapped_error.message)
-
-    return errors
+        logger.error(f"Memory error: {wrapped_error.message}", exc_info=error)
+    else:
+        raise error
+    return wrapped_error.message
 
 
-def validate_architecture_directory(
-    directory: Path, max_violations: int = 0
-) -> ModelValidationResult[None]:
-    """Validate ONEX architecture for a directory.
+def validate_one_model_per_file(file_path: Path) -> list[str]:
+    """Validate a single Python file for one-model-per-file compliance.
 
-    Note: For new code, consider using ValidatorArchitecture.validate() instead.
+    Note: For new code, consider using ValidatorArchitecture.validate_file() instead.
 
     Args:
-        directory: Directory to validate.
-        max_violations: Maximum allowed violations (default: 0).
+        file_path: Path to the Python file to validate.
 
     Returns:
-        ModelValidationResult with validation outcome.
+        List of error message strings (empty if valid).
     """
-    python_files = []
-
-    for file_path in directory.rglob("*.py"):
+    try:
+        tree = get_validator_source_cache().parse(file_path).tree
+        counter = ModelCounter()
+        counter.visit(tree)
+    except (
+        SyntaxError,
+        UnicodeDecodeError,
+        ValueError,
+        OSError,
+        TypeError,
+        RecursionError,
+        MemoryError,
+    ) as e:
+        return [_file_error_message(file_path, e)]
+    return _model_counter_errors(counter)
+
+
+class ArchitectureAstPass(ValidationAstPass):
+    """validate_architecture_directory() as a single-pass engine pass."""
+
+    name = "architecture"
+
+    def __init__(self, max_violations: int = 0) -> None:
+        self.max_violations = max_violations
+        self._files_processed = 0
+        self._total_violations = 0
+        self._files_with_violations: list[str] = []
+        self._all_errors: list[str] = []
+
+    def includes(self, path: Path) -> bool:
         # Skip excluded directories and files
-        if any(
-            part in str(file_path)
+        return not any(
+            part in str(path)
             for part in [
                 "__pycache__",
                 ".git",
@@ -757,37 +785,61 @@ def validate_architecture_directory(
                 "tests/fixtures",
                 "__init__.py",  # Skip __init__.py files
             ]
-        ):
-            continue
+        )
 
-        python_files.append(file_path)
+    def create_checkers(self, path: Path) -> list[ast.NodeVisitor]:
+        return [ModelCounter()]
 
-    total_violations = 0
-    files_with_violations: list[str] = []
-    all_errors: list[str] = []
+    def collect(self, path: Path, checkers: list[ast.NodeVisitor]) -> None:
+        counter = checkers[0]
+        if not isinstance(counter, ModelCounter):
+            raise TypeError(f"expected ModelCounter, got {type(counter).__name__}")
+        self._record(path, _model_counter_errors(counter))
 
-    for file_path in python_files:
-        errors = validate_one_model_per_file(file_path)
+    def collect_error(self, path: Path, error: Exception) -> None:
+        self._record(path, [_file_error_message(path, error)])
 
+    def _record(self, file_path: Path, errors: list[str]) -> None:
+        self._files_processed += 1
         if errors:
-            total_violations += len(errors)
-            files_with_violations.append(str(file_path))
-            all_errors.extend([f"{file_path}: {error}" for error in errors])
-
-    is_valid = total_violations <= max_violations
-
-    return ModelValidationResult(
-        is_valid=is_valid,
-        errors=all_errors,
-        metadata=ModelValidationMetadata(
-            validation_type="architecture",
-            files_processed=len(python_files),
-            max_violations=max_violations,
-            violations_found=total_violations,
-            files_with_violations_count=len(files_with_violations),
-            files_with_violations=files_with_violations,
-        ),
-    )
+            self._total_violations += len(errors)
+            self._files_with_violations.append(str(file_path))
+            self._all_errors.extend([f"{file_path}: {error}" for error in errors])
+
+    def build_result(self) -> ModelValidationResult[None]:
+        is_valid = self._total_violations <= self.max_violations
+
+        return ModelValidationResult(
+            is_valid=is_valid,
+            errors=self._all_errors,
+            metadata=ModelValidationMetadata(
+                validation_type="architecture",
+                files_processed=self._files_processed,
+                max_violations=self.max_violations,
+                violations_found=self._total_violations,
+                files_with_violations_count=len(self._files_with_violations),
+                files_with_violations=self._files_with_violations,
+            ),
+        )
+
+
+def validate_architecture_directory(
+    directory: Path, max_violations: int = 0
+) -> ModelValidationResult[None]:
+    """Validate ONEX architecture for a directory.
+
+    Note: For new code, consider using ValidatorArchitecture.validate() instead.
+
+    Args:
+        directory: Directory to validate.
+        max_violations: Maximum allowed violations (default: 0).
+
+    Returns:
+        ModelValidationResult with validation outcome.
+    """
+    return run_ast_passes(directory, [ArchitectureAstPass(max_violations)])[
+        ArchitectureAstPass.name
+    ]
 
 
 def validate_architecture_cli() -> int:
@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Single-pass engine for AST-based directory validators.
+
+:func:`run_ast_passes` validates a directory for several AST-based validators
+at once. Files are discovered with one directory walk, each file is read and
+parsed once through the shared :class:`ValidatorSourceCache`, and one walk of
+each tree dispatches every node to the checkers of every pass that includes
+the file.
+
+Checker contract:
+    Checkers are ``ast.NodeVisitor`` subclasses whose ``visit_*`` methods
+    either call ``self.generic_visit(node)`` as their last action, in which
+    case the walk continues into the node's children for that checker, or
+    return without calling it, in which case the checker skips the subtree.
+    Under that contract one shared pre-order walk delivers the same nodes, in
+    the same order, as each checker's own recursive ``visit()``. The built-in
+    checkers (ModelCounter, UnionUsageChecker and the pattern checkers) follow
+    it.
+
+A checker that raises stops receiving nodes, together with the other checkers
+of its pass, and the exception is handed to that pass's
+:meth:`ValidationAstPass.collect_error`; other passes are unaffected.
+"""
+
+from __future__ import annotations
+
+import ast
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from functools import partial
+from pathlib import Path
+
+from omnibase_core.validation.validator_source_cache import (
+    ValidatorSourceCache,
+    get_validator_source_cache,
+)
+from omnibase_core.validation.validator_utils import ModelValidationResult
+
+__all__ = ["ValidationAstPass", "run_ast_passes", "walk_checkers"]
+
+
+class ValidationAstPass(ABC):
+    """One validator's share of a :func:`run_ast_passes` run.
+
+    A pass decides which files it validates, supplies fresh checkers for each
+    file, and turns the visited checkers (or the error that stopped them) into
+    its per-directory result. Every included file reaches exactly one of
+    :meth:`collect` or :meth:`collect_error`.
+    """
+
+    #: Key of this pass's result in the run_ast_passes() mapping
+    name: str
+
+    @abstractmethod
+    def includes(self, path: Path) -> bool:
+        """Return whether ``path`` is validated by this pass."""
+
+    @abstractmethod
+    def create_checkers(self, path: Path) -> list[ast.NodeVisitor]:
+        """Return fresh checkers for ``path``, in reporting order."""
+
+    @abstractmethod
+    def collect(self, path: Path, checkers: list[ast.NodeVisitor]) -> None:
+        """Record the findings of ``checkers`` after they visited ``path``."""
+
+    @abstractmethod
+    def collect_error(self, path: Path, error: Exception) -> None:
+        """Record that reading, parsing or checking ``path`` failed.
+
+        Re-raise ``error`` to abort the whole run, as an unhandled error in a
+        standalone run of the validator would.
+        """
+
+    @abstractmethod
+    def build_result(self) -> ModelValidationResult[None]:
+        """Return the directory result once every file has been collected."""
+
+
+def _record_descend(descend: list[bool], index: int, _node: ast.AST) -> None:
+    descend[index] = True
+
+
+def walk_checkers(
+    tree: ast.AST,
+    checkers: Sequence[ast.NodeVisitor],
+    groups: Sequence[int] | None = None,
+) -> dict[int, Exception]:
+    """Dispatch every node of ``tree`` to ``checkers`` in one pre-order walk.
+
+    Args:
+        tree: Tree to walk; it is not modified.
+        checkers: Visitors following the module's checker contract.
+        groups: Group of each checker; when a checker raises, every checker
+            of its group stops receiving nodes. Defaults to one group per
+            checker.
+
+    Returns:
+        The first exception raised in each failed group, keyed by group.
+    """
+    group_of = list(groups) if groups is not None else list(range(len(checkers)))
+    errors: dict[int, Exception] = {}
+    descend = [False] * len(checkers)
+    methods: list[dict[type[ast.AST], Callable[[ast.AST], object] | None]] = [
+        {} for _ in checkers
+    ]
+    # generic_visit() records that the checker wants the children instead of
+    # recursing into them; the walk delivers them
+    for index, checker in enumerate(checkers):
+        checker.generic_visit = partial(  # type: ignore[method-assign]
+            _record_descend, descend, index
+        )
+    try:
+        stack: list[tuple[ast.AST, tuple[int, ...]]] = [
+            (tree, tuple(range(len(checkers))))
+        ]
+        while stack:
+            node, active = stack.pop()
+            node_type = type(node)
+            following: list[int] = []
+            for index in active:
+                if group_of[index] in errors:
+                    continue
+                by_type = methods[index]
+                if node_type in by_type:
+                    method = by_type[node_type]
+                else:
+                    method = by_type[node_type] = getattr(
+                        checkers[index], f"visit_{node_type.__name__}", None
+                    )
+                if method is None:
+                    # NodeVisitor's default: visit the children
+                    following.append(index)
+                    continue
+                descend[index] = False
+                try:
+                    method(node)
+                except Exception as e:  # noqa: BLE001  # fallback-ok: reported to its pass
+                    errors[group_of[index]] = e
+                    continue
+                if descend[index]:
+                    following.append(index)
+            if following:
+                children = list(ast.iter_child_nodes(node))
+                next_active = tuple(following)
+                stack.extend((child, next_active) for child in reversed(children))
+    finally:
+        for checker in checkers:
+            vars(checker).pop("generic_visit", None)
+    return errors
+
+
+def run_ast_passes(
+    directory: Path,
+    passes: Sequence[ValidationAstPass],
+    cache: ValidatorSourceCache | None = None,
+) -> dict[str, ModelValidationResult[None]]:
+    """Validate ``directory`` for every pass with one parse and walk per file.
+
+    Files are visited in ``directory.rglob("*.py")`` order, the order the
+    standalone directory validators use, so each pass sees its files and
+    reports its findings in the same order as a standalone run.
+
+    Args:
+        directory: Directory searched recursively for ``*.py`` files.
+        passes: Passes to run; their names must be distinct.
+        cache: Source cache; defaults to the process-wide cache.
+
+    Returns:
+        Each pass's result, keyed by pass name, in ``passes`` order.
+    """
+    source_cache = cache if cache is not None else get_validator_source_cache()
+    for path in directory.rglob("*.py"):
+        active = [ast_pass for ast_pass in passes if ast_pass.includes(path)]
+        if not active:
+            continue
+        try:
+            tree = source_cache.parse(path).tree
+        except Exception as e:  # noqa: BLE001  # fallback-ok: each pass reports it
+            for ast_pass in active:
+                ast_pass.collect_error(path, e)
+            continue
+
+        per_pass = [ast_pass.create_checkers(path) for ast_pass in active]
+        checkers = [checker for group in per_pass for checker in group]
+        groups = [index for index, group in enumerate(per_pass) for _ in group]
+        errors = walk_checkers(tree, checkers, groups)
+        for index, ast_pass in enumerate(active):
+            if index in errors:
+                ast_pass.collect_error(path, errors[index])
+            else:
+                ast_pass.collect(path, per_pass[index])
+    return {ast_pass.name: ast_pass.build_result() for ast_pass in passes}
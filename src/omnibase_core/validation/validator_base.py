@@ -95,6 +95,7 @@ from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.validation.model_antipattern_registry import (
     ModelAntipatternRegistry,
 )
+from omnibase_core.validation.validator_source_cache import get_validator_source_cache
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -612,7 +613,7 @@ class ValidatorBase(ABC):
             return self._file_line_cache[path]
 
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()
+            lines = get_validator_source_cache().get_lines(path)
             self._file_line_cache[path] = lines
             return lines
         except FILE_IO_ERRORS as e:
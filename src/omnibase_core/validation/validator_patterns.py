@@ -71,7 +71,7 @@ import logging
 import re
 import sys
 from pathlib import Path
-from typing import ClassVar, Protocol
+from typing import ClassVar, Protocol, cast
 
 from omnibase_core.models.common.model_validation_issue import ModelValidationIssue
 from omnibase_core.models.common.model_validation_metadata import (
@@ -80,7 +80,12 @@ from omnibase_core.models.common.model_validation_metadata import (
 from omnibase_core.models.contracts.subcontracts.model_validator_subcontract import (
     ModelValidatorSubcontract,
 )
+from omnibase_core.validation.validator_ast_engine import (
+    ValidationAstPass,
+    run_ast_passes,
+)
 from omnibase_core.validation.validator_base import ValidatorBase
+from omnibase_core.validation.validator_source_cache import get_validator_source_cache
 from omnibase_core.validation.validator_utils import ModelValidationResult
 
 from .checker_generic_pattern import GenericPatternChecker
@@ -325,14 +330,11 @@ class ValidatorPatterns(ValidatorBase):
             Tuple of ModelValidationIssue instances for violations found.
         """
         try:
-            source = path.read_text(encoding="utf-8")
+            tree = get_validator_source_cache().parse(path).tree
         except OSError as e:
             # fallback-ok: log warning and skip file on read errors
             logger.warning("Cannot read file %s: %s", path, e)
             return ()
-
-        try:
-            tree = ast.parse(source, filename=str(path))
         except SyntaxError as e:
             # fallback-ok: log warning and skip file with syntax errors
             logger.warning(
@@ -397,6 +399,23 @@ class ValidatorPatterns(ValidatorBase):
 # =============================================================================
 
 
+def _pattern_error_issue(file_path: Path, error: Exception) -> str:
+    """Log and describe a failure to read or parse ``file_path``.
+
+    Raises:
+        Exception: ``error`` itself when it is not a read or parse failure.
+    """
+    if isinstance(error, OSError):
+        # fallback-ok: log file read errors for debugging
+        logger.warning("Cannot read file %s: %s", file_path, error)
+        return f"Error reading {file_path}: {error}"
+    if isinstance(error, (SyntaxError, UnicodeDecodeError, ValueError)):
+        # fallback-ok: log parsing errors for debugging
+        logger.debug("Error parsing %s: %s", file_path, error)
+        return f"Error parsing {file_path}: {error}"
+    raise error
+
+
 def validate_patterns_file(file_path: Path) -> list[str]:
     """Validate patterns in a Python file.
 
@@ -412,10 +431,7 @@ def validate_patterns_file(file_path: Path) -> list[str]:
     all_issues: list[str] = []
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        tree = ast.parse(content, filename=str(file_path))
+        tree = get_validator_source_cache().parse(file_path).tree
 
         # Run all pattern checkers
         checkers: list[ProtocolPatternChecker] = [
@@ -428,18 +444,80 @@ def validate_patterns_file(file_path: Path) -> list[str]:
             checker.visit(tree)
             all_issues.extend(checker.issues)
 
-    except OSError as e:
-        # fallback-ok: log file read errors for debugging
-        logger.warning("Cannot read file %s: %s", file_path, e)
-        all_issues.append(f"Error reading {file_path}: {e}")
-    except (SyntaxError, UnicodeDecodeError, ValueError) as e:
-        # fallback-ok: log parsing errors for debugging
-        logger.debug("Error parsing %s: %s", file_path, e)
-        all_issues.append(f"Error parsing {file_path}: {e}")
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+        all_issues.append(_pattern_error_issue(file_path, e))
 
     return all_issues
 
 
+class PatternsAstPass(ValidationAstPass):
+    """validate_patterns_directory() as a single-pass engine pass.
+
+    A checker failing with an error validate_patterns_file() reports
+    contributes only that error; the other checkers' issues for the file are
+    dropped with it.
+    """
+
+    name = "patterns"
+
+    def __init__(self, strict: bool = False) -> None:
+        self.strict = strict
+        self._files_processed = 0
+        self._all_errors: list[str] = []
+        self._files_with_errors: list[str] = []
+
+    def includes(self, path: Path) -> bool:
+        # Skip excluded files
+        return not any(
+            part in str(path)
+            for part in [
+                "__pycache__",
+                ".git",
+                "archived",
+                "examples",
+                "tests/fixtures",
+            ]
+        )
+
+    def create_checkers(self, path: Path) -> list[ast.NodeVisitor]:
+        return [
+            PydanticPatternChecker(str(path)),
+            NamingConventionChecker(str(path)),
+            GenericPatternChecker(str(path)),
+        ]
+
+    def collect(self, path: Path, checkers: list[ast.NodeVisitor]) -> None:
+        issues: list[str] = []
+        for checker in checkers:
+            issues.extend(cast(ProtocolPatternChecker, checker).issues)
+        self._record(path, issues)
+
+    def collect_error(self, path: Path, error: Exception) -> None:
+        self._record(path, [_pattern_error_issue(path, error)])
+
+    def _record(self, py_file: Path, issues: list[str]) -> None:
+        self._files_processed += 1
+        if issues:
+            self._files_with_errors.append(str(py_file))
+            self._all_errors.extend([f"{py_file}: {issue}" for issue in issues])
+
+    def build_result(self) -> ModelValidationResult[None]:
+        is_valid = len(self._all_errors) == 0 or not self.strict
+
+        return ModelValidationResult(
+            is_valid=is_valid,
+            errors=self._all_errors,
+            metadata=ModelValidationMetadata(
+                validation_type="patterns",
+                files_processed=self._files_processed,
+                violations_found=len(self._all_errors),
+                files_with_violations=self._files_with_errors,
+                files_with_violations_count=len(self._files_with_errors),
+                strict_mode=self.strict,
+            ),
+        )
+
+
 def validate_patterns_directory(
     directory: Path,
     strict: bool = False,
@@ -456,46 +534,7 @@ def validate_patterns_directory(
     See Also:
         ValidatorPatterns.validate(): Class-based validation with contracts.
     """
-    python_files: list[Path] = []
-
-    for py_file in directory.rglob("*.py"):
-        # Skip excluded files
-        if any(
-            part in str(py_file)
-            for part in [
-                "__pycache__",
-                ".git",
-                "archived",
-                "examples",
-                "tests/fixtures",
-            ]
-        ):
-            continue
-        python_files.append(py_file)
-
-    all_errors: list[str] = []
-    files_with_errors: list[str] = []
-
-    for py_file in python_files:
-        issues = validate_patterns_file(py_file)
-        if issues:
-            files_with_errors.append(str(py_file))
-            all_errors.extend([f"{py_file}: {issue}" for issue in issues])
-
-    is_valid = len(all_errors) == 0 or not strict
-
-    return ModelValidationResult(
-        is_valid=is_valid,
-        errors=all_errors,
-        metadata=ModelValidationMetadata(
-            validation_type="patterns",
-            files_processed=len(python_files),
-            violations_found=len(all_errors),
-            files_with_violations=files_with_errors,
-            files_with_violations_count=len(files_with_errors),
-            strict_mode=strict,
-        ),
-    )
+    return run_ast_passes(directory, [PatternsAstPass(strict)])[PatternsAstPass.name]
 
 
 def validate_patterns_cli() -> int:
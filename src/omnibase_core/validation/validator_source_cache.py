@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Shared parse-once cache of Python source, lines, ASTs and tokens.
+
+Validators that each read and ``ast.parse`` the same files repeat the most
+expensive part of validation once per validator. This cache reads a file,
+hashes its bytes and keys everything derived from it (decoded source, lines,
+AST, tokens) on that content hash, so identical content is decoded and parsed
+once per process no matter how many validators, or how many paths, ask.
+
+Files are re-read and re-hashed on every lookup, so edits are always seen; only
+the derived data is reused. Entries are evicted least-recently-used.
+
+Cached ASTs are shared between callers and must be treated as read-only, which
+``ast.NodeVisitor`` based checkers already do.
+
+Thread Safety:
+    ValidatorSourceCache is thread-safe; lookups and evictions are guarded by
+    an internal lock. Parsing happens outside the lock, so two threads may
+    occasionally parse the same content concurrently; either result is kept.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import io
+import threading
+import tokenize
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+__all__ = [
+    "ParsedPythonSource",
+    "ValidatorSourceCache",
+    "get_validator_source_cache",
+]
+
+# Default number of distinct file contents kept
+DEFAULT_MAX_ENTRIES = 2048
+
+
+class ParsedPythonSource(NamedTuple):
+    """A decoded, parsed Python file. ``tree`` is shared; do not mutate it."""
+
+    content_hash: str
+    source: str
+    lines: list[str]
+    tree: ast.Module
+
+
+class _CacheEntry:
+    """Everything derived from one file content, filled in lazily."""
+
+    __slots__ = ("lines", "source", "syntax_error", "tokens", "tree")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.lines = source.splitlines()
+        self.tree: ast.Module | None = None
+        # SyntaxError args with the filename left out, replayed per path
+        self.syntax_error: tuple[str, tuple[int | None, ...], str | None] | None = None
+        self.tokens: list[tokenize.TokenInfo] | None = None
+
+
+class ValidatorSourceCache:
+    """Content-hash-keyed LRU cache of decoded source, lines, ASTs and tokens.
+
+    Args:
+        max_entries: Distinct file contents kept before LRU eviction.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max(max_entries, 1)
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.parses = 0
+
+    def read_source(self, path: Path) -> tuple[str, str]:
+        """Return ``(content_hash, source)`` for ``path``.
+
+        The source is decoded as UTF-8 with universal newlines, matching
+        ``Path.read_text(encoding="utf-8")``.
+
+        Raises:
+            OSError: The file cannot be read.
+            UnicodeDecodeError: The file is not valid UTF-8.
+        """
+        content_hash, entry = self._entry(path)
+        return content_hash, entry.source
+
+    def get_lines(self, path: Path) -> list[str]:
+        """Return the lines of ``path``, as ``read_text().splitlines()`` would.
+
+        The list is shared between callers; do not mutate it.
+
+        Raises:
+            OSError: The file cannot be read.
+            UnicodeDecodeError: The file is not valid UTF-8.
+        """
+        return self._entry(path)[1].lines
+
+    def parse(self, path: Path, filename: str | None = None) -> ParsedPythonSource:
+        """Return the parsed module for ``path``, parsing each content once.
+
+        Args:
+            path: Python file to parse.
+            filename: Filename reported in a SyntaxError; defaults to ``path``.
+
+        Raises:
+            OSError: The file cannot be read.
+            UnicodeDecodeError: The file is not valid UTF-8.
+            SyntaxError: The source does not parse. Raised afresh, with
+                ``filename``, on every lookup of the same content.
+        """
+        content_hash, entry = self._entry(path)
+        if entry.tree is None and entry.syntax_error is None:
+            try:
+                tree = ast.parse(entry.source, filename=str(path))
+            except SyntaxError as e:
+                entry.syntax_error = (
+                    e.msg,
+                    (e.lineno, e.offset, e.end_lineno, e.end_offset),
+                    e.text,
+                )
+            else:
+                entry.tree = tree
+            with self._lock:
+                self.parses += 1
+        if entry.tree is not None:
+            return ParsedPythonSource(
+                content_hash, entry.source, entry.lines, entry.tree
+            )
+        msg, (lineno, offset, end_lineno, end_offset), text = entry.syntax_error or (
+            "invalid syntax",
+            (None, None, None, None),
+            None,
+        )
+        raise SyntaxError(
+            msg,
+            (
+                filename if filename is not None else str(path),
+                lineno,
+                offset,
+                text,
+                end_lineno,
+                end_offset,
+            ),
+        )
+
+    def get_tokens(self, path: Path) -> list[tokenize.TokenInfo]:
+        """Return the tokens of ``path``, tokenizing each content once.
+
+        Raises:
+            OSError: The file cannot be read.
+            UnicodeDecodeError: The file is not valid UTF-8.
+            tokenize.TokenError: The source cannot be tokenized.
+        """
+        _, entry = self._entry(path)
+        if entry.tokens is None:
+            entry.tokens = list(
+                tokenize.generate_tokens(io.StringIO(entry.source).readline)
+            )
+        return entry.tokens
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.parses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, path: Path) -> tuple[str, _CacheEntry]:
+        with open(path, "rb") as f:
+            data = f.read()
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None:
+                self._entries.move_to_end(content_hash)
+                self.hits += 1
+                return content_hash, entry
+            self.misses += 1
+        source = data.decode("utf-8")
+        if "\r" in source:
+            # Universal newlines, as text-mode reads apply
+            source = source.replace("\r\n", "\n").replace("\r", "\n")
+        entry = _CacheEntry(source)
+        with self._lock:
+            entry = self._entries.setdefault(content_hash, entry)
+            self._entries.move_to_end(content_hash)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return content_hash, entry
+
+
+_DEFAULT_CACHE = ValidatorSourceCache()
+
+
+def get_validator_source_cache() -> ValidatorSourceCache:
+    """Return the process-wide cache shared by the built-in validators."""
+    return _DEFAULT_CACHE
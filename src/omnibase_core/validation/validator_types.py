@@ -69,7 +69,12 @@ from omnibase_core.models.contracts.subcontracts.model_validator_subcontract imp
 )
 from omnibase_core.models.validation.model_union_pattern import ModelUnionPattern
 from omnibase_core.validation.checker_union_usage import UnionUsageChecker
+from omnibase_core.validation.validator_ast_engine import (
+    ValidationAstPass,
+    run_ast_passes,
+)
 from omnibase_core.validation.validator_base import ValidatorBase
+from omnibase_core.validation.validator_source_cache import get_validator_source_cache
 from omnibase_core.validation.validator_utils import ModelValidationResult
 
 # Configure logger for this module
@@ -153,7 +158,7 @@ class ValidatorUnionUsage(ValidatorBase):
             Tuple of ModelValidationIssue instances for violations found.
         """
         try:
-            source = path.read_text(encoding="utf-8")
+            tree = get_validator_source_cache().parse(path).tree
         except FILE_IO_ERRORS as e:
             # fallback-ok: log warning and skip file on read errors
             logger.warning(
@@ -163,9 +168,6 @@ class ValidatorUnionUsage(ValidatorBase):
                 e,
             )
             return ()
-
-        try:
-            tree = ast.parse(source, filename=str(path))
         except SyntaxError as e:
             # fallback-ok: log warning and skip file with syntax errors
             logger.warning(
@@ -271,41 +273,45 @@ def validate_union_usage_file(
         ValidatorUnionUsage.validate_file(): Class-based validation with contracts.
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        tree = ast.parse(content, filename=str(file_path))
+        tree = get_validator_source_cache().parse(file_path).tree
         checker = UnionUsageChecker(str(file_path))
         checker.visit(tree)
+    except (
+        Exception  # noqa: BLE001
+    ) as e:  # fallback-ok: Validation errors are returned as issues, not raised
+        return 0, _union_usage_error_issues(file_path, e), []
+    return checker.union_count, checker.issues, checker.union_patterns
 
-        return checker.union_count, checker.issues, checker.union_patterns
 
-    except FileNotFoundError as e:
+def _union_usage_error_issues(file_path: Path, error: Exception) -> list[str]:
+    """Return the issues reported when validating ``file_path`` failed."""
+    if isinstance(error, FileNotFoundError):
         # Return file not found error as an issue
-        return 0, [f"Error: File not found: {e}"], []
-    except SyntaxError as e:
+        return [f"Error: File not found: {error}"]
+    if isinstance(error, SyntaxError):
         # Return syntax error as an issue
-        return 0, [f"Error parsing {file_path}: {e}"], []
-    except (
-        Exception  # noqa: BLE001
-    ) as e:  # fallback-ok: Validation errors are returned as issues, not raised
-        # Return other errors as issues
-        return 0, [f"Failed to validate union usage in {file_path}: {e}"], []
+        return [f"Error parsing {file_path}: {error}"]
+    # Return other errors as issues
+    return [f"Failed to validate union usage in {file_path}: {error}"]
 
 
-def validate_union_usage_directory(
-    directory: Path, max_unions: int = 100, strict: bool = False
-) -> ModelValidationResult[None]:
-    """Validate Union usage in a directory.
+class UnionUsageAstPass(ValidationAstPass):
+    """validate_union_usage_directory() as a single-pass engine pass."""
 
-    See Also:
-        ValidatorUnionUsage.validate(): Class-based validation with contracts.
-    """
-    python_files = []
-    for py_file in directory.rglob("*.py"):
+    name = "union_usage"
+
+    def __init__(self, max_unions: int = 100, strict: bool = False) -> None:
+        self.max_unions = max_unions
+        self.strict = strict
+        self._files_processed = 0
+        self._total_unions = 0
+        self._total_issues: list[str] = []
+        self._all_patterns: list[ModelUnionPattern] = []
+
+    def includes(self, path: Path) -> bool:
         # Filter out archived files, examples, and __pycache__
-        if any(
-            part in str(py_file)
+        return not any(
+            part in str(path)
             for part in [
                 "/archived/",
                 "archived",
@@ -315,47 +321,75 @@ def validate_union_usage_directory(
                 "examples",
                 "__pycache__",
             ]
-        ):
-            continue
-        python_files.append(py_file)
+        )
+
+    def create_checkers(self, path: Path) -> list[ast.NodeVisitor]:
+        return [UnionUsageChecker(str(path))]
+
+    def collect(self, path: Path, checkers: list[ast.NodeVisitor]) -> None:
+        checker = checkers[0]
+        if not isinstance(checker, UnionUsageChecker):
+            raise TypeError(f"expected UnionUsageChecker, got {type(checker).__name__}")
+        self._record(path, checker.union_count, checker.issues, checker.union_patterns)
+
+    def collect_error(self, path: Path, error: Exception) -> None:
+        self._record(path, 0, _union_usage_error_issues(path, error), [])
+
+    def _record(
+        self,
+        py_file: Path,
+        union_count: int,
+        issues: list[str],
+        patterns: list[ModelUnionPattern],
+    ) -> None:
+        self._files_processed += 1
+        self._total_unions += union_count
+        self._all_patterns.extend(patterns)
+        if issues:
+            self._total_issues.extend([f"{py_file}: {issue}" for issue in issues])
+
+    def build_result(self) -> ModelValidationResult[None]:
+        if not self._files_processed:
+            return ModelValidationResult(
+                is_valid=True,
+                errors=[],
+                metadata=ModelValidationMetadata(
+                    files_processed=0,
+                ),
+            )
+
+        is_valid = (self._total_unions <= self.max_unions) and (
+            not self._total_issues or not self.strict
+        )
 
-    if not python_files:
         return ModelValidationResult(
-            is_valid=True,
-            errors=[],
+            is_valid=is_valid,
+            errors=self._total_issues,
             metadata=ModelValidationMetadata(
-                files_processed=0,
+                validation_type="union_usage",
+                files_processed=self._files_processed,
+                violations_found=len(self._total_issues),
+                total_unions=self._total_unions,
+                max_unions=self.max_unions,
+                complex_patterns=len(
+                    [p for p in self._all_patterns if p.type_count >= 3]
+                ),
+                strict_mode=self.strict,
             ),
         )
 
-    total_unions = 0
-    total_issues = []
-    all_patterns = []
 
-    # Process all files
-    for py_file in python_files:
-        union_count, issues, patterns = validate_union_usage_file(py_file)
-        total_unions += union_count
-        all_patterns.extend(patterns)
+def validate_union_usage_directory(
+    directory: Path, max_unions: int = 100, strict: bool = False
+) -> ModelValidationResult[None]:
+    """Validate Union usage in a directory.
 
-        if issues:
-            total_issues.extend([f"{py_file}: {issue}" for issue in issues])
-
-    is_valid = (total_unions <= max_unions) and (not total_issues or not strict)
-
-    return ModelValidationResult(
-        is_valid=is_valid,
-        errors=total_issues,
-        metadata=ModelValidationMetadata(
-            validation_type="union_usage",
-            files_processed=len(python_files),
-            violations_found=len(total_issues),
-            total_unions=total_unions,
-            max_unions=max_unions,
-            complex_patterns=len([p for p in all_patterns if p.type_count >= 3]),
-            strict_mode=strict,
-        ),
-    )
+    See Also:
+        ValidatorUnionUsage.validate(): Class-based validation with contracts.
+    """
+    return run_ast_passes(directory, [UnionUsageAstPass(max_unions, strict)])[
+        UnionUsageAstPass.name
+    ]
 
 
 def validate_union_usage_cli() -> int:
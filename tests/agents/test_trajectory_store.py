@@ -3,11 +3,15 @@
 
 import json
 import threading
+import time
+from array import array
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from omnibase_core.agents.trajectory_store import TrajectoryStore
+from omnibase_core.enums.enum_fsync_policy import EnumFsyncPolicy
 from omnibase_core.models.agents.model_trajectory_entry import ModelTrajectoryEntry
 
 
@@ -146,3 +150,174 @@ def test_concurrent_appends_serialised(tmp_path: Path) -> None:
     for line in lines:
         obj = json.loads(line)
         assert "step" in obj
+
+
+def _steps(entries: list[ModelTrajectoryEntry]) -> list[int]:
+    return [e.step for e in entries]
+
+
+@pytest.mark.unit
+def test_restart_restores_recent_entries(tmp_path: Path) -> None:
+    with TrajectoryStore(session_id="sess-restart", state_dir=tmp_path) as store:
+        for i in range(10):
+            store.append(_make_entry(i))
+
+    reopened = TrajectoryStore(session_id="sess-restart", state_dir=tmp_path)
+    assert _steps(reopened.read_recent(3)) == [7, 8, 9]
+    reopened.append(_make_entry(10))
+    assert _steps(reopened.read_recent(2)) == [9, 10]
+
+
+@pytest.mark.unit
+def test_read_recent_offset_pages_past_the_cache(tmp_path: Path) -> None:
+    store = TrajectoryStore(session_id="sess-page", state_dir=tmp_path)
+    for i in range(2500):
+        store.append(_make_entry(i))
+
+    assert _steps(store.read_recent(3, offset=0)) == [2497, 2498, 2499]
+    assert _steps(store.read_recent(5, offset=2000)) == [495, 496, 497, 498, 499]
+    # Straddles the oldest cached entry
+    page = store.read_recent(1000, offset=1000)
+    assert _steps(page) == list(range(500, 1500))
+    assert _steps(store.read_recent(10, offset=2495)) == [0, 1, 2, 3, 4]
+    assert store.read_recent(10, offset=2500) == []
+    with pytest.raises(ValueError, match="offset"):
+        store.read_recent(1, offset=-1)
+
+    reopened = TrajectoryStore(session_id="sess-page", state_dir=tmp_path)
+    assert _steps(reopened.read_recent(2, offset=100)) == [2398, 2399]
+
+
+@pytest.mark.unit
+def test_offset_index_is_rebuilt_when_missing_or_stale(tmp_path: Path) -> None:
+    with TrajectoryStore(session_id="sess-idx", state_dir=tmp_path) as store:
+        for i in range(50):
+            store.append(_make_entry(i))
+    index_path = tmp_path / "trajectory" / "sess-idx.idx"
+    assert index_path.stat().st_size == 50 * 8
+
+    index_path.write_bytes(index_path.read_bytes()[: 20 * 8])
+    store = TrajectoryStore(session_id="sess-idx", state_dir=tmp_path)
+    assert _steps(store.read_recent(2, offset=10)) == [38, 39]
+    assert index_path.stat().st_size == 50 * 8
+    store.close()
+
+    index_path.unlink()
+    store = TrajectoryStore(session_id="sess-idx", state_dir=tmp_path)
+    assert _steps(store.read_recent(1, offset=49)) == [0]
+
+
+@pytest.mark.unit
+def test_torn_trailing_line_is_skipped(tmp_path: Path) -> None:
+    with TrajectoryStore(session_id="sess-torn", state_dir=tmp_path) as store:
+        for i in range(3):
+            store.append(_make_entry(i))
+    jsonl_path = tmp_path / "trajectory" / "sess-torn.jsonl"
+    with jsonl_path.open("ab") as fh:
+        fh.write(b'{"step": 3, "agent"')
+
+    with TrajectoryStore(session_id="sess-torn", state_dir=tmp_path) as store:
+        store.append(_make_entry(4))
+        assert _steps(store.read_recent(10)) == [0, 1, 2, 4]
+        assert _steps(store.read_recent(10, offset=0)) == [0, 1, 2, 4]
+    lines = jsonl_path.read_bytes().splitlines()
+    assert lines[3] == b'{"step": 3, "agent"'
+    assert _steps(store.read_recent(10, offset=0)) == [0, 1, 2, 4]
+
+
+@pytest.mark.unit
+def test_open_leaves_an_in_progress_line_alone(tmp_path: Path) -> None:
+    with TrajectoryStore(session_id="sess-live", state_dir=tmp_path) as store:
+        store.append(_make_entry(0))
+    jsonl_path = tmp_path / "trajectory" / "sess-live.jsonl"
+    line = _make_entry(1).model_dump_json().encode() + b"\n"
+    with jsonl_path.open("ab") as writer:
+        writer.write(line[:10])
+        writer.flush()
+        reader = TrajectoryStore(session_id="sess-live", state_dir=tmp_path)
+        assert jsonl_path.read_bytes().endswith(line[:10])
+        writer.write(line[10:])
+
+    assert _steps(reader.read_recent(10, offset=0)) == [0, 1]
+    reader.close()
+
+
+@pytest.mark.unit
+def test_stores_sharing_a_session_keep_the_index_in_file_order(
+    tmp_path: Path,
+) -> None:
+    first = TrajectoryStore(session_id="sess-shared", state_dir=tmp_path)
+    second = TrajectoryStore(session_id="sess-shared", state_dir=tmp_path)
+    for i in range(0, 20, 2):
+        first.append(_make_entry(i))
+        second.append(_make_entry(i + 1))
+
+    jsonl_path = tmp_path / "trajectory" / "sess-shared.jsonl"
+    data = jsonl_path.read_bytes()
+    line_starts = [0] + [i + 1 for i, byte in enumerate(data[:-1]) if byte == 0x0A]
+    index = array("Q", (tmp_path / "trajectory" / "sess-shared.idx").read_bytes())
+    assert index.tolist() == line_starts
+
+    for store in (first, second):
+        assert _steps(store.read_recent(20, offset=0)) == list(range(20))
+        assert _steps(store.read_recent(3, offset=5)) == [12, 13, 14]
+    first.close()
+    second.close()
+    reopened = TrajectoryStore(session_id="sess-shared", state_dir=tmp_path)
+    assert _steps(reopened.read_recent(4)) == [16, 17, 18, 19]
+
+
+@pytest.mark.unit
+def test_group_commit_flushes_on_batch_size_and_flush(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "trajectory" / "sess-batch.jsonl"
+    store = TrajectoryStore(
+        session_id="sess-batch", state_dir=tmp_path, batch_size=4, flush_interval_s=60
+    )
+    for i in range(3):
+        store.append(_make_entry(i))
+    assert jsonl_path.read_text() == ""
+    assert _steps(store.read_recent(3)) == [0, 1, 2]
+
+    store.append(_make_entry(3))
+    assert len(jsonl_path.read_text().splitlines()) == 4
+    store.append(_make_entry(4))
+    store.flush()
+    assert len(jsonl_path.read_text().splitlines()) == 5
+    store.close()
+    with pytest.raises(ValueError, match="closed"):
+        store.append(_make_entry(5))
+
+
+@pytest.mark.unit
+def test_group_commit_flushes_after_interval(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "trajectory" / "sess-timer.jsonl"
+    store = TrajectoryStore(
+        session_id="sess-timer",
+        state_dir=tmp_path,
+        batch_size=100,
+        flush_interval_s=0.01,
+    )
+    store.append(_make_entry(1))
+    deadline = time.monotonic() + 5
+    while not jsonl_path.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(jsonl_path.read_text().splitlines()) == 1
+    store.close()
+
+
+@pytest.mark.unit
+def test_fsync_policy_every_batch(tmp_path: Path) -> None:
+    store = TrajectoryStore(
+        session_id="sess-fsync",
+        state_dir=tmp_path,
+        fsync_policy=EnumFsyncPolicy.EVERY_BATCH,
+    )
+    with patch("omnibase_core.agents.trajectory_store.os.fsync") as fsync:
+        store.append(_make_entry(1))
+    assert fsync.call_count == 2  # data and index
+
+
+@pytest.mark.unit
+def test_batch_size_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        TrajectoryStore(session_id="sess-bad", state_dir=tmp_path, batch_size=0)
@@ -75,3 +75,23 @@ def test_build_consumer_graph_returns_dict_str_int(tmp_path: Path) -> None:
     for k, v in result.items():
         assert isinstance(k, str)
         assert isinstance(v, int)
+
+
+@pytest.mark.unit
+def test_build_consumer_graph_applies_edge_deltas(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("import b\nimport c\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("", encoding="utf-8")
+    (tmp_path / "c.py").write_text("import b\n", encoding="utf-8")
+    assert build_consumer_graph(tmp_path) == {"b.py": 2, "c.py": 1}
+
+    # a.py drops both imports, d.py starts importing c.py
+    (tmp_path / "a.py").write_text("", encoding="utf-8")
+    (tmp_path / "d.py").write_text("import c\n", encoding="utf-8")
+    result = build_consumer_graph(tmp_path)
+
+    assert result == {"b.py": 1, "c.py": 1}
+    cached = json.loads(
+        (tmp_path / ".onex_state" / "consumer-graph.json").read_text(encoding="utf-8")
+    )
+    assert cached["edges"] == {"c.py": ["b.py"], "d.py": ["c.py"]}
+    assert (tmp_path / ".onex_state" / "import-graph-cache.json").is_file()
@@ -3,6 +3,7 @@
 
 """Tests for build_import_graph."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -246,3 +247,77 @@ def test_js_resolution_uses_all_declared_extensions(
     target_path.write_text("export default 1;\n")
     g = build_import_graph(tmp_path)
     assert target in g.edges_out["page.ts"]
+
+
+def test_cache_reparses_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import omnibase_core.analysis.import_graph as import_graph
+
+    cache = tmp_path / ".onex_state" / "import-graph-cache.json"
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    (tmp_path / "c.js").write_text("require('./d');\n")
+    (tmp_path / "d.js").write_text("module.exports = 1;\n")
+    first = build_import_graph(tmp_path, cache_path=cache)
+
+    parsed: list[str] = []
+    extract = import_graph._extract_records
+
+    def counting(kind: str, source: str) -> object:
+        parsed.append(source)
+        return extract(kind, source)
+
+    monkeypatch.setattr(import_graph, "_extract_records", counting)
+    assert build_import_graph(tmp_path, cache_path=cache).edges_out == first.edges_out
+    assert parsed == []
+
+    (tmp_path / "b.py").write_text("import a\n")
+    g = build_import_graph(tmp_path, cache_path=cache)
+    assert parsed == ["import a\n"]
+    assert g.edges_out["b.py"] == {"a.py"}
+    assert g.edges_out["c.js"] == {"d.js"}
+
+
+def test_cached_records_resolve_against_current_files(tmp_path: Path) -> None:
+    cache = tmp_path / ".onex_state" / "import-graph-cache.json"
+    (tmp_path / "a.py").write_text("from pkg import mod\n")
+    assert "a.py" not in build_import_graph(tmp_path, cache_path=cache).edges_out
+
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    g = build_import_graph(tmp_path, cache_path=cache)
+    assert g.edges_out["a.py"] == {"pkg/__init__.py", "pkg/mod.py"}
+
+
+def test_invalid_cache_is_ignored(tmp_path: Path) -> None:
+    cache = tmp_path / "import-graph-cache.json"
+    cache.write_text("{not json")
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("")
+    g = build_import_graph(tmp_path, cache_path=cache)
+    assert g.edges_out["a.py"] == {"b.py"}
+    assert build_import_graph(tmp_path, cache_path=cache).edges_out == g.edges_out
+
+    # Malformed records are reparsed instead of trusted
+    payload = json.loads(cache.read_text())
+    for key in payload["records"]:
+        payload["records"][key] = [[[0, None, "b"]], []]
+    cache.write_text(json.dumps(payload))
+    assert build_import_graph(tmp_path, cache_path=cache).edges_out == g.edges_out
+
+
+def test_process_pool_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import omnibase_core.analysis.import_graph as import_graph
+
+    monkeypatch.setattr(import_graph, "_PARALLEL_MIN_FILES", 4)
+    for i in range(12):
+        (tmp_path / f"m{i}.py").write_text(f"import m{(i + 1) % 12}\n")
+        (tmp_path / f"j{i}.ts").write_text(f"import x from './j{(i + 1) % 12}';\n")
+    serial = build_import_graph(tmp_path, max_workers=1)
+    parallel = build_import_graph(tmp_path, max_workers=2)
+    assert parallel.edges_out == serial.edges_out
+    assert serial.edges_out["m11.py"] == {"m0.py"}
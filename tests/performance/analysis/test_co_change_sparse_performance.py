@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Build and scoring cost of the sparse co-change backend on a large history.
+
+build_cochange_matrix counts every pair of every commit into a Counter of
+path tuples, O(sum k^2) Python operations. The sparse backend interns paths
+and computes X^T X over a commit x file incidence matrix, then scores and
+filters all pairs as arrays.
+
+Related:
+    - src/omnibase_core/analysis/co_change_sparse.py
+"""
+
+import random
+import time
+
+import pytest
+
+from omnibase_core.analysis.co_change_dark_matter import find_dark_matter
+from omnibase_core.analysis.co_change_matrix import build_cochange_matrix
+from omnibase_core.analysis.co_change_sparse import build_sparse_cochange_matrix
+from omnibase_core.analysis.import_graph import ImportGraph
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+COMMITS = 50_000
+FILES = 2_000
+
+
+def _history() -> list[list[str]]:
+    rng = random.Random(7)
+    files = [f"pkg{i % 30}/sub{i % 7}/mod/f{i}.py" for i in range(FILES)]
+    hot = files[:200]
+    return [
+        rng.sample(hot if rng.random() < 0.7 else files, rng.randint(1, 40))
+        for _ in range(COMMITS)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+class TestCoChangeSparsePerformance:
+    """Seconds to build and scan a 50k-commit history."""
+
+    def test_sparse_backend_beats_mapping_backend(self) -> None:
+        commits = _history()
+        graph = ImportGraph()
+
+        start = time.perf_counter()
+        mapping = build_cochange_matrix(commits)
+        mapping_pairs = find_dark_matter(mapping, graph)
+        mapping_cost = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sparse = build_sparse_cochange_matrix(commits)
+        sparse_pairs = find_dark_matter(sparse, graph)
+        sparse_cost = time.perf_counter() - start
+
+        print(f"\nmapping {mapping_cost:.2f} s, sparse {sparse_cost:.2f} s")
+        assert len(sparse.pair_count) == len(mapping.pair_count)
+        assert {(p["a"], p["b"]) for p in sparse_pairs} == {
+            (p["a"], p["b"]) for p in mapping_pairs
+        }
+        assert sparse_cost < mapping_cost
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Quota-checked write cost and streaming memory of ArtifactStore.
+
+With a per-scope quota, every new blob used to re-read and parse every
+sidecar in the store, so write cost grew linearly with the store. The scope
+ledger makes the check independent of store size. write_stream keeps peak
+memory near one chunk instead of the whole payload.
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - quota-checked write, 500 and 4k stored artifacts: ~1 ms each (was
+      ~23 ms at 500 and ~110 ms at 4k)
+    - write_stream of 16 MiB: peak traced memory ~0.2 MiB (write_blob holds
+      the 16 MiB payload)
+
+Related:
+    - src/omnibase_core/artifacts/artifact_store.py
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.artifacts.artifact_store import (
+    ARTIFACT_STORE_ROOT_ENV,
+    ArtifactStore,
+)
+from tests.performance.conftest import ci_upper_threshold
+
+SMALL = 500
+LARGE = 4_000
+OPS = 100
+STREAM_BYTES = 16 * 1024 * 1024
+
+
+def _write(store: ArtifactStore, i: int) -> None:
+    store.write_blob(
+        f"artifact {i}\n".encode() * 8,
+        media_type="text/plain",
+        artifact_kind="tool_stdout",
+        source_system="local_cli",
+        scope_ref=f"scope-{i % 10}",
+        correlation_id=None,
+    )
+
+
+def _measure_write(root: Path, size: int, monkeypatch: pytest.MonkeyPatch) -> float:
+    monkeypatch.setenv(ARTIFACT_STORE_ROOT_ENV, str(root))
+    store = ArtifactStore(max_scope_bytes=1 << 40)
+    for i in range(size):
+        _write(store, i)
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(size, size + OPS):
+        _write(store, i)
+    return (time.perf_counter() - start) / OPS
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestArtifactStorePerformance:
+    """Per-write milliseconds and streaming peak memory."""
+
+    def test_quota_check_is_independent_of_store_size(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        small = _measure_write(tmp_path / "small", SMALL, monkeypatch)
+        large = _measure_write(tmp_path / "large", LARGE, monkeypatch)
+
+        print(
+            f"\nquota-checked write: {small * 1e3:.3f} ms at {SMALL}, "
+            f"{large * 1e3:.3f} ms at {LARGE}"
+        )
+        # 8x the artifacts must cost well under 8x per write
+        assert large < small * 3
+        assert large < ci_upper_threshold(0.01)
+
+    def test_write_stream_memory_is_bounded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(ARTIFACT_STORE_ROOT_ENV, str(tmp_path))
+        store = ArtifactStore()
+        source = tmp_path / "payload.bin"
+        source.write_bytes(os.urandom(STREAM_BYTES))
+
+        tracemalloc.start()
+        try:
+            with source.open("rb") as handle:
+                store.write_stream(
+                    handle,
+                    media_type="application/octet-stream",
+                    artifact_kind="tool_stdout",
+                    source_system="local_cli",
+                    scope_ref=None,
+                    correlation_id=None,
+                )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        print(f"\nwrite_stream peak memory: {peak / 2**20:.2f} MiB")
+        assert peak < STREAM_BYTES / 16
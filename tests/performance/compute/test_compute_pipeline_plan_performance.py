@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Throughput of compiled compute pipeline plans vs the interpreted executor.
+
+Runs one representative contract (trim, upper-case, JSON_PATH extraction and a
+four-field mapping with nested $.input paths) over the same inputs through
+execute_compute_pipeline and through a compiled plan (single and batch).
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - execute_compute_pipeline: ~9k-14k pipelines/sec
+    - compiled plan, execute() and execute_batch(): ~12k-17k pipelines/sec
+    - Per-step result models (pydantic) and the GC work they cause are the
+      remaining floor shared by both paths; with GC paused, the compiled plan
+      is ~1.5x the interpreter.
+
+Related:
+    - src/omnibase_core/utils/util_compute_pipeline_plan.py
+    - src/omnibase_core/utils/util_compute_executor.py
+"""
+
+import gc
+import time
+from uuid import uuid4
+
+import pytest
+
+from omnibase_core.enums.enum_case_mode import EnumCaseMode
+from omnibase_core.enums.enum_compute_step_type import EnumComputeStepType
+from omnibase_core.enums.enum_transformation_type import EnumTransformationType
+from omnibase_core.enums.enum_trim_mode import EnumTrimMode
+from omnibase_core.models.compute.model_compute_execution_context import (
+    ModelComputeExecutionContext,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_pipeline_step import (
+    ModelComputePipelineStep,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_subcontract import (
+    ModelComputeSubcontract,
+)
+from omnibase_core.models.transformations.model_mapping_config import (
+    ModelMappingConfig,
+)
+from omnibase_core.models.transformations.model_transform_case_config import (
+    ModelTransformCaseConfig,
+)
+from omnibase_core.models.transformations.model_transform_json_path_config import (
+    ModelTransformJsonPathConfig,
+)
+from omnibase_core.models.transformations.model_transform_trim_config import (
+    ModelTransformTrimConfig,
+)
+from omnibase_core.utils.util_compute_executor import execute_compute_pipeline
+from omnibase_core.utils.util_compute_pipeline_plan import compile_compute_pipeline
+from tests.performance.conftest import ci_threshold
+
+INPUTS = 5_000
+
+
+def _contract() -> ModelComputeSubcontract:
+    return ModelComputeSubcontract(
+        operation_name="benchmark_pipeline",
+        operation_version={"major": 1, "minor": 0, "patch": 0},
+        pipeline=[
+            ModelComputePipelineStep(
+                step_name="extract",
+                step_type=EnumComputeStepType.TRANSFORMATION,
+                transformation_type=EnumTransformationType.JSON_PATH,
+                transformation_config=ModelTransformJsonPathConfig(
+                    path="$.payload.text"
+                ),
+            ),
+            ModelComputePipelineStep(
+                step_name="trim",
+                step_type=EnumComputeStepType.TRANSFORMATION,
+                transformation_type=EnumTransformationType.TRIM,
+                transformation_config=ModelTransformTrimConfig(mode=EnumTrimMode.BOTH),
+            ),
+            ModelComputePipelineStep(
+                step_name="upper",
+                step_type=EnumComputeStepType.TRANSFORMATION,
+                transformation_type=EnumTransformationType.CASE_CONVERSION,
+                transformation_config=ModelTransformCaseConfig(mode=EnumCaseMode.UPPER),
+            ),
+            ModelComputePipelineStep(
+                step_name="shape",
+                step_type=EnumComputeStepType.MAPPING,
+                mapping_config=ModelMappingConfig(
+                    field_mappings={
+                        "text": "$.steps.upper",
+                        "user": "$.input.meta.user.name",
+                        "region": "$.input.meta.region",
+                        "source": "$.steps.extract.output",
+                    }
+                ),
+            ),
+        ],
+    )
+
+
+def _inputs() -> list[dict[str, object]]:
+    return [
+        {
+            "payload": {"text": f"  item {i}  "},
+            "meta": {"user": {"name": f"user{i}"}, "region": "eu"},
+        }
+        for i in range(INPUTS)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestComputePipelinePlanPerformance:
+    """Pipelines/sec, interpreted vs compiled, on identical inputs."""
+
+    def test_compiled_plan_outperforms_interpreter(self) -> None:
+        contract = _contract()
+        inputs = _inputs()
+        context = ModelComputeExecutionContext(operation_id=uuid4())
+        plan = compile_compute_pipeline(contract)
+
+        # Every variant keeps its results, so GC pressure is comparable
+        def interpreted() -> object:
+            return [
+                execute_compute_pipeline(contract, item, context) for item in inputs
+            ]
+
+        def compiled() -> object:
+            return [plan.execute(item, context) for item in inputs]
+
+        def batch() -> object:
+            return plan.execute_batch(inputs, context)
+
+        # Interleaved best-of rounds to damp noise on shared runners
+        best = {
+            "interpreted": float("inf"),
+            "compiled": float("inf"),
+            "batch": float("inf"),
+        }
+        for _ in range(5):
+            for name, run in (
+                ("interpreted", interpreted),
+                ("compiled", compiled),
+                ("batch", batch),
+            ):
+                gc.collect()
+                start = time.perf_counter()
+                results = run()
+                best[name] = min(best[name], time.perf_counter() - start)
+                del results
+
+        rates = {name: INPUTS / elapsed for name, elapsed in best.items()}
+        for name, rate in rates.items():
+            print(f"\n{name}: {rate:,.0f} pipelines/sec")
+
+        assert plan.execute(inputs[0], context).output == {
+            "text": "ITEM 0",
+            "user": "user0",
+            "region": "eu",
+            "source": "  item 0  ",
+        }
+        assert rates["compiled"] > rates["interpreted"] * 1.05
+        assert rates["batch"] > rates["interpreted"] * 1.05
+        assert rates["batch"] > ci_threshold(8_000)
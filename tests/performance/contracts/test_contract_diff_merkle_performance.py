@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Merkle hashing benchmark for ContractDiffComputer on large, mostly unchanged
+contracts.
+
+The default walk compares every field of both dumps. With
+use_merkle_hashing, identical subtrees are skipped by hash, and hashes are
+reused for contracts seen before (same class and dump), so re-diffing a large
+contract with one change only walks the changed path.
+
+Related:
+    - src/omnibase_core/contracts/contract_diff_computer.py
+"""
+
+import time
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from omnibase_core.contracts.contract_diff_computer import ContractDiffComputer
+from omnibase_core.models.contracts.diff.model_diff_configuration import (
+    ModelDiffConfiguration,
+)
+
+SECTIONS = 400
+ROUNDS = 20
+
+
+class LargeContract(BaseModel):
+    """Contract with many nested sections and identity-keyed dependencies."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    dependencies: list[dict[str, object]] = Field(default_factory=list)
+    sections: dict[str, dict[str, object]] = Field(default_factory=dict)
+
+
+def _contract(changed_section: int | None) -> LargeContract:
+    sections: dict[str, dict[str, object]] = {
+        f"section_{i}": {
+            "enabled": True,
+            "limits": {"timeout_ms": 1000 + i, "retries": 3},
+            "tags": [f"tag_{j}" for j in range(10)],
+        }
+        for i in range(SECTIONS)
+    }
+    if changed_section is not None:
+        sections[f"section_{changed_section}"]["enabled"] = False
+    return LargeContract(
+        name="large",
+        dependencies=[
+            {"name": f"dep_{i}", "version": "1.0.0", "options": {"lazy": i % 2 == 0}}
+            for i in range(SECTIONS)
+        ],
+        sections=sections,
+    )
+
+
+def _diff_cost(
+    computer: ContractDiffComputer, before: BaseModel, after: BaseModel
+) -> float:
+    computer.compute_diff(before, after)  # warm-up, fills the hash cache
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        diff = computer.compute_diff(before, after)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    assert [d.field_path for d in diff.field_diffs] == ["sections.section_7.enabled"]
+    return elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestContractDiffMerklePerformance:
+    """Milliseconds per diff of a large contract with a single change."""
+
+    def test_merkle_mode_skips_unchanged_subtrees(self) -> None:
+        before = _contract(None)
+        after = _contract(7)
+        identity_keys = ContractDiffComputer().config.identity_keys
+
+        full_walk = _diff_cost(
+            ContractDiffComputer(ModelDiffConfiguration(identity_keys=identity_keys)),
+            before,
+            after,
+        )
+        merkle = _diff_cost(
+            ContractDiffComputer(
+                ModelDiffConfiguration(
+                    identity_keys=identity_keys, use_merkle_hashing=True
+                )
+            ),
+            before,
+            after,
+        )
+
+        print(
+            f"\nfull walk {full_walk * 1e3:.2f} ms, merkle {merkle * 1e3:.2f} ms "
+            f"({SECTIONS} sections, {SECTIONS} dependencies)"
+        )
+        assert merkle < full_walk
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Per-operation cost of ServiceDiffFileStore as the stored history grows.
+
+put() used to call get(), which parsed the whole file, and upserts rewrote
+the file; query() parsed it twice. With the append-only segments and the
+in-memory index, put/get/query cost should not depend on history size.
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - upsert + flush, 1k and 8k stored diffs: ~0.1 ms each (was ~47 ms at 1k,
+      growing linearly)
+    - get, 1k and 8k stored diffs: ~45 us each (was ~13 ms at 1k)
+    - query by contract name, limit 10: ~0.2 ms at 1k, ~0.7 ms at 8k
+    - reopen from the index checkpoint, 8k diffs: ~0.1 s
+
+Related:
+    - src/omnibase_core/services/diff/service_diff_file_store.py
+"""
+
+import asyncio
+import gc
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.models.contracts.diff import ModelContractDiff
+from omnibase_core.models.diff.model_diff_query import ModelDiffQuery
+from omnibase_core.services.diff.service_diff_file_store import ServiceDiffFileStore
+from tests.performance.conftest import ci_upper_threshold
+
+SMALL = 1_000
+LARGE = 8_000
+OPS = 200
+
+
+def _diff(i: int) -> ModelContractDiff:
+    return ModelContractDiff(
+        before_contract_name=f"Contract{i % 50}",
+        after_contract_name=f"Contract{i % 50}",
+        computed_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(seconds=i),
+    )
+
+
+async def _measure(path: Path, size: int) -> tuple[float, float, float]:
+    store = ServiceDiffFileStore(base_path=path, buffer_size=500)
+    diffs = [_diff(i) for i in range(size)]
+    for diff in diffs:
+        await store.put(diff)
+    await store.flush()
+    store._buffer_size = 1
+    gc.collect()
+
+    start = time.perf_counter()
+    for diff in diffs[:OPS]:
+        await store.put(diff.model_copy(update={"after_contract_name": "Updated"}))
+    upsert = (time.perf_counter() - start) / OPS
+
+    start = time.perf_counter()
+    for diff in diffs[-OPS:]:
+        await store.get(diff.diff_id)
+    get = (time.perf_counter() - start) / OPS
+
+    start = time.perf_counter()
+    for i in range(OPS // 10):
+        await store.query(ModelDiffQuery(contract_name=f"Contract{i}", limit=10))
+    query = (time.perf_counter() - start) / (OPS // 10)
+    await store.close()
+    return upsert, get, query
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestDiffFileStorePerformance:
+    """Milliseconds per operation at two history sizes."""
+
+    def test_operation_cost_is_independent_of_history_size(
+        self, tmp_path: Path
+    ) -> None:
+        small = asyncio.run(_measure(tmp_path / "small", SMALL))
+        large = asyncio.run(_measure(tmp_path / "large", LARGE))
+
+        start = time.perf_counter()
+        reopened = ServiceDiffFileStore(base_path=tmp_path / "large")
+        assert asyncio.run(reopened.count()) == LARGE
+        reopen = time.perf_counter() - start
+
+        for name, at_small, at_large in zip(
+            ("upsert", "get", "query"), small, large, strict=True
+        ):
+            print(
+                f"\n{name}: {at_small * 1e3:.3f} ms at {SMALL}, "
+                f"{at_large * 1e3:.3f} ms at {LARGE}"
+            )
+        print(f"reopen from checkpoint: {reopen:.2f} s")
+        # 8x the history must cost well under 8x per operation
+        assert large[0] < small[0] * 3
+        assert large[1] < small[1] * 3
+        assert large[0] < ci_upper_threshold(0.005)
+        assert large[1] < ci_upper_threshold(0.001)
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Planning benchmark for BackwardChainingPlanner on a 2k-node registry graph.
+
+Every node declares six transitions to random targets, so simple paths within
+the default max_depth number in the billions; path-enumerating search did not
+finish on such graphs. The planner searches over nodes instead, and repeated
+queries are served from its per-(graph hash, start, goal) plan cache.
+
+Related:
+    - src/omnibase_core/navigation/model_backward_chaining.py
+"""
+
+import random
+import time
+
+import pytest
+
+from omnibase_core.navigation.model_backward_chaining import BackwardChainingPlanner
+from omnibase_core.navigation.model_contract_graph import (
+    RegistryNode,
+    RegistrySnapshot,
+    RegistryTransitionDecl,
+)
+from omnibase_core.navigation.model_contract_graph_builder import (
+    ContractGraphBuilder,
+)
+from omnibase_core.navigation.model_graph_boundary import (
+    GoalCondition,
+    NoPlanFound,
+    Plan,
+)
+
+NODES = 2000
+FANOUT = 6
+QUERIES = 50
+
+
+def _snapshot() -> RegistrySnapshot:
+    rng = random.Random(2561)
+    nodes = [
+        RegistryNode(
+            node_id=f"node.{i:04d}",
+            schema_version="1.0.0",
+            declared_transitions=tuple(
+                RegistryTransitionDecl(
+                    transition_id=f"t.{i}.{k}",
+                    target_node_id=f"node.{rng.randrange(NODES - 1):04d}",
+                    latency_estimate_ms=rng.randrange(100),
+                )
+                for k in range(FANOUT)
+            ),
+        )
+        for i in range(NODES - 1)
+    ]
+    # A sink that no query can leave
+    nodes.append(RegistryNode(node_id=f"node.{NODES - 1:04d}", schema_version="1.0.0"))
+    return RegistrySnapshot(nodes=tuple(nodes))
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestBackwardChainingPerformance:
+    """Milliseconds per plan query on a dense 2k-node graph."""
+
+    def test_plan_queries_on_dense_graph(self) -> None:
+        graph = ContractGraphBuilder().build(_snapshot())
+        planner = BackwardChainingPlanner()
+        rng = random.Random(7)
+        queries = [
+            (
+                graph.states[f"node.{rng.randrange(NODES):04d}"],
+                GoalCondition(target_node_id=f"node.{rng.randrange(NODES - 1):04d}"),
+            )
+            for _ in range(QUERIES)
+        ]
+
+        start = time.perf_counter()
+        results = [planner.plan(graph, goal, state) for state, goal in queries]
+        cold = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        for (state, goal), result in zip(queries, results, strict=True):
+            assert planner.plan(graph, goal, state) is result
+        cached = (time.perf_counter() - start) / QUERIES
+
+        plans = [r for r in results if isinstance(r, Plan)]
+        print(
+            f"\n{len(plans)}/{QUERIES} plans, {cold * 1e3:.2f} ms per query, "
+            f"{cached * 1e3:.3f} ms cached ({NODES} nodes, {graph.edge_count} edges)"
+        )
+        assert plans
+        assert all(len(p.steps) <= planner.max_depth for p in plans)
+        assert all(
+            isinstance(r, NoPlanFound)
+            for (state, _goal), r in zip(queries, results, strict=True)
+            if state.node_id == f"node.{NODES - 1:04d}"
+        )
+        assert cached < cold
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmarks for workflow context construction on large workflows.
+
+Sequential execution hands each step a context of all prior outputs.
+Rebuilding it per step (_build_workflow_context) is O(steps^2) overall;
+UtilIncrementalWorkflowContext records each step once and snapshots in O(1).
+Workflows of 1k-5k steps are in scope, because MAX_DFS_ITERATIONS is sized
+for ~5,000 steps.
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - Context only, 2k steps: rebuild ~5s, incremental ~6ms
+    - execute_workflow (sequential), 1k-5k steps: ~170-220 us/step,
+      dominated by action creation
+
+Related:
+    - src/omnibase_core/utils/util_incremental_workflow_context.py
+    - src/omnibase_core/utils/util_workflow_executor.py
+"""
+
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+from omnibase_core.enums.enum_workflow_coordination import EnumFailureRecoveryStrategy
+from omnibase_core.enums.enum_workflow_execution import EnumExecutionMode
+from omnibase_core.enums.enum_workflow_status import EnumWorkflowStatus
+from omnibase_core.models.contracts.model_workflow_step import ModelWorkflowStep
+from omnibase_core.models.contracts.subcontracts.model_coordination_rules import (
+    ModelCoordinationRules,
+)
+from omnibase_core.models.contracts.subcontracts.model_execution_graph import (
+    ModelExecutionGraph,
+)
+from omnibase_core.models.contracts.subcontracts.model_workflow_definition import (
+    ModelWorkflowDefinition,
+)
+from omnibase_core.models.contracts.subcontracts.model_workflow_definition_metadata import (
+    ModelWorkflowDefinitionMetadata,
+)
+from omnibase_core.models.primitives.model_semver import ModelSemVer
+from omnibase_core.utils import util_workflow_executor
+from omnibase_core.utils.util_incremental_workflow_context import (
+    UtilIncrementalWorkflowContext,
+)
+from omnibase_core.utils.util_workflow_executor import (
+    _build_workflow_context,
+    execute_workflow,
+)
+from tests.performance.conftest import ci_upper_threshold
+
+
+def _workflow_definition() -> ModelWorkflowDefinition:
+    semver = ModelSemVer(major=1, minor=0, patch=0)
+    return ModelWorkflowDefinition(
+        workflow_metadata=ModelWorkflowDefinitionMetadata(
+            workflow_name="large_workflow",
+            workflow_version=semver,
+            version=semver,
+            description="benchmark",
+            execution_mode="sequential",
+            timeout_ms=3_600_000,
+        ),
+        execution_graph=ModelExecutionGraph(nodes=[], version=semver),
+        coordination_rules=ModelCoordinationRules(
+            parallel_execution_allowed=False,
+            failure_recovery_strategy=EnumFailureRecoveryStrategy.RETRY,
+            version=semver,
+        ),
+        version=semver,
+    )
+
+
+def _lanes(count: int, lanes: int = 50) -> list[ModelWorkflowStep]:
+    # Interleaved dependency chains; bounded depth keeps the recursive cycle
+    # check within the interpreter recursion limit.
+    steps: list[ModelWorkflowStep] = []
+    for i in range(count):
+        steps.append(
+            ModelWorkflowStep(
+                step_id=uuid4(),
+                step_name=f"step_{i}",
+                step_type="compute",
+                depends_on=[steps[i - lanes].step_id] if i >= lanes else [],
+            )
+        )
+    return steps
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestWorkflowContextPerformance:
+    """Context construction cost as workflows grow to thousands of steps."""
+
+    def test_incremental_context_vs_rebuild(self) -> None:
+        workflow_id = uuid4()
+        step_ids = [uuid4() for _ in range(2_000)]
+        output = {"data": 1}
+
+        start = time.perf_counter()
+        completed: set[UUID] = set()
+        outputs: dict[UUID, object] = {}
+        for step_id in step_ids:
+            _build_workflow_context(workflow_id, completed, outputs)
+            completed.add(step_id)
+            outputs[step_id] = output
+        rebuild = time.perf_counter() - start
+
+        start = time.perf_counter()
+        builder = UtilIncrementalWorkflowContext(workflow_id)
+        for step_id in step_ids:
+            builder.snapshot()
+            builder.record(step_id, output)
+        incremental = time.perf_counter() - start
+
+        print(
+            f"\n2,000 steps: rebuild {rebuild * 1000:.1f} ms, "
+            f"incremental {incremental * 1000:.1f} ms"
+        )
+        assert incremental * 20 < rebuild
+
+    @pytest.mark.asyncio
+    async def test_sequential_per_step_cost_is_flat(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(util_workflow_executor, "MAX_WORKFLOW_STEPS", 5_000)
+        definition = _workflow_definition()
+
+        per_step: dict[int, float] = {}
+        for count in (1_000, 2_500, 5_000):
+            steps = _lanes(count)
+            start = time.perf_counter()
+            result = await execute_workflow(
+                definition, steps, uuid4(), EnumExecutionMode.SEQUENTIAL
+            )
+            per_step[count] = (time.perf_counter() - start) / count
+            assert result.execution_status == EnumWorkflowStatus.COMPLETED
+            print(f"\n{count:,} steps: {per_step[count] * 1e6:.0f} us/step")
+
+        # Quadratic context rebuilding made 5k steps ~5x costlier per step than 1k.
+        assert per_step[5_000] < per_step[1_000] * ci_upper_threshold(2.0)
@@ -0,0 +1,9 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""# ai-slop-ok: pre-existing boilerplate, suppressed per OMN-4405
+Performance tests for ONEX contract models.
+
+This module contains performance benchmarks for contract validation,
+dependency resolution, and workflow orchestration components.
+"""
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Round-trip benchmark for the runtime envelope boundary.
+
+Compares the generic path (``decode_inbound_envelope`` + re-validating the payload
+dict into the route's input model + ``model_dump_json().encode()``) against a
+route-bound :class:`EnvelopeCodec` (typed one-pass decode + direct-to-bytes encode).
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - generic round trip: ~12k msgs/sec
+    - EnvelopeCodec round trip: ~13.5k msgs/sec; never slower than generic
+
+Related:
+    - src/omnibase_core/runtime/runtime_envelope_codec.py
+    - tests/unit/runtime/test_runtime_envelope_codec.py
+"""
+
+import time
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from omnibase_core.models.events.model_event_envelope import ModelEventEnvelope
+from omnibase_core.runtime.runtime_envelope_codec import EnvelopeCodec
+from omnibase_core.runtime.runtime_envelope_router import (
+    decode_inbound_envelope,
+    wrap_outbound_envelope,
+)
+from tests.performance.conftest import ci_threshold
+
+TOPIC = "onex.evt.omnibench.codec-done.v1"
+MESSAGE_COUNT = 2_000
+ROUNDS = 5
+
+
+class _Req(BaseModel):
+    name: str
+    count: int
+    tags: list[str]
+
+
+class _Evt(BaseModel):
+    name: str
+    total: int
+
+
+def _raw_inbound() -> bytes:
+    inbound = ModelEventEnvelope(
+        payload={"name": "bench", "count": 3, "tags": ["a", "b", "c"]},
+        correlation_id=uuid4(),
+    )
+    return inbound.model_dump_json().encode("utf-8")
+
+
+def _generic_round_trip(raw: bytes) -> None:
+    envelope = decode_inbound_envelope(raw)
+    request = _Req(**envelope.payload)  # type: ignore[arg-type]
+    out = wrap_outbound_envelope(
+        _Evt(name=request.name, total=request.count),
+        inbound_envelope=envelope,
+        idx=0,
+        topic=TOPIC,
+    )
+    out.model_dump_json().encode("utf-8")
+
+
+def _codec_round_trip(codec: EnvelopeCodec, raw: bytes) -> None:
+    envelope = codec.decode(raw)
+    request = envelope.payload
+    assert isinstance(request, _Req)
+    out = wrap_outbound_envelope(
+        _Evt(name=request.name, total=request.count),
+        inbound_envelope=envelope,
+        idx=0,
+        topic=TOPIC,
+    )
+    codec.encode(out)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestEnvelopeCodecPerformance:
+    """Messages/sec for the generic vs codec envelope round trip."""
+
+    def test_codec_round_trip_throughput(self) -> None:
+        raw = _raw_inbound()
+        codec = EnvelopeCodec(_Req)
+        generic_best = codec_best = float("inf")
+        # Interleaved rounds, best-of: a shared runner's noise hits both paths alike.
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for _ in range(MESSAGE_COUNT):
+                _generic_round_trip(raw)
+            generic_best = min(generic_best, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(MESSAGE_COUNT):
+                _codec_round_trip(codec, raw)
+            codec_best = min(codec_best, time.perf_counter() - start)
+        generic_rate = MESSAGE_COUNT / generic_best
+        codec_rate = MESSAGE_COUNT / codec_best
+
+        print(
+            f"\nenvelope round trip: generic={generic_rate:,.0f} msgs/s "
+            f"codec={codec_rate:,.0f} msgs/s"
+        )
+        assert codec_rate > ci_threshold(1_000)
+        assert codec_rate > ci_threshold(generic_rate * 0.9)
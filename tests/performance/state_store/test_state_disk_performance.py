@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Per-operation cost of ServiceStateDisk by file format and cache state.
+
+Every get() used to parse YAML from disk and every list_keys() walked the
+state tree. With the key index and LRU cache, hot reads and key queries stay
+in memory; JSON state files serialize and parse several times faster than
+YAML.
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - put, YAML: ~3.5 ms; JSON: ~0.6 ms
+    - cold get (cache disabled), YAML: ~6 ms; JSON: ~0.15 ms
+    - cached get: ~2 us (every get used to parse YAML, ~6 ms)
+    - list_keys over 200 keys: ~75 us (was a directory walk, ~5 ms)
+
+Related:
+    - src/omnibase_core/services/state/service_state_disk.py
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.enums.enum_data_format import EnumDataFormat
+from omnibase_core.models.state.model_state_envelope import ModelStateEnvelope
+from omnibase_core.services.state.service_state_disk import ServiceStateDisk
+from tests.performance.conftest import ci_upper_threshold
+
+KEYS = 200
+
+
+def _envelope(i: int) -> ModelStateEnvelope:
+    return ModelStateEnvelope(
+        node_id=f"node-{i % 20}",
+        scope_id=f"scope-{i}",
+        data={"step": i, "items": [{"id": j, "name": f"item-{j}"} for j in range(20)]},
+        written_at=datetime.now(UTC),
+    )
+
+
+async def _measure(
+    path: Path, file_format: EnumDataFormat
+) -> tuple[float, float, float, float]:
+    envelopes = [_envelope(i) for i in range(KEYS)]
+    store = ServiceStateDisk(state_root=path, file_format=file_format)
+
+    start = time.perf_counter()
+    for envelope in envelopes:
+        await store.put(envelope)
+    put = (time.perf_counter() - start) / KEYS
+
+    start = time.perf_counter()
+    for envelope in envelopes:
+        await store.get(envelope.node_id, envelope.scope_id)
+    cached = (time.perf_counter() - start) / KEYS
+
+    cold_store = ServiceStateDisk(
+        state_root=path, file_format=file_format, cache_size=0
+    )
+    await cold_store.list_keys()
+    start = time.perf_counter()
+    for envelope in envelopes:
+        await cold_store.get(envelope.node_id, envelope.scope_id)
+    cold = (time.perf_counter() - start) / KEYS
+
+    start = time.perf_counter()
+    for _ in range(100):
+        await store.list_keys()
+    list_keys = (time.perf_counter() - start) / 100
+    return put, cold, cached, list_keys
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestStateDiskPerformance:
+    """Milliseconds per operation for YAML and JSON stores."""
+
+    def test_json_is_faster_and_hot_paths_stay_in_memory(self, tmp_path: Path) -> None:
+        yaml_costs = asyncio.run(_measure(tmp_path / "yaml", EnumDataFormat.YAML))
+        json_costs = asyncio.run(_measure(tmp_path / "json", EnumDataFormat.JSON))
+
+        for name, as_yaml, as_json in zip(
+            ("put", "cold get", "cached get", "list_keys"),
+            yaml_costs,
+            json_costs,
+            strict=True,
+        ):
+            print(f"\n{name}: YAML {as_yaml * 1e3:.3f} ms, JSON {as_json * 1e3:.3f} ms")
+        assert json_costs[0] < yaml_costs[0]
+        assert json_costs[1] < yaml_costs[1]
+        assert json_costs[2] < ci_upper_threshold(0.0001)
+        assert json_costs[3] < ci_upper_threshold(0.001)
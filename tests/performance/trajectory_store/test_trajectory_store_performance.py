@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Append throughput and reopen cost of TrajectoryStore.
+
+append() used to open, write and close the JSONL for every entry. The store
+now keeps the handle open, and with batch_size > 1 group commits appends.
+Reopening reconciles the offset index and reads the newest entries backwards
+from the end of the file, so its cost does not grow with session length.
+
+Performance Baselines (as of 2026-10-16, single shared core):
+    - append, write-through (default): ~11 us (was ~30 us with open/close)
+    - append, batch_size=256: ~6.5 us
+    - reopen with 20k entries: ~4 ms
+    - read_recent page past the cache, 20k entries: ~0.4 ms for 100 entries
+
+Related:
+    - src/omnibase_core/agents/trajectory_store.py
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.agents.trajectory_store import TrajectoryStore
+from omnibase_core.models.agents.model_trajectory_entry import ModelTrajectoryEntry
+from tests.performance.conftest import ci_upper_threshold
+
+APPENDS = 20_000
+
+
+def _entries() -> list[ModelTrajectoryEntry]:
+    return [
+        ModelTrajectoryEntry(
+            step=i, agent="agent-a", action="edit", target="src/foo.py", result="ok"
+        )
+        for i in range(APPENDS)
+    ]
+
+
+def _append_cost(path: Path, session_id: str, batch_size: int) -> float:
+    entries = _entries()
+    store = TrajectoryStore(session_id, state_dir=path, batch_size=batch_size)
+    start = time.perf_counter()
+    for entry in entries:
+        store.append(entry)
+    store.close()
+    return (time.perf_counter() - start) / APPENDS
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.timeout(120)
+class TestTrajectoryStorePerformance:
+    """Microseconds per append and milliseconds per reopen."""
+
+    def test_append_and_reopen(self, tmp_path: Path) -> None:
+        write_through = _append_cost(tmp_path, "write-through", 1)
+        batched = _append_cost(tmp_path, "batched", 256)
+
+        start = time.perf_counter()
+        store = TrajectoryStore("batched", state_dir=tmp_path)
+        reopen = time.perf_counter() - start
+        start = time.perf_counter()
+        page = store.read_recent(100, offset=APPENDS // 2)
+        page_cost = time.perf_counter() - start
+
+        print(
+            f"\nappend: write-through {write_through * 1e6:.1f} us, "
+            f"batched {batched * 1e6:.1f} us"
+        )
+        print(f"reopen: {reopen * 1e3:.2f} ms, page: {page_cost * 1e3:.2f} ms")
+        assert [e.step for e in page] == list(range(APPENDS // 2 - 100, APPENDS // 2))
+        assert batched < write_through
+        assert reopen < ci_upper_threshold(0.1)
+        assert page_cost < ci_upper_threshold(0.01)
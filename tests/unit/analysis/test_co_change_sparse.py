@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+import random
+
+import pytest
+
+from omnibase_core.analysis.co_change_dark_matter import find_dark_matter
+from omnibase_core.analysis.co_change_matrix import (
+    build_cochange_matrix,
+    compute_lift,
+    compute_npmi,
+)
+from omnibase_core.analysis.co_change_sparse import build_sparse_cochange_matrix
+from omnibase_core.analysis.import_graph import ImportGraph
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+pytestmark = pytest.mark.unit
+
+
+def _random_commits(seed: int, count: int = 300) -> list[list[str]]:
+    rng = random.Random(seed)
+    files = [f"pkg{i % 5}/sub{i % 3}/mod/f{i}.py" for i in range(40)]
+    return [rng.sample(files, rng.randint(1, 6)) for _ in range(count)]
+
+
+def test_counts_match_mapping_backend() -> None:
+    commits = _random_commits(1)
+    commits.append(["dup.py", "dup.py", "pkg0/sub0/mod/f0.py"])
+    sparse = build_sparse_cochange_matrix(commits).to_cochange_matrix()
+    expected = build_cochange_matrix(commits)
+    assert dict(sparse.pair_count) == dict(expected.pair_count)
+    assert dict(sparse.file_count) == dict(expected.file_count)
+    assert sparse.total_commits == expected.total_commits
+
+
+def test_pairs_are_oriented_and_ordered() -> None:
+    m = build_sparse_cochange_matrix([["z.py", "a.py", "m.py"], ["a.py", "z.py"]])
+    assert m.files == ("a.py", "m.py", "z.py")
+    assert list(zip(m.pair_a.tolist(), m.pair_b.tolist(), strict=True)) == [
+        (0, 1),
+        (0, 2),
+        (1, 2),
+    ]
+    assert m.pair_count.tolist() == [1, 2, 1]
+    assert m.file_count.tolist() == [2, 1, 2]
+
+
+def test_empty_commits() -> None:
+    m = build_sparse_cochange_matrix([])
+    assert m.files == ()
+    assert m.total_commits == 0
+    assert list(m.scored_pairs()) == []
+
+
+def test_arrays_are_read_only() -> None:
+    m = build_sparse_cochange_matrix([["a.py", "b.py"]])
+    with pytest.raises(ValueError):
+        m.pair_count[0] = 99
+
+
+def test_scores_match_scalar_functions() -> None:
+    commits = _random_commits(2)
+    m = build_sparse_cochange_matrix(commits)
+    total = len(commits)
+    file_count = build_cochange_matrix(commits).file_count
+    scored = list(m.scored_pairs())
+    assert len(scored) == len(m.pair_count)
+    for a, b, npmi, co in scored:
+        p_a, p_b, p_ab = file_count[a] / total, file_count[b] / total, co / total
+        assert npmi == pytest.approx(compute_npmi(p_a, p_b, p_ab))
+    npmis = [npmi for _, _, npmi, _ in scored]
+    assert npmis == sorted(npmis, reverse=True)
+
+
+def test_thresholds_filter_pairs() -> None:
+    commits = _random_commits(3)
+    m = build_sparse_cochange_matrix(commits)
+    total = len(commits)
+    file_count = build_cochange_matrix(commits).file_count
+    for a, b, npmi, co in m.scored_pairs(min_co_changes=3, min_npmi=0.1, min_lift=1.2):
+        assert co >= 3
+        assert npmi >= 0.1
+        lift = compute_lift(file_count[a] / total, file_count[b] / total, co / total)
+        assert lift >= 1.2 - 1e-12
+
+
+def test_pair_in_every_commit_scores_one() -> None:
+    m = build_sparse_cochange_matrix([["a.py", "b.py"]] * 4)
+    assert list(m.scored_pairs()) == [("a.py", "b.py", 1.0, 4)]
+
+
+def test_find_dark_matter_matches_mapping_backend() -> None:
+    commits = [
+        ["src/x/a/one.py", "lib/y/b/two.py"],
+        ["src/x/a/one.py", "lib/y/b/two.py", "docs/z/c/three.md"],
+        ["src/x/a/one.py", "lib/y/b/two.py"],
+        ["docs/z/c/three.md", "tests/q/r/test_one.py"],
+    ] * 3
+    graph = ImportGraph()
+    sparse = find_dark_matter(build_sparse_cochange_matrix(commits), graph)
+    assert sparse == find_dark_matter(build_cochange_matrix(commits), graph)
+    assert [(p["a"], p["b"]) for p in sparse] == [("lib/y/b/two.py", "src/x/a/one.py")]
@@ -798,9 +798,9 @@ class TestEdgeCases:
     def test_empty_string_to_value_is_change(self) -> None:
         """Test that empty string to value is detected as change.
 
-        Note: None -> value transitions in optional fields may cause validation
-        issues since the field exists in both models. This test verifies that
-        empty string to non-empty string is properly detected as a change.
+        Note: None -> value transitions are reported as ADDED/REMOVED, see
+        test_none_to_value_is_added. This test verifies that empty string to
+        non-empty string is properly detected as a change.
         """
         before = SampleContractWithOptional(name="test", optional_field="")
         after = SampleContractWithOptional(name="test", optional_field="new_value")
@@ -814,6 +814,18 @@ class TestEdgeCases:
         assert field_diff is not None
         assert field_diff.change_type == EnumContractDiffChangeType.MODIFIED
 
+    def test_none_to_value_is_added(self) -> None:
+        """Test that optional fields set or cleared are ADDED or REMOVED."""
+        before = SampleContractWithOptional(name="test", optional_list=["x"])
+        after = SampleContractWithOptional(name="test", optional_int=1)
+        diff = compute_contract_diff(before, after)
+
+        change_types = {d.field_path: d.change_type for d in diff.field_diffs}
+        assert change_types == {
+            "optional_int": EnumContractDiffChangeType.ADDED,
+            "optional_list": EnumContractDiffChangeType.REMOVED,
+        }
+
     def test_empty_list_vs_populated_list(self) -> None:
         """Test comparing empty list to populated list."""
         before = SampleContract(name="test", tags=[])
@@ -1083,6 +1095,145 @@ class TestDuplicateIdentityKeys:
         assert len(deps_diff.added_items) == 3
 
 
+# =================== MERKLE HASHING TESTS ===================
+
+
+def _merkle_config(**kwargs: object) -> ModelDiffConfiguration:
+    base = ContractDiffComputer().config
+    return ModelDiffConfiguration(
+        identity_keys=base.identity_keys, use_merkle_hashing=True, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestMerkleHashing:
+    """Tests for the use_merkle_hashing diff mode."""
+
+    @pytest.mark.parametrize(
+        ("before", "after"),
+        [
+            (
+                SampleContract(name="a", tags=["x", "y"]),
+                SampleContract(name="a", tags=["y", "z"]),
+            ),
+            (
+                SampleContract(
+                    name="a", dependencies=[{"name": "d1", "v": 1}, {"name": "d2"}]
+                ),
+                SampleContract(
+                    name="a", dependencies=[{"name": "d2"}, {"name": "d1", "v": 2}]
+                ),
+            ),
+            (
+                SampleContractWithNested(
+                    name="a", metadata={"k": {"deep": [1, 2]}, "same": {"x": 1}}
+                ),
+                SampleContractWithNested(
+                    name="a",
+                    config=NestedConfig(retry_count=9),
+                    metadata={"k": {"deep": [1, 3]}, "same": {"x": 1}},
+                ),
+            ),
+            (
+                SampleContractWithOptional(name="a", optional_list=["x"]),
+                SampleContractWithOptional(name="a", optional_int=1),
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("include_unchanged", [False, True])
+    def test_matches_default_mode(
+        self, before: BaseModel, after: BaseModel, include_unchanged: bool
+    ) -> None:
+        """Merkle mode reports exactly what the full walk reports."""
+        default = ContractDiffComputer(
+            ModelDiffConfiguration(
+                identity_keys=ContractDiffComputer().config.identity_keys,
+                include_unchanged=include_unchanged,
+            )
+        ).compute_diff(before, after)
+        merkle = ContractDiffComputer(
+            _merkle_config(include_unchanged=include_unchanged)
+        ).compute_diff(before, after)
+
+        assert merkle.field_diffs == default.field_diffs
+        assert merkle.list_diffs == default.list_diffs
+        assert merkle.before_fingerprint == default.before_fingerprint
+
+    def test_identical_subtrees_are_not_walked(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only subtrees whose hashes differ are descended into."""
+        metadata = {f"section_{i}": {"values": list(range(20))} for i in range(50)}
+        changed = {**metadata, "section_7": {"values": [0]}}
+        before = SampleContractWithNested(name="a", metadata=metadata)
+        after = SampleContractWithNested(name="a", metadata=changed)
+        visited: list[str] = []
+        original = ContractDiffComputer._diff_objects
+
+        def spy(self: ContractDiffComputer, *args: object, **kwargs: object) -> None:
+            visited.append(str(kwargs["path"]))
+            original(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(ContractDiffComputer, "_diff_objects", spy)
+        diff = ContractDiffComputer(_merkle_config()).compute_diff(before, after)
+
+        assert visited == ["", "metadata", "metadata.section_7"]
+        assert [d.field_path for d in diff.field_diffs] == [
+            f"metadata.section_7.values[{i}]" for i in range(1, 20)
+        ]
+
+    def test_identical_contracts_skip_walk(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Equal root hashes produce an empty diff without walking."""
+        before = SampleContractWithNested(name="a", metadata={"k": [1, 2]})
+        after = SampleContractWithNested(name="a", metadata={"k": [1, 2]})
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("walked identical contracts")
+
+        monkeypatch.setattr(ContractDiffComputer, "_diff_objects", fail)
+        diff = ContractDiffComputer(_merkle_config()).compute_diff(before, after)
+
+        assert not diff.has_changes
+
+    def test_excluded_fields_still_ignored(self) -> None:
+        """Subtrees differing only in excluded keys compare equal."""
+        before = SampleContract(
+            name="a", dependencies=[{"name": "d1", "computed_at": "t1"}]
+        )
+        after = SampleContract(
+            name="a", dependencies=[{"name": "d1", "computed_at": "t2"}]
+        )
+
+        diff = ContractDiffComputer(_merkle_config()).compute_diff(before, after)
+
+        assert not diff.has_changes
+
+    def test_unhashable_values_fall_back_to_walk(self) -> None:
+        """NaN and unknown types disable skipping instead of hiding changes."""
+        before = SampleContractWithNested(
+            name="a", metadata={"nan": float("nan"), "v": 1}
+        )
+        after = SampleContractWithNested(
+            name="a", metadata={"nan": float("nan"), "v": 2}
+        )
+
+        diff = ContractDiffComputer(_merkle_config()).compute_diff(before, after)
+
+        field_paths = {d.field_path for d in diff.field_diffs}
+        assert "metadata.v" in field_paths
+
+    def test_equal_fingerprints_are_not_conflated(self) -> None:
+        """Contracts differing only in what fingerprints ignore still differ."""
+        before = SampleContractWithNested(name="a", metadata={"k": {"z": 1}})
+        after = SampleContractWithNested(name="a", metadata={"k": {"z": 1}, "e": {}})
+
+        diff = ContractDiffComputer(_merkle_config()).compute_diff(before, after)
+
+        assert [d.field_path for d in diff.field_diffs] == ["metadata.e"]
+
+
 # =================== GENERATE REVERSE PATCH TESTS ===================
 
 
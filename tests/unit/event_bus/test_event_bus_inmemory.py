@@ -4,10 +4,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import pytest
 
+from omnibase_core.enums.enum_subscriber_dispatch_mode import (
+    EnumSubscriberDispatchMode,
+)
 from omnibase_core.event_bus.event_bus_inmemory import EventBusInmemory
 from omnibase_core.models.errors.model_onex_error import ModelOnexError
 from omnibase_core.models.event_bus.model_event_message import ModelEventMessage
@@ -269,6 +274,83 @@ class TestEventBusInmemoryDebugging:
 
         await bus.close()
 
+    @pytest.mark.asyncio
+    async def test_topic_history_has_own_retention(self) -> None:
+        bus = EventBusInmemory(max_history=10, max_topic_history=4)
+        await bus.start()
+
+        for i in range(6):
+            await bus.publish("a", None, str(i).encode())
+        for i in range(3):
+            await bus.publish("b", None, str(i).encode())
+
+        assert len(await bus.get_event_history()) == 9
+        history_a = await bus.get_event_history(topic="a")
+        assert [m.value for m in history_a] == [b"2", b"3", b"4", b"5"]
+        recent_a = await bus.get_event_history(limit=2, topic="a")
+        assert [m.value for m in recent_a] == [b"4", b"5"]
+
+        await bus.clear_event_history()
+        assert await bus.get_event_history(topic="a") == []
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_topic_history_bounded_by_global_history(self) -> None:
+        bus = EventBusInmemory(max_history=4, max_topic_history=4)
+        await bus.start()
+
+        for topic in ("a", "a", "b", "c", "c", "c"):
+            await bus.publish(topic, None, topic.encode())
+
+        # "a" aged out of the global history and its topic entry was freed
+        assert "a" not in bus._topic_history
+        assert len(await bus.get_event_history(topic="b")) == 1
+        assert len(await bus.get_event_history(topic="c")) == 3
+        assert sum(len(h) for h in bus._topic_history.values()) <= 4
+
+        await bus.initialize({"max_history": 2})
+        assert "b" not in bus._topic_history
+        assert len(await bus.get_event_history(topic="c")) == 2
+        await bus.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("max_history", "events", "limit"), [(5, 3, 100), (1000, 500, 300)]
+    )
+    async def test_single_topic_history_matches_unfiltered_history(
+        self, max_history: int, events: int, limit: int
+    ) -> None:
+        bus = EventBusInmemory(max_history=max_history)
+        await bus.start()
+
+        for i in range(events):
+            await bus.publish("only", None, str(i).encode())
+
+        unfiltered = await bus.get_event_history(limit=limit)
+        assert await bus.get_event_history(limit=limit, topic="only") == unfiltered
+        assert len(unfiltered) == min(events, limit)
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_counters_track_unsubscribe(self) -> None:
+        bus = EventBusInmemory()
+        await bus.start()
+
+        async def handler(msg: ModelEventMessage) -> None:
+            pass
+
+        unsub_a = await bus.subscribe("t1", group_id="g1", on_message=handler)
+        unsub_b = await bus.subscribe("t1", group_id="g2", on_message=handler)
+        await bus.subscribe("t2", group_id="g1", on_message=handler)
+
+        await unsub_a()
+        await unsub_a()  # second call is a no-op
+        assert await bus.get_subscriber_count() == 2
+        await unsub_b()
+        health = await bus.health_check()
+        assert "subscribers=1 topics=1" in health["status"]
+        await bus.close()
+
     @pytest.mark.asyncio
     async def test_subscriber_count_and_topics(self) -> None:
         bus = EventBusInmemory()
@@ -373,3 +455,168 @@ class TestEventBusInmemoryInitialize:
         assert health["healthy"] is True
 
         await bus.close()
+
+
+@pytest.mark.unit
+async def _until(condition: Callable[[], bool]) -> None:
+    """Yield to the loop until ``condition`` holds."""
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+class TestEventBusInmemoryConcurrentDispatch:
+    """Concurrent subscriber dispatch tests."""
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_other_groups(self) -> None:
+        bus = EventBusInmemory(dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT)
+        await bus.start()
+
+        release = asyncio.Event()
+        fast_received: list[ModelEventMessage] = []
+
+        async def slow(msg: ModelEventMessage) -> None:
+            await release.wait()
+
+        async def fast(msg: ModelEventMessage) -> None:
+            fast_received.append(msg)
+            release.set()
+
+        await bus.subscribe("t", group_id="slow", on_message=slow)
+        await bus.subscribe("t", group_id="fast", on_message=fast)
+
+        await asyncio.wait_for(bus.publish("t", None, b"v"), timeout=1.0)
+        assert len(fast_received) == 1
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_within_lane(self) -> None:
+        bus = EventBusInmemory(dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT)
+        await bus.start()
+
+        received: list[bytes] = []
+
+        async def handler(msg: ModelEventMessage) -> None:
+            await asyncio.sleep(0.01 if msg.value == b"0" else 0)
+            received.append(msg.value)
+
+        await bus.subscribe("t", group_id="g", on_message=handler)
+        await asyncio.gather(
+            *(bus.publish("t", None, str(i).encode()) for i in range(5))
+        )
+        assert received == [b"0", b"1", b"2", b"3", b"4"]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_group_concurrency_limit(self) -> None:
+        bus = EventBusInmemory(
+            dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT,
+            group_concurrency_limits={"g": 1},
+        )
+        await bus.start()
+
+        active = 0
+        peak = 0
+
+        async def handler(msg: ModelEventMessage) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+        for topic in ("a", "b", "c"):
+            await bus.subscribe(topic, group_id="g", on_message=handler)
+        await asyncio.gather(*(bus.publish(t, None, b"v") for t in ("a", "b", "c")))
+        assert peak == 1
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_republish_from_subscriber_does_not_deadlock(self) -> None:
+        bus = EventBusInmemory(
+            dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT,
+            max_concurrent_deliveries=1,
+            group_concurrency_limits={"g": 1},
+        )
+        await bus.start()
+
+        received: list[bytes] = []
+
+        async def handler(msg: ModelEventMessage) -> None:
+            received.append(msg.value)
+            if msg.value == b"first":
+                await bus.publish("t", None, b"second")
+                await bus.publish("other", None, b"third")
+
+        await bus.subscribe("t", group_id="g", on_message=handler)
+        await bus.subscribe("other", group_id="g", on_message=handler)
+        await asyncio.wait_for(bus.publish("t", None, b"first"), timeout=1.0)
+        # Delivered inline to the publishing lane; "other" is a separate lane
+        # that runs once the publishing lane releases the semaphores
+        assert received[:2] == [b"first", b"second"]
+        await asyncio.wait_for(_until(lambda: len(received) == 3), timeout=1.0)
+        assert received == [b"first", b"second", b"third"]
+
+        # Publishes from outside a subscriber are dispatched concurrently again
+        await asyncio.wait_for(bus.publish("t", None, b"fourth"), timeout=1.0)
+        assert received[-1] == b"fourth"
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_nested_publish_keeps_order_in_other_groups(self) -> None:
+        bus = EventBusInmemory(
+            dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT,
+            max_concurrent_deliveries=1,
+        )
+        await bus.start()
+
+        received: dict[str, list[bytes]] = {"g": [], "h": []}
+
+        async def on_g(msg: ModelEventMessage) -> None:
+            received["g"].append(msg.value)
+            if msg.value == b"first":
+                await bus.publish("t", None, b"second")
+
+        async def on_h(msg: ModelEventMessage) -> None:
+            received["h"].append(msg.value)
+
+        await bus.subscribe("t", group_id="g", on_message=on_g)
+        await bus.subscribe("t", group_id="h", on_message=on_h)
+        await asyncio.wait_for(bus.publish("t", None, b"first"), timeout=1.0)
+        await asyncio.wait_for(_until(lambda: len(received["h"]) == 2), timeout=1.0)
+        assert received == {"g": [b"first", b"second"], "h": [b"first", b"second"]}
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_task_started_by_subscriber_publishes_normally(self) -> None:
+        bus = EventBusInmemory(dispatch_mode=EnumSubscriberDispatchMode.CONCURRENT)
+        await bus.start()
+
+        received: list[bytes] = []
+        spawned: list[asyncio.Task[None]] = []
+
+        async def handler(msg: ModelEventMessage) -> None:
+            spawned.append(asyncio.create_task(bus.publish("other", None, b"bg")))
+
+        async def on_other(msg: ModelEventMessage) -> None:
+            if msg.value == b"slow":
+                await asyncio.sleep(0.02)
+            received.append(msg.value)
+
+        await bus.subscribe("t", group_id="g", on_message=handler)
+        await bus.subscribe("other", group_id="g", on_message=on_other)
+        slow = asyncio.create_task(bus.publish("other", None, b"slow"))
+        await asyncio.sleep(0)
+        await bus.publish("t", None, b"v")
+        # The task inherits the lane's context but is not the lane, so its
+        # publish queues behind the in-flight delivery like any other
+        await asyncio.wait_for(asyncio.gather(slow, *spawned), timeout=1.0)
+        assert received == [b"slow", b"bg"]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_limits(self) -> None:
+        with pytest.raises(ModelOnexError):
+            EventBusInmemory(max_concurrent_deliveries=0)
+        with pytest.raises(ModelOnexError):
+            EventBusInmemory(group_concurrency_limits={"g": 0})
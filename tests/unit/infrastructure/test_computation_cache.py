@@ -296,10 +296,9 @@ class TestComputationCacheGetStats:
         cache.put("valid1", "value1", ttl_minutes=60)
         cache.put("valid2", "value2", ttl_minutes=60)
 
-        # Manually add expired entries (use UTC for timezone-aware comparison)
-        expired_time = datetime.now(UTC) - timedelta(minutes=1)
-        cache._cache["expired1"] = ("value", expired_time, 1)
-        cache._cache["expired2"] = ("value", expired_time, 1)
+        # Add entries whose TTL has already elapsed
+        cache.put("expired1", "value", ttl_minutes=-1)
+        cache.put("expired2", "value", ttl_minutes=-1)
 
         stats = cache.get_stats()
 
@@ -314,9 +313,8 @@ class TestComputationCacheGetStats:
         # Valid entry
         cache.put("valid", "value", ttl_minutes=30)
 
-        # Expired entry (use UTC for timezone-aware comparison)
-        expired_time = datetime.now(UTC) - timedelta(minutes=1)
-        cache._cache["expired"] = ("value", expired_time, 1)
+        # Expired entry (TTL already elapsed)
+        cache.put("expired", "value", ttl_minutes=-1)
 
         stats = cache.get_stats()
 
@@ -14,7 +14,6 @@ Tests cover:
 - Thread safety
 """
 
-from datetime import datetime
 from unittest.mock import Mock
 from uuid import UUID, uuid4
 
@@ -23,7 +22,6 @@ import pytest
 from omnibase_core.enums.enum_log_level import EnumLogLevel as LogLevel
 from omnibase_core.logging.logging_emit import (
     LogCodeBlock,
-    _create_log_context_from_frame,
     _detect_node_id_from_context,
     _sanitize_data_dict,
     _sanitize_sensitive_data,
@@ -34,7 +32,6 @@ from omnibase_core.logging.logging_emit import (
     log_performance_metrics,
     trace_function_lifecycle,
 )
-from omnibase_core.models.core.model_log_entry import LogModelContext
 
 
 @pytest.mark.unit
@@ -359,51 +356,6 @@ class TestNodeIdDetection:
         assert isinstance(result, (UUID, str))
 
 
-@pytest.mark.unit
-class TestLogContextCreation:
-    """Test _create_log_context_from_frame functionality."""
-
-    def test_create_log_context_returns_model(self):
-        """Test that log context creation returns LogModelContext."""
-        context = _create_log_context_from_frame()
-
-        assert isinstance(context, LogModelContext)
-
-    def test_create_log_context_has_required_fields(self):
-        """Test that log context has required fields."""
-        context = _create_log_context_from_frame()
-
-        assert hasattr(context, "calling_function")
-        assert hasattr(context, "calling_module")
-        assert hasattr(context, "calling_line")
-        assert hasattr(context, "timestamp")
-        assert hasattr(context, "node_id")
-
-    def test_create_log_context_timestamp_format(self):
-        """Test that timestamp is in ISO format."""
-        context = _create_log_context_from_frame()
-
-        # Should be ISO format string
-        assert isinstance(context.timestamp, str)
-        # Should be parseable as datetime
-        datetime.fromisoformat(context.timestamp)
-
-    def test_create_log_context_calling_info(self):
-        """Test that calling information is captured."""
-        context = _create_log_context_from_frame()
-
-        # Should have valid calling function name
-        assert isinstance(context.calling_function, str)
-        assert len(context.calling_function) > 0
-
-        # Should have valid module name
-        assert isinstance(context.calling_module, str)
-
-        # Should have valid line number
-        assert isinstance(context.calling_line, int)
-        assert context.calling_line >= 0
-
-
 @pytest.mark.unit
 class TestTraceFunctionLifecycle:
     """Test trace_function_lifecycle decorator."""
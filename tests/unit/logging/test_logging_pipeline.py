@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for the level-gated, batched logging pipeline.
+
+Tests cover:
+- LogPipeline batching, flush and backpressure policies
+- emit_log_event() level gate and deferred processing
+- Combined sensitive-data regex equivalence with the sequential patterns
+"""
+
+import random
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from omnibase_core.enums.enum_log_backpressure_policy import (
+    EnumLogBackpressurePolicy,
+)
+from omnibase_core.enums.enum_log_level import EnumLogLevel as LogLevel
+from omnibase_core.logging import logging_emit
+from omnibase_core.logging.logging_emit import (
+    _SENSITIVE_PATTERNS,
+    _sanitize_sensitive_data,
+    configure_log_pipeline,
+    emit_log_event,
+    flush_log_pipeline,
+    get_log_level_threshold,
+    get_log_pipeline_stats,
+    is_log_level_enabled,
+    set_log_level_threshold,
+)
+from omnibase_core.logging.logging_pipeline import LogPipeline
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+class TestLogPipeline:
+    def test_batches_are_written_in_order(self) -> None:
+        batches: list[list[int]] = []
+        pipeline = LogPipeline(batches.append, batch_size=4)
+        for value in range(10):
+            assert pipeline.submit(value)
+        assert pipeline.flush()
+        assert [v for batch in batches for v in batch] == list(range(10))
+        assert all(len(batch) <= 4 for batch in batches)
+        stats = pipeline.get_stats()
+        assert stats["enqueued"] == stats["written"] == 10
+        assert stats["batches"] == len(batches)
+        assert stats["queue_depth"] == 0
+        pipeline.shutdown()
+
+    def _blocked_pipeline(
+        self, policy: EnumLogBackpressurePolicy
+    ) -> tuple[LogPipeline[int], list[int], threading.Event]:
+        """A pipeline whose writer holds the first record until released."""
+        written: list[int] = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def writer(batch: list[int]) -> None:
+            started.set()
+            release.wait(5)
+            written.extend(batch)
+
+        pipeline = LogPipeline(
+            writer, max_queue_size=2, batch_size=1, policy=policy, block_timeout_s=0.05
+        )
+        pipeline.submit(0)
+        assert started.wait(5)
+        return pipeline, written, release
+
+    def test_drop_newest_rejects_when_full(self) -> None:
+        pipeline, written, release = self._blocked_pipeline(
+            EnumLogBackpressurePolicy.DROP_NEWEST
+        )
+        assert pipeline.submit(1)
+        assert pipeline.submit(2)
+        assert not pipeline.submit(3)
+        release.set()
+        assert pipeline.flush()
+        assert written == [0, 1, 2]
+        assert pipeline.get_stats()["dropped"] == 1
+        pipeline.shutdown()
+
+    def test_drop_oldest_evicts_queued_record(self) -> None:
+        pipeline, written, release = self._blocked_pipeline(
+            EnumLogBackpressurePolicy.DROP_OLDEST
+        )
+        for value in (1, 2, 3):
+            assert pipeline.submit(value)
+        release.set()
+        assert pipeline.flush()
+        assert written == [0, 2, 3]
+        assert pipeline.get_stats()["dropped"] == 1
+        pipeline.shutdown()
+
+    def test_block_drops_after_timeout(self) -> None:
+        pipeline, written, release = self._blocked_pipeline(
+            EnumLogBackpressurePolicy.BLOCK
+        )
+        pipeline.submit(1)
+        pipeline.submit(2)
+        assert not pipeline.submit(3)
+        stats = pipeline.get_stats()
+        assert stats["blocked"] == 1
+        assert stats["dropped"] == 1
+        release.set()
+        assert pipeline.submit(4)
+        assert pipeline.flush()
+        assert written == [0, 1, 2, 4]
+        pipeline.shutdown()
+
+    def test_writer_errors_are_counted(self) -> None:
+        pipeline: LogPipeline[int] = LogPipeline(Mock(side_effect=ValueError))
+        pipeline.submit(1)
+        assert pipeline.flush()
+        assert pipeline.get_stats()["writer_errors"] == 1
+        pipeline.submit(2)
+        assert pipeline.flush()
+        assert pipeline.get_stats()["written"] == 2
+        pipeline.shutdown()
+
+    def test_shutdown_writes_remaining_records(self) -> None:
+        written: list[int] = []
+        pipeline = LogPipeline(written.extend)
+        for value in range(5):
+            pipeline.submit(value)
+        pipeline.shutdown()
+        assert written == list(range(5))
+
+
+@pytest.fixture
+def output_handler() -> Iterator[Mock]:
+    """Route emitted events to a mock handler through a fresh asynchronous pipeline."""
+    formatter = Mock()
+    formatter.format_log_event.side_effect = lambda **kwargs: kwargs
+    handler = Mock()
+    previous = get_log_level_threshold()
+    configure_log_pipeline(asynchronous=True)
+    with patch.object(
+        logging_emit, "get_protocol_services", return_value=(formatter, handler)
+    ):
+        yield handler
+        flush_log_pipeline()
+    set_log_level_threshold(previous)
+    configure_log_pipeline()
+
+
+def _emitted(handler: Mock) -> list[dict[str, Any]]:
+    assert flush_log_pipeline()
+    return [call.args[0] for call in handler.output_log_entry.call_args_list]
+
+
+class TestEmitLogEventPipeline:
+    def test_defaults_process_every_level_inline(self) -> None:
+        assert get_log_level_threshold() is LogLevel.TRACE
+        assert is_log_level_enabled(LogLevel.DEBUG)
+        assert not logging_emit._pipeline_asynchronous[0]
+
+    def test_disabled_levels_do_no_work(self, output_handler: Mock) -> None:
+        set_log_level_threshold(LogLevel.WARNING)
+        assert not is_log_level_enabled(LogLevel.INFO)
+        with patch.object(logging_emit, "_detect_node_id_from_context") as detect:
+            emit_log_event(LogLevel.INFO, "skipped", "password=hunter2", uuid4())
+        detect.assert_not_called()
+        assert get_log_pipeline_stats()["enqueued"] == 0
+        assert _emitted(output_handler) == []
+
+    def test_enabled_event_is_sanitized_by_the_writer(
+        self, output_handler: Mock
+    ) -> None:
+        set_log_level_threshold(LogLevel.DEBUG)
+        node_id = uuid4()
+        items = [1]
+        data = {"api_key": "abc", "count": 3, "items": items}
+        emit_log_event(
+            LogLevel.DEBUG, "evt", "password=hunter2", uuid4(), node_id, data
+        )
+        data["count"] = 4
+        items.append(2)
+        (entry,) = _emitted(output_handler)
+        assert entry["message"] == "password=[REDACTED]"
+        assert entry["data"] == {"api_key": "[REDACTED]", "count": 3, "items": "[1]"}
+        assert entry["context"].node_id == node_id
+        assert entry["context"].calling_function == (
+            "test_enabled_event_is_sanitized_by_the_writer"
+        )
+
+    def test_node_id_detected_once_when_omitted(self, output_handler: Mock) -> None:
+        with patch.object(
+            logging_emit, "_detect_node_id_from_context", return_value="module"
+        ) as detect:
+            emit_log_event(LogLevel.INFO, "evt", "hello", uuid4())
+        assert detect.call_count == 1
+        (entry,) = _emitted(output_handler)
+        assert entry["context"].node_id is None
+
+    def test_synchronous_mode_writes_inline(self, output_handler: Mock) -> None:
+        configure_log_pipeline(asynchronous=False)
+        emit_log_event(LogLevel.DEBUG, "evt", "inline", uuid4())
+        output_handler.output_log_entry.assert_called_once()
+        assert get_log_pipeline_stats()["enqueued"] == 0
+
+    def test_errors_bypass_a_full_queue(self, output_handler: Mock) -> None:
+        configure_log_pipeline(asynchronous=True, max_queue_size=1)
+        release = threading.Event()
+        messages: list[str] = []
+
+        def output(entry: dict[str, object], level: str) -> None:
+            if entry["message"] == "burst":
+                release.wait(5)
+            messages.append(str(entry["message"]))
+
+        output_handler.output_log_entry.side_effect = output
+        for _ in range(5):
+            emit_log_event(LogLevel.INFO, "evt", "burst", uuid4())
+        emit_log_event(LogLevel.ERROR, "evt", "failure", uuid4())
+        emit_log_event(LogLevel.CRITICAL, "evt", "fatal", uuid4())
+        # Written on the calling thread while the writer is still held
+        assert messages == ["failure", "fatal"]
+        release.set()
+        stats = get_log_pipeline_stats()
+        assert stats["enqueued"] + stats["dropped"] == 5
+
+    def test_stats_report_drops(self, output_handler: Mock) -> None:
+        configure_log_pipeline(asynchronous=True, max_queue_size=1)
+        release = threading.Event()
+        output_handler.output_log_entry.side_effect = lambda *_: release.wait(5)
+        for _ in range(20):
+            emit_log_event(LogLevel.INFO, "evt", "burst", uuid4())
+        release.set()
+        stats = get_log_pipeline_stats()
+        assert stats["dropped"] > 0
+        assert stats["enqueued"] + stats["dropped"] == 20
+
+
+class TestCombinedSensitivePattern:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "nothing to see here",
+            "password=hunter2",
+            'Password: "hunter2", user=bob',
+            "api_key=abc123 and api-key: def",
+            "secret=s3cr3t}",
+            "access_token=xyz token=abc",
+            "token=secret=abc",
+            "password=abcdefghijklmnopqrstuvwxyz123",
+            "bearer dGhpc2lzYXZlcnlsb25nYmFzZTY0dG9rZW4=",
+            "short AbC1 and LONGTOKENVALUE1234567890 end",
+            "API_KEY = value, SECRET:other",
+            "token=password=abc",
+            "secret=api_key=abcdefghijklmnopqrstuvwx",
+            'password:"token=abc"}',
+            "access-token=token:AAAAAAAAAAAAAAAAAAAAAAAA==",
+            "passwordtoken=abc",
+        ],
+    )
+    def test_matches_sequential_patterns(self, text: str) -> None:
+        expected = text
+        for pattern, replacement in _SENSITIVE_PATTERNS:
+            expected = pattern.sub(replacement, expected)
+        assert _sanitize_sensitive_data(text) == expected
+
+    def test_matches_sequential_patterns_on_chained_fragments(self) -> None:
+        # Fragments that let one pattern's output or input overlap another's
+        fragments = [
+            "password", "PASSWORD", "api_key", "api-key", "apikey", "secret",
+            "access_token", "access-token", "token", "Token", "=", ":", " = ",
+            '"', "'", "}", ",", " ", "abc", "x" * 20, "QUJD" * 6, "==", "/+",
+            "[REDACTED]", "[REDACTED_TOKEN]",
+        ]  # fmt: skip
+        rng = random.Random(1234)
+        for _ in range(20_000):
+            text = "".join(rng.choices(fragments, k=rng.randrange(1, 9)))
+            expected = text
+            for pattern, replacement in _SENSITIVE_PATTERNS:
+                expected = pattern.sub(replacement, expected)
+            assert _sanitize_sensitive_data(text) == expected, text
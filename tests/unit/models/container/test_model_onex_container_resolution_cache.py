@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the ModelONEXContainer service slot cache and sampled hit logging."""
+
+from typing import Protocol
+from unittest.mock import patch
+
+import pytest
+
+from omnibase_core.models.container import model_onex_container
+from omnibase_core.models.container.model_onex_container import ModelONEXContainer
+
+
+class ProtocolGreeter(Protocol):
+    def greet(self) -> str: ...
+
+
+class _Greeter:
+    def greet(self) -> str:
+        return "hi"
+
+
+async def _container_with_greeter(**kwargs: object) -> ModelONEXContainer:
+    container = ModelONEXContainer(**kwargs)
+    await container.service_registry.register_instance(ProtocolGreeter, _Greeter())
+    return container
+
+
+@pytest.mark.unit
+class TestServiceSlotCache:
+    @pytest.mark.asyncio
+    async def test_cached_service_is_returned_by_every_path(self) -> None:
+        container = await _container_with_greeter()
+        assert container.get_cached_service(ProtocolGreeter) is None
+
+        service = await container.get_service_async(ProtocolGreeter)
+        assert container.get_cached_service(ProtocolGreeter) is service
+        assert await container.get_service_async(ProtocolGreeter) is service
+        assert container.get_service_sync(ProtocolGreeter) is service
+
+    @pytest.mark.asyncio
+    async def test_sync_hit_does_not_run_a_coroutine(self) -> None:
+        container = await _container_with_greeter()
+        service = await container.get_service_async(ProtocolGreeter)
+        with patch.object(model_onex_container, "run_coro_sync") as run_coro_sync:
+            assert container.get_service_sync(ProtocolGreeter) is service
+        run_coro_sync.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slots_are_per_protocol_and_name(self) -> None:
+        container = await _container_with_greeter()
+        await container.get_service_async(ProtocolGreeter)
+        assert container.get_cached_service(ProtocolGreeter, "other") is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_clears_slots(self) -> None:
+        container = await _container_with_greeter()
+        await container.get_service_async(ProtocolGreeter)
+        await container.refresh_external_services()
+        assert container.get_cached_service(ProtocolGreeter) is None
+
+
+@pytest.mark.unit
+class TestCacheHitLogging:
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_not_logged_by_default(self) -> None:
+        container = await _container_with_greeter()
+        await container.get_service_async(ProtocolGreeter)
+        with patch.object(model_onex_container, "emit_log_event") as emit:
+            for _ in range(10):
+                await container.get_service_async(ProtocolGreeter)
+        emit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_sampled(self) -> None:
+        container = await _container_with_greeter(cache_hit_log_interval=4)
+        await container.get_service_async(ProtocolGreeter)
+        with patch.object(model_onex_container, "emit_log_event") as emit:
+            for _ in range(10):
+                container.get_cached_service(ProtocolGreeter)
+        assert emit.call_count == 2
+        assert emit.call_args.args[2]["cache_hits"] == 8
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for ModelComputeCache eviction/expiry bookkeeping and its thread-safe variant.
+"""
+
+import threading
+
+import pytest
+
+from omnibase_core.enums.enum_cache_eviction_policy import EnumCacheEvictionPolicy
+from omnibase_core.models.configuration.model_compute_cache_config import (
+    ModelComputeCacheConfig,
+)
+from omnibase_core.models.infrastructure.model_compute_cache import ModelComputeCache
+from omnibase_core.models.infrastructure.model_thread_safe_compute_cache import (
+    ModelThreadSafeComputeCache,
+)
+from omnibase_core.services.service_compute_cache import ServiceComputeCache
+
+
+@pytest.mark.unit
+class TestModelComputeCacheEviction:
+    @pytest.mark.parametrize("policy", list(EnumCacheEvictionPolicy))
+    def test_overwrite_at_capacity_does_not_evict(
+        self, policy: EnumCacheEvictionPolicy
+    ) -> None:
+        cache = ModelComputeCache(max_size=2, eviction_policy=policy)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 3)
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+        assert cache.get_stats()["evictions"] == 0
+
+    def test_put_at_capacity_reclaims_expired_before_evicting(self) -> None:
+        cache = ModelComputeCache(max_size=2)
+        cache.put("stale", 1, ttl_minutes=-1)
+        cache.put("live", 2)
+        cache.put("new", 3)
+        assert cache.get("live") == 2
+        assert cache.get("new") == 3
+        stats = cache.get_stats()
+        assert stats["evictions"] == 0
+        assert stats["expirations"] == 1
+
+    def test_lfu_ties_evict_oldest(self) -> None:
+        cache = ModelComputeCache(
+            max_size=3, eviction_policy=EnumCacheEvictionPolicy.LFU
+        )
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+        cache.get("a")
+        cache.put("d", "d")
+        assert cache.get("b") is None
+        assert cache.get("c") == "c"
+
+    def test_get_stats_purges_expired_entries(self) -> None:
+        cache = ModelComputeCache(max_size=10)
+        cache.put("valid", 1)
+        cache.put("expired", 2, ttl_minutes=-1)
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["expired_entries"] == 1
+        assert stats["valid_entries"] == 1
+        assert "expired" not in cache._cache
+        assert cache.get_stats()["total_entries"] == 1
+
+    def test_clear_resets_eviction_order(self) -> None:
+        cache = ModelComputeCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        cache.put("c", 3)
+        cache.put("d", 4)
+        cache.put("e", 5)
+        assert cache.get("c") is None
+        assert cache.get("e") == 5
+
+
+@pytest.mark.unit
+class TestModelThreadSafeComputeCache:
+    def test_concurrent_puts_and_gets_keep_cache_consistent(self) -> None:
+        cache = ModelThreadSafeComputeCache(
+            max_size=64, eviction_policy=EnumCacheEvictionPolicy.LFU
+        )
+
+        def worker(offset: int) -> None:
+            for i in range(2_000):
+                key = f"k{(i + offset) % 200}"
+                if cache.get(key) is None:
+                    cache.put(key, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == len(cache._index) <= 64
+        assert stats["hits"] + stats["misses"] == 8_000
+
+    def test_service_uses_thread_safe_cache_when_configured(self) -> None:
+        service = ServiceComputeCache(ModelComputeCacheConfig(thread_safe=True))
+        assert isinstance(service._cache, ModelThreadSafeComputeCache)
+        default = ServiceComputeCache(ModelComputeCacheConfig())
+        assert not isinstance(default._cache, ModelThreadSafeComputeCache)
@@ -15,6 +15,8 @@ Covers:
   required_capabilities, policy_tier_max, required_metadata_keys
 - Plan steps are in correct forward order
 - Planner is deterministic (same inputs -> same output)
+- Among shortest plans, the cheapest is returned
+- Plans are cached per (graph hash, start, goal)
 - All steps in plan correspond to declared graph transitions
 - BackwardChainingPlanner constructor rejects max_depth < 1
 """
@@ -26,8 +28,10 @@ from omnibase_core.navigation.model_contract_graph import (
     ContractGraph,
     ContractState,
     ContractTransition,
+    TransitionCost,
 )
 from omnibase_core.navigation.model_graph_boundary import (
+    CycleDetected,
     GoalAlreadySatisfied,
     GoalCondition,
     MaxDepthExceeded,
@@ -62,12 +66,14 @@ def make_transition(
     source_id: str,
     target_id: str,
     output_types: tuple[str, ...] = (),
+    latency_ms: int = 0,
 ) -> ContractTransition:
     return ContractTransition(
         transition_id=transition_id,
         source_state_id=source_id,
         target_state_id=target_id,
         output_types=output_types,
+        cost=TransitionCost(latency_estimate_ms=latency_ms),
     )
 
 
@@ -462,6 +468,127 @@ class TestPlannerDeterminism:
         assert len(result.steps) == 1
         assert result.steps[0].transition_id == "t.direct"
 
+    def test_equal_length_paths_return_cheapest(self) -> None:
+        """Among plans with the fewest steps, the lowest total cost wins."""
+        planner = BackwardChainingPlanner()
+        states = [make_state(f"node.{n}") for n in ("start", "a", "b", "goal")]
+        transitions = [
+            make_transition("t.sa", "node.start", "node.a", latency_ms=1),
+            make_transition("t.ag", "node.a", "node.goal", latency_ms=50),
+            make_transition("t.sb", "node.start", "node.b", latency_ms=20),
+            make_transition("t.bg", "node.b", "node.goal", latency_ms=5),
+            # Cheapest overall, but three steps
+            make_transition("t.ab", "node.a", "node.b", latency_ms=0),
+        ]
+        graph = build_graph(states, transitions)
+        goal = GoalCondition(target_node_id="node.goal")
+        result = planner.plan(graph, goal, states[0])
+        assert isinstance(result, Plan)
+        assert [s.transition_id for s in result.steps] == ["t.sb", "t.bg"]
+
+    def test_plan_may_pass_through_other_goal_state(self) -> None:
+        """A goal state reached without the required output is only a waypoint."""
+        planner = BackwardChainingPlanner()
+        states = [make_state(f"node.{n}", metadata={"done": "1"}) for n in "ab"]
+        start = make_state("node.start")
+        transitions = [
+            make_transition("t.sa", "node.start", "node.a", output_types=("Draft",)),
+            make_transition("t.ab", "node.a", "node.b", output_types=("Final",)),
+        ]
+        graph = build_graph([start, *states], transitions)
+        goal = GoalCondition(
+            required_metadata_keys=frozenset({"done"}),
+            required_output_types=frozenset({"Final"}),
+        )
+        result = planner.plan(graph, goal, start)
+        assert isinstance(result, Plan)
+        assert [s.post_state_id for s in result.steps] == ["node.a", "node.b"]
+
+
+# ---------------------------------------------------------------------------
+# Search semantics and caching tests
+# ---------------------------------------------------------------------------
+
+
+class TestPlannerSearch:
+    def test_cycle_leading_to_goal_reports_cycle(self) -> None:
+        """Goal reachable only from a cycle the start cannot enter."""
+        planner = BackwardChainingPlanner()
+        states = [make_state(f"node.{n}") for n in ("start", "a", "b", "goal")]
+        transitions = [
+            make_transition("t.ab", "node.a", "node.b"),
+            make_transition("t.ba", "node.b", "node.a"),
+            make_transition("t.bg", "node.b", "node.goal"),
+        ]
+        graph = build_graph(states, transitions)
+        goal = GoalCondition(target_node_id="node.goal")
+        result = planner.plan(graph, goal, states[0])
+        assert isinstance(result, NoPlanFound)
+        assert isinstance(result.reason, CycleDetected)
+
+    def test_self_loop_on_goal_is_not_a_plan(self) -> None:
+        """A goal whose only incoming edge is a self-loop has no plan."""
+        planner = BackwardChainingPlanner()
+        start = make_state("node.start")
+        goal_state = make_state("node.goal")
+        graph = build_graph(
+            [start, goal_state], [make_transition("t.gg", "node.goal", "node.goal")]
+        )
+        result = planner.plan(graph, GoalCondition(target_node_id="node.goal"), start)
+        assert isinstance(result, NoPlanFound)
+        assert isinstance(result.reason, CycleDetected)
+
+    def test_dense_graph_finishes(self) -> None:
+        """Dense cyclic graphs no longer blow up the search."""
+        planner = BackwardChainingPlanner()
+        states = [make_state(f"node.{i:02d}") for i in range(40)]
+        transitions = [
+            make_transition(f"t.{i}.{j}", f"node.{i:02d}", f"node.{j:02d}")
+            for i in range(39)
+            for j in range(39)
+            if i != j
+        ]
+        sink = make_state("node.sink")
+        graph = build_graph([*states, sink], transitions)
+        goal = GoalCondition(target_node_id="node.05")
+        # The sink has no outgoing transitions, so no plan exists from it
+        result = planner.plan(graph, goal, sink)
+        assert isinstance(result, NoPlanFound)
+        assert isinstance(result.reason, CycleDetected)
+
+    def test_plans_are_cached_by_graph_content(self) -> None:
+        """An equal graph built separately reuses the cached plan."""
+        planner = BackwardChainingPlanner()
+
+        def chain() -> tuple[ContractGraph, list[ContractState]]:
+            states = [make_state(f"node.{i}") for i in range(3)]
+            transitions = [
+                make_transition(f"t.{i}{i + 1}", f"node.{i}", f"node.{i + 1}")
+                for i in range(2)
+            ]
+            return build_graph(states, transitions), states
+
+        graph, states = chain()
+        other_graph, other_states = chain()
+        goal = GoalCondition(target_node_id="node.2")
+        first = planner.plan(graph, goal, states[0])
+        assert planner.plan(graph, goal, states[0]) is first
+        assert planner.plan(other_graph, goal, other_states[0]) is first
+        assert planner.plan(graph, goal, states[1]) is not first
+
+    def test_graphs_with_different_content_are_not_shared(self) -> None:
+        planner = BackwardChainingPlanner()
+        start = make_state("node.start")
+        goal_state = make_state("node.goal")
+        goal = GoalCondition(target_node_id="node.goal")
+        empty = build_graph([start, goal_state], [])
+        linked = build_graph(
+            [start, goal_state],
+            [make_transition("t.sg", "node.start", "node.goal")],
+        )
+        assert isinstance(planner.plan(empty, goal, start), NoPlanFound)
+        assert isinstance(planner.plan(linked, goal, start), Plan)
+
 
 # ---------------------------------------------------------------------------
 # PlanStep type tests
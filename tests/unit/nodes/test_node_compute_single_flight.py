@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for NodeCompute single-flight caching and stale-while-revalidate.
+
+Concurrent cache misses on one key must share a single computation; a hit past
+the refresh deadline must serve the cached value and recompute in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from omnibase_core.models.compute.model_compute_input import ModelComputeInput
+from omnibase_core.models.configuration.model_compute_cache_config import (
+    ModelComputeCacheConfig,
+)
+from omnibase_core.models.container.model_onex_container import ModelONEXContainer
+from omnibase_core.nodes import node_compute as node_compute_module
+from omnibase_core.nodes.node_compute import NodeCompute
+from omnibase_core.services.service_compute_cache import ServiceComputeCache
+
+pytestmark = pytest.mark.unit
+
+
+class _GatedNodeCompute(NodeCompute[Any, Any]):
+    """Computation suspends on a gate so concurrent callers genuinely overlap."""
+
+    def __init__(self, container: ModelONEXContainer) -> None:
+        super().__init__(container)
+        self.gate = asyncio.Event()
+        self.calls = 0
+        self.fail_next = False
+
+    async def _execute_sequential_computation(
+        self, input_data: ModelComputeInput[Any]
+    ) -> Any:
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail_next:
+            self.fail_next = False
+            raise ValueError("boom")
+        return f"{input_data.data}#{self.calls}"
+
+
+@pytest.fixture
+def node() -> _GatedNodeCompute:
+    node = _GatedNodeCompute(ModelONEXContainer(enable_service_registry=False))
+    node._cache = ServiceComputeCache(ModelComputeCacheConfig())
+    node._timing_service = None
+    node._parallel_executor = None
+    return node
+
+
+def _input(data: str = "x") -> ModelComputeInput[Any]:
+    return ModelComputeInput(data=data, computation_type="default")
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(
+        self, node: _GatedNodeCompute
+    ) -> None:
+        tasks = [asyncio.create_task(node.process(_input())) for _ in range(5)]
+        await _settle()
+        node.gate.set()
+        outputs = await asyncio.gather(*tasks)
+
+        assert node.calls == 1
+        assert {o.result for o in outputs} == {"x#1"}
+        assert sum(not o.cache_hit for o in outputs) == 1
+        metrics = await node.get_computation_metrics()
+        assert metrics["cache_requests"]["misses"] == 1.0
+        assert metrics["cache_requests"]["coalesced"] == 4.0
+        assert metrics["cache_requests"]["in_flight"] == 0.0
+
+        await node.process(_input())
+        metrics = await node.get_computation_metrics()
+        assert metrics["cache_requests"]["hits"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_are_not_coalesced(
+        self, node: _GatedNodeCompute
+    ) -> None:
+        tasks = [asyncio.create_task(node.process(_input(d))) for d in "ab"]
+        await _settle()
+        node.gate.set()
+        await asyncio.gather(*tasks)
+        assert node.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_leader_failure_propagates_to_followers(
+        self, node: _GatedNodeCompute
+    ) -> None:
+        node.fail_next = True
+        tasks = [asyncio.create_task(node.process(_input())) for _ in range(3)]
+        await _settle()
+        node.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, Exception) for r in results)
+        assert node.calls == 1
+        assert node._inflight_computations == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_follower(
+        self, node: _GatedNodeCompute
+    ) -> None:
+        leader = asyncio.create_task(node.process(_input()))
+        await _settle()
+        follower = asyncio.create_task(node.process(_input()))
+        await _settle()
+        leader.cancel()
+        await _settle()
+        node.gate.set()
+        output = await follower
+        assert output.result == "x#2"
+        assert leader.cancelled()
+
+
+class TestStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_hit_past_deadline_refreshes_in_background(
+        self, node: _GatedNodeCompute, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clock = [1_000.0]
+        monkeypatch.setattr(node_compute_module, "monotonic", lambda: clock[0])
+        node.stale_while_revalidate_fraction = 0.5
+        node.gate.set()
+        assert (await node.process(_input())).result == "x#1"
+
+        clock[0] += node.cache_ttl_minutes * 60 * 0.6
+        node.gate.clear()
+        stale = await node.process(_input())
+        assert stale.cache_hit
+        assert stale.result == "x#1"
+        await _settle()
+        assert node.calls == 2  # refresh started in the background
+
+        node.gate.set()
+        await asyncio.gather(*node._refresh_tasks)
+        fresh = await node.process(_input())
+        assert fresh.result == "x#2"
+        metrics = await node.get_computation_metrics()
+        assert metrics["cache_requests"]["stale_refreshes"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, node: _GatedNodeCompute) -> None:
+        node.gate.set()
+        await node.process(_input())
+        await node.process(_input())
+        assert node._refresh_deadlines == {}
+        assert node.calls == 1
@@ -580,6 +580,120 @@ class TestHandlerLookup:
         assert handler is None
 
 
+@pytest.mark.unit
+class TestDispatchTables:
+    """Tests for the lookup tables compiled by freeze()."""
+
+    def _handlers(self) -> list[MockMessageHandler]:
+        return [
+            MockMessageHandler(
+                "typed-a", EnumMessageCategory.EVENT, EnumNodeKind.REDUCER, {"A"}
+            ),
+            MockMessageHandler(
+                "catch-all", EnumMessageCategory.EVENT, EnumNodeKind.ORCHESTRATOR
+            ),
+            MockMessageHandler(
+                "typed-ab",
+                EnumMessageCategory.EVENT,
+                EnumNodeKind.REDUCER,
+                {"A", "B"},
+            ),
+        ]
+
+    def test_lookup_merges_accept_all_in_registration_order(
+        self, handler_registry: ServiceHandlerRegistry
+    ) -> None:
+        """Exact-type and accept-all handlers keep registration order."""
+        for handler in self._handlers():
+            handler_registry.register_handler(handler)
+        handler_registry.freeze()
+
+        def ids(message_type: str | None) -> list[str]:
+            return [
+                h.handler_id
+                for h in handler_registry.lookup_handlers(
+                    EnumMessageCategory.EVENT, message_type
+                )
+            ]
+
+        assert ids("A") == ["typed-a", "catch-all", "typed-ab"]
+        assert ids("B") == ["catch-all", "typed-ab"]
+        assert ids("Unknown") == ["catch-all"]
+        assert ids(None) == ["typed-a", "catch-all", "typed-ab"]
+        assert handler_registry.lookup_handlers(EnumMessageCategory.INTENT) == ()
+
+    def test_lookup_returns_cached_tuple(
+        self, handler_registry: ServiceHandlerRegistry
+    ) -> None:
+        """Repeated lookups return the same immutable tuple."""
+        for handler in self._handlers():
+            handler_registry.register_handler(handler)
+        handler_registry.freeze()
+
+        first = handler_registry.lookup_handlers(EnumMessageCategory.EVENT, "A")
+        assert isinstance(first, tuple)
+        assert handler_registry.lookup_handlers(EnumMessageCategory.EVENT, "A") is first
+
+    def test_get_handlers_matches_lookup_and_returns_fresh_list(
+        self, handler_registry: ServiceHandlerRegistry
+    ) -> None:
+        """get_handlers() keeps returning a list callers may modify."""
+        for handler in self._handlers():
+            handler_registry.register_handler(handler)
+        handler_registry.freeze()
+
+        handlers = handler_registry.get_handlers(EnumMessageCategory.EVENT, "B")
+        handlers.clear()
+        assert handler_registry.get_handlers(EnumMessageCategory.EVENT, "B") == list(
+            handler_registry.lookup_handlers(EnumMessageCategory.EVENT, "B")
+        )
+
+    def test_tables_are_a_snapshot_at_freeze(
+        self, handler_registry: ServiceHandlerRegistry
+    ) -> None:
+        """Message types changed after freeze() do not affect lookups."""
+        handler = MockMessageHandler(
+            "typed", EnumMessageCategory.EVENT, EnumNodeKind.REDUCER, {"A"}
+        )
+        handler_registry.register_handler(handler)
+        handler_registry.freeze()
+
+        handler.message_types.add("B")
+        assert handler_registry.get_handlers(EnumMessageCategory.EVENT, "B") == []
+
+    def test_lookup_counts(self, handler_registry: ServiceHandlerRegistry) -> None:
+        """Each lookup key counts the lookups it served."""
+        for handler in self._handlers():
+            handler_registry.register_handler(handler)
+        assert handler_registry.get_lookup_counts() == {}
+        handler_registry.freeze()
+
+        handler_registry.lookup_handlers(EnumMessageCategory.EVENT, "A")
+        handler_registry.lookup_handlers(EnumMessageCategory.EVENT, "A")
+        handler_registry.get_handlers(EnumMessageCategory.EVENT, "Unknown")
+        handler_registry.get_handlers(EnumMessageCategory.COMMAND)
+
+        counts = handler_registry.get_lookup_counts()
+        assert counts[(EnumMessageCategory.EVENT, "A")] == 2
+        assert counts[(EnumMessageCategory.EVENT, "B")] == 0
+        assert counts[(EnumMessageCategory.EVENT, "*")] == 1
+        assert counts[(EnumMessageCategory.COMMAND, None)] == 1
+
+    def test_lookup_handlers_before_freeze_raises(
+        self,
+        handler_registry: ServiceHandlerRegistry,
+        event_reducer_handler: MockMessageHandler,
+    ) -> None:
+        """lookup_handlers() enforces the freeze contract too."""
+        handler_registry.register_handler(event_reducer_handler)
+
+        with pytest.raises(ModelOnexError) as exc_info:
+            handler_registry.lookup_handlers(EnumMessageCategory.EVENT)
+
+        assert exc_info.value.error_code == EnumCoreErrorCode.INVALID_STATE
+        assert "lookup_handlers() called before freeze()" in str(exc_info.value)
+
+
 # =============================================================================
 # Unregistration Tests
 # =============================================================================
@@ -24,6 +24,7 @@ The handlers here are def-B (``handle(request: ModelX) -> ModelY``) and never im
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from uuid import UUID, uuid4, uuid5
 
@@ -584,3 +585,146 @@ class TestRouting:
             RuntimeDispatch(
                 consumer=consumer, producer=producer, routing_map={IN_TOPIC: bad_route}
             )
+
+
+# --- partition concurrency --------------------------------------------------
+class BarrierHandler:
+    """Blocks until ``parties`` invocations are in flight at once, then doubles.
+
+    Deadlocks (and trips the wait_for timeout) if partitions run sequentially.
+    """
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = asyncio.Barrier(parties)
+        self.seen: list[int] = []
+
+    async def handle(self, request: ModelDoubleCommand) -> ModelDoubled:
+        self.seen.append(request.n)
+        if request.n % 10 == 0:
+            await self._barrier.wait()
+        return ModelDoubled(doubled=request.n * 2)
+
+
+class StallingHandler:
+    """Doubles even inputs at once; odd inputs wait until cancelled."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.finished = False
+
+    async def handle(self, request: ModelDoubleCommand) -> ModelDoubled:
+        if request.n % 2:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+            self.finished = True
+        return ModelDoubled(doubled=request.n * 2)
+
+
+class TestConcurrentPartitions:
+    async def test_partition_groups_run_concurrently_in_offset_order(self) -> None:
+        broker = InMemoryBroker(num_partitions=2)
+        producer = InMemoryTransport(broker=broker, group="producer")
+        # Unkeyed round-robin: 0, 10 land on p0/p1 first; 1, 11 follow them.
+        for n in (0, 10, 1, 11):
+            await _seed(
+                producer, IN_TOPIC, ModelDoubleCommand(n=n), correlation_id=uuid4()
+            )
+        handler = BarrierHandler(parties=2)
+        consumer = _consumer(broker, group="node", topics=[IN_TOPIC])
+        rd = RuntimeDispatch(
+            consumer=consumer,
+            producer=producer,
+            routing_map={
+                IN_TOPIC: _route(
+                    "barrier",
+                    handler,
+                    {"Doubled": DONE_TOPIC},
+                    input_model_cls=ModelDoubleCommand,
+                )
+            },
+            max_concurrent_partitions=2,
+        )
+        await consumer.start()
+        assert await asyncio.wait_for(rd.run_once(), timeout=5) == 4
+
+        # Per-partition order held: each partition's first offset precedes its second.
+        assert handler.seen.index(0) < handler.seen.index(1)
+        assert handler.seen.index(10) < handler.seen.index(11)
+        assert broker.committed_offset(IN_TOPIC, "node", 0) == 1
+        assert broker.committed_offset(IN_TOPIC, "node", 1) == 1
+
+    async def test_failed_partition_cancels_its_siblings(self) -> None:
+        broker = InMemoryBroker(num_partitions=2)
+        producer = InMemoryTransport(broker=broker, group="producer")
+        for n in (0, 11):
+            await _seed(
+                producer, IN_TOPIC, ModelDoubleCommand(n=n), correlation_id=uuid4()
+            )
+        handler = StallingHandler()
+        consumer = _consumer(broker, group="node", topics=[IN_TOPIC])
+
+        async def failing_commit(message: object) -> None:
+            raise RuntimeError("commit failed")
+
+        consumer.commit = failing_commit  # type: ignore[method-assign]
+        rd = RuntimeDispatch(
+            consumer=consumer,
+            producer=producer,
+            routing_map={
+                IN_TOPIC: _route(
+                    "stall",
+                    handler,
+                    {"Doubled": DONE_TOPIC},
+                    input_model_cls=ModelDoubleCommand,
+                )
+            },
+            max_concurrent_partitions=2,
+        )
+        await consumer.start()
+        with pytest.raises(RuntimeError, match="commit failed"):
+            await asyncio.wait_for(rd.run_once(), timeout=5)
+
+        # The stalled sibling was cancelled and awaited, not left running.
+        assert handler.cancelled
+        assert not handler.finished
+
+    async def test_pipelined_fanout_sends_keep_order(
+        self, broker: InMemoryBroker, producer: InMemoryTransport
+    ) -> None:
+        corr = uuid4()
+        await _seed(producer, IN_TOPIC, ModelDoubleCommand(n=4), correlation_id=corr)
+        consumer = _consumer(broker, group="node", topics=[IN_TOPIC])
+        route = _route(
+            "node_fanout",
+            FanoutHandler(),
+            {"Doubled": DONE_TOPIC, "DoubleAudited": AUDIT_TOPIC},
+            input_model_cls=ModelDoubleCommand,
+        )
+        rd = RuntimeDispatch(
+            consumer=consumer,
+            producer=producer,
+            routing_map={IN_TOPIC: route},
+            pipeline_sends=True,
+        )
+        assert await rd.drain() == 1
+        assert [e.payload for e in await _drain_topic(broker, DONE_TOPIC)] == [
+            {"doubled": 8}
+        ]
+        assert [e.payload for e in await _drain_topic(broker, AUDIT_TOPIC)] == [
+            {"original": 4}
+        ]
+
+    async def test_invalid_partition_concurrency_rejected(
+        self, broker: InMemoryBroker, producer: InMemoryTransport
+    ) -> None:
+        consumer = _consumer(broker, group="node", topics=[IN_TOPIC])
+        with pytest.raises(ModelOnexError):
+            RuntimeDispatch(
+                consumer=consumer,
+                producer=producer,
+                routing_map={},
+                max_concurrent_partitions=0,
+            )
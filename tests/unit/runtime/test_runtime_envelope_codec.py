@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the precompiled runtime envelope codec.
+
+:class:`EnvelopeCodec` must be wire-compatible with the generic boundary
+(:func:`decode_inbound_envelope` / ``model_dump_json``) while decoding typed routes in
+one pass and keeping the boundary's fail-closed decode contract.
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.errors.model_onex_error import ModelOnexError
+from omnibase_core.models.events.model_event_envelope import ModelEventEnvelope
+from omnibase_core.runtime.runtime_envelope_codec import (
+    EnvelopeCodec,
+    get_envelope_codec,
+)
+from omnibase_core.runtime.runtime_envelope_router import (
+    decode_inbound_envelope,
+    wrap_outbound_envelope,
+)
+
+
+class _Req(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    n: int
+
+
+class _Evt(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    value: int
+
+
+def _wire(payload: object) -> tuple[ModelEventEnvelope[object], bytes]:
+    inbound = ModelEventEnvelope(payload=payload, correlation_id=uuid4())
+    return inbound, inbound.model_dump_json().encode("utf-8")
+
+
+@pytest.mark.unit
+class TestEnvelopeCodecDecode:
+    def test_typed_route_decodes_payload_into_input_model(self) -> None:
+        inbound, raw = _wire({"n": 7})
+        decoded = EnvelopeCodec(_Req).decode(raw)
+        assert isinstance(decoded.payload, _Req)
+        assert decoded.payload.n == 7
+        assert decoded.correlation_id == inbound.correlation_id
+        assert decoded.envelope_id == inbound.envelope_id
+
+    def test_untyped_route_matches_generic_boundary(self) -> None:
+        _, raw = _wire({"n": 7, "extra": [1, 2]})
+        decoded = EnvelopeCodec().decode(raw)
+        legacy = decode_inbound_envelope(raw)
+        assert decoded.payload == legacy.payload == {"n": 7, "extra": [1, 2]}
+        assert decoded.model_dump() == legacy.model_dump()
+
+    def test_fail_closed_on_non_envelope_bytes(self) -> None:
+        with pytest.raises(ModelOnexError) as exc_info:
+            EnvelopeCodec(_Req).decode(b"not-json-at-all")
+        assert exc_info.value.error_code == EnumCoreErrorCode.VALIDATION_ERROR
+
+    def test_fail_closed_on_payload_not_matching_input_model(self) -> None:
+        _, raw = _wire({"n": "not-an-int"})
+        with pytest.raises(ModelOnexError, match=r"ModelEventEnvelope\[_Req\]"):
+            EnvelopeCodec(_Req).decode(raw)
+
+
+@pytest.mark.unit
+class TestEnvelopeCodecEncode:
+    def test_encode_is_byte_identical_to_model_dump_json(self) -> None:
+        inbound, _ = _wire({"n": 1})
+        out = wrap_outbound_envelope(
+            _Evt(value=42),
+            inbound_envelope=inbound,
+            idx=0,
+            topic="onex.evt.omnitest.double-done.v1",
+        )
+        assert EnvelopeCodec.encode(out) == out.model_dump_json().encode("utf-8")
+
+    def test_encoded_bytes_round_trip_through_typed_decode(self) -> None:
+        inbound, _ = _wire({"n": 1})
+        out = wrap_outbound_envelope(
+            _Evt(value=5),
+            inbound_envelope=inbound,
+            idx=0,
+            topic="onex.evt.omnitest.double-done.v1",
+        )
+        decoded = EnvelopeCodec(_Evt).decode(EnvelopeCodec.encode(out))
+        assert decoded.payload == _Evt(value=5)
+        assert decoded.event_type == "omnitest.double-done"
+
+
+@pytest.mark.unit
+class TestGetEnvelopeCodec:
+    def test_codecs_are_shared_per_input_model(self) -> None:
+        assert get_envelope_codec(_Req) is get_envelope_codec(_Req)
+        assert get_envelope_codec(None) is get_envelope_codec(None)
+        assert get_envelope_codec(_Req) is not get_envelope_codec(_Evt)
@@ -372,3 +372,133 @@ async def test_poll_respects_max_messages_bound() -> None:
     second = await consumer.poll(max_messages=2, timeout_ms=0)
     await consumer.close()
     assert [m.offset for m in second] == [2]
+
+
+# --------------------------------------------------------------------------- #
+# batched produce
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.asyncio
+async def test_send_batch_matches_per_message_send() -> None:
+    """A batch assigns the same partitions/offsets as the same sends one by one."""
+    keys: list[bytes | None] = [b"a", None, b"b", None, b"a", b"c", None]
+    single = InMemoryBroker(num_partitions=3)
+    producer = InMemoryTransport(broker=single, group="producer")
+    for i, key in enumerate(keys):
+        await producer.send(TOPIC, key=key, value=str(i).encode(), headers={})
+
+    batched = InMemoryBroker(num_partitions=3)
+    headers = {"h": b"1"}
+    await InMemoryTransport(broker=batched, group="producer").send_batch(
+        TOPIC, [(key, str(i).encode(), headers) for i, key in enumerate(keys)]
+    )
+
+    for partition in range(3):
+        expected = [(m.offset, m.value) for m in single.records(TOPIC, partition)]
+        actual = [(m.offset, m.value) for m in batched.records(TOPIC, partition)]
+        assert actual == expected
+
+
+def test_append_batch_snapshots_headers_and_continues_offsets() -> None:
+    broker = InMemoryBroker()
+    broker.append(TOPIC, None, b"first", {})
+    headers = {"h": b"1"}
+    appended = broker.append_batch(
+        TOPIC, [(None, b"x", headers), (None, b"y", headers)]
+    )
+
+    assert [m.offset for m in appended] == [1, 2]
+    headers["h"] = b"mutated"
+    assert appended[0].headers == {"h": b"1"}
+    record = broker.record_at(TOPIC, 0, 2)
+    assert record is not None
+    assert record.ack_token == (TOPIC, 0, 2)
+
+
+# --------------------------------------------------------------------------- #
+# retention / compaction
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.asyncio
+async def test_trim_committed_drops_below_min_group_commit() -> None:
+    broker = InMemoryBroker(trim_committed=True)
+    await _send_n(broker, 5)
+    broker.commit_offset(TOPIC, "g1", 0, 3)
+    assert broker.log_start_offset(TOPIC, 0) == 4
+
+    broker.commit_offset(TOPIC, "g2", 0, 1)
+    broker.commit_offset(TOPIC, "g1", 0, 4)
+    # A slower group joining later cannot resurrect already-trimmed records.
+    assert broker.log_start_offset(TOPIC, 0) == 4
+    assert broker.record_at(TOPIC, 0, 4) is not None
+    assert broker.record_at(TOPIC, 0, 2) is None
+
+    await _send_n(broker, 1)
+    assert broker.log_end_offset(TOPIC, 0) == 6  # offsets stay monotonic
+
+
+@pytest.mark.asyncio
+async def test_max_records_retention_and_consumer_resumes_at_log_start() -> None:
+    broker = InMemoryBroker(retention_max_records=3)
+    await _send_n(broker, 10)
+    assert [m.offset for m in broker.records(TOPIC, 0)] == [7, 8, 9]
+
+    consumer = _consumer(broker)
+    await consumer.start()
+    batch = await consumer.poll(max_messages=10, timeout_ms=0)
+    await consumer.close()
+    assert [m.offset for m in batch] == [7, 8, 9]
+
+
+def test_max_bytes_retention() -> None:
+    broker = InMemoryBroker(retention_max_bytes=10)
+    for _ in range(5):
+        broker.append(TOPIC, None, b"abcd", {})
+    assert [m.offset for m in broker.records(TOPIC, 0)] == [3, 4]
+
+
+def test_head_retention_keeps_reads_consistent_across_many_drops() -> None:
+    broker = InMemoryBroker(retention_max_records=5)
+    for i in range(100):
+        broker.append(TOPIC, None, str(i).encode(), {})
+        start = max(0, i - 4)
+        assert broker.log_start_offset(TOPIC, 0) == start
+        assert [m.offset for m in broker.read(TOPIC, 0, 0, 10)] == list(
+            range(start, i + 1)
+        )
+        record = broker.record_at(TOPIC, 0, i)
+        assert record is not None
+        assert record.value == str(i).encode()
+        assert broker.record_at(TOPIC, 0, start - 1) is None
+    assert [m.offset for m in broker.records(TOPIC, 0)] == [95, 96, 97, 98, 99]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_latest_per_key() -> None:
+    broker = InMemoryBroker(compact_by_key=True)
+    for i in range(6):
+        broker.append(TOPIC, f"k{i % 2}".encode(), str(i).encode(), {})
+    broker.append(TOPIC, None, b"unkeyed", {})
+    broker.enforce_retention()
+
+    retained = [(m.offset, m.value) for m in broker.records(TOPIC, 0)]
+    assert retained == [(4, b"4"), (5, b"5"), (6, b"unkeyed")]
+    record = broker.record_at(TOPIC, 0, 5)
+    assert record is not None
+    assert record.value == b"5"
+    assert broker.record_at(TOPIC, 0, 3) is None
+
+    consumer = _consumer(broker)
+    await consumer.start()
+    batch = await consumer.poll(max_messages=10, timeout_ms=0)
+    await consumer.close()
+    assert [m.offset for m in batch] == [4, 5, 6]
+
+
+def test_invalid_retention_config_rejected() -> None:
+    with pytest.raises(ModelOnexError):
+        InMemoryBroker(retention_max_records=0)
+    with pytest.raises(ModelOnexError):
+        InMemoryBroker(retention_max_bytes=0)
@@ -0,0 +1,320 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for ServiceDiffFileStore segments, index and compaction.
+
+Tests cover:
+- Index checkpoint reload and tail scanning
+- Append-only upserts and tombstone deletes across reopen
+- Segment sealing and compaction
+- Indexed queries against the in-memory store
+"""
+
+import asyncio
+import random
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from omnibase_core.models.contracts.diff import ModelContractDiff
+from omnibase_core.models.diff.model_diff_query import ModelDiffQuery
+from omnibase_core.services.diff.service_diff_file_store import ServiceDiffFileStore
+from omnibase_core.services.diff.service_diff_in_memory_store import (
+    ServiceDiffInMemoryStore,
+)
+
+from .conftest import create_test_diff
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _diffs(count: int, names: int = 3) -> list[ModelContractDiff]:
+    rng = random.Random(7)
+    minutes = rng.sample(range(10_000), count)
+    return [
+        create_test_diff(
+            before_contract_name=f"Contract{rng.randrange(names)}",
+            after_contract_name=f"Contract{rng.randrange(names)}",
+            computed_at=BASE_TIME + timedelta(minutes=minutes[i]),
+            with_changes=bool(i % 3),
+        )
+        for i in range(count)
+    ]
+
+
+async def _filled_store(path: Path, diffs: list[ModelContractDiff], **kwargs: int):
+    store = ServiceDiffFileStore(base_path=path, buffer_size=8, **kwargs)
+    for diff in diffs:
+        await store.put(diff)
+    await store.flush()
+    return store
+
+
+class TestIndexCheckpoint:
+    async def test_reopen_uses_checkpoint_without_scanning(
+        self, tmp_path: Path
+    ) -> None:
+        diffs = _diffs(20)
+        store = await _filled_store(tmp_path, diffs)
+        await store.close()
+        assert store.index_path.exists()
+
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        with patch.object(
+            ServiceDiffFileStore, "_index_record", autospec=True
+        ) as index_record:
+            assert await reopened.count() == 20
+        index_record.assert_not_called()
+        assert await reopened.get(diffs[5].diff_id) == diffs[5]
+
+    async def test_records_after_checkpoint_are_scanned(self, tmp_path: Path) -> None:
+        diffs = _diffs(12)
+        store = await _filled_store(tmp_path, diffs[:6])
+        await store.close()
+        store = await _filled_store(tmp_path, diffs[6:])
+
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert {d.diff_id for d in await reopened.get_all()} == {
+            d.diff_id for d in diffs
+        }
+
+    async def test_stale_checkpoint_triggers_rebuild(self, tmp_path: Path) -> None:
+        diffs = _diffs(6)
+        store = await _filled_store(tmp_path, diffs)
+        await store.close()
+        # Replace the segment behind the checkpoint's back
+        lines = store.file_path.read_bytes().splitlines(keepends=True)
+        store.file_path.write_bytes(b"".join(lines[:3]))
+
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert await reopened.count() == 3
+
+    async def test_partial_trailing_record_is_ignored(self, tmp_path: Path) -> None:
+        store = await _filled_store(tmp_path, _diffs(2))
+        with store.file_path.open("ab") as f:
+            f.write(b'{"diff_id": "trunc')
+
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert await reopened.count() == 2
+        extra = create_test_diff()
+        await reopened.put(extra)
+        await reopened.flush()
+        assert await ServiceDiffFileStore(base_path=tmp_path).get(extra.diff_id) == (
+            extra
+        )
+
+
+class TestAppendOnlyWrites:
+    async def test_upsert_appends_instead_of_rewriting(self, tmp_path: Path) -> None:
+        diff = create_test_diff(before_contract_name="Old")
+        store = await _filled_store(tmp_path, [diff])
+        size = store.file_path.stat().st_size
+        updated = diff.model_copy(update={"before_contract_name": "New"})
+
+        await store.put(updated)
+        await store.flush()
+
+        assert store.file_path.stat().st_size > size
+        assert (await store.get(diff.diff_id)).before_contract_name == "New"
+        assert await store.query(ModelDiffQuery(contract_name="Old")) == []
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert (await reopened.get(diff.diff_id)).before_contract_name == "New"
+        assert await reopened.count() == 1
+
+    async def test_delete_survives_reopen(self, tmp_path: Path) -> None:
+        diffs = _diffs(3)
+        store = await _filled_store(tmp_path, diffs)
+
+        assert await store.delete(diffs[1].diff_id)
+        assert not await store.delete(diffs[1].diff_id)
+
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert not await reopened.exists(diffs[1].diff_id)
+        assert await reopened.count() == 2
+
+    async def test_put_replaces_buffered_version(self, tmp_path: Path) -> None:
+        store = ServiceDiffFileStore(base_path=tmp_path)
+        diff = create_test_diff(before_contract_name="Old")
+        await store.put(diff)
+        await store.put(diff.model_copy(update={"before_contract_name": "New"}))
+
+        assert store.buffer_count == 1
+        assert (await store.get(diff.diff_id)).before_contract_name == "New"
+
+
+class TestSegmentsAndCompaction:
+    async def test_active_segment_is_sealed_when_full(self, tmp_path: Path) -> None:
+        store = await _filled_store(tmp_path, _diffs(30), segment_max_bytes=4096)
+
+        sealed = sorted(tmp_path.glob("diffs.0*.jsonl"))
+        assert sealed
+        assert await store.count() == 30
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert await reopened.count() == 30
+
+    async def test_compaction_drops_garbage(self, tmp_path: Path) -> None:
+        diffs = _diffs(30)
+        store = await _filled_store(
+            tmp_path, diffs, segment_max_bytes=4096, compaction_threshold=2
+        )
+        for diff in diffs[:20]:
+            await store.delete(diff.diff_id)
+        await store.put(diffs[25].model_copy(update={"after_contract_name": "Moved"}))
+        await store.flush()
+        before = sum(p.stat().st_size for p in tmp_path.glob("diffs.0*.jsonl"))
+
+        await store.compact()
+
+        sealed = list(tmp_path.glob("diffs.0*.jsonl"))
+        assert len(sealed) == 1
+        assert sealed[0].stat().st_size < before
+        expected = {d.diff_id for d in diffs[20:]}
+        assert {d.diff_id for d in await store.get_all()} == expected
+        assert (await store.get(diffs[25].diff_id)).after_contract_name == "Moved"
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert {d.diff_id for d in await reopened.get_all()} == expected
+        store.index_path.unlink()
+        rebuilt = ServiceDiffFileStore(base_path=tmp_path)
+        assert {d.diff_id for d in await rebuilt.get_all()} == expected
+
+    async def test_compaction_runs_in_background(self, tmp_path: Path) -> None:
+        diffs = _diffs(40)
+        store = await _filled_store(tmp_path, diffs[:20], segment_max_bytes=2048)
+        for diff in diffs[:20]:
+            await store.delete(diff.diff_id)
+        for diff in diffs[20:]:
+            await store.put(diff)
+        await store.flush()
+
+        assert store._compaction_task is not None
+        await store.close()
+        assert {d.diff_id for d in await store.get_all()} == {
+            d.diff_id for d in diffs[20:]
+        }
+
+    async def test_cancelled_compaction_removes_temp_file(self, tmp_path: Path) -> None:
+        diffs = _diffs(30)
+        store = await _filled_store(tmp_path, diffs, segment_max_bytes=4096)
+        started = threading.Event()
+        release = threading.Event()
+        write_compacted = ServiceDiffFileStore._write_compacted
+
+        def slow_write(records: list[object], temp_path: Path) -> list[int]:
+            started.set()
+            release.wait(5)
+            return write_compacted(records, temp_path)  # type: ignore[arg-type]
+
+        with patch.object(
+            ServiceDiffFileStore, "_write_compacted", staticmethod(slow_write)
+        ):
+            task = asyncio.ensure_future(store.compact())
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert not list(tmp_path.glob("*.compacting"))
+        assert await store.count() == 30
+
+    async def test_manual_compaction_waits_for_background_one(
+        self, tmp_path: Path
+    ) -> None:
+        diffs = _diffs(40)
+        store = await _filled_store(tmp_path, diffs[:20], segment_max_bytes=2048)
+        started = threading.Event()
+        release = threading.Event()
+        active: list[int] = []
+        overlaps: list[int] = []
+        write_compacted = ServiceDiffFileStore._write_compacted
+
+        def slow_write(records: list[object], temp_path: Path) -> list[int]:
+            active.append(1)
+            overlaps.append(len(active))
+            started.set()
+            release.wait(5)
+            try:
+                return write_compacted(records, temp_path)  # type: ignore[arg-type]
+            finally:
+                active.pop()
+
+        with patch.object(
+            ServiceDiffFileStore, "_write_compacted", staticmethod(slow_write)
+        ):
+            for diff in diffs[:20]:
+                await store.delete(diff.diff_id)
+            for diff in diffs[20:]:
+                await store.put(diff)
+            await store.flush()
+            assert store._compaction_task is not None
+            await asyncio.to_thread(started.wait, 5)
+
+            manual = asyncio.ensure_future(store.compact())
+            await asyncio.sleep(0.05)
+            release.set()
+            await manual
+            await store.close()
+
+        assert overlaps and max(overlaps) == 1
+        assert not list(tmp_path.glob("*.compacting"))
+        expected = {d.diff_id for d in diffs[20:]}
+        assert {d.diff_id for d in await store.get_all()} == expected
+        reopened = ServiceDiffFileStore(base_path=tmp_path)
+        assert {d.diff_id for d in await reopened.get_all()} == expected
+
+
+class TestIndexedQueries:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            ModelDiffQuery(),
+            ModelDiffQuery(contract_name="Contract1", limit=5, offset=2),
+            ModelDiffQuery(
+                before_contract_name="Contract0", after_contract_name="Contract2"
+            ),
+            ModelDiffQuery(
+                computed_after=BASE_TIME + timedelta(minutes=2_000),
+                computed_before=BASE_TIME + timedelta(minutes=6_000),
+            ),
+            ModelDiffQuery(has_changes=False, limit=7),
+            ModelDiffQuery(contract_name="Missing"),
+        ],
+    )
+    async def test_matches_in_memory_store(
+        self, tmp_path: Path, query: ModelDiffQuery
+    ) -> None:
+        diffs = _diffs(60)
+        store = await _filled_store(tmp_path, diffs[:55])
+        for diff in diffs[55:]:
+            await store.put(diff)  # left in the buffer
+        reference = ServiceDiffInMemoryStore()
+        for diff in diffs:
+            await reference.put(diff)
+
+        assert await store.query(query) == await reference.query(query)
+        assert await store.count(query) == await reference.count(query)
+
+    async def test_query_reads_only_returned_records(self, tmp_path: Path) -> None:
+        store = await _filled_store(tmp_path, _diffs(50))
+        with patch.object(
+            ModelContractDiff,
+            "model_validate_json",
+            wraps=ModelContractDiff.model_validate_json,
+        ) as parse:
+            results = await store.query(ModelDiffQuery(limit=3))
+        assert len(results) == 3
+        assert parse.call_count == 3
+
+    async def test_count_without_record_filters_reads_nothing(
+        self, tmp_path: Path
+    ) -> None:
+        store = await _filled_store(tmp_path, _diffs(20))
+        with patch.object(ModelContractDiff, "model_validate_json") as parse:
+            await store.count(ModelDiffQuery(contract_name="Contract1"))
+        parse.assert_not_called()
@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for ServiceStateDisk formats, key index, cache and write coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from omnibase_core.enums.enum_data_format import EnumDataFormat
+from omnibase_core.errors import ModelOnexError
+from omnibase_core.models.state.model_state_envelope import ModelStateEnvelope
+from omnibase_core.services.state.service_state_disk import ServiceStateDisk
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+def _spy(method: str) -> Any:
+    """Patch a ServiceStateDisk method with a call-counting passthrough."""
+    return patch.object(
+        ServiceStateDisk,
+        method,
+        autospec=True,
+        side_effect=getattr(ServiceStateDisk, method),
+    )
+
+
+def _envelope(
+    node_id: str = "node", scope_id: str = "default", **data: object
+) -> ModelStateEnvelope:
+    return ModelStateEnvelope(
+        node_id=node_id, scope_id=scope_id, data=data, written_at=datetime.now(UTC)
+    )
+
+
+async def test_json_format_round_trip(tmp_path: Path) -> None:
+    store = ServiceStateDisk(state_root=tmp_path, file_format=EnumDataFormat.JSON)
+    envelope = _envelope(count=3)
+    await store.put(envelope)
+
+    assert (tmp_path / "node" / "default" / "state.json").exists()
+    fresh = ServiceStateDisk(state_root=tmp_path, file_format=EnumDataFormat.JSON)
+    assert await fresh.get("node") == envelope
+
+
+async def test_switching_format_reads_and_replaces_old_files(tmp_path: Path) -> None:
+    await ServiceStateDisk(state_root=tmp_path).put(_envelope(v=1))
+    store = ServiceStateDisk(state_root=tmp_path, file_format=EnumDataFormat.JSON)
+
+    assert (await store.get("node")).data == {"v": 1}
+    await store.put(_envelope(v=2))
+    assert not (tmp_path / "node" / "default" / "state.yaml").exists()
+    assert (await ServiceStateDisk(state_root=tmp_path).get("node")).data == {"v": 2}
+
+
+async def test_unsupported_format_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ModelOnexError):
+        ServiceStateDisk(state_root=tmp_path, file_format=EnumDataFormat.XML)
+
+
+async def test_key_queries_do_not_touch_the_filesystem(tmp_path: Path) -> None:
+    await ServiceStateDisk(state_root=tmp_path).put(_envelope("a"))
+    store = ServiceStateDisk(state_root=tmp_path)
+    with _spy("_scan_keys") as scan:
+        await store.put(_envelope("b", "run-1"))
+        assert await store.exists("a")
+        assert not await store.exists("c")
+        assert await store.list_keys() == [("a", "default"), ("b", "run-1")]
+        assert await store.list_keys("b") == [("b", "run-1")]
+        await store.delete("a")
+        assert await store.list_keys() == [("b", "run-1")]
+    assert scan.call_count == 1
+
+
+async def test_cache_serves_hot_envelopes(tmp_path: Path) -> None:
+    store = ServiceStateDisk(state_root=tmp_path, cache_size=2)
+    for name in ("a", "b", "c"):
+        await store.put(_envelope(name))
+
+    with _spy("_read_file") as read:
+        assert (await store.get("c")).node_id == "c"
+        assert (await store.get("b")).node_id == "b"
+        assert read.call_count == 0
+        assert (await store.get("a")).node_id == "a"  # evicted, read from disk
+        assert read.call_count == 1
+
+
+async def test_file_io_runs_off_the_event_loop(tmp_path: Path) -> None:
+    store = ServiceStateDisk(state_root=tmp_path)
+    threads: list[str] = []
+    original = ServiceStateDisk._write_file
+
+    def record_thread(self: ServiceStateDisk, *args: object) -> None:
+        threads.append(threading.current_thread().name)
+        original(self, *args)
+
+    with patch.object(ServiceStateDisk, "_write_file", record_thread):
+        await store.put(_envelope())
+    assert threads
+    assert threads[0].startswith("onex-state-disk")
+
+
+async def test_read_racing_a_put_does_not_cache_stale_state(tmp_path: Path) -> None:
+    await ServiceStateDisk(state_root=tmp_path).put(_envelope(v=1))
+    store = ServiceStateDisk(state_root=tmp_path)
+    await store.list_keys()
+
+    read = asyncio.ensure_future(store.get("node"))
+    await asyncio.sleep(0)
+    await store.put(_envelope(v=2))
+    await read
+
+    assert (await store.get("node")).data == {"v": 2}
+
+
+class TestWriteCoalescing:
+    async def test_rapid_puts_write_once(self, tmp_path: Path) -> None:
+        store = ServiceStateDisk(state_root=tmp_path, coalesce_delay_s=0.05)
+        with _spy("_write_file") as write:
+            for v in range(20):
+                await store.put(_envelope(v=v))
+            assert (await store.get("node")).data == {"v": 19}
+            assert await store.exists("node")
+            assert write.call_count == 0
+            await asyncio.sleep(0.2)
+            assert write.call_count == 1
+
+        fresh = ServiceStateDisk(state_root=tmp_path)
+        assert (await fresh.get("node")).data == {"v": 19}
+
+    async def test_flush_writes_pending_now(self, tmp_path: Path) -> None:
+        store = ServiceStateDisk(state_root=tmp_path, coalesce_delay_s=60)
+        await store.put(_envelope("a"))
+        await store.put(_envelope("b"))
+
+        await store.flush()
+
+        fresh = ServiceStateDisk(state_root=tmp_path)
+        assert await fresh.list_keys() == [("a", "default"), ("b", "default")]
+
+    @pytest.mark.parametrize("delay", [0.01, 60])
+    async def test_coalesced_write_replaces_old_format_file(
+        self, tmp_path: Path, delay: float
+    ) -> None:
+        await ServiceStateDisk(state_root=tmp_path).put(_envelope(v=1))
+        store = ServiceStateDisk(
+            state_root=tmp_path,
+            file_format=EnumDataFormat.JSON,
+            coalesce_delay_s=delay,
+        )
+        await store.put(_envelope(v=2))
+        await store.put(_envelope(v=3))
+
+        if delay < 1:
+            await asyncio.sleep(0.1)
+        await store.flush()
+
+        scope_dir = tmp_path / "node" / "default"
+        assert (scope_dir / "state.json").exists()
+        assert not (scope_dir / "state.yaml").exists()
+        assert (await ServiceStateDisk(state_root=tmp_path).get("node")).data == {
+            "v": 3
+        }
+
+    async def test_delete_discards_pending_write(self, tmp_path: Path) -> None:
+        store = ServiceStateDisk(state_root=tmp_path, coalesce_delay_s=0.01)
+        await store.put(_envelope())
+
+        assert await store.delete("node")
+        await asyncio.sleep(0.05)
+
+        assert await store.get("node") is None
+        assert not (tmp_path / "node").exists()
+
+    async def test_close_writes_pending_and_rejects_later_io(
+        self, tmp_path: Path
+    ) -> None:
+        store = ServiceStateDisk(state_root=tmp_path, coalesce_delay_s=60)
+        await store.put(_envelope(v=1))
+
+        await store.close()
+        await store.close()
+
+        assert store._executor._shutdown
+        fresh = ServiceStateDisk(state_root=tmp_path)
+        assert (await fresh.get("node")).data == {"v": 1}
+        with pytest.raises(ModelOnexError):
+            await store.put(_envelope("other"))
+
+    async def test_failed_delayed_write_is_raised_by_flush(
+        self, tmp_path: Path
+    ) -> None:
+        store = ServiceStateDisk(state_root=tmp_path, coalesce_delay_s=0.01)
+        with patch.object(
+            ServiceStateDisk, "_write_file", side_effect=OSError("disk full")
+        ):
+            await store.put(_envelope(v=1))
+            await asyncio.sleep(0.05)
+
+        assert not store._background
+        with pytest.raises(OSError, match="disk full"):
+            await store.flush()
+        # Reported once
+        await store.flush()
+        await store.close()
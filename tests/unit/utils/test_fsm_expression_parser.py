@@ -588,7 +588,7 @@ class TestConsistencyWithFSMExecutor:
 
     def test_all_fsm_executor_operators_supported(self) -> None:
         """Should support all word-based operators used in fsm_executor."""
-        # These word-based operators are used in fsm_executor._evaluate_single_condition()
+        # These word-based operators are used in util_fsm_transition_table.compile_condition()
         fsm_executor_operators = {
             "equals",
             "not_equals",
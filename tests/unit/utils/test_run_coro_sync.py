@@ -5,13 +5,15 @@
 
 Graduated from omnibase_compat into omnibase_core (OMN-13763).
 Covers the two execution paths: no running loop (asyncio.run) and
-running loop (ThreadPoolExecutor dispatch).
+running loop (persistent background loop thread).
 """
 
 import asyncio
+import threading
 
 import pytest
 
+from omnibase_core.utils.util_loop_thread_runner import get_default_loop_runner
 from omnibase_core.utils.util_run_coro_sync import run_coro_sync
 
 
@@ -39,11 +41,11 @@ def test_run_coro_sync_no_loop_propagates_exception() -> None:
 
 @pytest.mark.unit
 def test_run_coro_sync_inside_running_loop_returns_value() -> None:
-    """run_coro_sync dispatches to a worker thread when a loop is already running."""
+    """run_coro_sync dispatches to the loop thread when a loop is already running."""
 
     async def _driver() -> int:
         # run_coro_sync must not call asyncio.run on this thread --
-        # it detects the running loop and spawns a worker thread instead.
+        # it detects the running loop and uses the background loop thread.
         return run_coro_sync(_return_value(99))
 
     result = asyncio.run(_driver())
@@ -52,10 +54,40 @@ def test_run_coro_sync_inside_running_loop_returns_value() -> None:
 
 @pytest.mark.unit
 def test_run_coro_sync_inside_running_loop_propagates_exception() -> None:
-    """run_coro_sync propagates coroutine exceptions via the thread-pool path."""
+    """run_coro_sync propagates coroutine exceptions via the loop-thread path."""
 
     async def _driver() -> None:
         run_coro_sync(_raise_error())
 
     with pytest.raises(ValueError, match="expected error"):
         asyncio.run(_driver())
+
+
+@pytest.mark.unit
+def test_run_coro_sync_inside_running_loop_reuses_one_loop_thread() -> None:
+    """Repeated calls from a running loop share the persistent loop thread."""
+
+    async def _thread_name() -> str:
+        return threading.current_thread().name
+
+    async def _driver() -> list[str]:
+        return [run_coro_sync(_thread_name()) for _ in range(5)]
+
+    names = asyncio.run(_driver())
+    assert names == [get_default_loop_runner().name] * 5
+
+
+@pytest.mark.unit
+def test_run_coro_sync_reentry_from_loop_thread_does_not_deadlock() -> None:
+    """A coroutine on the loop thread can itself call run_coro_sync."""
+
+    async def _inner() -> int:
+        return 7
+
+    async def _outer() -> int:
+        return run_coro_sync(_inner()) + 1
+
+    async def _driver() -> int:
+        return run_coro_sync(_outer())
+
+    assert asyncio.run(_driver()) == 8
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for compiled compute pipeline plans.
+
+A compiled plan must return the same result as execute_compute_pipeline for
+the same contract and input: outputs, step results and error details.
+"""
+
+import gc
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from omnibase_core.enums.enum_case_mode import EnumCaseMode
+from omnibase_core.enums.enum_compute_step_type import EnumComputeStepType
+from omnibase_core.enums.enum_transformation_type import EnumTransformationType
+from omnibase_core.enums.enum_trim_mode import EnumTrimMode
+from omnibase_core.models.compute.model_compute_execution_context import (
+    ModelComputeExecutionContext,
+)
+from omnibase_core.models.compute.model_compute_pipeline_result import (
+    ModelComputePipelineResult,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_pipeline_step import (
+    ModelComputePipelineStep,
+)
+from omnibase_core.models.contracts.subcontracts.model_compute_subcontract import (
+    ModelComputeSubcontract,
+)
+from omnibase_core.models.transformations.model_mapping_config import (
+    ModelMappingConfig,
+)
+from omnibase_core.models.transformations.model_transform_case_config import (
+    ModelTransformCaseConfig,
+)
+from omnibase_core.models.transformations.model_transform_json_path_config import (
+    ModelTransformJsonPathConfig,
+)
+from omnibase_core.models.transformations.model_transform_trim_config import (
+    ModelTransformTrimConfig,
+)
+from omnibase_core.models.transformations.model_validation_step_config import (
+    ModelValidationStepConfig,
+)
+from omnibase_core.utils import util_compute_pipeline_plan
+from omnibase_core.utils.util_compute_executor import execute_compute_pipeline
+from omnibase_core.utils.util_compute_pipeline_plan import (
+    compile_compute_pipeline,
+    get_compiled_compute_pipeline,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+
+def _contract(
+    *steps: ModelComputePipelineStep, **kwargs: object
+) -> ModelComputeSubcontract:
+    return ModelComputeSubcontract(
+        operation_name="plan_test",
+        operation_version={"major": 1, "minor": 0, "patch": 0},
+        pipeline=list(steps),
+        **kwargs,
+    )
+
+
+def _trim() -> ModelComputePipelineStep:
+    return ModelComputePipelineStep(
+        step_name="trim",
+        step_type=EnumComputeStepType.TRANSFORMATION,
+        transformation_type=EnumTransformationType.TRIM,
+        transformation_config=ModelTransformTrimConfig(mode=EnumTrimMode.BOTH),
+    )
+
+
+def _upper(enabled: bool = True) -> ModelComputePipelineStep:
+    return ModelComputePipelineStep(
+        step_name="upper",
+        step_type=EnumComputeStepType.TRANSFORMATION,
+        transformation_type=EnumTransformationType.CASE_CONVERSION,
+        transformation_config=ModelTransformCaseConfig(mode=EnumCaseMode.UPPER),
+        enabled=enabled,
+    )
+
+
+def _json_path(path: str) -> ModelComputePipelineStep:
+    return ModelComputePipelineStep(
+        step_name="extract",
+        step_type=EnumComputeStepType.TRANSFORMATION,
+        transformation_type=EnumTransformationType.JSON_PATH,
+        transformation_config=ModelTransformJsonPathConfig(path=path),
+    )
+
+
+def _mapping(**field_mappings: str) -> ModelComputePipelineStep:
+    return ModelComputePipelineStep(
+        step_name="map",
+        step_type=EnumComputeStepType.MAPPING,
+        mapping_config=ModelMappingConfig(field_mappings=field_mappings),
+    )
+
+
+def _comparable(result: ModelComputePipelineResult) -> dict[str, object]:
+    data = result.model_dump(exclude={"processing_time_ms"})
+    for step in data["step_results"].values():
+        step["metadata"].pop("duration_ms")
+    return data
+
+
+def _assert_equivalent(contract: ModelComputeSubcontract, input_data: object) -> None:
+    context = ModelComputeExecutionContext(operation_id=uuid4())
+    expected = execute_compute_pipeline(contract, input_data, context)
+    actual = compile_compute_pipeline(contract).execute(input_data, context)
+    assert _comparable(actual) == _comparable(expected)
+
+
+class TestPlanEquivalence:
+    @pytest.mark.parametrize(
+        ("steps", "input_data"),
+        [
+            ((_trim(), _upper()), "  hello  "),
+            ((_trim(), _upper(enabled=False)), "  hello  "),
+            ((_upper(),), 123),
+            ((_json_path("$.user.name"),), {"user": {"name": "Ada"}}),
+            ((_json_path("$.user.missing"),), {"user": {"name": "Ada"}}),
+            ((_json_path("$"),), {"a": 1}),
+            ((_json_path("$.obj._secret"),), {"obj": SimpleNamespace(_secret=1)}),
+            ((_json_path("$.obj.value"),), {"obj": SimpleNamespace(value=1)}),
+            ((_json_path("$.obj.nope"),), {"obj": SimpleNamespace(value=1)}),
+            ((_json_path("$._key"),), {"_key": "dict keys may be private"}),
+        ],
+    )
+    def test_transformations(
+        self, steps: tuple[ModelComputePipelineStep, ...], input_data: object
+    ) -> None:
+        _assert_equivalent(_contract(*steps), input_data)
+
+    @pytest.mark.parametrize(
+        "field_mappings",
+        [
+            {"all": "$.input", "alias": "$input"},
+            {"name": "$.input.user.name", "alt": "$input.user.name"},
+            {"out": "$.steps.trim", "explicit": "$.steps.trim.output"},
+            {"missing": "$.input.user.nope"},
+            {"private": "$.input.obj._hidden"},
+            {"unknown_step": "$.steps.nope"},
+            {"bad_sub_path": "$.steps.trim.metadata"},
+            {"trailing_dot": "$.steps.trim."},
+            {"bad_prefix": "$.other"},
+            {"no_dollar": "input.user"},
+        ],
+    )
+    def test_mappings(self, field_mappings: dict[str, str]) -> None:
+        input_data = {
+            "user": {"name": "Ada"},
+            "obj": SimpleNamespace(_hidden=1),
+            "text": " x ",
+        }
+        trim_text = ModelComputePipelineStep(
+            step_name="trim",
+            step_type=EnumComputeStepType.TRANSFORMATION,
+            transformation_type=EnumTransformationType.IDENTITY,
+        )
+        _assert_equivalent(_contract(trim_text, _mapping(**field_mappings)), input_data)
+
+    def test_validation_step_passes_through(self) -> None:
+        step = ModelComputePipelineStep(
+            step_name="validate",
+            step_type=EnumComputeStepType.VALIDATION,
+            validation_config=ModelValidationStepConfig(schema_ref="schemas/x.json"),
+        )
+        with pytest.warns(UserWarning, match="pass-through"):
+            _assert_equivalent(_contract(step), {"a": 1})
+
+    def test_invalid_step_fails_like_interpreter(self) -> None:
+        # model_construct bypasses contract validation, leaving config missing
+        step = ModelComputePipelineStep.model_construct(
+            step_name="broken",
+            step_type=EnumComputeStepType.TRANSFORMATION,
+            transformation_type=EnumTransformationType.TRIM,
+            transformation_config=None,
+            mapping_config=None,
+            validation_config=None,
+            enabled=True,
+        )
+        _assert_equivalent(_contract().model_copy(update={"pipeline": [step]}), "x")
+
+
+class TestPlanCompilation:
+    def test_disabled_steps_are_dropped(self) -> None:
+        plan = compile_compute_pipeline(_contract(_trim(), _upper(enabled=False)))
+        assert len(plan) == 1
+        assert plan.skipped_steps == ("upper",)
+
+    def test_cached_plan_is_per_contract_and_released(self) -> None:
+        contract = _contract(_trim())
+        plan = get_compiled_compute_pipeline(contract)
+        assert get_compiled_compute_pipeline(contract) is plan
+        assert get_compiled_compute_pipeline(_contract(_trim())) is not plan
+
+        key = id(contract)
+        del contract, plan
+        gc.collect()
+        assert key not in util_compute_pipeline_plan._plan_cache
+
+
+class TestPlanBatch:
+    def test_batch_returns_one_result_per_input_in_order(self) -> None:
+        plan = compile_compute_pipeline(_contract(_trim(), _upper()))
+        context = ModelComputeExecutionContext(operation_id=uuid4())
+        results = plan.execute_batch([" a ", 1, " c "], context)
+        assert [r.success for r in results] == [True, False, True]
+        assert [r.output for r in results] == ["A", None, "C"]
+
+    def test_batch_with_timeout_configured(self) -> None:
+        plan = compile_compute_pipeline(_contract(_upper(), pipeline_timeout_ms=5000))
+        context = ModelComputeExecutionContext(operation_id=uuid4())
+        results = plan.execute_batch(["a", "b"], context)
+        assert [r.output for r in results] == ["A", "B"]
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for UtilEvictionIndex (O(1) LRU/LFU/FIFO eviction + expiry heap)."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from omnibase_core.enums.enum_cache_eviction_policy import EnumCacheEvictionPolicy
+from omnibase_core.utils.util_eviction_index import UtilEvictionIndex
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+LATER = NOW + timedelta(hours=1)
+
+
+def _index(policy: EnumCacheEvictionPolicy, *keys: str) -> UtilEvictionIndex:
+    index = UtilEvictionIndex(policy)
+    for key in keys:
+        index.insert(key, LATER)
+    return index
+
+
+@pytest.mark.unit
+class TestUtilEvictionIndexPolicies:
+    def test_lru_evicts_least_recently_touched(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LRU, "a", "b", "c")
+        index.touch("a")
+        assert index.pop_victim() == "b"
+        assert index.pop_victim() == "c"
+        assert index.pop_victim() == "a"
+        assert index.pop_victim() is None
+
+    def test_fifo_ignores_touches(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.FIFO, "a", "b", "c")
+        index.touch("a")
+        assert [index.pop_victim() for _ in range(3)] == ["a", "b", "c"]
+
+    def test_lfu_evicts_lowest_frequency_oldest_first(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LFU, "a", "b", "c")
+        index.touch("a")
+        index.touch("a")
+        index.touch("c")
+        assert index.pop_victim() == "b"
+        assert index.pop_victim() == "c"
+        assert index.pop_victim() == "a"
+
+    def test_lfu_recovers_min_frequency_after_remove(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LFU, "a", "b")
+        index.touch("a")
+        index.touch("a")
+        index.touch("b")
+        index.remove("b")
+        assert index.pop_victim() == "a"
+
+    def test_reinsert_restarts_tracking(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LFU, "a", "b")
+        index.touch("a")
+        index.insert("a", LATER)
+        index.touch("b")
+        assert index.pop_victim() == "a"
+        assert len(index) == 1
+
+    def test_remove_untracked_key_is_noop(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LRU, "a")
+        index.remove("missing")
+        index.touch("missing")
+        assert "a" in index
+        assert len(index) == 1
+
+
+@pytest.mark.unit
+class TestUtilEvictionIndexExpiry:
+    def test_pop_expired_returns_only_expired_keys(self) -> None:
+        index = UtilEvictionIndex(EnumCacheEvictionPolicy.LRU)
+        index.insert("old", NOW - timedelta(seconds=1))
+        index.insert("new", LATER)
+        assert index.pop_expired(NOW) == ["old"]
+        assert "old" not in index
+        assert index.pop_victim() == "new"
+
+    def test_overwritten_expiry_is_not_reported_stale(self) -> None:
+        index = UtilEvictionIndex(EnumCacheEvictionPolicy.LRU)
+        index.insert("k", NOW - timedelta(seconds=1))
+        index.insert("k", LATER)
+        assert index.pop_expired(NOW) == []
+        assert "k" in index
+
+    def test_heap_is_compacted_under_overwrites(self) -> None:
+        index = UtilEvictionIndex(EnumCacheEvictionPolicy.LRU)
+        for _ in range(1_000):
+            index.insert("k", LATER)
+        assert len(index._heap) <= 2 * len(index) + 64
+
+    def test_clear_drops_everything(self) -> None:
+        index = _index(EnumCacheEvictionPolicy.LFU, "a", "b")
+        index.clear()
+        assert len(index) == 0
+        assert index.pop_victim() is None
+        assert index.pop_expired(LATER) == []
@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for precompiled FSM transition tables.
+
+Behavioral coverage of transition semantics lives in test_fsm_executor.py,
+which runs through the compiled tables; these tests cover compilation and
+the fingerprint cache.
+"""
+
+import gc
+
+import pytest
+
+from omnibase_core.models.contracts.subcontracts.model_fsm_state_definition import (
+    ModelFSMStateDefinition,
+)
+from omnibase_core.models.contracts.subcontracts.model_fsm_state_transition import (
+    ModelFSMStateTransition,
+)
+from omnibase_core.models.contracts.subcontracts.model_fsm_subcontract import (
+    ModelFSMSubcontract,
+)
+from omnibase_core.models.fsm.model_fsm_transition_condition import (
+    ModelFSMTransitionCondition,
+)
+from omnibase_core.models.primitives.model_semver import ModelSemVer
+from omnibase_core.utils import util_fsm_transition_table
+from omnibase_core.utils.util_fsm_transition_table import (
+    compile_condition,
+    compile_fsm,
+    get_compiled_fsm,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+V1 = ModelSemVer(major=1, minor=0, patch=0)
+
+
+def _state(name: str) -> ModelFSMStateDefinition:
+    return ModelFSMStateDefinition(
+        state_name=name, state_type="operational", description=name, version=V1
+    )
+
+
+def _condition(expression: str, required: bool = True) -> ModelFSMTransitionCondition:
+    return ModelFSMTransitionCondition(
+        condition_name=expression,
+        condition_type="expression",
+        expression=expression,
+        required=required,
+    )
+
+
+def _transition(
+    name: str,
+    from_state: str,
+    to_state: str,
+    priority: int = 0,
+    conditions: list[ModelFSMTransitionCondition] | None = None,
+) -> ModelFSMStateTransition:
+    return ModelFSMStateTransition(
+        transition_name=name,
+        from_state=from_state,
+        to_state=to_state,
+        trigger="go",
+        priority=priority,
+        conditions=conditions or [],
+        version=V1,
+    )
+
+
+def _fsm(name: str = "table_test") -> ModelFSMSubcontract:
+    return ModelFSMSubcontract(
+        state_machine_name=name,
+        state_machine_version=V1,
+        description="table test",
+        version=V1,
+        states=[_state("idle"), _state("fast"), _state("slow"), _state("error")],
+        initial_state="idle",
+        transitions=[
+            _transition("slow", "idle", "slow"),
+            _transition(
+                "fast", "idle", "fast", priority=5, conditions=[_condition("n > 10")]
+            ),
+            _transition("panic", "*", "error"),
+        ],
+    )
+
+
+class TestCompileCondition:
+    @pytest.mark.parametrize(
+        ("expression", "context", "expected"),
+        [
+            ("n equals 5", {"n": 5}, True),
+            ("n != 5", {"n": "5"}, False),
+            ("n >= 2", {"n": "2.0"}, True),
+            ("n < 2", {"n": "abc"}, False),
+            ("n > abc", {"n": 5}, False),
+            ("n > 0", {}, False),
+            ("user.role in admin,ops", {"user": {"role": "ops"}}, True),
+            ("user.role not_in admin,ops", {"user": None}, True),
+            ("name contains da", {"name": "Ada"}, True),
+            ("name contains x", {}, False),
+            ("name matches ^A.a$", {"name": "Ada"}, True),
+            ("name matches [", {"name": "Ada"}, False),
+            ("name exists _", {"name": "Ada"}, False),
+            ("_private equals x", {"_private": "x"}, False),
+        ],
+    )
+    def test_predicates(
+        self, expression: str, context: dict[str, object], expected: bool
+    ) -> None:
+        assert compile_condition(_condition(expression))(context) is expected
+
+
+class TestUtilFSMTransitionTable:
+    def test_candidates_are_priority_ordered(self) -> None:
+        table = compile_fsm(_fsm())
+        names = [t.transition_name for t in table.candidates("idle", "go")]
+        assert names == ["fast", "slow"]
+
+    def test_wildcard_applies_without_exact_match(self) -> None:
+        table = compile_fsm(_fsm())
+        assert [t.transition_name for t in table.candidates("fast", "go")] == ["panic"]
+        assert table.select("idle", "nope", {}) is None
+
+    def test_select_falls_through_failed_guards(self) -> None:
+        table = compile_fsm(_fsm())
+        assert table.select("idle", "go", {"n": 11}).transition.transition_name == (
+            "fast"
+        )
+        selection = table.select("idle", "go", {"n": 1})
+        assert selection.transition.transition_name == "slow"
+        assert selection.guard_passed
+
+    def test_optional_conditions_are_not_compiled(self) -> None:
+        fsm = _fsm().model_copy(
+            update={
+                "transitions": [
+                    _transition(
+                        "only",
+                        "idle",
+                        "fast",
+                        conditions=[_condition("n > 10", required=False)],
+                    )
+                ]
+            }
+        )
+        assert compile_fsm(fsm).select("idle", "go", {"n": 0}).guard_passed
+
+    def test_state_lookup(self) -> None:
+        table = compile_fsm(_fsm())
+        assert table.state("idle").state_name == "idle"
+        assert table.state("missing") is None
+
+
+class TestCompiledFSMCache:
+    def test_equal_contracts_share_one_table(self) -> None:
+        table = get_compiled_fsm(_fsm())
+        assert get_compiled_fsm(_fsm()) is table
+        assert get_compiled_fsm(_fsm("other")) is not table
+
+    def test_instance_memo_is_released_with_the_contract(self) -> None:
+        fsm = _fsm("released")
+        get_compiled_fsm(fsm)
+        key = id(fsm)
+        assert key in util_fsm_transition_table._tables_by_instance
+        del fsm
+        gc.collect()
+        assert key not in util_fsm_transition_table._tables_by_instance
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for UtilIncrementalWorkflowContext (append-only context, O(1) snapshots)."""
+
+from uuid import uuid4
+
+import pytest
+
+from omnibase_core.utils.util_incremental_workflow_context import (
+    UtilIncrementalWorkflowContext,
+)
+
+
+@pytest.mark.unit
+class TestUtilIncrementalWorkflowContext:
+    def test_empty_snapshot(self) -> None:
+        workflow_id = uuid4()
+        context = UtilIncrementalWorkflowContext(workflow_id).snapshot()
+        assert context["workflow_uuid_str"] == str(workflow_id)
+        assert context["completed_steps"] == []
+        assert context["step_outputs"] == {}
+        assert context["step_count"] == 0
+
+    def test_snapshot_is_unaffected_by_later_records(self) -> None:
+        builder = UtilIncrementalWorkflowContext(uuid4())
+        first, second = uuid4(), uuid4()
+        builder.record(first, {"n": 1})
+        before = builder.snapshot()
+        builder.record(second, {"n": 2})
+        after = builder.snapshot()
+
+        assert before["completed_steps"] == [str(first)]
+        assert before["step_outputs"] == {str(first): {"n": 1}}
+        assert str(second) not in before["step_outputs"]
+        assert before["step_count"] == 1
+        assert list(after["completed_steps"]) == [str(first), str(second)]
+        assert after["step_outputs"][str(second)] == {"n": 2}
+
+    def test_steps_without_output_count_as_completed(self) -> None:
+        builder = UtilIncrementalWorkflowContext(uuid4())
+        skipped, done = uuid4(), uuid4()
+        builder.record(skipped)
+        builder.record(done, "out")
+        context = builder.snapshot()
+        assert context["step_count"] == 2
+        assert context["completed_steps"] == [str(skipped), str(done)]
+        assert dict(context["step_outputs"]) == {str(done): "out"}
+        assert skipped in builder
+        assert len(builder) == 2
+
+    def test_record_is_write_once(self) -> None:
+        builder = UtilIncrementalWorkflowContext(uuid4())
+        step_id = uuid4()
+        builder.record(step_id, "first")
+        snapshot = builder.snapshot()
+        builder.record(step_id, "second")
+        assert builder.snapshot()["step_outputs"][str(step_id)] == "first"
+        assert snapshot["step_outputs"][str(step_id)] == "first"
+        assert len(builder) == 1
+
+    def test_views_are_read_only_sequences_and_mappings(self) -> None:
+        builder = UtilIncrementalWorkflowContext(uuid4())
+        ids = [uuid4() for _ in range(3)]
+        for step_id in ids:
+            builder.record(step_id, str(step_id))
+        context = builder.snapshot()
+        steps = context["completed_steps"]
+
+        assert steps[0] == str(ids[0])
+        assert steps[-1] == str(ids[2])
+        assert steps[1:] == [str(ids[1]), str(ids[2])]
+        with pytest.raises(IndexError):
+            steps[3]
+        with pytest.raises(KeyError):
+            context["step_outputs"]["missing"]
+        assert not hasattr(steps, "append")
+        assert not hasattr(context["step_outputs"], "__setitem__")
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for UtilLoopThreadRunner (persistent background event loop)."""
+
+import asyncio
+import contextvars
+from collections.abc import Iterator
+
+import pytest
+
+from omnibase_core.utils.util_loop_thread_runner import UtilLoopThreadRunner
+
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(30)]
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture
+def runner() -> Iterator[UtilLoopThreadRunner]:
+    runner = UtilLoopThreadRunner(name="test-loop-runner")
+    yield runner
+    runner.shutdown()
+
+
+async def _echo(value: int, delay: float = 0.0) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail() -> None:
+    raise ValueError("boom")
+
+
+class TestUtilLoopThreadRunner:
+    def test_run_returns_result_on_one_loop(self, runner: UtilLoopThreadRunner) -> None:
+        async def loop_id() -> int:
+            return id(asyncio.get_running_loop())
+
+        assert runner.run(loop_id()) == runner.run(loop_id())
+        assert runner.get_metrics()["loop_starts"] == 1
+
+    def test_run_propagates_exceptions(self, runner: UtilLoopThreadRunner) -> None:
+        with pytest.raises(ValueError, match="boom"):
+            runner.run(_fail())
+        assert runner.get_metrics()["failed"] == 1
+
+    def test_run_timeout_cancels_the_coroutine(
+        self, runner: UtilLoopThreadRunner
+    ) -> None:
+        with pytest.raises(TimeoutError):
+            runner.run(_echo(1, delay=5), timeout=0.05)
+        metrics = runner.get_metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["failed"] == 1
+
+    def test_caller_context_is_visible(self, runner: UtilLoopThreadRunner) -> None:
+        async def read() -> str:
+            return _request_id.get("unset")
+
+        token = _request_id.set("req-1")
+        try:
+            assert runner.run(read()) == "req-1"
+        finally:
+            _request_id.reset(token)
+
+    def test_run_batch_returns_results_in_order(
+        self, runner: UtilLoopThreadRunner
+    ) -> None:
+        coros = [_echo(i, delay=0.01 * (3 - i)) for i in range(3)]
+        assert runner.run_batch(coros) == [0, 1, 2]
+        metrics = runner.get_metrics()
+        assert metrics["submitted"] == metrics["completed"] == 3
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_wait_ms"] >= metrics["avg_wait_ms"] >= 0.0
+
+    def test_run_batch_raises_first_failure(self, runner: UtilLoopThreadRunner) -> None:
+        with pytest.raises(ValueError, match="boom"):
+            runner.run_batch([_echo(1), _fail(), _echo(2)])
+        assert runner.get_metrics()["completed"] == 3
+
+    def test_run_from_loop_thread_is_rejected(
+        self, runner: UtilLoopThreadRunner
+    ) -> None:
+        async def reenter() -> None:
+            runner.run(_echo(1))
+
+        with pytest.raises(RuntimeError, match="own loop thread"):
+            runner.run(reenter())
+
+    def test_shutdown_cancels_pending_and_restarts_on_demand(
+        self, runner: UtilLoopThreadRunner
+    ) -> None:
+        pending = runner.submit(_echo(1, delay=10))
+        runner.shutdown()
+        assert pending.cancelled()
+        assert not runner.is_running
+
+        assert runner.run(_echo(2)) == 2
+        assert runner.get_metrics()["loop_starts"] == 2
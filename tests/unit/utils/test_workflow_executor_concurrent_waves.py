@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for opt-in concurrent wave execution in util_workflow_executor.py.
+
+With max_concurrent_steps set, steps of one parallel wave run concurrently
+(bounded by a per-workflow semaphore) while completion order, emission order,
+stop-on-error (Fix 22) and the global timeout (Fix 35) stay deterministic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from omnibase_core.enums.enum_core_error_code import EnumCoreErrorCode
+from omnibase_core.enums.enum_workflow_coordination import EnumFailureRecoveryStrategy
+from omnibase_core.enums.enum_workflow_execution import EnumExecutionMode
+from omnibase_core.enums.enum_workflow_status import EnumWorkflowStatus
+from omnibase_core.models.contracts.model_workflow_step import ModelWorkflowStep
+from omnibase_core.models.contracts.subcontracts.model_coordination_rules import (
+    ModelCoordinationRules,
+)
+from omnibase_core.models.contracts.subcontracts.model_execution_graph import (
+    ModelExecutionGraph,
+)
+from omnibase_core.models.contracts.subcontracts.model_workflow_definition import (
+    ModelWorkflowDefinition,
+)
+from omnibase_core.models.contracts.subcontracts.model_workflow_definition_metadata import (
+    ModelWorkflowDefinitionMetadata,
+)
+from omnibase_core.models.errors.model_onex_error import ModelOnexError
+from omnibase_core.models.orchestrator.model_action import ModelAction
+from omnibase_core.models.primitives.model_semver import ModelSemVer
+from omnibase_core.types.typed_dict_workflow_context import TypedDictWorkflowContext
+from omnibase_core.utils.util_workflow_executor import execute_workflow
+
+pytestmark = pytest.mark.unit
+
+
+def _semver() -> ModelSemVer:
+    return ModelSemVer(major=1, minor=0, patch=0)
+
+
+def _make_workflow_def(timeout_ms: int = 300000) -> ModelWorkflowDefinition:
+    return ModelWorkflowDefinition(
+        workflow_metadata=ModelWorkflowDefinitionMetadata(
+            workflow_name="concurrent_wave_workflow",
+            workflow_version=_semver(),
+            version=_semver(),
+            description="test",
+            execution_mode="parallel",
+            timeout_ms=timeout_ms,
+        ),
+        execution_graph=ModelExecutionGraph(nodes=[], version=_semver()),
+        coordination_rules=ModelCoordinationRules(
+            parallel_execution_allowed=True,
+            failure_recovery_strategy=EnumFailureRecoveryStrategy.RETRY,
+            version=_semver(),
+        ),
+        version=_semver(),
+    )
+
+
+def _step(
+    name: str,
+    depends_on: list[UUID] | None = None,
+    error_action: str = "stop",
+) -> ModelWorkflowStep:
+    return ModelWorkflowStep(
+        step_id=uuid4(),
+        step_name=name,
+        step_type="effect",
+        depends_on=depends_on or [],
+        error_action=error_action,
+    )
+
+
+class _RecordingExecutor:
+    """Step executor that sleeps per step and records start order and overlap."""
+
+    def __init__(
+        self, delays: dict[str, float] | None = None, fail: set[str] | None = None
+    ) -> None:
+        self.delays = delays or {}
+        self.fail = fail or set()
+        self.started: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(
+        self,
+        step: ModelWorkflowStep,
+        action: ModelAction,
+        context: TypedDictWorkflowContext,
+    ) -> None:
+        self.started.append(step.step_name)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(step.step_name, 0.01))
+            if step.step_name in self.fail:
+                raise RuntimeError(f"{step.step_name} failed")
+        finally:
+            self.running -= 1
+
+
+class TestConcurrentWaves:
+    @pytest.mark.asyncio
+    async def test_wave_runs_concurrently_up_to_bound(self) -> None:
+        steps = [_step(f"s{i}") for i in range(6)]
+        executor = _RecordingExecutor()
+
+        result = await execute_workflow(
+            _make_workflow_def(),
+            steps,
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=3,
+            step_executor=executor,
+        )
+
+        assert result.execution_status == EnumWorkflowStatus.COMPLETED
+        assert executor.max_running == 3
+        assert executor.started == [s.step_name for s in steps]
+
+    @pytest.mark.asyncio
+    async def test_results_keep_declaration_order(self) -> None:
+        # Later steps finish first; completion and emission order must not follow.
+        steps = [_step("slow"), _step("medium"), _step("fast")]
+        executor = _RecordingExecutor(
+            delays={"slow": 0.05, "medium": 0.02, "fast": 0.0}
+        )
+
+        result = await execute_workflow(
+            _make_workflow_def(),
+            steps,
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=3,
+            step_executor=executor,
+        )
+
+        assert result.completed_steps == [str(s.step_id) for s in steps]
+        assert [a.metadata.correlation_id for a in result.actions_emitted] == [
+            s.correlation_id for s in steps
+        ]
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_wave_output(self) -> None:
+        root = _step("root")
+        steps = [root, _step("a", [root.step_id]), _step("b", [root.step_id])]
+
+        sequential = await execute_workflow(
+            _make_workflow_def(), steps, uuid4(), EnumExecutionMode.PARALLEL
+        )
+        concurrent = await execute_workflow(
+            _make_workflow_def(),
+            steps,
+            uuid4(),
+            EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=4,
+        )
+
+        assert concurrent.completed_steps == sequential.completed_steps
+        assert [a.action_type for a in concurrent.actions_emitted] == [
+            a.action_type for a in sequential.actions_emitted
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_drops_later_siblings(self) -> None:
+        # Fix 22: the failing step stops the workflow; declaration-earlier
+        # siblings keep their actions, later ones are discarded.
+        first, failing, last = _step("first"), _step("failing"), _step("last")
+        dependent = _step("dependent", [first.step_id])
+        executor = _RecordingExecutor(
+            delays={"first": 0.03, "failing": 0.0, "last": 0.0}, fail={"failing"}
+        )
+
+        result = await execute_workflow(
+            _make_workflow_def(),
+            [first, failing, last, dependent],
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=3,
+            step_executor=executor,
+        )
+
+        assert result.execution_status == EnumWorkflowStatus.FAILED
+        assert result.completed_steps == [str(first.step_id)]
+        assert result.failed_steps == [str(failing.step_id)]
+        assert len(result.actions_emitted) == 1
+        assert "dependent" not in executor.started
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_steps", [None, 1, 2])
+    async def test_skipped_wave_members_never_reach_executor(
+        self, max_concurrent_steps: int | None
+    ) -> None:
+        failing, running, later = _step("failing"), _step("running"), _step("later")
+        executor = _RecordingExecutor(
+            delays={"failing": 0.0, "running": 0.05}, fail={"failing"}
+        )
+
+        result = await execute_workflow(
+            _make_workflow_def(),
+            [failing, running, later],
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=max_concurrent_steps,
+            step_executor=executor,
+        )
+
+        assert result.failed_steps == [str(failing.step_id)]
+        assert result.completed_steps == []
+        # Only a sibling already running when the failure landed was executed
+        expected = ["failing", "running"] if max_concurrent_steps == 2 else ["failing"]
+        assert executor.started == expected
+
+    @pytest.mark.asyncio
+    async def test_continue_on_error_keeps_siblings(self) -> None:
+        steps = [_step("ok"), _step("bad", error_action="continue"), _step("ok2")]
+        executor = _RecordingExecutor(fail={"bad"})
+
+        result = await execute_workflow(
+            _make_workflow_def(),
+            steps,
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=3,
+            step_executor=executor,
+        )
+
+        assert result.completed_steps == [
+            str(steps[0].step_id),
+            str(steps[2].step_id),
+        ]
+        assert result.failed_steps == [str(steps[1].step_id)]
+
+    @pytest.mark.asyncio
+    async def test_global_timeout_cancels_running_steps(self) -> None:
+        steps = [_step("quick"), _step("hung")]
+        executor = _RecordingExecutor(delays={"quick": 0.0, "hung": 60.0})
+
+        result = await execute_workflow(
+            _make_workflow_def(timeout_ms=1000),
+            steps,
+            uuid4(),
+            execution_mode=EnumExecutionMode.PARALLEL,
+            max_concurrent_steps=2,
+            step_executor=executor,
+        )
+
+        assert result.execution_status == EnumWorkflowStatus.FAILED
+        assert result.completed_steps == [str(steps[0].step_id)]
+        assert result.failed_steps == [str(steps[1].step_id)]
+        assert executor.running == 0
+
+    @pytest.mark.asyncio
+    async def test_outer_cancellation_cancels_wave_tasks(self) -> None:
+        executor = _RecordingExecutor(delays={"a": 60.0, "b": 60.0})
+        task = asyncio.create_task(
+            execute_workflow(
+                _make_workflow_def(),
+                [_step("a"), _step("b")],
+                uuid4(),
+                execution_mode=EnumExecutionMode.PARALLEL,
+                max_concurrent_steps=2,
+                step_executor=executor,
+            )
+        )
+        while executor.running < 2:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert executor.running == 0
+
+
+class TestConcurrentWaveValidation:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bound", [0, -1])
+    async def test_rejects_non_positive_bound(self, bound: int) -> None:
+        with pytest.raises(ModelOnexError) as exc_info:
+            await execute_workflow(
+                _make_workflow_def(),
+                [_step("a")],
+                uuid4(),
+                execution_mode=EnumExecutionMode.PARALLEL,
+                max_concurrent_steps=bound,
+            )
+        assert exc_info.value.error_code == EnumCoreErrorCode.VALIDATION_ERROR
+
+    @pytest.mark.asyncio
+    async def test_rejects_concurrency_options_for_sequential_mode(self) -> None:
+        with pytest.raises(ModelOnexError) as exc_info:
+            await execute_workflow(
+                _make_workflow_def(),
+                [_step("a")],
+                uuid4(),
+                execution_mode=EnumExecutionMode.SEQUENTIAL,
+                max_concurrent_steps=2,
+            )
+        assert exc_info.value.error_code == EnumCoreErrorCode.VALIDATION_ERROR
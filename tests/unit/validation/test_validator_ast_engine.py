@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the single-pass AST validation engine."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.validation import ServiceValidationSuite
+from omnibase_core.validation.checker_union_usage import UnionUsageChecker
+from omnibase_core.validation.validator_architecture import (
+    ArchitectureAstPass,
+    validate_architecture_directory,
+)
+from omnibase_core.validation.validator_ast_engine import (
+    run_ast_passes,
+    walk_checkers,
+)
+from omnibase_core.validation.validator_patterns import (
+    PatternsAstPass,
+    validate_patterns_directory,
+)
+from omnibase_core.validation.validator_source_cache import ValidatorSourceCache
+from omnibase_core.validation.validator_types import (
+    UnionUsageAstPass,
+    validate_union_usage_directory,
+)
+
+SAMPLE = """
+from enum import Enum
+from typing import Union
+
+from pydantic import BaseModel
+
+
+class ModelUser(BaseModel):
+    name: str | int | None
+    tags: list[str | bytes] | None = None
+
+
+class EnumColor(Enum):
+    RED = "red"
+
+
+class badName:
+    def helper(self, value: Union[str, int, float, bool]) -> None:
+        def inner(x: int | str) -> None:
+            pass
+"""
+
+
+class _Recorder(ast.NodeVisitor):
+    """Records visits; does not descend into functions."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.seen.append(node.name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.seen.append(node.name)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.seen.append(node.id)
+
+
+class _Exploding(ast.NodeVisitor):
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        raise ValueError("boom")
+
+
+@pytest.mark.unit
+class TestWalkCheckers:
+    """Test walk_checkers()."""
+
+    def test_matches_recursive_visit(self) -> None:
+        """One shared walk visits what each checker's visit() would."""
+        tree = ast.parse(SAMPLE)
+        expected = _Recorder()
+        expected.visit(tree)
+        first, second = _Recorder(), _Recorder()
+
+        errors = walk_checkers(tree, [first, second])
+
+        assert errors == {}
+        assert first.seen == expected.seen
+        assert second.seen == expected.seen
+
+    def test_union_checker_matches_recursive_visit(self) -> None:
+        """Nested unions are counted once in a shared walk too."""
+        tree = ast.parse(SAMPLE)
+        expected = UnionUsageChecker("sample.py")
+        expected.visit(tree)
+        checker = UnionUsageChecker("sample.py")
+
+        walk_checkers(tree, [checker])
+
+        assert checker.union_count == expected.union_count
+        assert checker.issues == expected.issues
+
+    def test_failing_group_stops_alone(self) -> None:
+        """A raising checker stops its group; other groups keep going."""
+        tree = ast.parse(SAMPLE)
+        survivor = _Recorder()
+        sibling = _Recorder()
+
+        errors = walk_checkers(tree, [_Exploding(), sibling, survivor], [0, 0, 1])
+
+        assert list(errors) == [0]
+        assert isinstance(errors[0], ValueError)
+        assert "ModelUser" in survivor.seen
+        assert "ModelUser" not in sibling.seen
+
+    def test_generic_visit_restored(self) -> None:
+        """Checkers can still be used standalone after a shared walk."""
+        checker = _Recorder()
+        walk_checkers(ast.parse(SAMPLE), [checker])
+        assert "generic_visit" not in vars(checker)
+
+
+@pytest.mark.unit
+class TestRunAstPasses:
+    """Test run_ast_passes() and the built-in passes."""
+
+    @pytest.fixture
+    def tree_dir(self, tmp_path: Path) -> Path:
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "sample.py").write_text(SAMPLE)
+        (tmp_path / "pkg" / "copy.py").write_text(SAMPLE)
+        (tmp_path / "pkg" / "broken.py").write_text("def broken(:\n")
+        (tmp_path / "pkg" / "__init__.py").write_text("")
+        return tmp_path
+
+    def test_matches_standalone_validators(self, tree_dir: Path) -> None:
+        """A shared run reports what each standalone validator reports."""
+        results = run_ast_passes(
+            tree_dir,
+            [ArchitectureAstPass(), UnionUsageAstPass(max_unions=3), PatternsAstPass()],
+        )
+
+        standalone = {
+            "architecture": validate_architecture_directory(tree_dir),
+            "union_usage": validate_union_usage_directory(tree_dir, max_unions=3),
+            "patterns": validate_patterns_directory(tree_dir),
+        }
+        assert list(results) == ["architecture", "union_usage", "patterns"]
+        for name, result in standalone.items():
+            assert results[name].is_valid == result.is_valid
+            assert results[name].errors == result.errors
+            assert results[name].metadata == result.metadata
+
+    def test_each_file_parsed_once(self, tree_dir: Path) -> None:
+        """Three passes over identical files share one parse per content."""
+        cache = ValidatorSourceCache()
+
+        run_ast_passes(
+            tree_dir,
+            [ArchitectureAstPass(), UnionUsageAstPass(), PatternsAstPass()],
+            cache,
+        )
+
+        # sample.py and copy.py share content; plus broken.py and __init__.py
+        assert cache.parses == 3
+
+    def test_parse_errors_reported_per_pass(self, tree_dir: Path) -> None:
+        """A file that fails to parse is reported by every pass."""
+        results = run_ast_passes(tree_dir, [ArchitectureAstPass(), PatternsAstPass()])
+
+        assert any("Syntax error" in e for e in results["architecture"].errors)
+        assert any("Error parsing" in e for e in results["patterns"].errors)
+
+    def test_suite_uses_shared_passes(self, tree_dir: Path) -> None:
+        """run_all_validations() matches running each validator on its own."""
+        suite = ServiceValidationSuite()
+
+        shared = suite.run_all_validations(tree_dir)
+
+        for validation_type in ("architecture", "union-usage", "patterns"):
+            alone = suite.run_validation(validation_type, tree_dir)
+            assert shared[validation_type].errors == alone.errors
+            assert shared[validation_type].metadata == alone.metadata
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the shared parse-once validator source cache."""
+
+from pathlib import Path
+
+import pytest
+
+from omnibase_core.validation.validator_source_cache import (
+    ValidatorSourceCache,
+    get_validator_source_cache,
+)
+
+
+@pytest.mark.unit
+class TestValidatorSourceCache:
+    """Test ValidatorSourceCache."""
+
+    def test_identical_content_is_parsed_once(self, tmp_path: Path) -> None:
+        """Files with the same bytes share one parsed tree."""
+        first = tmp_path / "a.py"
+        second = tmp_path / "b.py"
+        first.write_text("x: int = 1\n")
+        second.write_text("x: int = 1\n")
+        cache = ValidatorSourceCache()
+
+        parsed_first = cache.parse(first)
+        parsed_second = cache.parse(second)
+
+        assert parsed_first.tree is parsed_second.tree
+        assert parsed_first.content_hash == parsed_second.content_hash
+        assert cache.parses == 1
+        assert cache.hits == 1
+        assert len(cache) == 1
+
+    def test_edits_are_seen(self, tmp_path: Path) -> None:
+        """Changing a file's content yields a fresh parse."""
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        cache = ValidatorSourceCache()
+        before = cache.parse(path)
+
+        path.write_text("y = 2\n")
+        after = cache.parse(path)
+
+        assert before.content_hash != after.content_hash
+        assert after.lines == ["y = 2"]
+        assert cache.parses == 2
+
+    def test_lines_match_read_text(self, tmp_path: Path) -> None:
+        """Lines use universal newlines, as read_text() does."""
+        path = tmp_path / "crlf.py"
+        path.write_bytes(b"a = 1\r\nb = 2\rc = 3\n")
+
+        lines = ValidatorSourceCache().get_lines(path)
+
+        assert lines == path.read_text(encoding="utf-8").splitlines()
+
+    def test_syntax_error_reraised_with_filename(self, tmp_path: Path) -> None:
+        """A cached syntax error is raised again for each path and filename."""
+        path = tmp_path / "bad.py"
+        path.write_text("def broken(:\n")
+        cache = ValidatorSourceCache()
+
+        with pytest.raises(SyntaxError) as first:
+            cache.parse(path)
+        with pytest.raises(SyntaxError) as second:
+            cache.parse(path, filename="<unknown>")
+
+        assert first.value.filename == str(path)
+        assert second.value.filename == "<unknown>"
+        assert first.value.lineno == second.value.lineno
+        assert cache.parses == 1
+
+    def test_read_errors_propagate(self, tmp_path: Path) -> None:
+        """Missing and undecodable files raise instead of being cached."""
+        cache = ValidatorSourceCache()
+        binary = tmp_path / "binary.py"
+        binary.write_bytes(b"\xff\xfe\xfd")
+
+        with pytest.raises(FileNotFoundError):
+            cache.parse(tmp_path / "missing.py")
+        with pytest.raises(UnicodeDecodeError):
+            cache.parse(binary)
+        assert len(cache) == 0
+
+    def test_tokens_cached(self, tmp_path: Path) -> None:
+        """Tokens are produced once per content."""
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        cache = ValidatorSourceCache()
+
+        tokens = cache.get_tokens(path)
+
+        assert tokens is cache.get_tokens(path)
+        assert [t.string for t in tokens[:3]] == ["x", "=", "1"]
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """The least recently used content is evicted first."""
+        cache = ValidatorSourceCache(max_entries=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"m{i}.py"
+            path.write_text(f"value = {i}\n")
+            paths.append(path)
+
+        cache.parse(paths[0])
+        cache.parse(paths[1])
+        cache.parse(paths[0])
+        cache.parse(paths[2])
+        cache.parse(paths[0])
+
+        assert len(cache) == 2
+        assert cache.parses == 3
+        cache.parse(paths[1])
+        assert cache.parses == 4
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear() drops entries and counters."""
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        cache = ValidatorSourceCache()
+        cache.parse(path)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == cache.parses == 0
+
+    def test_default_cache_is_shared(self) -> None:
+        """The process-wide cache is a single instance."""
+        assert get_validator_source_cache() is get_validator_source_cache()